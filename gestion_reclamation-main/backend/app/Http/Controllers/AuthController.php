@@ -3,10 +3,13 @@
 namespace App\Http\Controllers;
 
 use App\Models\User;
+use App\Services\LoginThrottle;
+use App\Services\ReferenceData;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Auth;
 use Illuminate\Support\Facades\Hash;
 use Illuminate\Support\Facades\Password;
+use Illuminate\Validation\Rule;
 use Illuminate\Validation\ValidationException;
 
 class AuthController extends Controller
@@ -42,7 +45,7 @@ public function register(Request $request)
         }
 
         return response()->json([
-            'user' => $user->load('role', 'filiere'),
+            'user' => $user->loadReferences(),
             'token' => $token,
         ]);
     }
@@ -50,37 +53,75 @@ public function register(Request $request)
     /**
      * Connexion de l'utilisateur et génération du token.
      */
-    public function login(Request $request)
+    public function login(Request $request, LoginThrottle $throttle)
     {
+        // Rôles lus depuis le cache de référence : une tentative refusée ne touche pas la base
         $request->validate([
             'email' => 'required|string|email',
             'password' => 'required|string',
-            'role_name' => 'required|string|exists:roles,name',
+            'role_name' => ['required', 'string', Rule::in(app(ReferenceData::class)->roles()->pluck('name'))],
         ]);
 
+        // Refus avant Auth::attempt : pas de hachage bcrypt pour un compte ou une adresse bloqués
+        if ($blocage = $throttle->blocage($request->email, $request->ip())) {
+            return $this->reponseBlocage($blocage);
+        }
+
         if (!Auth::attempt($request->only('email', 'password'))) {
-            throw ValidationException::withMessages([
-                'email' => ['Identifiants incorrects ou rôle invalide'],
-            ]);
+            return $this->echecConnexion($throttle, $request);
         }
 
         $user = Auth::user();
 
         // Vérifier si le rôle choisi correspond au rôle réel de l'utilisateur
-        if ($user->role->name !== $request->role_name) {
-            throw ValidationException::withMessages([
-                'email' => ['Identifiants incorrects ou rôle invalide'],
-            ]);
+        if ($user->roleName() !== $request->role_name) {
+            return $this->echecConnexion($throttle, $request);
         }
 
+        $throttle->reussite($request->email);
+
         $token = $user->createToken('auth_token')->plainTextToken;
 
         return response()->json([
-            'user' => $user->load('role', 'filiere'),
+            'user' => $user->loadReferences(),
             'token' => $token,
         ]);
     }
 
+    /**
+     * Échec compté (email et adresse) ; le message de blocage remplace le message
+     * générique dès que la tentative atteint le seuil.
+     */
+    private function echecConnexion(LoginThrottle $throttle, Request $request)
+    {
+        if ($blocage = $throttle->echec($request->email, $request->ip())) {
+            return $this->reponseBlocage($blocage);
+        }
+
+        throw ValidationException::withMessages([
+            'email' => ['Identifiants incorrects ou rôle invalide'],
+        ]);
+    }
+
+    /**
+     * 429 au format des erreurs de validation (errors.email), avec Retry-After.
+     *
+     * @param  array{type: string, secondes: int}  $blocage
+     */
+    private function reponseBlocage(array $blocage)
+    {
+        $minutes = max(1, (int) ceil($blocage['secondes'] / 60));
+        $message = $blocage['type'] === 'email'
+            ? "Compte temporairement bloqué après " . config('auth.lockout.tentatives_email')
+                . " tentatives de connexion échouées. Réessayez dans {$minutes} minute(s)."
+            : "Trop de tentatives de connexion depuis cette adresse : connexions bloquées pendant {$minutes} minute(s).";
+
+        return response()->json([
+            'message' => $message,
+            'errors' => ['email' => [$message]],
+        ], 429)->header('Retry-After', $blocage['secondes']);
+    }
+
     /**
      * Envoi du lien de réinitialisation de mot de passe.
      */
@@ -123,6 +164,9 @@ function ($user, $password) {
                 $user->forceFill([
                     'password' => Hash::make($password)
                 ])->save();
+
+                // Nouveau mot de passe : le blocage de connexion du compte est levé
+                app(LoginThrottle::class)->debloquer($user->email);
             }
         );
 
@@ -146,6 +190,6 @@ public function logout(Request $request)
      */
     public function user(Request $request)
     {
-        return response()->json($request->user()->load('role', 'filiere'));
+        return response()->json($request->user()->loadReferences());
     }
 }
@@ -2,15 +2,28 @@
 
 namespace App\Http\Controllers;
 
+use App\Jobs\NotifierScolarite;
 use App\Models\HistoriqueAction;
 use App\Models\Notification;
 use App\Models\Note;
 use App\Repositories\Interfaces\DemandeRepositoryInterface;
+use App\Services\CsvExport;
+use App\Services\FichierStore;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Storage;
 
 class DemandeController extends Controller
 {
+    // Filtres communs à la liste paginée et à l'export
+    private const REGLES_FILTRES = [
+        'statut' => 'nullable|string',
+        'matiere_id' => 'nullable|integer',
+        'enseignant_id' => 'nullable|integer',
+        'date_debut' => 'nullable|date',
+        'date_fin' => 'nullable|date|after_or_equal:date_debut',
+        'q' => 'nullable|string|max:100',
+    ];
+
     protected $demandeRepository;
 
     public function __construct(DemandeRepositoryInterface $demandeRepository)
@@ -22,11 +35,19 @@ public function __construct(DemandeRepositoryInterface $demandeRepository)
      * - Étudiant : Ses propres demandes.
      * - Enseignant : Demandes qui lui sont assignées.
      * - Scolarité/Admin : Toutes les demandes.
+     *
+     * Avec ?per_page= ou ?cursor=, la liste est paginée par curseur et filtrable
+     * (statut, matiere_id, enseignant_id, date_debut, date_fin, q) ; ?fields=
+     * limite les colonnes renvoyées. Sans ces paramètres : tableau complet.
      */
     public function index(Request $request)
     {
         $user = $request->user();
-        $role = $user->role->name;
+        $role = $user->roleName();
+
+        if ($request->hasAny(['per_page', 'cursor'])) {
+            return $this->indexPagine($request, $role, $user->id);
+        }
 
         if ($role === 'student') {
             $demandes = $this->demandeRepository->getByUser($user->id);
@@ -40,6 +61,94 @@ public function index(Request $request)
         return response()->json($demandes);
     }
 
+    /**
+     * Liste paginée et filtrée.
+     */
+    private function indexPagine(Request $request, string $role, int $userId)
+    {
+        $request->validate([
+            'per_page' => 'nullable|integer|min:1|max:100',
+            'cursor' => 'nullable|string',
+            'fields' => 'nullable|string',
+            ...self::REGLES_FILTRES,
+        ]);
+
+        $champs = null;
+        if ($request->filled('fields')) {
+            $champs = array_values(array_intersect(
+                explode(',', $request->fields),
+                DemandeRepositoryInterface::CHAMPS_LISTE
+            ));
+        }
+
+        return response()->json($this->demandeRepository->paginate(
+            $this->filtres($request, $role, $userId),
+            (int) $request->input('per_page', 25),
+            $request->cursor,
+            $champs ?: null
+        ));
+    }
+
+    /**
+     * Export CSV des demandes (scolarité et admin), avec les filtres de la liste
+     * paginée. Les lignes sont lues par tranches et écrites au fil de l'eau.
+     */
+    public function export(Request $request, CsvExport $csv)
+    {
+        $user = $request->user();
+        $role = $user->roleName();
+        if (!in_array($role, ['registrar', 'admin'], true)) {
+            return response()->json(['message' => 'Non autorisé'], 403);
+        }
+
+        $request->validate(self::REGLES_FILTRES);
+
+        return $csv->telecharger(
+            'reclamations-' . now()->format('Y-m-d') . '.csv',
+            ['N°', 'Date', 'Étudiant', 'Email', 'Filière / niveau', 'Matière', 'Enseignant', 'Objet',
+                'Motif', 'Statut', 'Note actuelle', 'Note demandée', 'Note finale'],
+            $this->demandeRepository->export($this->filtres($request, $role, $user->id)),
+            fn ($demande) => [
+                $demande->id,
+                $demande->created_at,
+                $demande->nom_prenom,
+                $demande->user?->email,
+                $demande->filiere_niveau,
+                $demande->matiere?->name,
+                $demande->enseignant?->name ?? $demande->enseignant_nom,
+                $demande->objet,
+                $demande->motif,
+                $demande->statut,
+                $demande->note_actuelle,
+                $demande->note_demandee,
+                $demande->note_finale,
+            ]
+        );
+    }
+
+    /**
+     * Filtres de la liste et de l'export ; le périmètre du rôle s'applique toujours
+     * (un étudiant ne peut pas élargir la liste via les filtres).
+     */
+    private function filtres(Request $request, string $role, int $userId): array
+    {
+        $filtres = [
+            'statut' => $request->filled('statut') ? explode(',', $request->statut) : null,
+            'matiere_id' => $request->matiere_id,
+            'enseignant_id' => $request->enseignant_id,
+            'date_debut' => $request->date_debut,
+            'date_fin' => $request->filled('date_fin') ? \Illuminate\Support\Carbon::parse($request->date_fin)->endOfDay() : null,
+            'recherche' => $request->q,
+        ];
+        if ($role === 'student') {
+            $filtres['user_id'] = $userId;
+        } elseif ($role === 'teacher') {
+            $filtres['enseignant_id'] = $userId;
+        }
+
+        return $filtres;
+    }
+
     /**
      * Show the form for creating a new resource.
      */
@@ -51,7 +160,7 @@ public function create()
     /**
      * Création d'une nouvelle demande (réclamation).
      */
-    public function store(Request $request)
+    public function store(Request $request, FichierStore $fichiers)
     {
         $request->validate([
             'nom_prenom' => 'required|string',
@@ -70,17 +179,17 @@ public function store(Request $request)
         $data['user_id'] = $request->user()->id;
         $data['statut'] = 'SOUMISE';
 
+        // Justificatif stocké une fois par contenu ; analyse (type réel, antivirus, aperçu) dans la file
+        // (jamais depuis la saisie : un hash connu rattacherait le fichier d'un autre étudiant)
+        unset($data['justification'], $data['justification_sha256']);
         if ($request->hasFile('justification')) {
-            $data['justification'] = $request->file('justification')->store('justifications', 'public');
+            $data['justification_sha256'] = $fichiers->enregistrer($request->file('justification'))->sha256;
         }
 
         $demande = $this->demandeRepository->create($data);
 
-        try {
-            \Illuminate\Support\Facades\Mail::to($request->user())->send(new \App\Mail\ClaimSubmitted($demande));
-        } catch (\Exception $e) {
-            \Illuminate\Support\Facades\Log::error('Failed to send claim confirmation email: ' . $e->getMessage());
-        }
+        // Mail de confirmation envoyé par la file (voir ClaimSubmitted)
+        \Illuminate\Support\Facades\Mail::to($request->user())->queue(new \App\Mail\ClaimSubmitted($demande));
 
         HistoriqueAction::create([
             'demande_id' => $demande->id,
@@ -89,19 +198,8 @@ public function store(Request $request)
             'details' => 'Demande soumise',
         ]);
 
-        // Notifier la scolarité (Global notification for all registrars)
-        $registrarRole = \App\Models\Role::where('name', 'registrar')->first();
-        if ($registrarRole) {
-            $registrars = \App\Models\User::where('role_id', $registrarRole->id)->get();
-            foreach ($registrars as $registrar) {
-                Notification::create([
-                    'user_id' => $registrar->id,
-                    'message' => 'Nouvelle réclamation soumise par ' . $request->user()->name,
-                    'type' => 'new_claim',
-                    'demande_id' => $demande->id,
-                ]);
-            }
-        }
+        // Notifier la scolarité (Global notification for all registrars), en file d'attente
+        NotifierScolarite::dispatch($demande->id, 'Nouvelle réclamation soumise par ' . $request->user()->name);
 
         return response()->json($demande->load(['user', 'matiere', 'enseignant']), 201);
     }
@@ -115,7 +213,8 @@ public function show(string $id)
         if (!$demande) {
             return response()->json(['message' => 'Demande introuvable'], 404);
         }
-        return response()->json($demande->load(['user', 'matiere', 'enseignant', 'historiques.user']));
+        // user, matiere et enseignant déjà chargés par findById
+        return response()->json($demande->loadMissing(['user', 'matiere', 'enseignant', 'fichier', 'historiques.user']));
     }
 
     /**
@@ -151,44 +250,39 @@ public function valider(Request $request, $id)
     {
         $demande = \App\Models\Demande::findOrFail($id);
         $user = $request->user();
-        $role = $user->role->name;
+        $role = $user->roleName();
 
         if ($role === 'registrar' && $demande->statut === 'SOUMISE') {
-            $demande->update(['statut' => 'RECUE_SCOLARITE']);
+            // Statut et commentaire en un seul UPDATE
+            $demande->update(['statut' => 'RECUE_SCOLARITE', 'commentaire_scolarite' => $request->input('commentaire')]);
             HistoriqueAction::create([
                 'demande_id' => $demande->id,
                 'user_id' => $user->id,
                 'action' => 'Réception scolarité',
                 'details' => $request->input('commentaire', 'Demande reçue par la scolarité'),
             ]);
-            $demande->update(['commentaire_scolarite' => $request->input('commentaire')]);
             Notification::create([
                 'user_id' => $demande->user_id,
                 'message' => 'Votre réclamation a été reçue par la scolarité.',
                 'type' => 'status_update',
                 'demande_id' => $demande->id,
             ]);
-            try {
-                \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-            } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+            $this->notifierEtudiant($demande);
         } elseif ($role === 'teacher' && $demande->statut === 'IMPUTEE_ENSEIGNANT') {
-            $demande->update(['statut' => 'VALIDEE']);
+            $demande->update(['statut' => 'VALIDEE', 'commentaire_enseignant' => $request->input('commentaire')]);
             HistoriqueAction::create([
                 'demande_id' => $demande->id,
                 'user_id' => $user->id,
                 'action' => 'Validation enseignant',
                 'details' => $request->input('commentaire', 'Demande validée par l\'enseignant'),
             ]);
-            $demande->update(['commentaire_enseignant' => $request->input('commentaire')]);
             Notification::create([
                 'user_id' => $demande->user_id,
                 'message' => 'Votre réclamation a été validée par l\'enseignant.',
                 'type' => 'status_update',
                 'demande_id' => $demande->id,
             ]);
-            try {
-                \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-            } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+            $this->notifierEtudiant($demande);
         }
 
         return response()->json($demande);
@@ -203,18 +297,15 @@ public function envoyerAuDA(Request $request, $id)
         $demande = \App\Models\Demande::findOrFail($id);
         $user = $request->user();
 
-        if ($user->role->name === 'registrar' && in_array($demande->statut, ['SOUMISE', 'RECUE_SCOLARITE'])) {
-            $demande->update(['statut' => 'ENVOYEE_DA']);
+        if ($user->roleName() === 'registrar' && in_array($demande->statut, ['SOUMISE', 'RECUE_SCOLARITE'])) {
+            $demande->update(['statut' => 'ENVOYEE_DA', 'commentaire_scolarite' => $request->input('commentaire')]);
             HistoriqueAction::create([
                 'demande_id' => $demande->id,
                 'user_id' => $user->id,
                 'action' => 'Transfert au DA',
                 'details' => $request->input('commentaire', 'Demande transférée au Directeur Académique'),
             ]);
-            $demande->update(['commentaire_scolarite' => $request->input('commentaire')]);
-            try {
-                \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-            } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+            $this->notifierEtudiant($demande);
             return response()->json($demande);
         }
 
@@ -228,14 +319,21 @@ public function rejeter(Request $request, $id)
     {
         $demande = \App\Models\Demande::findOrFail($id);
         $user = $request->user();
-        $role = $user->role->name;
+        $role = $user->roleName();
+
+        // Commentaire écrit avec le statut (un seul UPDATE)
+        $commentaire = $role === 'teacher'
+            ? ['commentaire_enseignant' => $request->input('commentaire')]
+            : ['commentaire_scolarite' => $request->input('commentaire')];
 
         if ($role === 'registrar' && $demande->statut === 'SOUMISE') {
-            $demande->update(['statut' => 'REJETEE_SCOLARITE']);
+            $demande->update(['statut' => 'REJETEE_SCOLARITE', ...$commentaire]);
         } elseif ($role === 'teacher' && $demande->statut === 'IMPUTEE_ENSEIGNANT') {
-            $demande->update(['statut' => 'NON_VALIDEE']);
+            $demande->update(['statut' => 'NON_VALIDEE', ...$commentaire]);
         } elseif ($role === 'admin' && $demande->statut === 'ENVOYEE_DA') {
-            $demande->update(['statut' => 'REJETEE_DA']);
+            $demande->update(['statut' => 'REJETEE_DA', ...$commentaire]);
+        } elseif (in_array($role, ['registrar', 'admin', 'teacher'], true)) {
+            $demande->update($commentaire);
         }
 
         HistoriqueAction::create([
@@ -252,15 +350,7 @@ public function rejeter(Request $request, $id)
             'demande_id' => $demande->id,
         ]);
 
-        if ($role === 'registrar' || $role === 'admin') {
-            $demande->update(['commentaire_scolarite' => $request->input('commentaire')]);
-        } elseif ($role === 'teacher') {
-            $demande->update(['commentaire_enseignant' => $request->input('commentaire')]);
-        }
-        
-        try {
-            \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-        } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+        $this->notifierEtudiant($demande);
 
         return response()->json($demande);
     }
@@ -274,7 +364,7 @@ public function imputer(Request $request, $id)
         $demande = \App\Models\Demande::findOrFail($id);
         $user = $request->user();
 
-        if ($user->role->name === 'admin' && $demande->statut === 'ENVOYEE_DA') {
+        if ($user->roleName() === 'admin' && $demande->statut === 'ENVOYEE_DA') {
             $demande->update([
                 'statut' => 'IMPUTEE_ENSEIGNANT',
                 'enseignant_id' => $request->enseignant_id,
@@ -298,10 +388,7 @@ public function imputer(Request $request, $id)
                 'type' => 'status_update',
                 'demande_id' => $demande->id,
             ]);
-            try {
-                 // Notify student as well
-                \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-            } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+            $this->notifierEtudiant($demande);
         }
 
         return response()->json($demande);
@@ -316,7 +403,7 @@ public function corriger(Request $request, $id)
         $demande = \App\Models\Demande::findOrFail($id);
         $user = $request->user();
 
-        if ($user->role->name === 'teacher' && $demande->statut === 'IMPUTEE_ENSEIGNANT') {
+        if ($user->roleName() === 'teacher' && $demande->statut === 'IMPUTEE_ENSEIGNANT') {
             $demande->update([
                 'statut' => 'VALIDEE',
                 'note_finale' => $request->nouvelle_note,
@@ -334,11 +421,17 @@ public function corriger(Request $request, $id)
                 'type' => 'status_update',
                 'demande_id' => $demande->id,
             ]);
-            try {
-                \Illuminate\Support\Facades\Mail::to($demande->user)->send(new \App\Mail\ClaimStatusUpdated($demande));
-            } catch (\Exception $e) { \Illuminate\Support\Facades\Log::error('Mail error: ' . $e->getMessage()); }
+            $this->notifierEtudiant($demande);
         }
 
         return response()->json($demande);
     }
+
+    /**
+     * Informe l'étudiant du nouveau statut de sa demande (mail envoyé par la file).
+     */
+    private function notifierEtudiant(\App\Models\Demande $demande): void
+    {
+        \Illuminate\Support\Facades\Mail::to($demande->user)->queue(new \App\Mail\ClaimStatusUpdated($demande));
+    }
 }
@@ -0,0 +1,64 @@
+<?php
+
+namespace App\Http\Controllers;
+
+use App\Models\Fichier;
+use Illuminate\Http\Request;
+use Illuminate\Support\Facades\Storage;
+use Symfony\Component\HttpFoundation\BinaryFileResponse;
+
+class FichierController extends Controller
+{
+    /**
+     * Téléchargement d'un justificatif (lien signé, voir Fichier::urlPour).
+     */
+    public function show(Request $request, string $sha256)
+    {
+        return $this->servir($request, $sha256, false);
+    }
+
+    /**
+     * Miniature JPEG d'un justificatif image.
+     */
+    public function apercu(Request $request, string $sha256)
+    {
+        return $this->servir($request, $sha256, true);
+    }
+
+    /**
+     * Le contenu d'une adresse ne change jamais : ETag = SHA-256, cache d'un an
+     * (immutable). Les requêtes Range (reprise, lecteur PDF du navigateur) sont
+     * traitées par BinaryFileResponse (206 Partial Content).
+     */
+    private function servir(Request $request, string $sha256, bool $apercu)
+    {
+        $fichier = Fichier::where('sha256', $sha256)->first();
+        if (!$fichier || ($apercu && !$fichier->apercu)) {
+            return response()->json(['message' => 'Fichier introuvable'], 404);
+        }
+        if ($fichier->statut === 'en_attente') {
+            return response()->json(['message' => 'Fichier en cours d\'analyse, réessayez dans quelques instants.'], 409)
+                ->header('Retry-After', 5);
+        }
+        if ($fichier->statut === 'rejete') {
+            return response()->json(['message' => "Fichier refusé : {$fichier->motif_rejet}"], 410);
+        }
+
+        $reponse = new BinaryFileResponse(
+            Storage::disk(Fichier::disque())->path($apercu ? $fichier->apercu : $fichier->chemin),
+            200,
+            ['Content-Type' => $apercu ? 'image/jpeg' : $fichier->mime],
+            false,
+            'inline'
+        );
+        $reponse->setEtag($apercu ? "{$sha256}-apercu" : $sha256);
+        $reponse->setLastModified($fichier->updated_at);
+        $reponse->headers->set('Cache-Control', 'private, max-age=31536000, immutable');
+        $reponse->headers->set('X-Content-Type-Options', 'nosniff');
+
+        // If-None-Match / If-Modified-Since : 304 sans corps
+        $reponse->isNotModified($request);
+
+        return $reponse;
+    }
+}
@@ -21,7 +21,7 @@ public function index(Request $request)
     {
         $user = $request->user();
         
-        if ($request->has('my') && $user && $user->role->name === 'teacher') {
+        if ($request->has('my') && $user && $user->roleName() === 'teacher') {
             return response()->json($this->matiereRepository->getByEnseignant($user->id));
         }
 
@@ -44,7 +44,7 @@ public function store(Request $request)
         $user = $request->user();
 
         // Si c'est un enseignant qui ajoute, on lui assigne d'office la matière
-        if ($user->role->name === 'teacher') {
+        if ($user->roleName() === 'teacher') {
             $data['enseignant_id'] = $user->id;
         }
 
@@ -5,9 +5,13 @@
 use App\Models\Note;
 use App\Models\Matiere;
 use App\Models\User;
+use App\Services\CsvExport;
+use App\Services\GradeSheetCache;
+use App\Services\ReferenceData;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Auth;
 use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Validator;
 
 class NoteController extends Controller
 {
@@ -19,7 +23,7 @@ public function index(Request $request)
         $user = Auth::user();
 
         // Si l'utilisateur est un enseignant, on retourne les notes de ses matières
-        if ($user->role->name === 'teacher') {
+        if ($user->roleName() === 'teacher') {
             // C'est un peu complexe car on veut souvent voir les notes PAR matière.
             // On va peut-être laisser le frontend appeler show() ou une méthode spécifique pour ça.
             // Pour l'instant, on peut retourner toutes les notes données par cet enseignant (via les matières).
@@ -28,7 +32,7 @@ public function index(Request $request)
         }
 
         // Si c'est la scolarité ou un admin, on retourne tout
-        if ($user->role->name === 'registrar' || $user->role->name === 'admin') {
+        if ($user->roleName() === 'registrar' || $user->roleName() === 'admin') {
             $query = Note::with(['user', 'matiere']);
             
             if ($request->has('user_id')) {
@@ -41,6 +45,52 @@ public function index(Request $request)
         return response()->json(['message' => 'Non autorisé'], 403);
     }
 
+    /**
+     * Export CSV des notes, avec les filtres de index() (user_id) plus matiere_id
+     * et filiere_id. Enseignant : ses matières seulement ; scolarité et admin : tout.
+     * Les notes sont lues par tranches et écrites au fil de l'eau.
+     */
+    public function export(Request $request, CsvExport $csv, ReferenceData $references)
+    {
+        $user = Auth::user();
+        $role = $user->roleName();
+        if (!in_array($role, ['teacher', 'registrar', 'admin'], true)) {
+            return response()->json(['message' => 'Non autorisé'], 403);
+        }
+
+        $request->validate([
+            'user_id' => 'nullable|integer',
+            'matiere_id' => 'nullable|integer',
+            'filiere_id' => 'nullable|integer',
+        ]);
+
+        $notes = Note::query()
+            ->with(['user:id,name,email,filiere_id', 'matiere:id,name'])
+            ->when($role === 'teacher', fn ($q) => $q->whereIn('matiere_id', Matiere::where('enseignant_id', $user->id)->select('id')))
+            ->when($request->user_id, fn ($q, $id) => $q->where('user_id', $id))
+            ->when($request->matiere_id, fn ($q, $id) => $q->where('matiere_id', $id))
+            ->when($request->filiere_id, fn ($q, $id) => $q->whereIn('matiere_id', Matiere::where('filiere_id', $id)->select('id')))
+            ->lazyById(1000);
+
+        // Libellés des filières lus une fois dans les données de référence : aucune requête par ligne
+        $filieres = $references->filieres()->mapWithKeys(fn ($f) => [$f->id => "{$f->name} - {$f->niveau}"]);
+
+        return $csv->telecharger(
+            'notes-' . now()->format('Y-m-d') . '.csv',
+            ['Étudiant', 'Email', 'Filière', 'Matière', 'Note', 'Commentaire', 'Mise à jour'],
+            $notes,
+            fn (Note $note) => [
+                $note->user?->name,
+                $note->user?->email,
+                $filieres[$note->user?->filiere_id] ?? '',
+                $note->matiere?->name,
+                $note->note,
+                $note->commentaire,
+                $note->updated_at,
+            ]
+        );
+    }
+
     /**
      * Store a newly created resource in storage.
      */
@@ -55,7 +105,7 @@ public function store(Request $request)
 
         // Vérification des droits (un enseignant ne peut noter que ses matières)
         $user = Auth::user();
-        if ($user->role->name === 'teacher') {
+        if ($user->roleName() === 'teacher') {
             $matiere = Matiere::find($request->matiere_id);
             if ($matiere->enseignant_id !== $user->id) {
                 return response()->json(['message' => 'Vous n\'enseignez pas cette matière.'], 403);
@@ -100,8 +150,8 @@ public function update(Request $request, string $id)
         // Vérification : Seule la scolarité peut modifier une note existante sans contrainte, 
         // ou l'enseignant de la matière concernée.
         $user = Auth::user();
-        $isScolarite = $user->role->name === 'registrar' || $user->role->name === 'admin';
-        $isEnseignantDeLaMatiere = $user->role->name === 'teacher' && $note->matiere->enseignant_id === $user->id;
+        $isScolarite = $user->roleName() === 'registrar' || $user->roleName() === 'admin';
+        $isEnseignantDeLaMatiere = $user->roleName() === 'teacher' && $note->matiere->enseignant_id === $user->id;
 
         if (!$isScolarite && !$isEnseignantDeLaMatiere) {
              return response()->json(['message' => 'Non autorisé'], 403);
@@ -124,47 +174,146 @@ public function destroy(string $id)
      * Get grades for a specific subject (Matiere)
      * Includes all eligible students (based on Filiere) and their current grades if any.
      */
-    public function getGradesByMatiere($matiereId)
+    public function getGradesByMatiere(GradeSheetCache $cache, $matiereId)
     {
         $matiere = Matiere::findOrFail($matiereId);
         $user = Auth::user();
 
         // Sécurité
-        if ($user->role->name === 'teacher' && $matiere->enseignant_id !== $user->id) {
+        if ($user->roleName() === 'teacher' && $matiere->enseignant_id !== $user->id) {
             return response()->json(['message' => 'Non autorisé'], 403);
         }
 
-        // 1. Récupérer tous les étudiants de la filière de la matière
-        $students = User::whereHas('role', function($q) {
-                            $q->where('name', 'student');
-                        })
-                        ->where('filiere_id', $matiere->filiere_id)
-                        ->get();
+        $feuille = $cache->feuilleMatiere($matiere->id, $matiere->filiere_id, function () use ($matiere) {
+            // 1. Récupérer tous les étudiants de la filière de la matière
+            $students = User::where('role_id', app(ReferenceData::class)->roleId('student'))
+                            ->where('filiere_id', $matiere->filiere_id)
+                            ->get();
 
-        // 2. Récupérer les notes existantes pour cette matière
-        $notes = Note::where('matiere_id', $matiereId)->get()->keyBy('user_id');
+            // 2. Récupérer les notes existantes pour cette matière
+            $notes = Note::where('matiere_id', $matiere->id)->get()->keyBy('user_id');
+
+            // 3. Fusionner pour le frontend
+            $result = $students->map(function ($student) use ($notes) {
+                $note = $notes->get($student->id);
+                return [
+                    'student' => $student,
+                    'note' => $note ? $note->note : null,
+                    'commentaire' => $note ? $note->commentaire : null,
+                    'note_id' => $note ? $note->id : null, 
+                ];
+            });
 
-        // 3. Fusionner pour le frontend
-        $result = $students->map(function ($student) use ($notes) {
-            $note = $notes->get($student->id);
             return [
-                'student' => $student,
-                'note' => $note ? $note->note : null,
-                'commentaire' => $note ? $note->commentaire : null,
-                'note_id' => $note ? $note->id : null, 
+                'matiere' => $matiere->toArray(),
+                'grades' => $result->toArray(),
             ];
         });
 
+        return response()->json($feuille)->header('X-Cache', $cache->dernierStatut());
+    }
+
+    /**
+     * Enregistre une feuille de notes complète pour une matière en une seule requête.
+     *
+     * Chaque ligne est validée séparément (étudiant de la filière, note entre 0 et 20) ;
+     * les lignes valides sont écrites par un seul upsert multi-lignes dans une transaction.
+     * La réponse donne le résultat de chaque ligne : cree, modifie ou rejete.
+     */
+    public function saveGradesByMatiere(Request $request, $matiereId)
+    {
+        $matiere = Matiere::findOrFail($matiereId);
+        $user = Auth::user();
+
+        if ($user->roleName() === 'teacher' && $matiere->enseignant_id !== $user->id) {
+            return response()->json(['message' => 'Vous n\'enseignez pas cette matière.'], 403);
+        }
+        if ($user->roleName() === 'student') {
+            return response()->json(['message' => 'Non autorisé'], 403);
+        }
+
+        $request->validate([
+            'grades' => 'required|array|max:1000',
+        ]);
+
+        $lignes = collect($request->grades);
+        $userIds = $lignes->pluck('user_id')->filter(fn ($id) => is_numeric($id))->map(fn ($id) => (int) $id)->unique();
+
+        // Étudiants inscrits dans la filière de la matière (mêmes règles que getGradesByMatiere)
+        $eligibles = User::where('role_id', app(ReferenceData::class)->roleId('student'))
+            ->where('filiere_id', $matiere->filiere_id)
+            ->whereIn('id', $userIds)
+            ->pluck('id')
+            ->flip();
+        $existantes = Note::where('matiere_id', $matiere->id)
+            ->whereIn('user_id', $userIds)
+            ->pluck('id', 'user_id');
+
+        $resultats = [];
+        $aEcrire = [];
+        foreach ($lignes as $index => $ligne) {
+            $validation = Validator::make(is_array($ligne) ? $ligne : [], [
+                'user_id' => 'required|integer',
+                'note' => 'required|numeric|min:0|max:20',
+                'commentaire' => 'nullable|string|max:1000',
+            ]);
+            $erreur = $validation->fails() ? $validation->errors()->first() : null;
+            if (!$erreur && !$eligibles->has((int) $ligne['user_id'])) {
+                $erreur = 'Étudiant non inscrit dans la filière de cette matière.';
+            }
+            if (!$erreur && isset($aEcrire[(int) $ligne['user_id']])) {
+                $erreur = 'Étudiant présent plusieurs fois dans la feuille.';
+            }
+
+            if ($erreur) {
+                $resultats[$index] = ['user_id' => $ligne['user_id'] ?? null, 'statut' => 'rejete', 'erreur' => $erreur];
+                continue;
+            }
+
+            $aEcrire[(int) $ligne['user_id']] = [
+                'user_id' => (int) $ligne['user_id'],
+                'matiere_id' => $matiere->id,
+                'note' => $ligne['note'],
+                'commentaire' => $ligne['commentaire'] ?? null,
+            ];
+            $resultats[$index] = [
+                'user_id' => (int) $ligne['user_id'],
+                'statut' => $existantes->has((int) $ligne['user_id']) ? 'modifie' : 'cree',
+            ];
+        }
+
+        if ($aEcrire) {
+            $ids = DB::transaction(function () use ($aEcrire, $matiere) {
+                // Un seul INSERT ... ON DUPLICATE KEY UPDATE, sur la clé unique (user_id, matiere_id)
+                Note::upsert(array_values($aEcrire), ['user_id', 'matiere_id'], ['note', 'commentaire']);
+
+                return Note::where('matiere_id', $matiere->id)
+                    ->whereIn('user_id', array_keys($aEcrire))
+                    ->pluck('id', 'user_id');
+            });
+            // L'upsert ne déclenche pas les événements du modèle Note ; invalidation
+            // une fois les notes validées, jamais avant le commit
+            app(GradeSheetCache::class)->notesModifiees($matiere->id, array_keys($aEcrire));
+
+            foreach ($resultats as $index => $resultat) {
+                if ($resultat['statut'] !== 'rejete') {
+                    $resultats[$index]['note_id'] = $ids[$resultat['user_id']] ?? null;
+                }
+            }
+        }
+
         return response()->json([
-            'matiere' => $matiere,
-            'grades' => $result
+            'matiere_id' => $matiere->id,
+            'enregistres' => count($aEcrire),
+            'rejetes' => count($resultats) - count($aEcrire),
+            'resultats' => array_values($resultats),
         ]);
     }
 
     /**
      * Get all grades for a specific student
      */
-    public function getStudentGrades($userId)
+    public function getStudentGrades(GradeSheetCache $cache, $userId)
     {
         $student = User::with(['filiere', 'role'])->findOrFail($userId);
 
@@ -179,25 +328,46 @@ public function getStudentGrades($userId)
             ]);
         }
 
-        $matieres = Matiere::where('filiere_id', $student->filiere_id)->get();
+        $feuille = $cache->feuilleEtudiant($student->id, $student->filiere_id, function () use ($student) {
+            $matieres = Matiere::where('filiere_id', $student->filiere_id)->get();
 
-        // 2. Récupérer ses notes existantes
-        $notes = Note::where('user_id', $userId)->get()->keyBy('matiere_id');
+            // 2. Récupérer ses notes existantes
+            $notes = Note::where('user_id', $student->id)->get()->keyBy('matiere_id');
+
+            // 3. Fusionner
+            $result = $matieres->map(function ($matiere) use ($notes) {
+                $note = $notes->get($matiere->id);
+                return [
+                    'matiere' => $matiere,
+                    'note' => $note ? $note->note : null,
+                    'commentaire' => $note ? $note->commentaire : null,
+                    'note_id' => $note ? $note->id : null,
+                ];
+            });
 
-        // 3. Fusionner
-        $result = $matieres->map(function ($matiere) use ($notes) {
-            $note = $notes->get($matiere->id);
             return [
-                'matiere' => $matiere,
-                'note' => $note ? $note->note : null,
-                'commentaire' => $note ? $note->commentaire : null,
-                'note_id' => $note ? $note->id : null,
+                'student' => $student->toArray(),
+                'grades' => $result->toArray(),
             ];
         });
 
-        return response()->json([
-            'student' => $student,
-            'grades' => $result
-        ]);
+        return response()->json($feuille)->header('X-Cache', $cache->dernierStatut());
+    }
+
+    /**
+     * Compteurs du cache des feuilles de notes (scolarité et DA).
+     * DELETE remet les compteurs à zéro, par exemple avant un test de charge.
+     */
+    public function gradesCacheStats(Request $request, GradeSheetCache $cache)
+    {
+        if (!in_array(Auth::user()->roleName(), ['registrar', 'admin'], true)) {
+            return response()->json(['message' => 'Non autorisé'], 403);
+        }
+
+        if ($request->isMethod('delete')) {
+            $cache->reinitialiserStatistiques();
+        }
+
+        return response()->json($cache->statistiques());
     }
 }
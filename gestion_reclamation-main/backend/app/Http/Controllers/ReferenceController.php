@@ -0,0 +1,47 @@
+<?php
+
+namespace App\Http\Controllers;
+
+use App\Services\ReferenceData;
+use Illuminate\Http\JsonResponse;
+use Illuminate\Http\Request;
+
+class ReferenceController extends Controller
+{
+    public function __construct(private ReferenceData $references)
+    {
+    }
+
+    /**
+     * Liste des rôles (page de connexion, création d'utilisateur)
+     */
+    public function roles(Request $request)
+    {
+        return $this->repondre($request, 'roles', fn () => $this->references->roles());
+    }
+
+    /**
+     * Liste des filières
+     */
+    public function filieres(Request $request)
+    {
+        return $this->repondre($request, 'filieres', fn () => $this->references->filieres());
+    }
+
+    /**
+     * Répond 304 sans corps si le client a déjà la version courante (If-None-Match).
+     * no-cache : le navigateur garde la réponse mais la revalide à chaque appel.
+     */
+    private function repondre(Request $request, string $jeu, callable $donnees): JsonResponse
+    {
+        $reponse = new JsonResponse();
+        $reponse->setEtag($this->references->jeu($jeu)['etag']);
+        $reponse->headers->set('Cache-Control', 'no-cache, public');
+
+        if ($reponse->isNotModified($request)) {
+            return $reponse;
+        }
+
+        return $reponse->setData($donnees());
+    }
+}
@@ -0,0 +1,24 @@
+<?php
+
+namespace App\Http\Controllers;
+
+use App\Services\DemandeStats;
+use Illuminate\Http\Request;
+
+class StatsController extends Controller
+{
+    /**
+     * Statistiques des tableaux de bord, selon le rôle (voir DemandeStats::pour).
+     * ?details=matiere,enseignant ajoute le détail par matière / enseignant
+     * (scolarité et DA uniquement).
+     */
+    public function index(Request $request, DemandeStats $stats)
+    {
+        $request->validate(['details' => 'nullable|string']);
+
+        $details = $request->filled('details') ? explode(',', $request->details) : [];
+
+        return response()->json($stats->pour($request->user(), $details))
+            ->header('Cache-Control', 'private, no-cache');
+    }
+}
@@ -3,9 +3,9 @@
 namespace App\Http\Controllers;
 
 use App\Models\User;
-use App\Models\Role;
 use App\Models\Matiere;
 use App\Mail\UserCredentialsMail;
+use App\Services\ReferenceData;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Hash;
 use Illuminate\Support\Facades\Mail;
@@ -17,12 +17,12 @@ class TeachersController extends Controller
      */
     public function index()
     {
-        $roleTeacher = Role::where('name', 'teacher')->first();
+        $roleTeacher = app(ReferenceData::class)->roleId('teacher');
         if (!$roleTeacher) {
             return response()->json([], 200);
         }
 
-        $teachers = User::where('role_id', $roleTeacher->id)
+        $teachers = User::where('role_id', $roleTeacher)
             ->with(['matieres.filiere'])
             ->get();
 
@@ -40,13 +40,13 @@ public function store(Request $request)
             'password' => 'required|string|min:6',
         ]);
 
-        $roleTeacher = Role::where('name', 'teacher')->first();
+        $roleTeacher = app(ReferenceData::class)->roleId('teacher');
 
         $teacher = User::create([
             'name' => $request->name,
             'email' => $request->email,
             'password' => Hash::make($request->password),
-            'role_id' => $roleTeacher->id,
+            'role_id' => $roleTeacher,
         ]);
 
         // Envoi des identifiants par mail
@@ -3,8 +3,9 @@
 namespace App\Http\Controllers;
 
 use App\Models\User;
-use App\Models\Role;
 use App\Mail\UserCredentialsMail;
+use App\Services\NotificationStream;
+use App\Services\ReferenceData;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Mail;
 
@@ -48,7 +49,7 @@ public function store(Request $request)
             \Illuminate\Support\Facades\Log::error("Erreur d'envoi de mail à {$user->email}: " . $e->getMessage());
         }
 
-        return response()->json($user->load('role', 'filiere'), 201);
+        return response()->json($user->loadReferences(), 201);
     }
 
     /**
@@ -56,12 +57,12 @@ public function store(Request $request)
      */
     public function getEnseignants()
     {
-        $roleEnseignant = Role::where('name', 'teacher')->first();
+        $roleEnseignant = app(ReferenceData::class)->roleId('teacher');
         if (!$roleEnseignant) {
             return response()->json([], 200);
         }
 
-        $enseignants = User::where('role_id', $roleEnseignant->id)
+        $enseignants = User::where('role_id', $roleEnseignant)
             ->select('id', 'name', 'email')
             ->get();
 
@@ -106,10 +107,21 @@ public function markNotificationAsRead(Request $request, $id)
         // ... (existing code or just use the whole file replacement)
         $notification = $request->user()->notifications()->where('id', $id)->first();
         
-        if ($notification) {
+        if ($notification && !$notification->read_at) {
             $notification->update(['read_at' => now()]);
         }
 
         return response()->json(['message' => 'Notification marquée comme lue']);
     }
+
+    /**
+     * Marquer toutes les notifications de l'utilisateur comme lues (une seule requête)
+     */
+    public function markAllNotificationsAsRead(Request $request, NotificationStream $stream)
+    {
+        $request->user()->notifications()->unread()->update(['read_at' => now()]);
+        $stream->toutesLues($request->user()->id);
+
+        return response()->json(['message' => 'Toutes les notifications ont été marquées comme lues']);
+    }
 }
@@ -0,0 +1,138 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use Illuminate\Http\Request;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Log;
+use Symfony\Component\HttpFoundation\Response;
+
+class PerformanceProfiler
+{
+    /**
+     * Mesures de la requête HTTP quand app.profiler.actif est activé :
+     * - X-Query-Count : nombre de requêtes SQL de l'application ;
+     * - X-Query-Count-Infra : requêtes sur les tables du cache, de la file et des
+     *   sessions (stores « database »), comptées à part : elles dépendent de la
+     *   configuration (CACHE_STORE, QUEUE_CONNECTION, SESSION_DRIVER), pas du code ;
+     * - Server-Timing : temps SQL de l'application et de l'infrastructure, temps
+     *   applicatif, temps total depuis le démarrage de Laravel, pic mémoire et
+     *   store de cache (visibles dans l'onglet Réseau) ;
+     * - X-N-Plus-One : formes de SELECT de l'application répétées au moins
+     *   « seuil_n_plus_un » fois (même requête aux valeurs près : chargement
+     *   paresseux en boucle), détaillées dans le journal.
+     *
+     * Enregistré en tête de la pile globale pour compter aussi l'authentification.
+     */
+    public function handle(Request $request, Closure $next): Response
+    {
+        if (!config('app.profiler.actif')) {
+            return $next($request);
+        }
+
+        DB::flushQueryLog();
+        DB::enableQueryLog();
+        $debut = microtime(true);
+
+        $response = $next($request);
+
+        $fin = microtime(true);
+        $requetes = DB::getQueryLog();
+        DB::disableQueryLog();
+        DB::flushQueryLog();
+
+        [$requetes, $infra] = $this->separer($requetes);
+        $dureeSql = array_sum(array_column($requetes, 'time'));
+        $dureeInfra = array_sum(array_column($infra, 'time'));
+        $repetees = $this->repetees($requetes);
+        $memoire = memory_get_peak_usage(true) / 1048576;
+        $total = (defined('LARAVEL_START') ? $fin - LARAVEL_START : $fin - $debut) * 1000;
+
+        $response->headers->set('X-Query-Count', (string) count($requetes));
+        $response->headers->set('X-Query-Count-Infra', (string) count($infra));
+        $response->headers->set('X-N-Plus-One', (string) count($repetees));
+        $response->headers->set('Server-Timing', implode(', ', [
+            sprintf('db;dur=%.1f;desc="%d queries"', $dureeSql, count($requetes)),
+            sprintf('infra;dur=%.1f;desc="%d queries"', $dureeInfra, count($infra)),
+            sprintf('app;dur=%.1f', ($fin - $debut) * 1000),
+            sprintf('total;dur=%.1f', $total),
+            sprintf('mem;desc="peak %.1f MB"', $memoire),
+            sprintf('cache;desc="%s"', config('cache.default')),
+        ]));
+        // Server-Timing lisible par l'API Resource Timing depuis le frontend (autre origine)
+        $response->headers->set('Timing-Allow-Origin', '*');
+
+        $route = $request->method() . ' /' . ltrim($request->route()?->uri() ?? $request->path(), '/');
+        if ($repetees) {
+            Log::warning("N+1 probable sur {$route}", $repetees);
+        }
+        if (config('app.profiler.journal')) {
+            Log::info('profiler', [
+                'route' => $route,
+                'statut' => $response->getStatusCode(),
+                'requetes' => count($requetes),
+                'requetes_infra' => count($infra),
+                'sql_ms' => round($dureeSql, 1),
+                'total_ms' => round($total, 1),
+                'memoire_mo' => round($memoire, 1),
+            ]);
+        }
+
+        return $response;
+    }
+
+    /**
+     * Sépare les requêtes de l'application de celles des stores « database »
+     * (cache, verrous, file, lots, échecs, sessions).
+     *
+     * @return array{0: array, 1: array} [application, infrastructure]
+     */
+    private function separer(array $requetes): array
+    {
+        $tables = array_filter([
+            config('cache.stores.database.table'),
+            config('cache.stores.database.lock_table') ?? config('cache.stores.database.table') . '_locks',
+            config('queue.connections.database.table'),
+            config('queue.batching.table'),
+            config('queue.failed.table'),
+            config('session.table'),
+        ]);
+        $noms = implode('|', array_map(fn ($table) => preg_quote($table, '/'), $tables));
+        $motif = '/\b(?:from|into|update|join)\s+[`"\[]?(?:' . $noms . ')[`"\]]?(?:\s|$)/i';
+
+        $application = $infra = [];
+        foreach ($requetes as $requete) {
+            if (preg_match($motif, $requete['query'])) {
+                $infra[] = $requete;
+            } else {
+                $application[] = $requete;
+            }
+        }
+
+        return [$application, $infra];
+    }
+
+    /**
+     * Formes de SELECT exécutées au moins « seuil » fois : forme => nombre.
+     *
+     * @return array<string, int>
+     */
+    private function repetees(array $requetes): array
+    {
+        $formes = [];
+        foreach ($requetes as $requete) {
+            $sql = strtolower(trim(preg_replace('/\s+/', ' ', $requete['query'])));
+            if (!str_starts_with($sql, 'select')) {
+                continue;
+            }
+            // whereIn de tailles différentes : même forme
+            $forme = preg_replace('/\(\s*\?(\s*,\s*\?)*\s*\)/', '(?)', $sql);
+            $formes[$forme] = ($formes[$forme] ?? 0) + 1;
+        }
+
+        $seuil = max(2, (int) config('app.profiler.seuil_n_plus_un'));
+
+        return array_filter($formes, fn ($nombre) => $nombre >= $seuil);
+    }
+}
@@ -15,7 +15,7 @@ class RoleMiddleware
      */
     public function handle(Request $request, Closure $next, string $role): Response
     {
-        if (!$request->user() || $request->user()->role->name !== $role) {
+        if (!$request->user() || $request->user()->roleName() !== $role) {
             return response()->json(['message' => 'Unauthorized'], 403);
         }
 
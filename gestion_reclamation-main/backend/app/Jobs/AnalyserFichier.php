@@ -0,0 +1,117 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Demande;
+use App\Models\Fichier;
+use App\Models\Notification;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Support\Facades\Log;
+use Illuminate\Support\Facades\Process;
+use Illuminate\Support\Facades\Storage;
+
+/**
+ * Analyse d'un nouveau justificatif, hors de la requête de soumission :
+ * type réel du contenu, antivirus (si configuré) et aperçu des images.
+ *
+ * Fichier accepté : statut « pret ». Refusé : contenu supprimé, statut
+ * « rejete » et les étudiants concernés sont notifiés.
+ */
+class AnalyserFichier implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable;
+
+    public $tries = 3;
+    public $backoff = [10, 60];
+
+    public function __construct(
+        public string $sha256,
+    ) {
+    }
+
+    public function handle(): void
+    {
+        $fichier = Fichier::where('sha256', $this->sha256)->first();
+        if (!$fichier || $fichier->statut !== 'en_attente') {
+            return;
+        }
+
+        $disque = Storage::disk(Fichier::disque());
+        $chemin = $disque->path($fichier->chemin);
+
+        // Type lu dans le contenu : l'extension et le type déclarés par le navigateur ne prouvent rien
+        $mime = (new \finfo(FILEINFO_MIME_TYPE))->file($chemin);
+        if (!in_array($mime, Fichier::TYPES, true)) {
+            $this->rejeter($fichier, "type de fichier non autorisé ({$mime})");
+            return;
+        }
+
+        if ($commande = config('filesystems.justifications.antivirus')) {
+            $analyse = Process::timeout(120)->run([...explode(' ', $commande), $chemin]);
+            // Convention clamscan / clamdscan : 1 = virus trouvé, 2+ = erreur (nouvelle tentative)
+            if ($analyse->exitCode() === 1) {
+                $this->rejeter($fichier, 'fichier infecté');
+                return;
+            }
+            if (!$analyse->successful()) {
+                throw new \RuntimeException('Antivirus en échec : ' . $analyse->errorOutput());
+            }
+        }
+
+        $fichier->update([
+            'mime' => $mime,
+            'statut' => 'pret',
+            'apercu' => str_starts_with($mime, 'image/') ? $this->apercu($fichier, $chemin) : null,
+        ]);
+    }
+
+    /**
+     * Miniature JPEG des images (GD). Pas d'aperçu des PDF : il faudrait Imagick ou Ghostscript.
+     */
+    private function apercu(Fichier $fichier, string $chemin): ?string
+    {
+        if (!function_exists('imagecreatefromstring')) {
+            return null;
+        }
+
+        $image = @imagecreatefromstring(file_get_contents($chemin));
+        if ($image === false) {
+            return null;
+        }
+
+        $miniature = imagescale($image, min(imagesx($image), config('filesystems.justifications.apercu_largeur')));
+        ob_start();
+        imagejpeg($miniature, null, 80);
+        $contenu = ob_get_clean();
+        imagedestroy($image);
+        imagedestroy($miniature);
+
+        $cheminApercu = 'apercus/' . substr($fichier->sha256, 0, 2) . "/{$fichier->sha256}.jpg";
+        Storage::disk(Fichier::disque())->put($cheminApercu, $contenu);
+
+        return $cheminApercu;
+    }
+
+    private function rejeter(Fichier $fichier, string $motif): void
+    {
+        Storage::disk(Fichier::disque())->delete($fichier->chemin);
+        $fichier->update(['statut' => 'rejete', 'motif_rejet' => $motif]);
+
+        Demande::where('justification_sha256', $fichier->sha256)
+            ->select('id', 'user_id')
+            ->each(fn (Demande $demande) => Notification::create([
+                'user_id' => $demande->user_id,
+                'demande_id' => $demande->id,
+                'type' => 'attachment_rejected',
+                'message' => "Le justificatif de votre réclamation #{$demande->id} a été refusé : {$motif}.",
+            ]));
+    }
+
+    public function failed(\Throwable $e): void
+    {
+        Log::error("Analyse du justificatif {$this->sha256} échouée : " . $e->getMessage());
+    }
+}
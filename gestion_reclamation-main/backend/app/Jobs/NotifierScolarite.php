@@ -0,0 +1,69 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Notification;
+use App\Models\User;
+use App\Services\NotificationStream;
+use App\Services\ReferenceData;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Support\Facades\Log;
+
+/**
+ * Notifie tous les agents de la scolarité d'une nouvelle réclamation.
+ *
+ * Exécuté par la file pour ne pas allonger la soumission : les notifications
+ * sont insérées par lots plutôt qu'une requête INSERT par agent.
+ */
+class NotifierScolarite implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable;
+
+    public $tries = 3;
+    public $backoff = [10, 60];
+
+    // Lignes par requête INSERT
+    private const LOT = 500;
+
+    public function __construct(
+        public int $demandeId,
+        public string $message,
+    ) {
+    }
+
+    public function handle(): void
+    {
+        $registrarRole = app(ReferenceData::class)->roleId('registrar');
+        if (!$registrarRole) {
+            return;
+        }
+
+        $maintenant = now();
+        User::where('role_id', $registrarRole)
+            ->select('id')
+            // Nouvelle tentative : ne pas notifier deux fois les agents déjà servis
+            ->when($this->attempts() > 1, fn ($q) => $q->whereNotIn('id', Notification::where('demande_id', $this->demandeId)
+                ->where('type', 'new_claim')
+                ->select('user_id')))
+            ->chunkById(self::LOT, function ($registrars) use ($maintenant) {
+                Notification::insert($registrars->map(fn ($registrar) => [
+                    'user_id' => $registrar->id,
+                    'message' => $this->message,
+                    'type' => 'new_claim',
+                    'demande_id' => $this->demandeId,
+                    'created_at' => $maintenant,
+                    'updated_at' => $maintenant,
+                ])->all());
+                // insert() ne déclenche pas les événements du modèle Notification
+                app(NotificationStream::class)->ajoutees($registrars->pluck('id')->all());
+            });
+    }
+
+    public function failed(\Throwable $e): void
+    {
+        Log::error('Notification scolarité échouée (demande #' . $this->demandeId . '): ' . $e->getMessage());
+    }
+}
@@ -10,10 +10,14 @@
 use Illuminate\Mail\Mailables\Envelope;
 use Illuminate\Queue\SerializesModels;
 
-class ClaimSubmitted extends Mailable
+class ClaimSubmitted extends Mailable implements ShouldQueue
 {
     use Queueable, SerializesModels;
 
+    // Envoi différé par la file : un SMTP lent ne ralentit plus la requête
+    public $tries = 3;
+    public $backoff = [30, 120];
+
     public $demande;
 
     /**
@@ -53,4 +57,12 @@ public function attachments(): array
     {
         return [];
     }
+
+    /**
+     * Appelé après le dernier échec d'envoi.
+     */
+    public function failed(\Throwable $e): void
+    {
+        \Illuminate\Support\Facades\Log::error('Mail error (ClaimSubmitted #' . $this->demande->id . '): ' . $e->getMessage());
+    }
 }
@@ -2,6 +2,7 @@
 
 namespace App\Models;
 
+use App\Services\DemandeStats;
 use Illuminate\Database\Eloquent\Model;
 
 class Demande extends Model
@@ -9,7 +10,7 @@ class Demande extends Model
     // Champs assignables en masse pour une demande
     protected $fillable = [
         'nom_prenom', 'filiere_niveau', 'matiere_id', 'enseignant_id', 'enseignant_nom',
-        'objet', 'objectif', 'motif', 'justification', 'statut', 'user_id',
+        'objet', 'objectif', 'motif', 'justification', 'justification_sha256', 'statut', 'user_id',
         'note_actuelle', 'note_demandee', 'note_finale', 'commentaire_scolarite', 'commentaire_enseignant'
     ];
 
@@ -19,12 +20,44 @@ class Demande extends Model
         'statut' => 'string',
     ];
 
+    protected static function booted(): void
+    {
+        // Compteurs des tableaux de bord (GET /api/stats) : création, transition,
+        // imputation, suppression. Les insertions groupées appellent recompter().
+        static::created(function (Demande $demande) {
+            app(DemandeStats::class)->appliquer(null, $demande->only(DemandeStats::COLONNES));
+        });
+        static::updated(function (Demande $demande) {
+            if ($demande->wasChanged(DemandeStats::COLONNES)) {
+                app(DemandeStats::class)->appliquer(
+                    array_intersect_key($demande->getOriginal(), array_flip(DemandeStats::COLONNES)),
+                    $demande->only(DemandeStats::COLONNES)
+                );
+            }
+        });
+        static::deleted(function (Demande $demande) {
+            app(DemandeStats::class)->appliquer($demande->only(DemandeStats::COLONNES), null);
+        });
+    }
+
     // Retourne l'URL complète du fichier de justification s'il existe
+    // (calculée sans requête : lien signé vers le fichier adressé par son contenu,
+    // ou ancien fichier du disque public)
     public function getJustificationUrlAttribute()
     {
+        if ($this->justification_sha256) {
+            return Fichier::urlPour($this->justification_sha256);
+        }
+
         return $this->justification ? asset('storage/' . $this->justification) : null;
     }
 
+    // Relation : justificatif (statut de l'analyse, aperçu)
+    public function fichier()
+    {
+        return $this->belongsTo(Fichier::class, 'justification_sha256', 'sha256');
+    }
+
     public function user()
     {
         return $this->belongsTo(User::class);
@@ -0,0 +1,47 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Support\Facades\URL;
+
+/**
+ * Justificatif stocké une seule fois par contenu (clé : SHA-256).
+ *
+ * Statut : en_attente jusqu'à l'analyse par la file (AnalyserFichier), puis
+ * pret (téléchargeable) ou rejete (type réel non autorisé, virus).
+ */
+class Fichier extends Model
+{
+    // Types acceptés, vérifiés sur le contenu (pas sur l'extension déclarée)
+    public const TYPES = ['application/pdf', 'image/jpeg', 'image/png'];
+
+    protected $fillable = ['sha256', 'chemin', 'mime', 'taille', 'statut', 'motif_rejet', 'apercu'];
+
+    protected $hidden = ['id', 'chemin', 'apercu'];
+
+    protected $appends = ['url', 'apercu_url'];
+
+    public static function disque(): string
+    {
+        return config('filesystems.justifications.disque');
+    }
+
+    /**
+     * URL signée : pas de jeton Bearer à joindre (lien, <img>), pas d'URL devinable.
+     */
+    public static function urlPour(string $sha256, bool $apercu = false): string
+    {
+        return URL::signedRoute($apercu ? 'fichiers.apercu' : 'fichiers.show', ['sha256' => $sha256]);
+    }
+
+    public function getUrlAttribute(): ?string
+    {
+        return $this->statut === 'pret' ? self::urlPour($this->sha256) : null;
+    }
+
+    public function getApercuUrlAttribute(): ?string
+    {
+        return $this->statut === 'pret' && $this->apercu ? self::urlPour($this->sha256, true) : null;
+    }
+}
@@ -2,12 +2,28 @@
 
 namespace App\Models;
 
+use App\Services\DemandeStats;
+use App\Services\GradeSheetCache;
 use Illuminate\Database\Eloquent\Model;
 
 class Matiere extends Model
 {
     protected $fillable = ['name', 'filiere_id', 'enseignant_id'];
 
+    protected static function booted(): void
+    {
+        // Renommage, changement de filière ou réaffectation à un enseignant :
+        // la feuille de la matière et les relevés de la filière (ancienne et nouvelle)
+        $invalider = fn (Matiere $matiere) => app(GradeSheetCache::class)
+            ->matiereModifiee($matiere->id, $matiere->filiere_id, $matiere->getOriginal('filiere_id'));
+
+        static::saved($invalider);
+        static::deleted($invalider);
+
+        // Ses demandes sont supprimées en cascade par la base, sans événement
+        DemandeStats::suivreSuppressions(static::class, ['matiere_id']);
+    }
+
     public function filiere()
     {
         return $this->belongsTo(Filiere::class);
@@ -2,12 +2,25 @@
 
 namespace App\Models;
 
+use App\Services\GradeSheetCache;
 use Illuminate\Database\Eloquent\Model;
 
 class Note extends Model
 {
     protected $fillable = ['user_id', 'matiere_id', 'note', 'commentaire'];
 
+    protected static function booted(): void
+    {
+        // Les feuilles de notes en cache de la matière et de l'étudiant sont périmées
+        // (l'upsert de NoteController::saveGradesByMatiere invalide lui-même). Dans une
+        // transaction, GradeSheetCache attend le commit pour publier les nouvelles versions
+        $invalider = fn (Note $note) => app(GradeSheetCache::class)
+            ->notesModifiees($note->matiere_id, [$note->user_id]);
+
+        static::saved($invalider);
+        static::deleted($invalider);
+    }
+
     public function user()
     {
         return $this->belongsTo(User::class);
@@ -2,6 +2,7 @@
 
 namespace App\Models;
 
+use App\Services\NotificationStream;
 use Illuminate\Database\Eloquent\Model;
 
 class Notification extends Model
@@ -12,6 +13,27 @@ class Notification extends Model
         'read_at' => 'datetime',
     ];
 
+    protected static function booted(): void
+    {
+        // Compteur de non lues et marqueur lu par le serveur du flux (NotificationStream).
+        // Les insertions groupées (NotifierScolarite) appellent le service elles-mêmes.
+        static::created(function (Notification $notification) {
+            if ($notification->read_at === null) {
+                app(NotificationStream::class)->ajoutees([$notification->user_id]);
+            }
+        });
+        static::updated(function (Notification $notification) {
+            if ($notification->wasChanged('read_at') && $notification->getOriginal('read_at') === null) {
+                app(NotificationStream::class)->retiree($notification->user_id);
+            }
+        });
+        static::deleted(function (Notification $notification) {
+            if ($notification->read_at === null) {
+                app(NotificationStream::class)->retiree($notification->user_id);
+            }
+        });
+    }
+
     public function user()
     {
         return $this->belongsTo(User::class);
@@ -0,0 +1,65 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Support\Facades\Cache;
+use Laravel\Sanctum\PersonalAccessToken as SanctumPersonalAccessToken;
+
+/**
+ * Jeton Sanctum avec recherche en cache et écriture de last_used_at espacée.
+ *
+ * Par défaut, chaque requête authentifiée lit personal_access_tokens puis y écrit
+ * last_used_at. Ici le jeton est relu depuis le cache (sanctum.cache_ttl secondes)
+ * et last_used_at n'est écrit qu'une fois par sanctum.last_used_interval secondes.
+ */
+class PersonalAccessToken extends SanctumPersonalAccessToken
+{
+    private const PREFIXE = 'sanctum:jeton:';
+
+    protected static function booted(): void
+    {
+        static::updating(function (PersonalAccessToken $jeton) {
+            // Annule l'UPDATE de last_used_at si une écriture récente a déjà eu lieu
+            $intervalle = config('sanctum.last_used_interval');
+            if ($intervalle > 0 && array_keys($jeton->getDirty()) === ['last_used_at']) {
+                return Cache::add(self::PREFIXE . "utilise:{$jeton->id}", true, $intervalle);
+            }
+        });
+        static::updated(function (PersonalAccessToken $jeton) {
+            // Seul last_used_at a changé : la copie en cache reste valable
+            if (array_diff(array_keys($jeton->getChanges()), ['last_used_at', 'updated_at'])) {
+                Cache::forget(self::PREFIXE . $jeton->id);
+            }
+        });
+        // Déconnexion : le jeton ne doit plus être servi par le cache
+        static::deleted(fn (PersonalAccessToken $jeton) => Cache::forget(self::PREFIXE . $jeton->id));
+    }
+
+    /**
+     * Même contrat que Sanctum : jeton « id|secret », secret comparé au hash stocké.
+     */
+    public static function findToken($token)
+    {
+        if (!str_contains($token, '|')) {
+            return parent::findToken($token);
+        }
+
+        [$id, $secret] = explode('|', $token, 2);
+        if (!ctype_digit($id)) {
+            return null;
+        }
+
+        $attributs = Cache::get(self::PREFIXE . $id);
+        if ($attributs === null) {
+            $attributs = static::find($id)?->getAttributes();
+            if ($attributs === null) {
+                return null;
+            }
+            Cache::put(self::PREFIXE . $id, $attributs, config('sanctum.cache_ttl'));
+        }
+
+        $instance = (new static)->newFromBuilder($attributs);
+
+        return hash_equals($instance->token, hash('sha256', $secret)) ? $instance : null;
+    }
+}
@@ -2,12 +2,20 @@
 
 namespace App\Models;
 
+use App\Services\ReferenceData;
 use Illuminate\Database\Eloquent\Model;
 
 class Role extends Model
 {
     protected $fillable = ['name'];
 
+    protected static function booted(): void
+    {
+        // Données de référence en cache (routes publiques, rôles des utilisateurs)
+        static::saved(fn () => app(ReferenceData::class)->invalider());
+        static::deleted(fn () => app(ReferenceData::class)->invalider());
+    }
+
     public function users()
     {
         return $this->hasMany(User::class);
@@ -3,6 +3,9 @@
 namespace App\Models;
 
 // use Illuminate\Contracts\Auth\MustVerifyEmail;
+use App\Services\DemandeStats;
+use App\Services\GradeSheetCache;
+use App\Services\ReferenceData;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Foundation\Auth\User as Authenticatable;
 use Illuminate\Notifications\Notifiable;
@@ -49,6 +52,40 @@ protected function casts(): array
         ];
     }
 
+    protected static function booted(): void
+    {
+        // Seuls les étudiants ont une filière : leur relevé et les feuilles des
+        // matières de leur filière (ancienne et nouvelle) sont périmés
+        $invalider = function (User $user) {
+            if ($user->filiere_id || $user->getOriginal('filiere_id')) {
+                app(GradeSheetCache::class)
+                    ->etudiantModifie($user->id, $user->filiere_id, $user->getOriginal('filiere_id'));
+            }
+        };
+
+        static::saved($invalider);
+        static::deleted($invalider);
+
+        // Ses demandes (étudiant) ou celles qui lui sont imputées (enseignant) sont
+        // supprimées en cascade par la base, sans événement
+        DemandeStats::suivreSuppressions(static::class, ['user_id', 'enseignant_id']);
+    }
+
+    // Nom du rôle depuis les données de référence en cache (sans requête sur roles)
+    public function roleName(): ?string
+    {
+        return app(ReferenceData::class)->roleName($this->role_id);
+    }
+
+    // Renseigne les relations role et filiere depuis le cache plutôt que par deux requêtes
+    public function loadReferences(): static
+    {
+        $references = app(ReferenceData::class);
+
+        return $this->setRelation('role', $references->role($this->role_id))
+            ->setRelation('filiere', $references->filiere($this->filiere_id));
+    }
+
     // Relation : Rôle de l'utilisateur
     public function role()
     {
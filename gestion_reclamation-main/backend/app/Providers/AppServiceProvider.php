@@ -2,14 +2,19 @@
 
 namespace App\Providers;
 
+use App\Models\PersonalAccessToken;
 use App\Repositories\DemandeRepository;
 use App\Repositories\Interfaces\DemandeRepositoryInterface;
 use App\Repositories\Interfaces\MatiereRepositoryInterface;
 use App\Repositories\Interfaces\UserRepositoryInterface;
 use App\Repositories\MatiereRepository;
 use App\Repositories\UserRepository;
+use App\Services\GradeSheetCache;
+use App\Services\ReferenceData;
+use Illuminate\Http\Middleware\TrustProxies;
 use Illuminate\Support\Facades\Schema;
 use Illuminate\Support\ServiceProvider;
+use Laravel\Sanctum\Sanctum;
 
 class AppServiceProvider extends ServiceProvider
 {
@@ -21,6 +26,10 @@ public function register(): void
         $this->app->bind(DemandeRepositoryInterface::class, DemandeRepository::class);
         $this->app->bind(UserRepositoryInterface::class, UserRepository::class);
         $this->app->bind(MatiereRepositoryInterface::class, MatiereRepository::class);
+
+        $this->app->singleton(GradeSheetCache::class);
+        // Copie en mémoire réinitialisée à chaque job (worker de file) ou requête Octane
+        $this->app->scoped(ReferenceData::class);
     }
 
     /**
@@ -30,6 +39,13 @@ public function boot(): void
     {
         Schema::defaultStringLength(191);
 
+        Sanctum::usePersonalAccessTokenModel(PersonalAccessToken::class);
+
+        // Adresse client derrière un proxy (blocage des connexions par IP)
+        if ($proxies = config('app.trusted_proxies')) {
+            TrustProxies::at($proxies === '*' ? '*' : explode(',', $proxies));
+        }
+
         \Illuminate\Auth\Notifications\ResetPassword::createUrlUsing(function ($user, string $token) {
             return env('FRONTEND_URL', 'http://localhost:5173') . '/reset-password?token=' . $token . '&email=' . $user->email;
         });
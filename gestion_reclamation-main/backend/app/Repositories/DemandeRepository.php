@@ -4,10 +4,23 @@
 
 use App\Models\Demande;
 use App\Repositories\Interfaces\DemandeRepositoryInterface;
+use Illuminate\Contracts\Pagination\CursorPaginator;
+use Illuminate\Database\Eloquent\Builder;
 use Illuminate\Database\Eloquent\Collection;
+use Illuminate\Support\LazyCollection;
 
 class DemandeRepository implements DemandeRepositoryInterface
 {
+    // Relations de la liste : clé étrangère => relation limitée aux colonnes affichées
+    private const RELATIONS_LISTE = [
+        'user_id' => 'user:id,name,email',
+        'matiere_id' => 'matiere:id,name,filiere_id',
+        'enseignant_id' => 'enseignant:id,name',
+    ];
+
+    // Lignes lues par requête lors d'un export
+    private const TRANCHE_EXPORT = 1000;
+
     public function getAll(): Collection
     {
         return Demande::with(['user', 'matiere', 'enseignant'])->get();
@@ -34,6 +47,44 @@ public function getByStatus(string $status): Collection
             ->get();
     }
 
+    public function paginate(array $filtres, int $parPage = 25, ?string $cursor = null, ?array $champs = null): CursorPaginator
+    {
+        $champs = $champs ? array_values(array_unique(['id', ...$champs])) : self::CHAMPS_LISTE;
+        $relations = array_values(array_intersect_key(self::RELATIONS_LISTE, array_flip($champs)));
+
+        return $this->filtrer(Demande::query()->select($champs)->with($relations), $filtres)
+            // Tri sur la clé primaire : curseur stable même si des demandes arrivent entre deux pages
+            ->orderByDesc('id')
+            ->cursorPaginate($parPage, ['*'], 'cursor', $cursor);
+    }
+
+    public function export(array $filtres): LazyCollection
+    {
+        // Parcours par tranches de clé primaire (WHERE id < dernier), relations chargées par tranche
+        return $this->filtrer(Demande::query()->with(['user:id,name,email', 'matiere:id,name', 'enseignant:id,name']), $filtres)
+            ->lazyByIdDesc(self::TRANCHE_EXPORT);
+    }
+
+    /**
+     * Filtres communs à la liste paginée et à l'export.
+     */
+    private function filtrer(Builder $query, array $filtres): Builder
+    {
+        return $query
+            ->when($filtres['user_id'] ?? null, fn ($q, $id) => $q->where('user_id', $id))
+            ->when($filtres['enseignant_id'] ?? null, fn ($q, $id) => $q->where('enseignant_id', $id))
+            ->when($filtres['matiere_id'] ?? null, fn ($q, $id) => $q->where('matiere_id', $id))
+            ->when($filtres['statut'] ?? null, fn ($q, $statuts) => $q->whereIn('statut', (array) $statuts))
+            ->when($filtres['date_debut'] ?? null, fn ($q, $date) => $q->where('created_at', '>=', $date))
+            ->when($filtres['date_fin'] ?? null, fn ($q, $date) => $q->where('created_at', '<=', $date))
+            ->when($filtres['recherche'] ?? null, function ($q, $texte) {
+                $motif = '%' . $texte . '%';
+                $q->where(fn ($q) => $q->where('nom_prenom', 'like', $motif)
+                    ->orWhere('objet', 'like', $motif)
+                    ->orWhereHas('matiere', fn ($q) => $q->where('name', 'like', $motif)));
+            });
+    }
+
     public function findById(int $id): ?Demande
     {
         return Demande::with(['user', 'matiere', 'enseignant'])->find($id);
@@ -46,7 +97,8 @@ public function create(array $data): Demande
 
     public function update(int $id, array $data): bool
     {
-        return Demande::where('id', $id)->update($data);
+        // Par le modèle : ses événements tiennent à jour les compteurs de statistiques
+        return (bool) Demande::find($id)?->update($data);
     }
 
     public function delete(int $id): bool
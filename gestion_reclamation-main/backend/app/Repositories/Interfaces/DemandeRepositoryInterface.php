@@ -3,10 +3,19 @@
 namespace App\Repositories\Interfaces;
 
 use App\Models\Demande;
+use Illuminate\Contracts\Pagination\CursorPaginator;
 use Illuminate\Database\Eloquent\Collection;
+use Illuminate\Support\LazyCollection;
 
 interface DemandeRepositoryInterface
 {
+    // Colonnes sélectionnables via ?fields= (liste paginée)
+    public const CHAMPS_LISTE = [
+        'id', 'nom_prenom', 'filiere_niveau', 'matiere_id', 'enseignant_id', 'enseignant_nom',
+        'objet', 'objectif', 'motif', 'justification', 'statut', 'user_id',
+        'note_actuelle', 'note_demandee', 'note_finale', 'created_at', 'updated_at',
+    ];
+
     public function getAll(): Collection;
 
     public function getByUser(int $userId): Collection;
@@ -15,6 +24,20 @@ public function getByEnseignant(int $enseignantId): Collection;
 
     public function getByStatus(string $status): Collection;
 
+    /**
+     * Liste paginée par curseur (plus récentes d'abord).
+     *
+     * @param array $filtres user_id, enseignant_id, matiere_id, statut (liste), date_debut, date_fin, recherche
+     * @param array|null $champs Colonnes à renvoyer (null = toutes)
+     */
+    public function paginate(array $filtres, int $parPage = 25, ?string $cursor = null, ?array $champs = null): CursorPaginator;
+
+    /**
+     * Toutes les demandes filtrées (mêmes filtres que paginate), lues par tranches
+     * pour un export en flux (plus récentes d'abord).
+     */
+    public function export(array $filtres): LazyCollection;
+
     public function findById(int $id): ?Demande;
 
     public function create(array $data): Demande;
@@ -4,6 +4,7 @@
 
 use App\Models\User;
 use App\Repositories\Interfaces\UserRepositoryInterface;
+use App\Services\ReferenceData;
 use Illuminate\Database\Eloquent\Collection;
 
 class UserRepository implements UserRepositoryInterface
@@ -26,9 +27,7 @@ public function findByEmail(string $email): ?User
     public function getByRole(string $roleName): Collection
     {
         return User::with(['role', 'filiere'])
-            ->whereHas('role', function ($query) use ($roleName) {
-                $query->where('name', $roleName);
-            })
+            ->where('role_id', app(ReferenceData::class)->roleId($roleName))
             ->get();
     }
 
@@ -0,0 +1,70 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Support\Facades\DB;
+use Symfony\Component\HttpFoundation\StreamedResponse;
+
+/**
+ * Export CSV en flux : chaque ligne est écrite dans la réponse dès qu'elle est
+ * lue, sans construire le fichier en mémoire. La mémoire consommée ne dépend
+ * donc pas du nombre de lignes, à condition que $lignes soit lui-même paresseux
+ * (LazyCollection, générateur).
+ *
+ * Séparateur « ; » et BOM UTF-8 : le fichier s'ouvre directement dans Excel
+ * avec les accents et les décimales à la française.
+ */
+class CsvExport
+{
+    private const SEPARATEUR = ';';
+
+    // Lignes écrites entre deux envois au client
+    private const LIGNES_PAR_ENVOI = 500;
+
+    /**
+     * @param  array<string>  $entetes
+     * @param  iterable<mixed>  $lignes
+     * @param  callable(mixed): array  $colonnes  valeurs d'une ligne, dans l'ordre des entêtes
+     */
+    public function telecharger(string $nomFichier, array $entetes, iterable $lignes, callable $colonnes): StreamedResponse
+    {
+        return response()->streamDownload(function () use ($entetes, $lignes, $colonnes) {
+            // Le journal des requêtes (PerformanceProfiler) grossirait à chaque tranche lue
+            DB::disableQueryLog();
+
+            $sortie = fopen('php://output', 'w');
+            fwrite($sortie, "\xEF\xBB\xBF");
+            fputcsv($sortie, $entetes, self::SEPARATEUR);
+
+            $ecrites = 0;
+            foreach ($lignes as $ligne) {
+                fputcsv($sortie, array_map([$this, 'valeur'], $colonnes($ligne)), self::SEPARATEUR);
+
+                if (++$ecrites % self::LIGNES_PAR_ENVOI === 0) {
+                    flush();
+                }
+            }
+
+            fclose($sortie);
+        }, $nomFichier, [
+            'Content-Type' => 'text/csv; charset=UTF-8',
+            'Cache-Control' => 'no-store',
+            // nginx : pas de mise en tampon de la réponse, le client reçoit les lignes au fil de l'eau
+            'X-Accel-Buffering' => 'no',
+        ]);
+    }
+
+    private function valeur(mixed $valeur): string
+    {
+        if ($valeur instanceof \DateTimeInterface) {
+            return $valeur->format('Y-m-d H:i');
+        }
+        if (is_float($valeur) || (is_string($valeur) && is_numeric($valeur))) {
+            return str_replace('.', ',', (string) $valeur);
+        }
+
+        $texte = (string) $valeur;
+        // Pas de formule interprétée par le tableur (=, +, -, @ en début de cellule)
+        return preg_match('/^[=+\-@]/', $texte) ? "'" . $texte : $texte;
+    }
+}
@@ -0,0 +1,248 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Demande;
+use App\Models\User;
+use Illuminate\Support\Facades\DB;
+
+/**
+ * Compteurs de demandes par statut (table demande_compteurs), lus par GET /api/stats.
+ *
+ * Une ligne par (portée, clé, statut) : portée « global » (clé 0), « matiere »,
+ * « enseignant » et « etudiant » (clé = identifiant). Les événements du modèle
+ * Demande appliquent chaque création, transition, imputation et suppression,
+ * suivreSuppressions() les suppressions en cascade (matière, utilisateur) ;
+ * les insertions groupées (VolumeSeeder) appellent recompter().
+ */
+class DemandeStats
+{
+    // Portée => colonne de la demande qui donne la clé
+    private const PORTEES = [
+        'global' => null,
+        'matiere' => 'matiere_id',
+        'enseignant' => 'enseignant_id',
+        'etudiant' => 'user_id',
+    ];
+
+    // Colonnes dont un changement déplace la demande d'un compteur à l'autre
+    public const COLONNES = ['statut', 'matiere_id', 'enseignant_id', 'user_id'];
+
+    /**
+     * Applique le passage d'une demande de l'état $avant à l'état $apres
+     * (null : demande créée ou supprimée).
+     *
+     * @param  array|null  $avant  valeurs des COLONNES avant l'écriture
+     * @param  array|null  $apres  valeurs des COLONNES après l'écriture
+     */
+    public function appliquer(?array $avant, ?array $apres): void
+    {
+        $this->ajouter($this->variations($avant, $apres));
+    }
+
+    /**
+     * Tient les compteurs à jour quand la suppression d'un $modele (matière,
+     * utilisateur) efface ses demandes en cascade dans la base, sans événement :
+     * les demandes concernées sont comptées avant la suppression, puis retirées
+     * de leurs compteurs une fois la suppression faite.
+     *
+     * @param  class-string<\Illuminate\Database\Eloquent\Model>  $modele
+     * @param  array<string>  $colonnes  colonnes de demandes qui référencent le modèle
+     */
+    public static function suivreSuppressions(string $modele, array $colonnes): void
+    {
+        $aRetirer = [];
+        $modele::deleting(function ($supprime) use (&$aRetirer, $colonnes) {
+            $aRetirer[$supprime->getKey()] = app(self::class)->suppression($colonnes, $supprime->getKey());
+        });
+        $modele::deleted(function ($supprime) use (&$aRetirer) {
+            app(self::class)->ajouter($aRetirer[$supprime->getKey()] ?? []);
+            unset($aRetirer[$supprime->getKey()]);
+        });
+    }
+
+    /**
+     * Variations qui retirent des compteurs les demandes dont une des $colonnes
+     * vaut $id (une requête groupée par combinaison des COLONNES).
+     *
+     * @param  array<string>  $colonnes
+     * @return array<string, int>
+     */
+    public function suppression(array $colonnes, int $id): array
+    {
+        $groupes = DB::table('demandes')
+            ->where(function ($q) use ($colonnes, $id) {
+                foreach ($colonnes as $colonne) {
+                    $q->orWhere($colonne, $id);
+                }
+            })
+            ->select(self::COLONNES)
+            ->selectRaw('COUNT(*) as nombre')
+            ->groupBy(self::COLONNES)
+            ->get();
+
+        $variations = [];
+        foreach ($groupes as $groupe) {
+            foreach ($this->variations((array) $groupe, null) as $ligne => $delta) {
+                $variations[$ligne] = ($variations[$ligne] ?? 0) + $delta * (int) $groupe->nombre;
+            }
+        }
+
+        return array_filter($variations);
+    }
+
+    /**
+     * Ajoute des variations aux compteurs : lignes absentes créées à 0, puis une
+     * requête par valeur de variation distincte.
+     *
+     * @param  array<string, int>  $variations  "portee|cle|statut" => variation
+     */
+    private function ajouter(array $variations): void
+    {
+        if (!$variations) {
+            return;
+        }
+
+        DB::table('demande_compteurs')->insertOrIgnore(array_map(function ($ligne) {
+            [$portee, $cle, $statut] = explode('|', $ligne);
+
+            return ['portee' => $portee, 'cle' => $cle, 'statut' => $statut, 'nombre' => 0];
+        }, array_keys($variations)));
+
+        $parDelta = [];
+        foreach ($variations as $ligne => $delta) {
+            $parDelta[$delta][] = $ligne;
+        }
+        foreach ($parDelta as $delta => $lignes) {
+            DB::table('demande_compteurs')
+                ->where(function ($q) use ($lignes) {
+                    foreach ($lignes as $ligne) {
+                        [$portee, $cle, $statut] = explode('|', $ligne);
+                        $q->orWhere(fn ($q) => $q->where('portee', $portee)->where('cle', $cle)->where('statut', $statut));
+                    }
+                })
+                ->increment('nombre', $delta);
+        }
+    }
+
+    /**
+     * Variations nettes des compteurs : "portee|cle|statut" => +1 / -1.
+     * Les compteurs que l'écriture ne change pas (ex. imputation : même statut
+     * pour la matière) ne figurent pas dans le résultat.
+     *
+     * @return array<string, int>
+     */
+    public function variations(?array $avant, ?array $apres): array
+    {
+        $variations = [];
+        foreach ([[$avant, -1], [$apres, 1]] as [$etat, $sens]) {
+            if ($etat === null) {
+                continue;
+            }
+            foreach (self::PORTEES as $portee => $colonne) {
+                $cle = $colonne ? ($etat[$colonne] ?? null) : 0;
+                if ($cle === null) {
+                    continue;
+                }
+                $ligne = "{$portee}|{$cle}|{$etat['statut']}";
+                $variations[$ligne] = ($variations[$ligne] ?? 0) + $sens;
+            }
+        }
+
+        return array_filter($variations);
+    }
+
+    /**
+     * Statistiques visibles par l'utilisateur :
+     * - étudiant : ses demandes par statut ;
+     * - enseignant : les demandes qui lui sont imputées, par statut ;
+     * - scolarité / DA : toutes les demandes par statut, détail par matière et
+     *   par enseignant sur demande ($details).
+     *
+     * @param  array<string>  $details  'matiere' et/ou 'enseignant'
+     */
+    public function pour(User $user, array $details = []): array
+    {
+        $role = $user->roleName();
+        if ($role === 'student' || $role === 'teacher') {
+            $parStatut = $this->parStatut($role === 'student' ? 'etudiant' : 'enseignant', $user->id);
+
+            return ['total' => array_sum($parStatut), 'par_statut' => $parStatut];
+        }
+
+        $parStatut = $this->parStatut('global', 0);
+        $stats = ['total' => array_sum($parStatut), 'par_statut' => $parStatut];
+
+        if (in_array('matiere', $details, true)) {
+            $stats['par_matiere'] = $this->detail('matiere', 'matieres', 'name');
+        }
+        if (in_array('enseignant', $details, true)) {
+            $stats['par_enseignant'] = $this->detail('enseignant', 'users', 'name');
+        }
+
+        return $stats;
+    }
+
+    /**
+     * Recalcule tous les compteurs depuis la table demandes.
+     */
+    public function recompter(): void
+    {
+        DB::transaction(function () {
+            DB::table('demande_compteurs')->delete();
+
+            foreach (self::PORTEES as $portee => $colonne) {
+                DB::table('demande_compteurs')->insertUsing(
+                    ['portee', 'cle', 'statut', 'nombre'],
+                    DB::table('demandes')
+                        ->selectRaw('? as portee, ' . ($colonne ?? '0') . ' as cle, statut, COUNT(*) as nombre', [$portee])
+                        ->when($colonne, fn ($q) => $q->whereNotNull($colonne))
+                        ->groupBy(array_filter([$colonne, 'statut']))
+                );
+            }
+        });
+    }
+
+    /**
+     * @return array<string, int> statut => nombre (statuts sans demande omis)
+     */
+    private function parStatut(string $portee, int $cle): array
+    {
+        return DB::table('demande_compteurs')
+            ->where('portee', $portee)
+            ->where('cle', $cle)
+            ->where('nombre', '>', 0)
+            ->pluck('nombre', 'statut')
+            ->map(fn ($nombre) => (int) $nombre)
+            ->all();
+    }
+
+    /**
+     * Compteurs d'une portée regroupés par clé, avec le libellé (une seule requête).
+     *
+     * @return array<int, array{id: int, nom: ?string, total: int, par_statut: array<string, int>}>
+     */
+    private function detail(string $portee, string $table, string $libelle): array
+    {
+        $lignes = DB::table('demande_compteurs')
+            ->leftJoin($table, "{$table}.id", '=', 'demande_compteurs.cle')
+            ->where('demande_compteurs.portee', $portee)
+            ->where('demande_compteurs.nombre', '>', 0)
+            ->orderBy('demande_compteurs.cle')
+            ->get([
+                'demande_compteurs.cle', "{$table}.{$libelle} as nom",
+                'demande_compteurs.statut', 'demande_compteurs.nombre',
+            ]);
+
+        $detail = [];
+        foreach ($lignes as $ligne) {
+            $entree = &$detail[$ligne->cle];
+            $entree ??= ['id' => (int) $ligne->cle, 'nom' => $ligne->nom, 'total' => 0, 'par_statut' => []];
+            $entree['par_statut'][$ligne->statut] = (int) $ligne->nombre;
+            $entree['total'] += (int) $ligne->nombre;
+            unset($entree);
+        }
+
+        return array_values($detail);
+    }
+}
@@ -0,0 +1,58 @@
+<?php
+
+namespace App\Services;
+
+use App\Jobs\AnalyserFichier;
+use App\Models\Fichier;
+use Illuminate\Http\UploadedFile;
+use Illuminate\Support\Facades\Storage;
+use Illuminate\Validation\ValidationException;
+
+/**
+ * Stockage des justificatifs adressé par le contenu.
+ *
+ * Le fichier envoyé est identifié par son SHA-256 : s'il est déjà connu (même
+ * justificatif joint à plusieurs demandes), rien n'est écrit. Sinon il est
+ * déplacé sous justifications/{2 premiers caractères}/{sha256}.{ext} et son
+ * analyse (type réel, antivirus, aperçu) part dans la file : la soumission
+ * n'attend que le hachage et le déplacement du fichier temporaire.
+ */
+class FichierStore
+{
+    public function enregistrer(UploadedFile $fichier): Fichier
+    {
+        $sha256 = hash_file('sha256', $fichier->getRealPath());
+
+        $existant = Fichier::where('sha256', $sha256)->first();
+        if ($existant) {
+            if ($existant->statut === 'rejete') {
+                throw ValidationException::withMessages([
+                    'justification' => ["Ce fichier a déjà été refusé : {$existant->motif_rejet}"],
+                ]);
+            }
+
+            return $existant;
+        }
+
+        $extension = $fichier->extension() ?: $fichier->getClientOriginalExtension();
+        $chemin = Storage::disk(Fichier::disque())->putFileAs(
+            'justifications/' . substr($sha256, 0, 2),
+            $fichier,
+            "{$sha256}.{$extension}"
+        );
+
+        // Deux envois simultanés du même contenu : une seule ligne, l'autre la relit
+        $enregistre = Fichier::createOrFirst(['sha256' => $sha256], [
+            'chemin' => $chemin,
+            'mime' => $fichier->getMimeType(),
+            'taille' => $fichier->getSize(),
+            'statut' => 'en_attente',
+        ]);
+
+        if ($enregistre->wasRecentlyCreated) {
+            AnalyserFichier::dispatch($sha256);
+        }
+
+        return $enregistre;
+    }
+}
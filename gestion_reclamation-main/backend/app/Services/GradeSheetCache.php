@@ -0,0 +1,179 @@
+<?php
+
+namespace App\Services;
+
+use Closure;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Str;
+
+/**
+ * Cache en lecture des feuilles de notes (par matière et par étudiant).
+ *
+ * Chaque feuille est stockée sous une clé qui contient les versions de ce dont
+ * elle dépend : la matière (ou l'étudiant) et sa filière. Une écriture ne supprime
+ * rien, elle change la version concernée ; les anciennes entrées ne sont plus lues
+ * et expirent d'elles-mêmes. Fonctionne avec n'importe quel store (database, file,
+ * redis...), sans support des tags.
+ *
+ * Dans une transaction, les nouvelles versions ne sont publiées qu'après le commit.
+ *
+ *   - matiere:{id}  : notes de la matière, nom, enseignant affecté
+ *   - etudiant:{id} : notes de l'étudiant, nom, filière
+ *   - filiere:{id}  : liste des étudiants ou des matières de la filière
+ *   - tout          : écritures en masse hors modèles (seeders)
+ */
+class GradeSheetCache
+{
+    private const PREFIXE = 'grades:';
+
+    // Durée de vie d'une feuille : borne la place prise par les versions abandonnées
+    private const TTL = 86400;
+
+    // HIT ou MISS pour la dernière feuille lue (en-tête X-Cache)
+    private ?string $dernierStatut = null;
+
+    // Une lecture sur $echantillon est comptée, pour $echantillon lectures
+    private int $echantillon;
+
+    public function __construct(?int $echantillon = null)
+    {
+        $this->echantillon = max(1, $echantillon ?? (int) config('cache.grades_stats_echantillon', 100));
+    }
+
+    /**
+     * Feuille d'une matière : tous les étudiants de sa filière et leurs notes.
+     */
+    public function feuilleMatiere(int $matiereId, ?int $filiereId, Closure $calcul): array
+    {
+        return $this->lire("matiere:{$matiereId}", ["matiere:{$matiereId}", "filiere:{$filiereId}"], $calcul);
+    }
+
+    /**
+     * Relevé d'un étudiant : toutes les matières de sa filière et ses notes.
+     */
+    public function feuilleEtudiant(int $userId, ?int $filiereId, Closure $calcul): array
+    {
+        return $this->lire("etudiant:{$userId}", ["etudiant:{$userId}", "filiere:{$filiereId}"], $calcul);
+    }
+
+    /**
+     * Notes écrites pour une matière (une ou plusieurs lignes, y compris par upsert).
+     *
+     * @param  array<int>  $userIds
+     */
+    public function notesModifiees(int $matiereId, array $userIds): void
+    {
+        $this->invalider(array_merge(
+            ["matiere:{$matiereId}"],
+            array_map(fn ($id) => "etudiant:{$id}", $userIds)
+        ));
+    }
+
+    /**
+     * Matière créée, renommée, déplacée, supprimée ou réaffectée à un enseignant.
+     */
+    public function matiereModifiee(int $matiereId, ?int ...$filiereIds): void
+    {
+        $this->invalider(array_merge(["matiere:{$matiereId}"], $this->filieres($filiereIds)));
+    }
+
+    /**
+     * Étudiant créé, modifié, changé de filière ou supprimé.
+     */
+    public function etudiantModifie(int $userId, ?int ...$filiereIds): void
+    {
+        $this->invalider(array_merge(["etudiant:{$userId}"], $this->filieres($filiereIds)));
+    }
+
+    /**
+     * Périme toutes les feuilles, après des insertions qui contournent les modèles.
+     */
+    public function toutInvalider(): void
+    {
+        $this->invalider(['tout']);
+    }
+
+    public function dernierStatut(): ?string
+    {
+        return $this->dernierStatut;
+    }
+
+    /**
+     * Compteurs de succès et d'échecs depuis la dernière remise à zéro : estimations
+     * à ± echantillon près quand une lecture seulement sur echantillon est comptée.
+     */
+    public function statistiques(): array
+    {
+        $hits = (int) Cache::get(self::PREFIXE . 'stats:hits', 0);
+        $misses = (int) Cache::get(self::PREFIXE . 'stats:misses', 0);
+
+        return [
+            'hits' => $hits,
+            'misses' => $misses,
+            'taux_succes' => $hits + $misses > 0 ? round($hits / ($hits + $misses), 4) : null,
+            'echantillon' => $this->echantillon,
+        ];
+    }
+
+    public function reinitialiserStatistiques(): void
+    {
+        Cache::deleteMultiple([self::PREFIXE . 'stats:hits', self::PREFIXE . 'stats:misses']);
+    }
+
+    private function lire(string $feuille, array $dependances, Closure $calcul): array
+    {
+        $cles = array_map(fn ($d) => self::PREFIXE . "v:{$d}", [...$dependances, 'tout']);
+        $versions = array_map(fn ($v) => $v ?? '0', Cache::many($cles));
+        $cle = self::PREFIXE . $feuille . ':' . implode('.', $versions);
+
+        $valeur = Cache::get($cle);
+        $this->dernierStatut = $valeur === null ? 'MISS' : 'HIT';
+        $this->compter($valeur === null ? 'misses' : 'hits');
+
+        if ($valeur === null) {
+            $valeur = $calcul();
+            Cache::put($cle, $valeur, self::TTL);
+        }
+
+        return $valeur;
+    }
+
+    private function invalider(array $dependances): void
+    {
+        // Une nouvelle version aléatoire plutôt qu'un compteur : une version perdue
+        // (cache vidé, éviction) ne peut pas faire ressortir une ancienne feuille
+        $version = Str::random(8);
+        $versions = [];
+        foreach (array_unique($dependances) as $dependance) {
+            $versions[self::PREFIXE . "v:{$dependance}"] = $version;
+        }
+
+        // Publiée avant le commit, la nouvelle version serait prise par une lecture
+        // concurrente qui voit encore les anciennes lignes : la feuille périmée resterait
+        // servie jusqu'à son expiration. Sans transaction ouverte, exécuté tout de suite.
+        DB::afterCommit(fn () => Cache::putMany($versions));
+    }
+
+    /**
+     * Compte la lecture sur un échantillon seulement : avec le store database, un
+     * incrément est une écriture, et toutes les lectures se disputeraient la même ligne.
+     */
+    private function compter(string $compteur): void
+    {
+        if ($this->echantillon > 1 && random_int(1, $this->echantillon) !== 1) {
+            return;
+        }
+
+        $cle = self::PREFIXE . "stats:{$compteur}";
+        // Le store database ne sait pas incrémenter une clé absente
+        if (Cache::increment($cle, $this->echantillon) === false) {
+            Cache::forever($cle, $this->echantillon);
+        }
+    }
+
+    private function filieres(array $filiereIds): array
+    {
+        return array_map(fn ($id) => "filiere:{$id}", array_unique(array_filter($filiereIds)));
+    }
+}
@@ -0,0 +1,131 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Contracts\Cache\Repository;
+use Illuminate\Support\Facades\Cache;
+
+/**
+ * Blocage des connexions après des échecs répétés, par email et par adresse IP.
+ *
+ * Les échecs sont comptés dans le cache (Cache::increment), jamais dans la table
+ * users : une rafale de tentatives n'écrit aucune ligne et ne se dispute aucun
+ * verrou. Fenêtre glissante approchée par deux compteurs de tranche (courante et
+ * précédente, pondérée par la part de la fenêtre encore couverte) ; chaque
+ * compteur expire de lui-même après deux fenêtres.
+ *
+ * Une fois un seuil atteint, une clé de blocage posée pour la durée du blocage
+ * fait refuser les tentatives suivantes avant toute vérification du mot de passe.
+ */
+class LoginThrottle
+{
+    private const PREFIXE = 'login:';
+
+    /**
+     * Secondes de blocage restantes pour cet email ou cette adresse (null si aucun).
+     *
+     * @return array{type: string, secondes: int}|null
+     */
+    public function blocage(string $email, string $ip): ?array
+    {
+        $cles = $this->cles($email, $ip);
+        $fins = $this->store()->many(array_map(fn ($cle) => "{$cle}:bloque", $cles));
+
+        foreach (array_keys($cles) as $type) {
+            $fin = $fins["{$cles[$type]}:bloque"] ?? null;
+            if ($fin && $fin > time()) {
+                return ['type' => $type, 'secondes' => $fin - time()];
+            }
+        }
+
+        return null;
+    }
+
+    /**
+     * Compte un échec ; retourne le blocage s'il vient d'être déclenché.
+     *
+     * @return array{type: string, secondes: int}|null
+     */
+    public function echec(string $email, string $ip): ?array
+    {
+        $seuils = [
+            'email' => (int) config('auth.lockout.tentatives_email'),
+            'ip' => (int) config('auth.lockout.tentatives_ip'),
+        ];
+        $duree = (int) config('auth.lockout.duree_blocage');
+        $blocage = null;
+
+        foreach ($this->cles($email, $ip) as $type => $cle) {
+            if ($seuils[$type] > 0 && $this->incrementer($cle) >= $seuils[$type]) {
+                $this->store()->put("{$cle}:bloque", time() + $duree, $duree);
+                $blocage ??= ['type' => $type, 'secondes' => $duree];
+            }
+        }
+
+        return $blocage;
+    }
+
+    /**
+     * Connexion réussie : les échecs de l'email sont oubliés (pas ceux de l'adresse).
+     */
+    public function reussite(string $email): void
+    {
+        $this->oublier($this->cles($email, '')['email'], false);
+    }
+
+    /**
+     * Levée manuelle du blocage d'un compte (administration).
+     */
+    public function debloquer(string $email): void
+    {
+        $this->oublier($this->cles($email, '')['email'], true);
+    }
+
+    /**
+     * Nombre d'échecs sur la fenêtre glissante, après ajout de celui-ci.
+     */
+    private function incrementer(string $cle): float
+    {
+        $fenetre = max(1, (int) config('auth.lockout.fenetre'));
+        $maintenant = time();
+        $tranche = intdiv($maintenant, $fenetre);
+
+        $store = $this->store();
+        $store->add("{$cle}:{$tranche}", 0, $fenetre * 2);
+        $courant = (int) $store->increment("{$cle}:{$tranche}");
+        $precedent = (int) $store->get("{$cle}:" . ($tranche - 1), 0);
+
+        // Part de la tranche précédente encore dans la fenêtre glissante
+        $recouvrement = 1 - ($maintenant % $fenetre) / $fenetre;
+
+        return $courant + $precedent * $recouvrement;
+    }
+
+    private function oublier(string $cle, bool $blocage): void
+    {
+        $tranche = intdiv(time(), max(1, (int) config('auth.lockout.fenetre')));
+        $store = $this->store();
+        $store->forget("{$cle}:{$tranche}");
+        $store->forget("{$cle}:" . ($tranche - 1));
+        if ($blocage) {
+            $store->forget("{$cle}:bloque");
+        }
+    }
+
+    /**
+     * @return array{email: string, ip: string}
+     */
+    private function cles(string $email, string $ip): array
+    {
+        // Email haché : pas d'adresse en clair dans le cache
+        return [
+            'email' => self::PREFIXE . 'email:' . sha1(mb_strtolower(trim($email))),
+            'ip' => self::PREFIXE . 'ip:' . $ip,
+        ];
+    }
+
+    private function store(): Repository
+    {
+        return Cache::store(config('auth.lockout.store'));
+    }
+}
@@ -0,0 +1,228 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\User;
+use Laravel\Sanctum\Sanctum;
+use Psr\Http\Message\ServerRequestInterface;
+use React\EventLoop\Loop;
+use React\Http\HttpServer;
+use React\Http\Message\Response;
+use React\Socket\SocketServer;
+use React\Stream\ThroughStream;
+use Throwable;
+
+/**
+ * Flux des nouvelles notifications (Server-Sent Events), servi par
+ * php artisan notifications:serve dans un processus à part, hors php-fpm.
+ *
+ * GET /notifications/stream?since={id} (jeton Bearer) garde la connexion ouverte :
+ * un événement `notifications` est envoyé à l'ouverture (notifications > since et
+ * nombre de non lues), puis à chaque notification reçue ou lue. Une boucle
+ * d'événements unique tient toutes les connexions ; un abonné inactif ne coûte
+ * qu'un descripteur et quelques Kio, aucun processus PHP.
+ *
+ * Toutes les INTERVALLE_S secondes, les marqueurs de cache des abonnés sont relus
+ * en une requête (NotificationStream::marqueurs) ; la table notifications n'est lue
+ * que pour les utilisateurs dont le marqueur a changé.
+ */
+class NotificationServer
+{
+    // Relecture des marqueurs : délai maximal avant qu'une notification soit poussée
+    private const INTERVALLE_S = 1.0;
+
+    // Commentaire SSE envoyé aux connexions inactives (proxys, détection des clients partis)
+    private const BATTEMENT_S = 20.0;
+
+    /**
+     * Abonnés par connexion : ['user_id' => int, 'curseur' => int, 'marqueur' => ?string, 'flux' => ThroughStream]
+     *
+     * @var array<int, array>
+     */
+    private array $abonnes = [];
+
+    private int $prochainId = 0;
+
+    public function __construct(private NotificationStream $stream)
+    {
+    }
+
+    /**
+     * Démarre le serveur sur $adresse (ex. 0.0.0.0:8081) ; ne rend la main qu'à l'arrêt de la boucle.
+     */
+    public function ecouter(string $adresse): void
+    {
+        $http = new HttpServer(fn (ServerRequestInterface $requete) => $this->repondre($requete));
+        $http->listen(new SocketServer($adresse));
+
+        Loop::addPeriodicTimer(self::INTERVALLE_S, fn () => $this->relever());
+        Loop::addPeriodicTimer(self::BATTEMENT_S, fn () => $this->diffuser(": battement\n\n"));
+        Loop::run();
+    }
+
+    public function nombreAbonnes(): int
+    {
+        return count($this->abonnes);
+    }
+
+    public function repondre(ServerRequestInterface $requete): Response
+    {
+        if ($requete->getMethod() === 'OPTIONS') {
+            return new Response(204, $this->entetesCors($requete));
+        }
+        if ($requete->getMethod() !== 'GET' || rtrim($requete->getUri()->getPath(), '/') !== '/notifications/stream') {
+            return $this->json($requete, 404, ['message' => 'Not Found']);
+        }
+
+        $userId = $this->authentifier($requete->getHeaderLine('Authorization'));
+        if ($userId === null) {
+            return $this->json($requete, 401, ['message' => 'Unauthenticated.']);
+        }
+
+        // Reconnexion d'un EventSource : Last-Event-ID porte le dernier curseur reçu
+        $depuis = $requete->getQueryParams()['since'] ?? $requete->getHeaderLine('Last-Event-ID');
+        if (!ctype_digit((string) $depuis)) {
+            return $this->json($requete, 422, ['message' => 'Le paramètre since doit être un entier positif.']);
+        }
+
+        $flux = new ThroughStream();
+        $id = $this->prochainId++;
+        $this->abonnes[$id] = [
+            'user_id' => $userId,
+            'curseur' => (int) $depuis,
+            // Lu avant les notifications (voir NotificationStream::marqueur)
+            'marqueur' => $this->stream->marqueur($userId),
+            'flux' => $flux,
+        ];
+        $flux->on('close', function () use ($id) {
+            unset($this->abonnes[$id]);
+        });
+
+        // Premier événement après l'envoi des en-têtes
+        Loop::futureTick(function () use ($id, $userId) {
+            try {
+                $this->envoyer([$id], $this->stream->nonLues([$userId]));
+            } catch (Throwable $e) {
+                report($e);
+            }
+        });
+
+        return new Response(200, [
+            'Content-Type' => 'text/event-stream',
+            'Cache-Control' => 'no-cache',
+            // nginx : ne pas mettre le flux en tampon
+            'X-Accel-Buffering' => 'no',
+            ...$this->entetesCors($requete),
+        ], $flux);
+    }
+
+    /**
+     * Relit les marqueurs des abonnés et pousse les nouveautés à ceux dont le marqueur a changé.
+     */
+    public function relever(): void
+    {
+        if (!$this->abonnes) {
+            return;
+        }
+
+        try {
+            $marqueurs = $this->stream->marqueurs(array_values(array_unique(array_column($this->abonnes, 'user_id'))));
+            $changes = [];
+            foreach ($this->abonnes as $id => $abonne) {
+                if ($marqueurs[$abonne['user_id']] !== $abonne['marqueur']) {
+                    $this->abonnes[$id]['marqueur'] = $marqueurs[$abonne['user_id']];
+                    $changes[] = $id;
+                }
+            }
+            if ($changes) {
+                $userIds = array_values(array_unique(array_map(fn ($id) => $this->abonnes[$id]['user_id'], $changes)));
+                $this->envoyer($changes, $this->stream->nonLues($userIds));
+            }
+        } catch (Throwable $e) {
+            // Base ou cache indisponible : on réessaie au prochain tour, les connexions restent ouvertes
+            report($e);
+        }
+    }
+
+    /**
+     * Envoie à chaque abonné ses notifications postérieures à son curseur et son nombre de non lues.
+     *
+     * @param  array<int>  $ids  abonnés
+     * @param  array<int, int>  $nonLues  user_id => non lues
+     */
+    private function envoyer(array $ids, array $nonLues): void
+    {
+        foreach ($ids as $id) {
+            $abonne = $this->abonnes[$id] ?? null;
+            if ($abonne === null) {
+                continue;
+            }
+            $nouvelles = $this->stream->depuis($abonne['user_id'], $abonne['curseur']);
+            $curseur = $nouvelles->max('id') ?? $abonne['curseur'];
+            $this->abonnes[$id]['curseur'] = $curseur;
+            if ($nouvelles->count() >= NotificationStream::LIMITE) {
+                // Page pleine : il en reste, le prochain tour relira la table quel que soit le marqueur
+                $this->abonnes[$id]['marqueur'] = '';
+            }
+
+            $abonne['flux']->write(sprintf(
+                "id: %d\nevent: notifications\ndata: %s\n\n",
+                $curseur,
+                json_encode([
+                    'notifications' => $nouvelles,
+                    'curseur' => $curseur,
+                    'non_lues' => $nonLues[$abonne['user_id']] ?? 0,
+                ])
+            ));
+        }
+    }
+
+    private function diffuser(string $message): void
+    {
+        foreach ($this->abonnes as $abonne) {
+            $abonne['flux']->write($message);
+        }
+    }
+
+    /**
+     * Utilisateur du jeton Bearer, avec les vérifications du garde Sanctum (expiration).
+     */
+    private function authentifier(string $entete): ?int
+    {
+        if (!str_starts_with($entete, 'Bearer ')) {
+            return null;
+        }
+
+        $jeton = Sanctum::$personalAccessTokenModel::findToken(substr($entete, 7));
+        $expiration = config('sanctum.expiration');
+        if (!$jeton
+            || ($expiration && $jeton->created_at->lte(now()->subMinutes($expiration)))
+            || ($jeton->expires_at && $jeton->expires_at->isPast())
+            || !$jeton->tokenable instanceof User) {
+            return null;
+        }
+
+        return $jeton->tokenable->id;
+    }
+
+    private function entetesCors(ServerRequestInterface $requete): array
+    {
+        $origine = $requete->getHeaderLine('Origin');
+        $autorisees = config('cors.allowed_origins', []);
+        if ($origine === '' || (!in_array('*', $autorisees, true) && !in_array($origine, $autorisees, true))) {
+            return [];
+        }
+
+        return [
+            'Access-Control-Allow-Origin' => $origine,
+            'Access-Control-Allow-Headers' => 'Authorization, Accept, Last-Event-ID',
+            'Access-Control-Allow-Methods' => 'GET, OPTIONS',
+            'Vary' => 'Origin',
+        ];
+    }
+
+    private function json(ServerRequestInterface $requete, int $statut, array $corps): Response
+    {
+        return new Response($statut, ['Content-Type' => 'application/json', ...$this->entetesCors($requete)], json_encode($corps));
+    }
+}
@@ -0,0 +1,151 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Notification;
+use App\Models\User;
+use Illuminate\Database\Eloquent\Collection;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Str;
+
+/**
+ * Nouvelles notifications par abonné et compteur de non lues.
+ *
+ * Chaque utilisateur a un marqueur dans le cache, remplacé à chaque notification
+ * reçue ou lue. Le serveur du flux (NotificationServer, hors php-fpm) relit d'un
+ * coup les marqueurs de ses abonnés et n'interroge la table notifications que
+ * pour ceux dont le marqueur a changé.
+ *
+ * Le compteur users.notifications_non_lues est tenu à jour à chaque écriture :
+ * événements du modèle Notification pour les create()/update(), appels explicites
+ * pour les insertions et mises à jour groupées.
+ */
+class NotificationStream
+{
+    private const PREFIXE = 'notifications:marqueur:';
+
+    // Notifications envoyées au plus par événement (les suivantes à l'événement d'après)
+    public const LIMITE = 50;
+
+    // Durée de vie d'un marqueur dans le cache (secondes)
+    private const DUREE_MARQUEUR = 3600;
+
+    /**
+     * Notifications créées pour ces utilisateurs (non lues) : compteur et marqueur.
+     *
+     * @param  array<int>  $userIds  un identifiant par notification (doublons possibles)
+     */
+    public function ajoutees(array $userIds): void
+    {
+        // Une requête par nombre distinct de notifications (en général une seule)
+        $parNombre = [];
+        foreach (array_count_values($userIds) as $userId => $nombre) {
+            $parNombre[$nombre][] = $userId;
+        }
+        foreach ($parNombre as $nombre => $ids) {
+            User::whereIn('id', $ids)->increment('notifications_non_lues', $nombre);
+        }
+
+        $this->signaler(array_unique($userIds));
+    }
+
+    /**
+     * Une notification non lue de l'utilisateur a été lue ou supprimée.
+     */
+    public function retiree(int $userId): void
+    {
+        User::whereKey($userId)->where('notifications_non_lues', '>', 0)->decrement('notifications_non_lues');
+        $this->signaler([$userId]);
+    }
+
+    /**
+     * Toutes les notifications de l'utilisateur ont été marquées comme lues.
+     * Recompté plutôt que remis à 0 : une notification a pu arriver entre-temps.
+     */
+    public function toutesLues(int $userId): void
+    {
+        $this->recompter([$userId]);
+        $this->signaler([$userId]);
+    }
+
+    /**
+     * Recalcule les compteurs depuis la table (après des insertions hors modèles).
+     *
+     * @param  array<int>|null  $userIds  null : tous les utilisateurs
+     */
+    public function recompter(?array $userIds = null): void
+    {
+        DB::table('users')
+            ->when($userIds !== null, fn ($q) => $q->whereIn('id', $userIds))
+            ->update([
+                'notifications_non_lues' => DB::table('notifications')
+                    ->selectRaw('COUNT(*)')
+                    ->whereColumn('notifications.user_id', 'users.id')
+                    ->whereNull('read_at'),
+            ]);
+    }
+
+    /**
+     * Marqueur courant de l'utilisateur, créé s'il a expiré du cache.
+     *
+     * À lire avant les notifications : une notification écrite entre les deux
+     * change le marqueur et sera vue au relevé suivant.
+     */
+    public function marqueur(int $userId): string
+    {
+        return Cache::remember(self::PREFIXE . $userId, self::DUREE_MARQUEUR, fn () => Str::random(8));
+    }
+
+    /**
+     * Marqueurs de plusieurs utilisateurs en une lecture du cache (null : expiré).
+     *
+     * @param  array<int>  $userIds
+     * @return array<int, ?string>
+     */
+    public function marqueurs(array $userIds): array
+    {
+        $valeurs = Cache::many(array_map(fn ($id) => self::PREFIXE . $id, $userIds));
+
+        return array_combine($userIds, array_values($valeurs));
+    }
+
+    /**
+     * Notifications d'identifiant > $depuis (au plus LIMITE, les plus anciennes d'abord).
+     */
+    public function depuis(int $userId, int $depuis): Collection
+    {
+        return Notification::where('user_id', $userId)
+            ->where('id', '>', $depuis)
+            ->orderBy('id')
+            ->limit(self::LIMITE)
+            ->get();
+    }
+
+    /**
+     * Compteurs de non lues de plusieurs utilisateurs (une requête).
+     *
+     * @param  array<int>  $userIds
+     * @return array<int, int>
+     */
+    public function nonLues(array $userIds): array
+    {
+        return User::whereIn('id', $userIds)
+            ->pluck('notifications_non_lues', 'id')
+            ->map(fn ($nombre) => (int) $nombre)
+            ->all();
+    }
+
+    /**
+     * Publié après le commit : un relevé qui verrait le nouveau marqueur avant la
+     * notification garderait ce marqueur et ne relirait plus la table.
+     *
+     * @param  array<int>  $userIds
+     */
+    private function signaler(array $userIds): void
+    {
+        $version = Str::random(8);
+        $cles = array_map(fn ($id) => self::PREFIXE . $id, $userIds);
+        DB::afterCommit(fn () => Cache::putMany(array_fill_keys($cles, $version), self::DUREE_MARQUEUR));
+    }
+}
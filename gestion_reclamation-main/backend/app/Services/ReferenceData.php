@@ -0,0 +1,93 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Filiere;
+use App\Models\Role;
+use Illuminate\Database\Eloquent\Collection;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Str;
+
+/**
+ * Données de référence quasi statiques : rôles et filières.
+ *
+ * Deux niveaux : le cache partagé (clé versionnée, comme GradeSheetCache) et une
+ * copie en mémoire pour la durée de la requête ou du job (service « scoped »).
+ * Chaque jeu porte un ETag calculé sur son contenu, pour répondre 304 aux
+ * requêtes conditionnelles.
+ *
+ * Invalidé par les événements des modèles Role et Filiere, et explicitement par
+ * les seeders qui désactivent ces événements (WithoutModelEvents).
+ */
+class ReferenceData
+{
+    private const PREFIXE = 'reference:';
+
+    // Copie locale : ['roles' => ['donnees' => [...], 'etag' => '...'], ...]
+    private array $jeux = [];
+
+    /**
+     * @return Collection<int, Role>
+     */
+    public function roles(): Collection
+    {
+        return Role::hydrate($this->jeu('roles')['donnees']);
+    }
+
+    /**
+     * @return Collection<int, Filiere>
+     */
+    public function filieres(): Collection
+    {
+        return Filiere::hydrate($this->jeu('filieres')['donnees']);
+    }
+
+    /**
+     * Données brutes et ETag d'un jeu ('roles' ou 'filieres'), pour les routes publiques.
+     *
+     * @return array{donnees: array, etag: string}
+     */
+    public function jeu(string $nom): array
+    {
+        if (!isset($this->jeux[$nom])) {
+            $version = Cache::get(self::PREFIXE . 'version', '0');
+            $this->jeux[$nom] = Cache::remember(self::PREFIXE . "{$nom}:{$version}", now()->addDay(), function () use ($nom) {
+                $modele = $nom === 'roles' ? Role::class : Filiere::class;
+                $donnees = $modele::query()->orderBy('id')->get()->map->getAttributes()->all();
+
+                return ['donnees' => $donnees, 'etag' => sha1(json_encode($donnees))];
+            });
+        }
+
+        return $this->jeux[$nom];
+    }
+
+    public function role(?int $roleId): ?Role
+    {
+        return $this->roles()->firstWhere('id', $roleId);
+    }
+
+    public function roleName(?int $roleId): ?string
+    {
+        return collect($this->jeu('roles')['donnees'])->firstWhere('id', $roleId)['name'] ?? null;
+    }
+
+    public function roleId(string $roleName): ?int
+    {
+        return collect($this->jeu('roles')['donnees'])->firstWhere('name', $roleName)['id'] ?? null;
+    }
+
+    public function filiere(?int $filiereId): ?Filiere
+    {
+        return $this->filieres()->firstWhere('id', $filiereId);
+    }
+
+    /**
+     * Périme les deux jeux (cache partagé et copie locale).
+     */
+    public function invalider(): void
+    {
+        Cache::forever(self::PREFIXE . 'version', Str::random(8));
+        $this->jeux = [];
+    }
+}
@@ -41,6 +41,42 @@
 
     'debug' => (bool) env('APP_DEBUG', false),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Performance Profiler
+    |--------------------------------------------------------------------------
+    |
+    | When enabled, every response carries "X-Query-Count", "Server-Timing"
+    | (SQL time, application time, total time, peak memory, cache store) and
+    | "X-N-Plus-One" headers (see App\Http\Middleware\PerformanceProfiler).
+    | Queries on the cache, queue and session tables are counted separately
+    | in "X-Query-Count-Infra". SELECT shapes repeated at least
+    | "seuil_n_plus_un" times are logged as probable N+1;
+    | "journal" also logs one line per request. Meant for benchmarks and
+    | local profiling, never for production. QUERY_COUNT_HEADER is still
+    | accepted as the switch.
+    |
+    */
+
+    'profiler' => [
+        'actif' => (bool) env('PERFORMANCE_PROFILER', env('QUERY_COUNT_HEADER', false)),
+        'seuil_n_plus_un' => (int) env('PROFILER_N_PLUS_ONE_THRESHOLD', 3),
+        'journal' => (bool) env('PROFILER_LOG', false),
+    ],
+
+    /*
+    |--------------------------------------------------------------------------
+    | Trusted Proxies
+    |--------------------------------------------------------------------------
+    |
+    | Comma separated addresses (or "*") of the proxies whose X-Forwarded-For
+    | header gives the client address used by the login lockout. Empty: the
+    | connection address is used and X-Forwarded-For is ignored.
+    |
+    */
+
+    'trusted_proxies' => env('TRUSTED_PROXIES'),
+
     /*
     |--------------------------------------------------------------------------
     | Application URL
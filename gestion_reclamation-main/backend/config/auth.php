@@ -112,4 +112,29 @@
 
     'password_timeout' => env('AUTH_PASSWORD_TIMEOUT', 10800),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Blocage après des connexions échouées
+    |--------------------------------------------------------------------------
+    |
+    | Échecs tolérés par email et par adresse IP sur une fenêtre glissante de
+    | "fenetre" secondes, avant un blocage de "duree_blocage" secondes (voir
+    | App\Services\LoginThrottle). Le seuil par IP reste haut : plusieurs
+    | utilisateurs légitimes peuvent partager une adresse (salle, NAT). Un
+    | seuil à 0 désactive le blocage correspondant.
+    |
+    | "store" : store de cache des compteurs (null : store par défaut). Un store
+    | à incrément atomique (redis, memcached, database) est préférable au
+    | store "file" sous forte concurrence.
+    |
+    */
+
+    'lockout' => [
+        'tentatives_email' => (int) env('LOGIN_LOCKOUT_EMAIL_ATTEMPTS', 3),
+        'tentatives_ip' => (int) env('LOGIN_LOCKOUT_IP_ATTEMPTS', 100),
+        'fenetre' => (int) env('LOGIN_LOCKOUT_WINDOW', 900),
+        'duree_blocage' => (int) env('LOGIN_LOCKOUT_DURATION', 900),
+        'store' => env('LOGIN_LOCKOUT_STORE'),
+    ],
+
 ];
@@ -114,4 +114,18 @@
 
     'prefix' => env('CACHE_PREFIX', Str::slug((string) env('APP_NAME', 'laravel')).'-cache-'),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Grade Sheet Cache Statistics
+    |--------------------------------------------------------------------------
+    |
+    | App\Services\GradeSheetCache records its hit / miss counters on one read
+    | in "grades_stats_echantillon" (each recorded read counts for that many),
+    | so that most cache hits do not write to the store. Set it to 1 for exact
+    | counts during a benchmark.
+    |
+    */
+
+    'grades_stats_echantillon' => (int) env('GRADES_CACHE_STATS_SAMPLE', 100),
+
 ];
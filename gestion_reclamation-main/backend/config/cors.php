@@ -30,7 +30,8 @@
 
     'allowed_headers' => ['*'],
 
-    'exposed_headers' => [],
+    // Mesures du profiler (PerformanceProfiler), lisibles par le frontend et les tests navigateur
+    'exposed_headers' => ['X-Query-Count', 'X-Query-Count-Infra', 'X-N-Plus-One', 'Server-Timing'],
 
     'max_age' => 0,
 
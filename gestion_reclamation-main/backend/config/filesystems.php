@@ -62,6 +62,23 @@
 
     ],
 
+    /*
+    |--------------------------------------------------------------------------
+    | Justificatifs des réclamations
+    |--------------------------------------------------------------------------
+    |
+    | Disque (privé) des justificatifs adressés par leur contenu, commande
+    | antivirus lancée par la file sur chaque nouveau fichier (ex: "clamdscan
+    | --no-summary" ; vide : pas d'analyse antivirale) et largeur des aperçus.
+    |
+    */
+
+    'justifications' => [
+        'disque' => env('JUSTIFICATIONS_DISK', 'local'),
+        'antivirus' => env('JUSTIFICATIONS_ANTIVIRUS'),
+        'apercu_largeur' => (int) env('JUSTIFICATIONS_PREVIEW_WIDTH', 320),
+    ],
+
     /*
     |--------------------------------------------------------------------------
     | Symbolic Links
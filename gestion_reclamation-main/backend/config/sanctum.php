@@ -49,6 +49,24 @@
 
     'expiration' => null,
 
+    /*
+    |--------------------------------------------------------------------------
+    | Token Cache & Pruning
+    |--------------------------------------------------------------------------
+    |
+    | App\Models\PersonalAccessToken caches token lookups for `cache_ttl`
+    | seconds and writes "last_used_at" at most once per `last_used_interval`
+    | seconds. The scheduled "tokens:prune" command deletes tokens unused for
+    | `prune_unused_days` days and tokens whose user no longer exists.
+    |
+    */
+
+    'cache_ttl' => (int) env('SANCTUM_TOKEN_CACHE_TTL', 60),
+
+    'last_used_interval' => (int) env('SANCTUM_LAST_USED_INTERVAL', 300),
+
+    'prune_unused_days' => (int) env('SANCTUM_PRUNE_UNUSED_DAYS', 30),
+
     /*
     |--------------------------------------------------------------------------
     | Token Prefix
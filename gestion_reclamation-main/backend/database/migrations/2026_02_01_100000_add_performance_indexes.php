@@ -0,0 +1,57 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Index composites des filtres les plus fréquents (voir tests/Feature/QueryPlanTest.php).
+     */
+    public function up(): void
+    {
+        Schema::table('demandes', function (Blueprint $table) {
+            // getByStatus et liste paginée filtrée par statut (+ plage de dates)
+            $table->index(['statut', 'created_at']);
+            // Demandes assignées à un enseignant, filtrées par statut
+            $table->index(['enseignant_id', 'statut']);
+        });
+
+        Schema::table('notifications', function (Blueprint $table) {
+            // UserController::getNotifications : user_id ORDER BY created_at DESC LIMIT 20
+            $table->index(['user_id', 'created_at']);
+        });
+
+        // Une seule note par (étudiant, matière) : on garde la plus récente des doublons
+        // avant de poser la contrainte sur laquelle s'appuie NoteController::store
+        $aGarder = DB::table('notes')->selectRaw('MAX(id) as id')->groupBy('user_id', 'matiere_id');
+        DB::table('notes')
+            ->whereNotIn('id', DB::query()->fromSub($aGarder, 'a_garder')->select('id'))
+            ->delete();
+
+        Schema::table('notes', function (Blueprint $table) {
+            $table->unique(['user_id', 'matiere_id']);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('notes', function (Blueprint $table) {
+            $table->dropUnique(['user_id', 'matiere_id']);
+        });
+
+        Schema::table('notifications', function (Blueprint $table) {
+            $table->dropIndex(['user_id', 'created_at']);
+        });
+
+        Schema::table('demandes', function (Blueprint $table) {
+            $table->dropIndex(['enseignant_id', 'statut']);
+            $table->dropIndex(['statut', 'created_at']);
+        });
+    }
+};
@@ -0,0 +1,37 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Compteur de notifications non lues tenu à jour à chaque écriture
+     * (voir App\Services\NotificationStream) au lieu d'un COUNT à chaque lecture.
+     */
+    public function up(): void
+    {
+        Schema::table('users', function (Blueprint $table) {
+            $table->unsignedInteger('notifications_non_lues')->default(0)->after('filiere_id');
+        });
+
+        DB::table('users')->update([
+            'notifications_non_lues' => DB::table('notifications')
+                ->selectRaw('COUNT(*)')
+                ->whereColumn('notifications.user_id', 'users.id')
+                ->whereNull('read_at'),
+        ]);
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('users', function (Blueprint $table) {
+            $table->dropColumn('notifications_non_lues');
+        });
+    }
+};
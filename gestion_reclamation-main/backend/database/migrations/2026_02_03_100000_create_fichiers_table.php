@@ -0,0 +1,44 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Justificatifs adressés par leur contenu (SHA-256) : un fichier joint à
+     * plusieurs demandes n'est stocké qu'une fois (voir App\Services\FichierStore).
+     * demandes.justification reste renseignée pour les fichiers déposés avant.
+     */
+    public function up(): void
+    {
+        Schema::create('fichiers', function (Blueprint $table) {
+            $table->id();
+            $table->char('sha256', 64)->unique();
+            $table->string('chemin');
+            $table->string('mime', 100);
+            $table->unsignedInteger('taille');
+            $table->enum('statut', ['en_attente', 'pret', 'rejete'])->default('en_attente');
+            $table->string('motif_rejet')->nullable();
+            $table->string('apercu')->nullable();
+            $table->timestamps();
+        });
+
+        Schema::table('demandes', function (Blueprint $table) {
+            $table->char('justification_sha256', 64)->nullable()->after('justification')->index();
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('demandes', function (Blueprint $table) {
+            $table->dropColumn('justification_sha256');
+        });
+
+        Schema::dropIfExists('fichiers');
+    }
+};
@@ -0,0 +1,36 @@
+<?php
+
+use App\Services\DemandeStats;
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Nombre de demandes par statut, globalement et par matière, enseignant et
+     * étudiant, tenu à jour à chaque écriture (voir App\Services\DemandeStats) :
+     * les tableaux de bord lisent quelques lignes au lieu de toutes les demandes.
+     */
+    public function up(): void
+    {
+        Schema::create('demande_compteurs', function (Blueprint $table) {
+            $table->string('portee', 10);
+            $table->unsignedBigInteger('cle');
+            $table->string('statut', 20);
+            $table->integer('nombre')->default(0);
+
+            $table->primary(['portee', 'cle', 'statut']);
+        });
+
+        app(DemandeStats::class)->recompter();
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('demande_compteurs');
+    }
+};
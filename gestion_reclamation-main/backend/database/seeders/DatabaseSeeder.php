@@ -6,6 +6,10 @@
 use App\Models\Matiere;
 use App\Models\Role;
 use App\Models\User;
+use App\Services\DemandeStats;
+use App\Services\GradeSheetCache;
+use App\Services\NotificationStream;
+use App\Services\ReferenceData;
 use Illuminate\Database\Console\Seeds\WithoutModelEvents;
 use Illuminate\Database\Seeder;
 use Illuminate\Support\Facades\Hash;
@@ -156,5 +160,11 @@ public function run(): void
             'demande_id' => 2,
             'created_at' => now()->subHours(2),
         ]);
+
+        // WithoutModelEvents : les caches ne sont pas invalidés par les modèles
+        app(ReferenceData::class)->invalider();
+        app(GradeSheetCache::class)->toutInvalider();
+        app(NotificationStream::class)->recompter();
+        app(DemandeStats::class)->recompter();
     }
 }
@@ -0,0 +1,413 @@
+<?php
+
+namespace Database\Seeders;
+
+use App\Services\DemandeStats;
+use App\Services\GradeSheetCache;
+use App\Services\NotificationStream;
+use Illuminate\Database\Seeder;
+use Illuminate\Support\Carbon;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Hash;
+use Random\Engine\Mt19937;
+use Random\Randomizer;
+
+/**
+ * Génère un jeu de données volumineux (étudiants, enseignants, matières, notes,
+ * demandes avec leurs historiques et notifications) par insertions groupées.
+ *
+ * Le résultat ne dépend que de la graine : deux exécutions avec les mêmes
+ * volumes produisent les mêmes lignes. Les rôles et filières doivent exister
+ * (php artisan db:seed). Voir la commande artisan db:seed-volume.
+ */
+class VolumeSeeder extends Seeder
+{
+    // Domaine des emails générés : permet de retrouver (et supprimer) le jeu de données
+    public const DOMAINE = 'volume.ibam.test';
+
+    // Date de référence fixe (et non now()) pour que les dates soient reproductibles
+    private const DATE_REFERENCE = '2026-01-15 08:00:00';
+
+    // Étapes franchies par une demande selon son statut final : [action, rôle]
+    private const CIRCUITS = [
+        'SOUMISE' => [],
+        'RECUE_SCOLARITE' => [['Réception scolarité', 'registrar']],
+        'REJETEE_SCOLARITE' => [['Rejet', 'registrar']],
+        'ENVOYEE_DA' => [['Réception scolarité', 'registrar'], ['Transfert au DA', 'registrar']],
+        'REJETEE_DA' => [['Transfert au DA', 'registrar'], ['Rejet', 'admin']],
+        'IMPUTEE_ENSEIGNANT' => [['Transfert au DA', 'registrar'], ['Imputation', 'admin']],
+        'VALIDEE' => [['Transfert au DA', 'registrar'], ['Imputation', 'admin'], ['Correction note', 'teacher']],
+        'NON_VALIDEE' => [['Transfert au DA', 'registrar'], ['Imputation', 'admin'], ['Rejet', 'teacher']],
+    ];
+
+    // Répartition des statuts finaux (poids relatifs)
+    private const POIDS_STATUTS = [
+        'SOUMISE' => 20,
+        'RECUE_SCOLARITE' => 10,
+        'REJETEE_SCOLARITE' => 10,
+        'ENVOYEE_DA' => 10,
+        'REJETEE_DA' => 5,
+        'IMPUTEE_ENSEIGNANT' => 10,
+        'VALIDEE' => 25,
+        'NON_VALIDEE' => 10,
+    ];
+
+    public array $volumes = [
+        'etudiants' => 20000,
+        'enseignants' => 200,
+        'scolarite' => 3,
+        'matieres' => 500,
+        'notes' => 200000,
+        'demandes' => 50000,
+    ];
+
+    public int $graine = 42;
+
+    public int $lot = 1000;
+
+    public bool $fresh = false;
+
+    private Randomizer $hasard;
+
+    private Carbon $reference;
+
+    /**
+     * Paramètre la génération (volumes partiels acceptés, les autres gardent leur valeur par défaut).
+     */
+    public function configurer(array $volumes, int $graine, int $lot, bool $fresh = false): static
+    {
+        $this->volumes = array_merge($this->volumes, array_filter($volumes, fn ($v) => $v !== null));
+        $this->graine = $graine;
+        $this->lot = max(1, $lot);
+        $this->fresh = $fresh;
+
+        return $this;
+    }
+
+    public function run(): void
+    {
+        $this->hasard = new Randomizer(new Mt19937($this->graine));
+        $this->reference = Carbon::parse(self::DATE_REFERENCE);
+
+        foreach (['etudiants', 'enseignants', 'scolarite', 'matieres'] as $cle) {
+            if ($this->volumes[$cle] < 1) {
+                throw new \InvalidArgumentException("Le volume '{$cle}' doit être au moins 1");
+            }
+        }
+
+        $this->nettoyer();
+
+        $roles = DB::table('roles')->pluck('id', 'name');
+        $filieres = DB::table('filieres')->orderBy('id')->get(['id', 'name', 'niveau'])->keyBy('id');
+        if (!isset($roles['student'], $roles['teacher'], $roles['registrar'], $roles['admin']) || $filieres->isEmpty()) {
+            throw new \RuntimeException('Rôles ou filières absents : lancer d\'abord php artisan db:seed');
+        }
+
+        // Un seul hachage pour tous les comptes générés (bcrypt est volontairement lent)
+        $motDePasse = Hash::make('password');
+
+        $etudiants = $this->etape('étudiants', fn () => $this->creerUtilisateurs(
+            'etudiant', 'Etudiant Volume', $roles['student'], $this->volumes['etudiants'], $motDePasse, $filieres->keys()->all()
+        ));
+        $enseignants = $this->etape('enseignants', fn () => $this->creerUtilisateurs(
+            'enseignant', 'Enseignant Volume', $roles['teacher'], $this->volumes['enseignants'], $motDePasse
+        ));
+        $scolarite = $this->etape('scolarité / DA', function () use ($roles, $motDePasse) {
+            return [
+                'registrar' => array_keys($this->creerUtilisateurs('scolarite', 'Scolarite Volume', $roles['registrar'], $this->volumes['scolarite'], $motDePasse)),
+                'admin' => array_keys($this->creerUtilisateurs('da', 'DA Volume', $roles['admin'], 1, $motDePasse)),
+            ];
+        });
+
+        $matieres = $this->etape('matières', fn () => $this->creerMatieres(array_keys($enseignants), $filieres->keys()->all()));
+
+        // Matières par filière, pour ne noter un étudiant que dans les matières de sa filière
+        $matieresParFiliere = [];
+        foreach ($matieres as $id => $matiere) {
+            $matieresParFiliere[$matiere->filiere_id][] = $id;
+        }
+
+        $this->etape('notes', fn () => $this->creerNotes($etudiants, $matieresParFiliere, array_keys($matieres)));
+        $this->etape('demandes, historiques et notifications', fn () => $this->creerDemandes(
+            $etudiants, $matieres, $matieresParFiliere, $filieres, $enseignants, $scolarite
+        ));
+
+        // Les insertions groupées ne passent pas par les modèles : feuilles de notes en cache
+        // périmées, compteurs de notifications non lues et de demandes à recalculer
+        app(GradeSheetCache::class)->toutInvalider();
+        $this->etape('compteurs de notifications', fn () => app(NotificationStream::class)->recompter());
+        $this->etape('compteurs de demandes', fn () => app(DemandeStats::class)->recompter());
+    }
+
+    /**
+     * Supprime une génération précédente (--fresh) ou refuse de générer des doublons.
+     * Les matières, notes, demandes, historiques et notifications suivent par cascade.
+     */
+    private function nettoyer(): void
+    {
+        $existants = DB::table('users')->where('email', 'like', '%@' . self::DOMAINE);
+        if (!$existants->exists()) {
+            return;
+        }
+        if (!$this->fresh) {
+            throw new \RuntimeException('Des données de volume existent déjà : relancer avec --fresh pour les remplacer');
+        }
+        $this->etape('suppression de la génération précédente', fn () => $existants->delete());
+    }
+
+    /**
+     * Exécute une étape de génération en affichant sa durée.
+     */
+    private function etape(string $libelle, callable $traitement)
+    {
+        $debut = microtime(true);
+        $resultat = $traitement();
+        $this->command?->info(sprintf('%s : %.1f s', $libelle, microtime(true) - $debut));
+
+        return $resultat;
+    }
+
+    /**
+     * Insère $nombre comptes par lots.
+     *
+     * @return array id => ['nom' => ..., 'filiere_id' => ...]
+     */
+    private function creerUtilisateurs(string $prefixe, string $nom, int $roleId, int $nombre, string $motDePasse, array $filiereIds = []): array
+    {
+        $maintenant = $this->reference->toDateTimeString();
+        $lignes = [];
+        for ($i = 1; $i <= $nombre; $i++) {
+            $lignes[] = [
+                'name' => "{$nom} {$i}",
+                'email' => "{$prefixe}{$i}@" . self::DOMAINE,
+                'password' => $motDePasse,
+                'role_id' => $roleId,
+                'filiere_id' => $filiereIds ? $filiereIds[$this->hasard->getInt(0, count($filiereIds) - 1)] : null,
+                'created_at' => $maintenant,
+                'updated_at' => $maintenant,
+            ];
+        }
+        $this->inserer('users', $lignes);
+
+        return DB::table('users')
+            ->where('email', 'like', "{$prefixe}%@" . self::DOMAINE)
+            ->where('role_id', $roleId)
+            ->orderBy('id')
+            ->get(['id', 'name', 'filiere_id'])
+            ->mapWithKeys(fn ($u) => [$u->id => ['nom' => $u->name, 'filiere_id' => $u->filiere_id]])
+            ->all();
+    }
+
+    /**
+     * @return array id => objet {filiere_id, enseignant_id}
+     */
+    private function creerMatieres(array $enseignantIds, array $filiereIds): array
+    {
+        $maintenant = $this->reference->toDateTimeString();
+        $lignes = [];
+        for ($i = 1; $i <= $this->volumes['matieres']; $i++) {
+            $lignes[] = [
+                'name' => "Matière Volume {$i}",
+                'filiere_id' => $filiereIds[($i - 1) % count($filiereIds)],
+                'enseignant_id' => $enseignantIds[$this->hasard->getInt(0, count($enseignantIds) - 1)],
+                'created_at' => $maintenant,
+                'updated_at' => $maintenant,
+            ];
+        }
+        $this->inserer('matieres', $lignes);
+
+        return DB::table('matieres')
+            ->whereIn('enseignant_id', $enseignantIds)
+            ->orderBy('id')
+            ->get(['id', 'filiere_id', 'enseignant_id'])
+            ->keyBy('id')
+            ->all();
+    }
+
+    /**
+     * Répartit les notes entre les étudiants, au plus une note par (étudiant, matière).
+     */
+    private function creerNotes(array $etudiants, array $matieresParFiliere, array $toutesMatieres): void
+    {
+        $nbEtudiants = count($etudiants);
+        $parEtudiant = intdiv($this->volumes['notes'], $nbEtudiants);
+        $reste = $this->volumes['notes'] % $nbEtudiants;
+        $maintenant = $this->reference->toDateTimeString();
+
+        $lot = [];
+        $rang = 0;
+        foreach ($etudiants as $etudiantId => $etudiant) {
+            $candidates = $matieresParFiliere[$etudiant['filiere_id']] ?? $toutesMatieres;
+            $nombre = min(count($candidates), $parEtudiant + ($rang++ < $reste ? 1 : 0));
+            if ($nombre === 0) {
+                continue;
+            }
+            foreach ($this->hasard->pickArrayKeys($candidates, $nombre) as $cle) {
+                $lot[] = [
+                    'user_id' => $etudiantId,
+                    'matiere_id' => $candidates[$cle],
+                    'note' => $this->hasard->getInt(0, 80) / 4,
+                    'commentaire' => null,
+                    'created_at' => $maintenant,
+                    'updated_at' => $maintenant,
+                ];
+                if (count($lot) >= $this->lot) {
+                    DB::table('notes')->insert($lot);
+                    $lot = [];
+                }
+            }
+        }
+        if ($lot) {
+            DB::table('notes')->insert($lot);
+        }
+    }
+
+    /**
+     * Crée les demandes par lots ; pour chaque lot inséré, les historiques et
+     * notifications correspondant aux étapes franchies sont insérés à leur tour.
+     */
+    private function creerDemandes(array $etudiants, array $matieres, array $matieresParFiliere, $filieres, array $enseignants, array $scolarite): void
+    {
+        $etudiantIds = array_keys($etudiants);
+        $toutesMatieres = array_keys($matieres);
+        $tirageStatut = [];
+        foreach (self::POIDS_STATUTS as $statut => $poids) {
+            array_push($tirageStatut, ...array_fill(0, $poids, $statut));
+        }
+
+        $dernierId = DB::table('demandes')->max('id') ?? 0;
+        $restant = $this->volumes['demandes'];
+
+        while ($restant > 0) {
+            $taille = min($this->lot, $restant);
+            $restant -= $taille;
+
+            $demandes = [];
+            $plans = [];
+            for ($i = 0; $i < $taille; $i++) {
+                $etudiantId = $etudiantIds[$this->hasard->getInt(0, count($etudiantIds) - 1)];
+                $etudiant = $etudiants[$etudiantId];
+                $candidates = $matieresParFiliere[$etudiant['filiere_id']] ?? $toutesMatieres;
+                $matiere = $matieres[$candidates[$this->hasard->getInt(0, count($candidates) - 1)]];
+                $statut = $tirageStatut[$this->hasard->getInt(0, count($tirageStatut) - 1)];
+                $etapes = self::CIRCUITS[$statut];
+                $imputee = in_array('Imputation', array_column($etapes, 0), true);
+                $creation = $this->reference->copy()->subSeconds($this->hasard->getInt(0, 180 * 86400));
+                $filiere = $filieres[$etudiant['filiere_id']];
+                $noteActuelle = $this->hasard->getInt(0, 60) / 4;
+                $noteDemandee = min(20, $noteActuelle + $this->hasard->getInt(1, 4));
+
+                $demandes[] = [
+                    'nom_prenom' => $etudiant['nom'],
+                    'filiere_niveau' => "{$filiere->name} {$filiere->niveau}",
+                    'matiere_id' => $matiere->id,
+                    'enseignant_id' => $imputee ? $matiere->enseignant_id : null,
+                    'enseignant_nom' => $enseignants[$matiere->enseignant_id]['nom'],
+                    'objet' => 'Contestation de note',
+                    'objectif' => "Passer de {$noteActuelle} à {$noteDemandee}",
+                    'motif' => 'Erreur de report de note',
+                    'justification' => null,
+                    'statut' => $statut,
+                    'user_id' => $etudiantId,
+                    'note_actuelle' => $noteActuelle,
+                    'note_demandee' => $noteDemandee,
+                    'note_finale' => $statut === 'VALIDEE' ? $noteDemandee : null,
+                    'commentaire_scolarite' => null,
+                    'commentaire_enseignant' => null,
+                    'created_at' => $creation->toDateTimeString(),
+                    'updated_at' => $creation->copy()->addHours(count($etapes) * 24)->toDateTimeString(),
+                ];
+                $plans[] = [$etudiantId, $matiere->enseignant_id, $etapes, $creation];
+            }
+
+            DB::table('demandes')->insert($demandes);
+            $ids = DB::table('demandes')->where('id', '>', $dernierId)->orderBy('id')->limit($taille)->pluck('id')->all();
+            $dernierId = end($ids);
+
+            $this->creerSuivi($ids, $plans, $scolarite);
+        }
+    }
+
+    /**
+     * Historiques et notifications d'un lot de demandes, comme les écrirait DemandeController.
+     */
+    private function creerSuivi(array $ids, array $plans, array $scolarite): void
+    {
+        $historiques = [];
+        $notifications = [];
+
+        foreach ($ids as $index => $demandeId) {
+            [$etudiantId, $enseignantId, $etapes, $date] = $plans[$index];
+            $date = $date->copy();
+
+            $historiques[] = $this->ligneSuivi($demandeId, $etudiantId, $date, [
+                'action' => 'Création de la demande',
+                'details' => 'Demande soumise',
+            ]);
+            foreach ($scolarite['registrar'] as $agentId) {
+                $notifications[] = $this->ligneSuivi($agentId, null, $date, [
+                    'message' => 'Nouvelle réclamation soumise',
+                    'type' => 'new_claim',
+                    'demande_id' => $demandeId,
+                    'read_at' => $this->lue($date),
+                ]);
+            }
+
+            foreach ($etapes as [$action, $role]) {
+                $date->addHours(24);
+                $auteurId = $role === 'teacher' ? $enseignantId : $scolarite[$role][0];
+                $historiques[] = $this->ligneSuivi($demandeId, $auteurId, $date, [
+                    'action' => $action,
+                    'details' => $action,
+                ]);
+                if ($action === 'Imputation') {
+                    $notifications[] = $this->ligneSuivi($enseignantId, null, $date, [
+                        'message' => 'Une nouvelle demande de correction vous a été assignée.',
+                        'type' => 'assignment',
+                        'demande_id' => $demandeId,
+                        'read_at' => $this->lue($date),
+                    ]);
+                }
+                $notifications[] = $this->ligneSuivi($etudiantId, null, $date, [
+                    'message' => "Mise à jour de votre réclamation : {$action}",
+                    'type' => 'status_update',
+                    'demande_id' => $demandeId,
+                    'read_at' => $this->lue($date),
+                ]);
+            }
+        }
+
+        $this->inserer('historique_actions', $historiques);
+        $this->inserer('notifications', $notifications);
+    }
+
+    /**
+     * Ligne d'historique (demande_id + user_id) ou de notification (user_id seul).
+     */
+    private function ligneSuivi(int $premierId, ?int $auteurId, Carbon $date, array $champs): array
+    {
+        $cles = $auteurId === null
+            ? ['user_id' => $premierId]
+            : ['demande_id' => $premierId, 'user_id' => $auteurId];
+
+        return $cles + $champs + [
+            'created_at' => $date->toDateTimeString(),
+            'updated_at' => $date->toDateTimeString(),
+        ];
+    }
+
+    /**
+     * Environ 70 % des notifications sont marquées comme lues, quelques heures après.
+     */
+    private function lue(Carbon $date): ?string
+    {
+        return $this->hasard->getInt(1, 10) <= 7 ? $date->copy()->addHours(6)->toDateTimeString() : null;
+    }
+
+    private function inserer(string $table, array $lignes): void
+    {
+        foreach (array_chunk($lignes, $this->lot) as $lot) {
+            DB::table($table)->insert($lot);
+        }
+    }
+}
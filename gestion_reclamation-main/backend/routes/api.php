@@ -2,7 +2,10 @@
 
 use App\Http\Controllers\AuthController;
 use App\Http\Controllers\DemandeController;
+use App\Http\Controllers\FichierController;
 use App\Http\Controllers\MatiereController;
+use App\Http\Controllers\ReferenceController;
+use App\Http\Controllers\StatsController;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Route;
 
@@ -13,11 +16,13 @@
 Route::post('/login', [AuthController::class, 'login']);
 
 // Routes de référence (Rôles et Filières)
-Route::get('/roles', function() {
-    return \App\Models\Role::all();
-});
-Route::get('/filieres', function() {
-    return \App\Models\Filiere::all();
+Route::get('/roles', [ReferenceController::class, 'roles']);
+Route::get('/filieres', [ReferenceController::class, 'filieres']);
+
+// Justificatifs : liens signés (utilisables dans un <a> ou un <img>, sans jeton Bearer)
+Route::middleware('signed')->group(function () {
+    Route::get('/fichiers/{sha256}', [FichierController::class, 'show'])->name('fichiers.show');
+    Route::get('/fichiers/{sha256}/apercu', [FichierController::class, 'apercu'])->name('fichiers.apercu');
 });
 
 // Routes protégées (nécessitent un token Bearer valide)
@@ -25,8 +30,12 @@
     Route::post('/logout', [AuthController::class, 'logout']);
     Route::get('/user', [AuthController::class, 'user']);
 
+    // Statistiques des tableaux de bord (compteurs par statut)
+    Route::get('stats', [StatsController::class, 'index']);
+
     // Gestion des demandes / réclamations
     Route::get('demandes', [DemandeController::class, 'index']);
+    Route::get('demandes/export', [DemandeController::class, 'export']);
     Route::post('demandes', [DemandeController::class, 'store']);
     Route::get('demandes/{id}', [DemandeController::class, 'show']);
     Route::post('demandes/{id}/valider', [DemandeController::class, 'valider']);
@@ -39,9 +48,12 @@
     Route::apiResource('matieres', MatiereController::class);
 
     // Gestion des Notes
+    Route::get('notes/export', [\App\Http\Controllers\NoteController::class, 'export']);
     Route::apiResource('notes', \App\Http\Controllers\NoteController::class);
     Route::get('matieres/{id}/grades', [\App\Http\Controllers\NoteController::class, 'getGradesByMatiere']);
+    Route::put('matieres/{id}/grades', [\App\Http\Controllers\NoteController::class, 'saveGradesByMatiere']);
     Route::get('users/{id}/grades', [\App\Http\Controllers\NoteController::class, 'getStudentGrades']);
+    Route::match(['get', 'delete'], 'grades/cache-stats', [\App\Http\Controllers\NoteController::class, 'gradesCacheStats']);
 
     // Gestion des Enseignants
     Route::get('teachers', [\App\Http\Controllers\TeachersController::class, 'index']);
@@ -55,5 +67,7 @@
     Route::delete('users/{id}', [\App\Http\Controllers\UserController::class, 'destroy']);
     Route::get('users/enseignants', [\App\Http\Controllers\UserController::class, 'getEnseignants']);
     Route::get('notifications', [\App\Http\Controllers\UserController::class, 'getNotifications']);
+    // Nouvelles notifications en direct : php artisan notifications:serve (hors php-fpm)
+    Route::post('notifications/read-all', [\App\Http\Controllers\UserController::class, 'markAllNotificationsAsRead']);
     Route::post('notifications/{id}/read', [\App\Http\Controllers\UserController::class, 'markNotificationAsRead']);
 });
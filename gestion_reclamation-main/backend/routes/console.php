@@ -1,8 +1,82 @@
 <?php
 
+use App\Models\PersonalAccessToken;
+use App\Models\User;
+use App\Services\DemandeStats;
+use App\Services\NotificationServer;
+use App\Services\NotificationStream;
+use Database\Seeders\VolumeSeeder;
 use Illuminate\Foundation\Inspiring;
 use Illuminate\Support\Facades\Artisan;
+use Illuminate\Support\Facades\Schedule;
 
 Artisan::command('inspire', function () {
     $this->comment(Inspiring::quote());
 })->purpose('Display an inspiring quote');
+
+Artisan::command(
+    'db:seed-volume
+        {--etudiants=20000} {--enseignants=200} {--matieres=500} {--notes=200000} {--demandes=50000}
+        {--graine=42 : Graine du générateur (même graine = mêmes données)}
+        {--lot=1000 : Nombre de lignes par INSERT}
+        {--fresh : Remplace une génération précédente}',
+    function () {
+        $seeder = (new VolumeSeeder)->configurer([
+            'etudiants' => (int) $this->option('etudiants'),
+            'enseignants' => (int) $this->option('enseignants'),
+            'matieres' => (int) $this->option('matieres'),
+            'notes' => (int) $this->option('notes'),
+            'demandes' => (int) $this->option('demandes'),
+        ], (int) $this->option('graine'), (int) $this->option('lot'), (bool) $this->option('fresh'));
+
+        $debut = microtime(true);
+        $seeder->setContainer($this->laravel)->setCommand($this)->__invoke();
+        $this->info(sprintf('Données de volume générées en %.1f s', microtime(true) - $debut));
+    }
+)->purpose('Génère un jeu de données volumineux et reproductible pour les benchmarks');
+
+Artisan::command('notifications:recompter', function () {
+    app(NotificationStream::class)->recompter();
+    $this->info('Compteurs de notifications non lues recalculés');
+})->purpose('Recalcule users.notifications_non_lues depuis la table notifications');
+
+// Service notifications de docker-compose : les connexions du flux restent ouvertes, elles n'occupent pas php-fpm
+Artisan::command('notifications:serve {--host=0.0.0.0} {--port=8081}', function () {
+    $adresse = $this->option('host') . ':' . $this->option('port');
+    $this->info("Flux des notifications sur http://{$adresse}/notifications/stream");
+    app(NotificationServer::class)->ecouter($adresse);
+})->purpose('Sert le flux SSE des nouvelles notifications (processus dédié, hors php-fpm)');
+
+Artisan::command('stats:recompter', function () {
+    app(DemandeStats::class)->recompter();
+    $this->info('Compteurs de demandes recalculés');
+})->purpose('Recalcule la table demande_compteurs depuis la table demandes');
+
+Artisan::command(
+    'tokens:prune
+        {--jours= : Supprime les jetons inutilisés depuis ce nombre de jours (défaut: sanctum.prune_unused_days)}',
+    function () {
+        $jours = (int) ($this->option('jours') ?? config('sanctum.prune_unused_days'));
+        $limite = now()->subDays($jours);
+        $supprimes = 0;
+
+        // Jetons inutilisés (jamais utilisés : date de création) ou dont l'utilisateur n'existe plus
+        PersonalAccessToken::query()
+            ->where(fn ($q) => $q
+                ->where('last_used_at', '<', $limite)
+                ->orWhere(fn ($q) => $q->whereNull('last_used_at')->where('created_at', '<', $limite))
+                ->orWhere(fn ($q) => $q
+                    ->where('tokenable_type', User::class)
+                    ->whereNotExists(fn ($q) => $q->from('users')->whereColumn('users.id', 'personal_access_tokens.tokenable_id'))))
+            ->select('id')
+            ->chunkById(1000, function ($jetons) use (&$supprimes) {
+                $supprimes += PersonalAccessToken::whereIn('id', $jetons->pluck('id'))->delete();
+            });
+
+        $this->info("{$supprimes} jeton(s) supprimé(s)");
+    }
+)->purpose('Supprime les jetons Sanctum inutilisés ou orphelins');
+
+// php artisan schedule:work (service scheduler de docker-compose)
+Schedule::command('sanctum:prune-expired --hours=24')->daily();
+Schedule::command('tokens:prune')->dailyAt('03:00');
@@ -0,0 +1,41 @@
+<?php
+
+namespace Tests\Feature;
+
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Route;
+use Illuminate\Support\Facades\Schema;
+use Tests\TestCase;
+
+class PerformanceProfilerTest extends TestCase
+{
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        config(['app.profiler.actif' => true, 'app.profiler.seuil_n_plus_un' => 3]);
+        Schema::create('cache', function ($table) {
+            $table->string('key')->primary();
+            $table->mediumText('value');
+            $table->integer('expiration');
+        });
+
+        Route::get('/_profiler', function () {
+            // Trois lectures du store « database » : ni comptées, ni prises pour un N+1
+            foreach (['a', 'b', 'c'] as $cle) {
+                DB::table('cache')->where('key', $cle)->first();
+            }
+            DB::select('select 1');
+
+            return response()->noContent();
+        });
+    }
+
+    public function test_les_requetes_du_cache_sont_comptees_a_part(): void
+    {
+        $this->get('/_profiler')
+            ->assertHeader('X-Query-Count', '1')
+            ->assertHeader('X-Query-Count-Infra', '3')
+            ->assertHeader('X-N-Plus-One', '0');
+    }
+}
@@ -0,0 +1,116 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Demande;
+use App\Models\User;
+use App\Repositories\Interfaces\DemandeRepositoryInterface;
+use Illuminate\Support\Facades\DB;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+/**
+ * Vérifie par EXPLAIN que les requêtes des listes (demandes, notes, notifications)
+ * utilisent un index et ne parcourent jamais une table entière.
+ *
+ * Nécessite une base MySQL déjà remplie (php artisan db:seed-volume) : le plan
+ * d'une table quasi vide ne dit rien. Le test est ignoré si EXPLAIN_DB_CONNECTION
+ * n'est pas défini, par exemple :
+ *
+ *   EXPLAIN_DB_CONNECTION=mysql php artisan test --filter=QueryPlanTest
+ */
+class QueryPlanTest extends TestCase
+{
+    // Tables de référence (quelques centaines de lignes au plus) : un parcours complet
+    // y est normal, par exemple pour charger les matières d'une longue liste de demandes
+    private const TABLES_REFERENCE = ['roles', 'filieres', 'matieres'];
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        $connexion = env('EXPLAIN_DB_CONNECTION');
+        if (!$connexion) {
+            $this->markTestSkipped('EXPLAIN_DB_CONNECTION non défini (base MySQL remplie requise)');
+        }
+
+        config(['database.default' => $connexion]);
+        DB::purge($connexion);
+
+        if (DB::connection()->getDriverName() !== 'mysql') {
+            $this->markTestSkipped('Plans de requête vérifiés uniquement sur MySQL');
+        }
+        if (Demande::count() < 1000) {
+            $this->markTestSkipped('Base trop petite : lancer php artisan db:seed-volume');
+        }
+    }
+
+    public function test_repository_des_demandes(): void
+    {
+        $repository = app(DemandeRepositoryInterface::class);
+        $demande = Demande::whereNotNull('enseignant_id')->first();
+        // Statut le plus rare : celui pour lequel un index est le plus utile
+        $statut = Demande::select('statut')->groupBy('statut')->orderByRaw('COUNT(*)')->value('statut');
+
+        $this->assertAucunParcoursComplet(function () use ($repository, $demande, $statut) {
+            $repository->getByUser($demande->user_id);
+            $repository->getByEnseignant($demande->enseignant_id);
+            $repository->getByStatus($statut);
+            $repository->findById($demande->id);
+            $repository->paginate(['statut' => [$statut]]);
+            $repository->paginate(['enseignant_id' => $demande->enseignant_id, 'statut' => ['IMPUTEE_ENSEIGNANT']]);
+            $repository->paginate(['user_id' => $demande->user_id]);
+        });
+    }
+
+    public function test_notifications_de_l_utilisateur(): void
+    {
+        $user = User::find(DB::table('notifications')->value('user_id'));
+        Sanctum::actingAs($user);
+
+        $this->assertAucunParcoursComplet(function () {
+            $this->getJson('/api/notifications')->assertOk();
+        });
+    }
+
+    public function test_notes_par_matiere_et_par_etudiant(): void
+    {
+        $note = DB::table('notes')->first();
+        Sanctum::actingAs(User::whereHas('role', fn ($q) => $q->where('name', 'registrar'))->firstOrFail());
+
+        $this->assertAucunParcoursComplet(function () use ($note) {
+            $this->getJson("/api/matieres/{$note->matiere_id}/grades")->assertOk();
+            $this->getJson("/api/users/{$note->user_id}/grades")->assertOk();
+            // Recherche faite par updateOrCreate dans NoteController::store
+            \App\Models\Note::where('user_id', $note->user_id)->where('matiere_id', $note->matiere_id)->first();
+        });
+    }
+
+    /**
+     * Exécute $traitement, puis EXPLAIN chaque SELECT capturé : échoue sur un type ALL
+     * (parcours complet) hors tables de référence.
+     */
+    private function assertAucunParcoursComplet(callable $traitement): void
+    {
+        DB::flushQueryLog();
+        DB::enableQueryLog();
+        $traitement();
+        DB::disableQueryLog();
+
+        $requetes = array_filter(DB::getQueryLog(), fn ($r) => stripos(ltrim($r['query']), 'select') === 0);
+        $this->assertNotEmpty($requetes, 'Aucune requête capturée');
+
+        foreach ($requetes as $requete) {
+            foreach (DB::select('EXPLAIN ' . $requete['query'], $requete['bindings']) as $ligne) {
+                if (in_array($ligne->table, self::TABLES_REFERENCE, true)) {
+                    continue;
+                }
+                $this->assertNotSame(
+                    'ALL',
+                    $ligne->type,
+                    "Parcours complet de {$ligne->table} ({$ligne->rows} lignes) pour : {$requete['query']}"
+                );
+            }
+        }
+    }
+}
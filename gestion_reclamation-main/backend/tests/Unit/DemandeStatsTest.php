@@ -0,0 +1,74 @@
+<?php
+
+namespace Tests\Unit;
+
+use App\Services\DemandeStats;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+use Tests\TestCase;
+
+class DemandeStatsTest extends TestCase
+{
+    private const SOUMISE = ['statut' => 'SOUMISE', 'matiere_id' => 3, 'enseignant_id' => null, 'user_id' => 12];
+
+    public function test_une_creation_incremente_chaque_portee(): void
+    {
+        $this->assertSame([
+            'global|0|SOUMISE' => 1,
+            'matiere|3|SOUMISE' => 1,
+            'etudiant|12|SOUMISE' => 1,
+        ], (new DemandeStats())->variations(null, self::SOUMISE));
+    }
+
+    public function test_une_transition_deplace_la_demande_d_un_statut_a_l_autre(): void
+    {
+        $variations = (new DemandeStats())->variations(self::SOUMISE, ['statut' => 'RECUE_SCOLARITE'] + self::SOUMISE);
+
+        $this->assertSame(-1, $variations['global|0|SOUMISE']);
+        $this->assertSame(1, $variations['global|0|RECUE_SCOLARITE']);
+        $this->assertSame(-1, $variations['etudiant|12|SOUMISE']);
+        $this->assertSame(1, $variations['matiere|3|RECUE_SCOLARITE']);
+        $this->assertCount(6, $variations);
+    }
+
+    public function test_l_imputation_ajoute_la_demande_a_l_enseignant(): void
+    {
+        $avant = ['statut' => 'ENVOYEE_DA'] + self::SOUMISE;
+        $apres = ['statut' => 'IMPUTEE_ENSEIGNANT', 'enseignant_id' => 7] + $avant;
+
+        $variations = (new DemandeStats())->variations($avant, $apres);
+
+        $this->assertSame(1, $variations['enseignant|7|IMPUTEE_ENSEIGNANT']);
+        $this->assertArrayNotHasKey('enseignant|7|ENVOYEE_DA', $variations);
+    }
+
+    public function test_une_ecriture_sans_changement_de_compteur_ne_produit_rien(): void
+    {
+        $this->assertSame([], (new DemandeStats())->variations(self::SOUMISE, self::SOUMISE));
+    }
+
+    public function test_la_suppression_d_un_enseignant_retire_ses_demandes_de_tous_les_compteurs(): void
+    {
+        Schema::create('demandes', function ($table) {
+            $table->id();
+            $table->string('statut');
+            $table->unsignedBigInteger('matiere_id');
+            $table->unsignedBigInteger('enseignant_id')->nullable();
+            $table->unsignedBigInteger('user_id');
+        });
+        DB::table('demandes')->insert([
+            ['statut' => 'IMPUTEE_ENSEIGNANT', 'matiere_id' => 3, 'enseignant_id' => 7, 'user_id' => 12],
+            ['statut' => 'IMPUTEE_ENSEIGNANT', 'matiere_id' => 3, 'enseignant_id' => 7, 'user_id' => 13],
+            ['statut' => 'VALIDEE', 'matiere_id' => 3, 'enseignant_id' => 7, 'user_id' => 12],
+            ['statut' => 'SOUMISE', 'matiere_id' => 3, 'enseignant_id' => null, 'user_id' => 12],
+        ]);
+
+        $variations = (new DemandeStats())->suppression(['user_id', 'enseignant_id'], 7);
+
+        $this->assertSame(-2, $variations['global|0|IMPUTEE_ENSEIGNANT']);
+        $this->assertSame(-2, $variations['enseignant|7|IMPUTEE_ENSEIGNANT']);
+        $this->assertSame(-1, $variations['etudiant|13|IMPUTEE_ENSEIGNANT']);
+        $this->assertSame(-1, $variations['matiere|3|VALIDEE']);
+        $this->assertArrayNotHasKey('global|0|SOUMISE', $variations);
+    }
+}
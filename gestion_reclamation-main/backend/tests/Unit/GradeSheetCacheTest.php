@@ -0,0 +1,103 @@
+<?php
+
+namespace Tests\Unit;
+
+use App\Services\GradeSheetCache;
+use Illuminate\Support\Facades\DB;
+use Tests\TestCase;
+
+class GradeSheetCacheTest extends TestCase
+{
+    private GradeSheetCache $cache;
+    private int $calculs = 0;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        // Chaque lecture comptée : compteurs exacts
+        $this->cache = new GradeSheetCache(echantillon: 1);
+    }
+
+    public function test_la_deuxieme_lecture_vient_du_cache(): void
+    {
+        $this->assertSame(['calcul' => 1], $this->lireMatiere());
+        $this->assertSame('MISS', $this->cache->dernierStatut());
+
+        $this->assertSame(['calcul' => 1], $this->lireMatiere());
+        $this->assertSame('HIT', $this->cache->dernierStatut());
+
+        $this->assertSame(
+            ['hits' => 1, 'misses' => 1, 'taux_succes' => 0.5, 'echantillon' => 1],
+            $this->cache->statistiques()
+        );
+    }
+
+    public function test_une_lecture_hors_echantillon_n_ecrit_rien(): void
+    {
+        $this->cache = new GradeSheetCache(echantillon: PHP_INT_MAX);
+
+        $this->lireMatiere();
+        $this->lireMatiere();
+
+        $this->assertSame('HIT', $this->cache->dernierStatut());
+        $this->assertSame(0, $this->cache->statistiques()['hits'] + $this->cache->statistiques()['misses']);
+    }
+
+    public function test_une_note_ecrite_perime_la_matiere_et_l_etudiant(): void
+    {
+        $this->lireMatiere();
+        $this->lireEtudiant(7);
+        $this->lireEtudiant(8);
+
+        $this->cache->notesModifiees(1, [7]);
+
+        $this->assertSame(['calcul' => 4], $this->lireMatiere());
+        $this->assertSame(['calcul' => 5], $this->lireEtudiant(7));
+        $this->assertSame(['calcul' => 3], $this->lireEtudiant(8));
+    }
+
+    public function test_l_invalidation_attend_le_commit(): void
+    {
+        $this->lireMatiere();
+
+        DB::transaction(function () {
+            $this->cache->notesModifiees(1, [7]);
+            // Lecture concurrente avant le commit : elle ne doit pas ranger les anciennes
+            // notes sous la nouvelle version
+            $this->assertSame(['calcul' => 1], $this->lireMatiere());
+        });
+
+        $this->assertSame(['calcul' => 2], $this->lireMatiere());
+    }
+
+    public function test_un_changement_de_filiere_perime_les_feuilles_de_la_filiere(): void
+    {
+        $this->lireMatiere();
+        $this->lireEtudiant(7);
+
+        // Un étudiant arrive dans la filière 2 : nouvelle ligne dans la feuille de la matière
+        $this->cache->etudiantModifie(9, 2, null);
+
+        $this->assertSame(['calcul' => 3], $this->lireMatiere());
+        $this->assertSame(['calcul' => 4], $this->lireEtudiant(7));
+    }
+
+    public function test_tout_invalider(): void
+    {
+        $this->lireMatiere();
+        $this->cache->toutInvalider();
+
+        $this->assertSame(['calcul' => 2], $this->lireMatiere());
+    }
+
+    private function lireMatiere(): array
+    {
+        return $this->cache->feuilleMatiere(1, 2, fn () => ['calcul' => ++$this->calculs]);
+    }
+
+    private function lireEtudiant(int $userId): array
+    {
+        return $this->cache->feuilleEtudiant($userId, 2, fn () => ['calcul' => ++$this->calculs]);
+    }
+}
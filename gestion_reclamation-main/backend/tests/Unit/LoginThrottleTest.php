@@ -0,0 +1,69 @@
+<?php
+
+namespace Tests\Unit;
+
+use App\Services\LoginThrottle;
+use Tests\TestCase;
+
+class LoginThrottleTest extends TestCase
+{
+    private LoginThrottle $throttle;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        config([
+            'auth.lockout.tentatives_email' => 3,
+            'auth.lockout.tentatives_ip' => 5,
+            'auth.lockout.fenetre' => 900,
+            'auth.lockout.duree_blocage' => 900,
+        ]);
+        $this->throttle = new LoginThrottle();
+    }
+
+    public function test_le_compte_est_bloque_a_la_troisieme_erreur(): void
+    {
+        $this->assertNull($this->throttle->echec('etudiant@ibam.edu', '10.0.0.1'));
+        $this->assertNull($this->throttle->echec('etudiant@ibam.edu', '10.0.0.2'));
+        $this->assertNull($this->throttle->blocage('etudiant@ibam.edu', '10.0.0.3'));
+
+        $blocage = $this->throttle->echec('Etudiant@IBAM.edu', '10.0.0.3');
+
+        $this->assertSame('email', $blocage['type']);
+        $this->assertSame('email', $this->throttle->blocage('etudiant@ibam.edu', '10.0.0.4')['type']);
+        $this->assertNull($this->throttle->blocage('autre@ibam.edu', '10.0.0.4'));
+    }
+
+    public function test_une_adresse_est_bloquee_pour_tous_les_comptes(): void
+    {
+        foreach (range(1, 5) as $i) {
+            $blocage = $this->throttle->echec("compte{$i}@ibam.edu", '10.0.0.9');
+        }
+
+        $this->assertSame('ip', $blocage['type']);
+        $this->assertSame('ip', $this->throttle->blocage('nouveau@ibam.edu', '10.0.0.9')['type']);
+        $this->assertNull($this->throttle->blocage('nouveau@ibam.edu', '10.0.0.10'));
+    }
+
+    public function test_une_connexion_reussie_remet_les_echecs_a_zero(): void
+    {
+        $this->throttle->echec('etudiant@ibam.edu', '10.0.0.1');
+        $this->throttle->echec('etudiant@ibam.edu', '10.0.0.1');
+        $this->throttle->reussite('etudiant@ibam.edu');
+
+        $this->assertNull($this->throttle->echec('etudiant@ibam.edu', '10.0.0.1'));
+        $this->assertNull($this->throttle->echec('etudiant@ibam.edu', '10.0.0.1'));
+    }
+
+    public function test_le_deblocage_leve_le_blocage_du_compte(): void
+    {
+        foreach (range(1, 3) as $i) {
+            $this->throttle->echec('etudiant@ibam.edu', "10.0.0.{$i}");
+        }
+
+        $this->throttle->debloquer('etudiant@ibam.edu');
+
+        $this->assertNull($this->throttle->blocage('etudiant@ibam.edu', '10.0.0.1'));
+    }
+}
@@ -0,0 +1,25 @@
+<?php
+
+namespace Tests\Unit;
+
+use App\Services\NotificationStream;
+use Tests\TestCase;
+
+class NotificationStreamTest extends TestCase
+{
+    public function test_le_marqueur_est_stable_entre_deux_releves(): void
+    {
+        $stream = new NotificationStream();
+
+        $this->assertSame($stream->marqueur(5), $stream->marqueur(5));
+        $this->assertNotSame($stream->marqueur(5), $stream->marqueur(6));
+    }
+
+    public function test_les_marqueurs_sont_lus_d_un_coup(): void
+    {
+        $stream = new NotificationStream();
+        $marqueur = $stream->marqueur(5);
+
+        $this->assertSame([5 => $marqueur, 6 => null], $stream->marqueurs([5, 6]));
+    }
+}
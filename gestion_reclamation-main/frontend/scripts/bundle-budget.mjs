@@ -0,0 +1,82 @@
+// Budget de taille du bundle de production (après `vite build`)
+//
+// Lit le graphe des chunks (dist/.vite/manifest.json) et mesure en gzip :
+// - le chargement initial : point d'entrée et ses imports statiques, c'est-à-dire
+//   ce que télécharge /login avant d'être utilisable ;
+// - chaque chunk chargé à la demande (pages, tableaux de bord, widgets) ;
+// - le total du JavaScript.
+// Code de sortie 1 si un budget de bundle-budget.json est dépassé.
+//
+// Utilisation : npm run build:budget   (ou node scripts/bundle-budget.mjs après un build)
+
+import { readFileSync, existsSync } from "node:fs";
+import { join, dirname } from "node:path";
+import { fileURLToPath } from "node:url";
+import { gzipSync } from "node:zlib";
+
+const racine = join(dirname(fileURLToPath(import.meta.url)), "..");
+const dist = join(racine, "dist");
+const cheminManifest = join(dist, ".vite", "manifest.json");
+
+if (!existsSync(cheminManifest)) {
+  console.error(`${cheminManifest} introuvable : lancer d'abord npm run build`);
+  process.exit(2);
+}
+
+const manifest = JSON.parse(readFileSync(cheminManifest, "utf-8"));
+const budget = JSON.parse(readFileSync(join(racine, "bundle-budget.json"), "utf-8"));
+
+const tailles = new Map();
+const ko = (fichier) => {
+  if (!tailles.has(fichier)) {
+    tailles.set(fichier, gzipSync(readFileSync(join(dist, fichier))).length / 1024);
+  }
+  return tailles.get(fichier);
+};
+
+// Entrées du manifeste atteintes par imports statiques depuis `cle`
+function fermetureStatique(cle, vus = new Set()) {
+  if (vus.has(cle) || !manifest[cle]) return vus;
+  vus.add(cle);
+  for (const importe of manifest[cle].imports ?? []) fermetureStatique(importe, vus);
+  return vus;
+}
+
+const entree = Object.keys(manifest).find((cle) => manifest[cle].isEntry);
+const initiales = fermetureStatique(entree);
+const initialJs = [...initiales].map((cle) => manifest[cle].file);
+const initialCss = [...new Set([...initiales].flatMap((cle) => manifest[cle].css ?? []))];
+const tousJs = [...new Set(Object.values(manifest).map((e) => e.file).filter((f) => f.endsWith(".js")))];
+
+const somme = (fichiers) => fichiers.reduce((total, fichier) => total + ko(fichier), 0);
+const controles = [
+  ["JS initial (/login)", somme(initialJs), budget.initial_js_ko],
+  ["CSS initial", somme(initialCss), budget.initial_css_ko],
+  ["JS total", somme(tousJs), budget.total_js_ko],
+];
+
+console.log("Chunks (gzip) :");
+for (const fichier of tousJs.sort((a, b) => ko(b) - ko(a))) {
+  const source = Object.keys(manifest).find((cle) => manifest[cle].file === fichier);
+  const marque = initialJs.includes(fichier) ? "initial " : "à la demande";
+  console.log(`  ${ko(fichier).toFixed(1).padStart(7)} Ko  ${marque.padEnd(12)} ${fichier}  (${source})`);
+  controles.push([`chunk ${fichier}`, ko(fichier), budget.chunk_js_ko]);
+}
+
+let depassements = 0;
+console.log("\nBudgets :");
+for (const [nom, valeur, limite] of controles) {
+  if (limite === undefined) continue;
+  const ok = valeur <= limite;
+  if (!ok) depassements += 1;
+  // Les chunks dans leur budget ne sont pas répétés
+  if (!ok || !nom.startsWith("chunk ")) {
+    console.log(`  ${ok ? "✓" : "✗"} ${nom} : ${valeur.toFixed(1)} Ko / ${limite} Ko`);
+  }
+}
+
+if (depassements) {
+  console.error(`\n${depassements} budget(s) dépassé(s)`);
+  process.exit(1);
+}
+console.log("\n✓ Bundle dans son budget");
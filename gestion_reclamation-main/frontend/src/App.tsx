@@ -2,28 +2,44 @@ import { Toaster } from "@/components/ui/toaster";
 import { Toaster as Sonner } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
 import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
+import { lazy, Suspense } from "react";
 import { BrowserRouter, Routes, Route } from "react-router-dom";
 import { AuthProvider } from "./context/AuthContext";
 import LoginPage from "./pages/LoginPage";
-import RegisterPage from "./pages/RegisterPage";
-import FaqPage from "./pages/FaqPage";
-import Dashboard from "./pages/Dashboard";
-import NewClaimPage from "./pages/claims/NewClaimPage";
-import ClaimsListPage from "./pages/claims/ClaimsListPage";
-import ClaimDetailPage from "./pages/claims/ClaimDetailPage";
-import NotificationsPage from "./pages/NotificationsPage";
-import GradesPage from "./pages/GradesPage";
-import StudentGradesPage from "./pages/StudentGradesPage";
-import UsersPage from "./pages/UsersPage";
-import TeachersPage from "./pages/TeachersPage";
-import SubjectsPage from "./pages/SubjectsPage";
-import TeacherNotes from "./pages/notes/TeacherNotes";
-import TeacherSubjectGrades from "./pages/notes/TeacherSubjectGrades";
-import ForgotPasswordPage from "./pages/ForgotPasswordPage";
-import ResetPasswordPage from "./pages/ResetPasswordPage";
-import NotFound from "./pages/NotFound";
 
-const queryClient = new QueryClient();
+// Une page = un chunk, chargé à la première visite : /login (page d'entrée, importée
+// directement) ne télécharge ni les tableaux de bord ni les pages de réclamations et de notes
+const RegisterPage = lazy(() => import("./pages/RegisterPage"));
+const FaqPage = lazy(() => import("./pages/FaqPage"));
+const Dashboard = lazy(() => import("./pages/Dashboard"));
+const NewClaimPage = lazy(() => import("./pages/claims/NewClaimPage"));
+const ClaimsListPage = lazy(() => import("./pages/claims/ClaimsListPage"));
+const ClaimDetailPage = lazy(() => import("./pages/claims/ClaimDetailPage"));
+const NotificationsPage = lazy(() => import("./pages/NotificationsPage"));
+const GradesPage = lazy(() => import("./pages/GradesPage"));
+const StudentGradesPage = lazy(() => import("./pages/StudentGradesPage"));
+const UsersPage = lazy(() => import("./pages/UsersPage"));
+const TeachersPage = lazy(() => import("./pages/TeachersPage"));
+const SubjectsPage = lazy(() => import("./pages/SubjectsPage"));
+const TeacherNotes = lazy(() => import("./pages/notes/TeacherNotes"));
+const TeacherSubjectGrades = lazy(() => import("./pages/notes/TeacherSubjectGrades"));
+const ForgotPasswordPage = lazy(() => import("./pages/ForgotPasswordPage"));
+const ResetPasswordPage = lazy(() => import("./pages/ResetPasswordPage"));
+const NotFound = lazy(() => import("./pages/NotFound"));
+
+// Cache partagé des données de l'API (voir src/lib/queries.ts) : une donnée de
+// moins de 30 s est réutilisée telle quelle, au-delà elle est affichée puis revalidée
+const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: {
+      staleTime: 30 * 1000,
+      gcTime: 5 * 60 * 1000,
+      // Pas de rechargement au retour sur l'onglet : les feuilles de notes en cours de saisie seraient écrasées
+      refetchOnWindowFocus: false,
+      retry: 1,
+    },
+  },
+});
 
 const App = () => (
   <QueryClientProvider client={queryClient}>
@@ -32,26 +48,28 @@ const App = () => (
         <Toaster />
         <Sonner />
         <BrowserRouter future={{ v7_startTransition: true, v7_relativeSplatPath: true }}>
-          <Routes>
-            <Route path="/" element={<LoginPage />} />
-            <Route path="/register" element={<RegisterPage />} />
-            <Route path="/faq" element={<FaqPage />} />
-            <Route path="/forgot-password" element={<ForgotPasswordPage />} />
-            <Route path="/reset-password" element={<ResetPasswordPage />} />
-            <Route path="/dashboard" element={<Dashboard />} />
-            <Route path="/claims" element={<ClaimsListPage />} />
-            <Route path="/claims/new" element={<NewClaimPage />} />
-            <Route path="/claims/:id" element={<ClaimDetailPage />} />
-            <Route path="/notifications" element={<NotificationsPage />} />
-            <Route path="/grades" element={<GradesPage />} />
-            <Route path="/grades/:id" element={<StudentGradesPage />} />
-            <Route path="/users" element={<UsersPage />} />
-            <Route path="/teachers" element={<TeachersPage />} />
-            <Route path="/subjects" element={<SubjectsPage />} />
-            <Route path="/teacher/notes" element={<TeacherNotes />} />
-            <Route path="/teacher/notes/:id" element={<TeacherSubjectGrades />} />
-            <Route path="*" element={<NotFound />} />
-          </Routes>
+          <Suspense fallback={<div className="flex h-screen items-center justify-center">Chargement...</div>}>
+            <Routes>
+              <Route path="/" element={<LoginPage />} />
+              <Route path="/register" element={<RegisterPage />} />
+              <Route path="/faq" element={<FaqPage />} />
+              <Route path="/forgot-password" element={<ForgotPasswordPage />} />
+              <Route path="/reset-password" element={<ResetPasswordPage />} />
+              <Route path="/dashboard" element={<Dashboard />} />
+              <Route path="/claims" element={<ClaimsListPage />} />
+              <Route path="/claims/new" element={<NewClaimPage />} />
+              <Route path="/claims/:id" element={<ClaimDetailPage />} />
+              <Route path="/notifications" element={<NotificationsPage />} />
+              <Route path="/grades" element={<GradesPage />} />
+              <Route path="/grades/:id" element={<StudentGradesPage />} />
+              <Route path="/users" element={<UsersPage />} />
+              <Route path="/teachers" element={<TeachersPage />} />
+              <Route path="/subjects" element={<SubjectsPage />} />
+              <Route path="/teacher/notes" element={<TeacherNotes />} />
+              <Route path="/teacher/notes/:id" element={<TeacherSubjectGrades />} />
+              <Route path="*" element={<NotFound />} />
+            </Routes>
+          </Suspense>
         </BrowserRouter>
       </AuthProvider>
     </TooltipProvider>
@@ -1,4 +1,5 @@
 import React, { createContext, useContext, useState, ReactNode, useEffect } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { User, UserRole } from '@/types';
 import api from '@/lib/axios';
 
@@ -26,6 +27,7 @@ const ROLE_IDS: Record<UserRole, number> = {
 export function AuthProvider({ children }: { children: ReactNode }) {
   const [user, setUser] = useState<User | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const queryClient = useQueryClient();
 
   useEffect(() => {
     checkAuth();
@@ -82,6 +84,8 @@ export function AuthProvider({ children }: { children: ReactNode }) {
 
       const { token, user: backendUser } = response.data;
       localStorage.setItem('token', token);
+      // Données en cache d'un compte précédent : jamais montrées au nouveau
+      queryClient.clear();
 
       const user = mapBackendUserToFrontend(backendUser);
 
@@ -114,6 +118,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
 
       const { token, user: backendUser } = response.data;
       localStorage.setItem('token', token);
+      queryClient.clear();
       setUser(mapBackendUserToFrontend(backendUser));
     } catch (error: any) {
       console.error('Registration failed:', error.response?.data || error.message);
@@ -131,6 +136,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
       console.error('Logout error:', error);
     } finally {
       localStorage.removeItem('token');
+      queryClient.clear();
       setUser(null);
     }
   };
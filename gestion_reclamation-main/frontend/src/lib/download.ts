@@ -0,0 +1,18 @@
+import api from '@/lib/axios';
+
+/**
+ * Télécharge un export de l'API (CSV en flux) sous le nom `filename`.
+ * Passe par axios pour envoyer le jeton Bearer ; le serveur produit le fichier
+ * au fil de l'eau, le navigateur le reçoit en Blob puis l'enregistre.
+ */
+export async function downloadExport(path: string, params: Record<string, unknown>, filename: string) {
+    const response = await api.get(path, { params, responseType: 'blob', timeout: 0 });
+    const url = URL.createObjectURL(response.data);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = filename;
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    URL.revokeObjectURL(url);
+}
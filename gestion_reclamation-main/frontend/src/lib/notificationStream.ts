@@ -0,0 +1,73 @@
+// Servi par php artisan notifications:serve (processus dédié, hors de l'API)
+const STREAM_URL = import.meta.env.VITE_NOTIFICATIONS_URL ?? 'http://127.0.0.1:8081/notifications/stream';
+
+// Reconnexion après 1 s, doublée à chaque échec jusqu'à 30 s
+const RETRY_MIN_MS = 1000;
+const RETRY_MAX_MS = 30000;
+
+export interface NotificationEvent<T> {
+    notifications: T[];
+    curseur: number;
+    non_lues: number;
+}
+
+/**
+ * S'abonne au flux SSE des nouvelles notifications à partir de l'identifiant `since`.
+ * Lu avec fetch plutôt qu'EventSource pour envoyer le jeton Bearer ; chaque
+ * reconnexion repart du dernier curseur reçu. S'arrête quand `signal` est annulé.
+ */
+export function subscribeNotifications<T>(
+    since: number,
+    onEvent: (event: NotificationEvent<T>) => void,
+    signal: AbortSignal,
+) {
+    let cursor = since;
+    let delay = RETRY_MIN_MS;
+
+    const connect = async () => {
+        try {
+            const url = new URL(STREAM_URL);
+            url.searchParams.set('since', String(cursor));
+            const response = await fetch(url, {
+                headers: {
+                    Accept: 'text/event-stream',
+                    Authorization: `Bearer ${localStorage.getItem('token') ?? ''}`,
+                },
+                signal,
+            });
+            if (!response.ok || !response.body) {
+                throw new Error(`Flux des notifications : HTTP ${response.status}`);
+            }
+
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += value;
+                // Un événement se termine par une ligne vide ; les commentaires (« : ») sont des battements
+                let end;
+                while ((end = buffer.indexOf('\n\n')) !== -1) {
+                    const block = buffer.slice(0, end);
+                    buffer = buffer.slice(end + 2);
+                    const data = block.split('\n').filter(line => line.startsWith('data: ')).map(line => line.slice(6)).join('\n');
+                    if (data) {
+                        const event: NotificationEvent<T> = JSON.parse(data);
+                        cursor = event.curseur;
+                        delay = RETRY_MIN_MS;
+                        onEvent(event);
+                    }
+                }
+            }
+        } catch (error) {
+            if (signal.aborted) return;
+            console.error('Notification stream interrupted', error);
+        }
+        if (signal.aborted) return;
+        // Connexion fermée (redémarrage du serveur, réseau) : on reprend au curseur
+        setTimeout(connect, delay);
+        delay = Math.min(delay * 2, RETRY_MAX_MS);
+    };
+
+    connect();
+}
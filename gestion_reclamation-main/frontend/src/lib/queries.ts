@@ -0,0 +1,221 @@
+import { useInfiniteQuery, useMutation, useQuery, useQueryClient, type QueryKey } from '@tanstack/react-query';
+import api from '@/lib/axios';
+import { fetchStats } from '@/lib/stats';
+
+/**
+ * Couche de données partagée : chaque ressource de l'API a une clé de cache.
+ * Deux composants qui demandent la même clé ne déclenchent qu'une requête ;
+ * une page revisitée affiche aussitôt les données en cache et les revalide en
+ * arrière-plan si elles sont périmées (stale-while-revalidate).
+ *
+ * Les mutations invalident les clés qu'elles modifient, et seulement celles-là.
+ */
+
+// Données de référence : changent rarement, revalidées à bas coût (ETag côté serveur)
+const REFERENCE_STALE_TIME = 10 * 60 * 1000;
+
+export const queryKeys = {
+    roles: ['roles'] as const,
+    filieres: ['filieres'] as const,
+    matieres: (mine = false) => ['matieres', { mine }] as const,
+    teachers: ['teachers'] as const,
+    users: ['users', 'liste'] as const,
+    enseignants: ['users', 'enseignants'] as const,
+    stats: (details: string[] = []) => ['stats', details] as const,
+    claims: (params: Record<string, unknown>) => ['demandes', 'liste', params] as const,
+    claimPages: (params: Record<string, unknown>) => ['demandes', 'liste', 'pages', params] as const,
+    claim: (id: string | number) => ['demandes', 'detail', String(id)] as const,
+    matiereGrades: (id: string | number) => ['grades', 'matiere', String(id)] as const,
+    studentGrades: (id: string | number) => ['grades', 'etudiant', String(id)] as const,
+};
+
+async function get<T = any>(path: string, params?: Record<string, unknown>): Promise<T> {
+    const response = await api.get(path, params ? { params } : undefined);
+    return response.data;
+}
+
+/**
+ * Marque des clés comme périmées. Avec `refetch: false`, les requêtes affichées
+ * ne sont pas relancées (la page garde sa saisie en cours) : elles le seront à
+ * la prochaine visite.
+ */
+function useInvalidate() {
+    const queryClient = useQueryClient();
+    return (keys: QueryKey[], refetch = true) => Promise.all(keys.map((queryKey) =>
+        queryClient.invalidateQueries({ queryKey, refetchType: refetch ? 'active' : 'none' })
+    ));
+}
+
+// ---- Lectures ----
+
+export function useRoles() {
+    return useQuery({ queryKey: queryKeys.roles, queryFn: () => get('/roles'), staleTime: REFERENCE_STALE_TIME });
+}
+
+export function useFilieres(enabled = true) {
+    return useQuery({ queryKey: queryKeys.filieres, queryFn: () => get('/filieres'), staleTime: REFERENCE_STALE_TIME, enabled });
+}
+
+/** Toutes les matières, ou celles de l'enseignant connecté (`mine`) */
+export function useMatieres(mine = false, enabled = true) {
+    return useQuery({
+        queryKey: queryKeys.matieres(mine),
+        queryFn: () => get('/matieres', mine ? { my: 1 } : undefined),
+        enabled,
+    });
+}
+
+export function useTeachers() {
+    return useQuery({ queryKey: queryKeys.teachers, queryFn: () => get('/teachers') });
+}
+
+export function useUsers() {
+    return useQuery({ queryKey: queryKeys.users, queryFn: () => get('/users') });
+}
+
+export function useEnseignants(enabled = true) {
+    return useQuery({ queryKey: queryKeys.enseignants, queryFn: () => get('/users/enseignants'), enabled });
+}
+
+export function useStats(details: Array<'matiere' | 'enseignant'> = []) {
+    return useQuery({ queryKey: queryKeys.stats(details), queryFn: () => fetchStats(details) });
+}
+
+/** Une page de la liste des réclamations (pagination par curseur) */
+export function useClaimsPage(params: Record<string, unknown>) {
+    return useQuery({
+        queryKey: queryKeys.claims(params),
+        queryFn: () => get('/demandes', params),
+    });
+}
+
+/** Liste des réclamations page après page (« Charger plus ») */
+export function useInfiniteClaims(params: Record<string, unknown>) {
+    return useInfiniteQuery({
+        queryKey: queryKeys.claimPages(params),
+        queryFn: ({ pageParam }) => get('/demandes', { ...params, ...(pageParam ? { cursor: pageParam } : {}) }),
+        initialPageParam: null as string | null,
+        getNextPageParam: (lastPage: { next_cursor: string | null }) => lastPage.next_cursor,
+    });
+}
+
+export function useClaim(id: string | undefined) {
+    return useQuery({ queryKey: queryKeys.claim(id ?? ''), queryFn: () => get(`/demandes/${id}`), enabled: !!id });
+}
+
+export function useMatiereGrades(id: string | undefined) {
+    return useQuery({ queryKey: queryKeys.matiereGrades(id ?? ''), queryFn: () => get(`/matieres/${id}/grades`), enabled: !!id });
+}
+
+export function useStudentGrades(id: string | undefined) {
+    return useQuery({ queryKey: queryKeys.studentGrades(id ?? ''), queryFn: () => get(`/users/${id}/grades`), enabled: !!id });
+}
+
+// ---- Réclamations ----
+
+export function useCreateClaim() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (data: FormData) => api.post('/demandes', data, {
+            headers: { 'Content-Type': 'multipart/form-data' },
+        }),
+        onSuccess: () => invalidate([['demandes', 'liste'], ['stats']]),
+    });
+}
+
+/** Transition d'une réclamation (valider, rejeter, envoyer-au-da, imputer, corriger) */
+export function useClaimTransition(id: string | undefined) {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: ({ action, data = {} }: { action: string; data?: Record<string, unknown> }) =>
+            api.post(`/demandes/${id}/${action}`, data),
+        onSuccess: (_response, { action }) => invalidate([
+            queryKeys.claim(id ?? ''),
+            ['demandes', 'liste'],
+            ['stats'],
+            // Correction : la note de l'étudiant a changé dans les feuilles de notes
+            ...(action === 'corriger' ? [['grades']] : []),
+        ]),
+    });
+}
+
+// ---- Notes ----
+
+/** Une note (POST /notes) : feuille de la matière et relevé de l'étudiant */
+export function useSaveGrade() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (grade: { user_id: number | string; matiere_id: number | string; note: number | null; commentaire: string | null }) =>
+            api.post('/notes', grade),
+        onSuccess: (_response, grade) => invalidate([
+            queryKeys.matiereGrades(grade.matiere_id),
+            queryKeys.studentGrades(grade.user_id),
+        ], false),
+    });
+}
+
+/** Feuille complète d'une matière (PUT /matieres/{id}/grades) */
+export function useSaveMatiereGrades(id: string | undefined) {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (grades: Array<{ user_id: number; note: number | null; commentaire: string | null }>) =>
+            api.put(`/matieres/${id}/grades`, { grades }).then((response) => response.data),
+        // Relevés des étudiants de la matière : tous marqués périmés (un seul préfixe)
+        onSuccess: () => invalidate([queryKeys.matiereGrades(id ?? ''), ['grades', 'etudiant']], false),
+    });
+}
+
+// ---- Matières, enseignants, utilisateurs ----
+
+export function useCreateMatiere() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (matiere: { name: string; filiere_id: number }) => api.post('/matieres', matiere),
+        onSuccess: () => invalidate([['matieres'], queryKeys.teachers]),
+    });
+}
+
+export function useDeleteMatiere() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (id: number) => api.delete(`/matieres/${id}`),
+        // Suppression en cascade des notes et réclamations de la matière
+        onSuccess: () => invalidate([['matieres'], queryKeys.teachers, ['grades'], ['demandes'], ['stats']]),
+    });
+}
+
+export function useCreateTeacher() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (teacher: { name: string; email: string; password: string }) => api.post('/teachers', teacher),
+        onSuccess: () => invalidate([queryKeys.teachers, ['users']]),
+    });
+}
+
+/** Affectation (`assign`) ou retrait (`unassign`) d'une matière à un enseignant */
+export function useTeacherMatiere() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: ({ teacherId, matiereId, assign }: { teacherId: number; matiereId: number | string; assign: boolean }) =>
+            api.post(`/teachers/${teacherId}/${assign ? 'assign-matiere' : 'unassign-matiere'}`, { matiere_id: matiereId })
+                .then((response) => response.data),
+        onSuccess: () => invalidate([queryKeys.teachers, ['matieres']]),
+    });
+}
+
+export function useCreateUser() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (user: Record<string, string>) => api.post('/users', user),
+        onSuccess: () => invalidate([['users'], queryKeys.teachers]),
+    });
+}
+
+export function useDeleteUser() {
+    const invalidate = useInvalidate();
+    return useMutation({
+        mutationFn: (id: number) => api.delete(`/users/${id}`),
+        // Suppression en cascade de ses réclamations et notes
+        onSuccess: () => invalidate([['users'], queryKeys.teachers, ['demandes'], ['stats'], ['grades']]),
+    });
+}
@@ -0,0 +1,18 @@
+import api from '@/lib/axios';
+import type { ClaimStats, ClaimStatus, StatusCounts } from '@/types';
+
+/**
+ * Compteurs de réclamations du tableau de bord (quelques centaines d'octets,
+ * au lieu de la liste complète des demandes à compter dans le navigateur).
+ */
+export async function fetchStats(details: Array<'matiere' | 'enseignant'> = []): Promise<ClaimStats> {
+    const response = await api.get('/stats', details.length ? { params: { details: details.join(',') } } : {});
+    return response.data;
+}
+
+/**
+ * Nombre de réclamations dans l'un des statuts donnés.
+ */
+export function countByStatus(counts: StatusCounts | undefined, statuses: ClaimStatus[]): number {
+    return statuses.reduce((total, status) => total + (counts?.[status] ?? 0), 0);
+}
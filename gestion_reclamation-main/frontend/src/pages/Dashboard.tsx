@@ -1,8 +1,5 @@
 import { useAuth } from '@/context/AuthContext';
-import StudentDashboard from './dashboards/StudentDashboard';
-import RegistrarDashboard from './dashboards/RegistrarDashboard';
-import TeacherDashboard from './dashboards/TeacherDashboard';
-import AdminDashboard from './dashboards/AdminDashboard';
+import { DASHBOARDS } from './dashboards/chargement';
 import { Navigate } from 'react-router-dom';
 
 // Composant Dispatcher qui redirige vers le bon dashboard selon le rôle de l'utilisateur
@@ -17,16 +14,11 @@ export default function Dashboard() {
     return <Navigate to="/" replace />;
   }
 
-  switch (user.role) {
-    case 'student':
-      return <StudentDashboard />;
-    case 'registrar':
-      return <RegistrarDashboard />;
-    case 'teacher':
-      return <TeacherDashboard />;
-    case 'admin':
-      return <AdminDashboard />;
-    default:
-      return <Navigate to="/" replace />;
+  // Tableau de bord du rôle, chargé à la demande (Suspense de App.tsx)
+  const RoleDashboard = DASHBOARDS[user.role];
+  if (!RoleDashboard) {
+    return <Navigate to="/" replace />;
   }
+
+  return <RoleDashboard />;
 }
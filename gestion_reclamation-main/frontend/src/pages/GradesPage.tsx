@@ -1,36 +1,38 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Button } from '@/components/ui/button';
-import { Search, User, Eye } from 'lucide-react';
+import { Search, User, Eye, Download, Loader2 } from 'lucide-react';
 import { Input } from '@/components/ui/input';
-import api from '@/lib/axios';
+import { useUsers } from '@/lib/queries';
+import { downloadExport } from '@/lib/download';
+import { toast } from 'sonner';
 import { Link } from 'react-router-dom';
 
 export default function GradesPage() {
-    const [students, setStudents] = useState<any[]>([]);
-    const [loading, setLoading] = useState(true);
     const [search, setSearch] = useState('');
+    const [isExporting, setIsExporting] = useState(false);
 
-    useEffect(() => {
-        const fetchStudents = async () => {
-            try {
-                // On récupère tous les utilisateurs
-                const response = await api.get('/users');
-                // On filtre pour ne garder que les étudiants (role name 'student')
-                const allUsers = response.data;
-                const studentsOnly = allUsers.filter((u: any) =>
-                    u.role?.name.toLowerCase() === 'student'
-                );
-                setStudents(studentsOnly);
-            } catch (error) {
-                console.error('Failed to fetch students', error);
-            } finally {
-                setLoading(false);
-            }
-        };
-        fetchStudents();
-    }, []);
+    // Liste des utilisateurs partagée avec la page Utilisateurs (même cache)
+    const usersQuery = useUsers();
+    const loading = usersQuery.isPending;
+    // On filtre pour ne garder que les étudiants (role name 'student')
+    const students: any[] = (usersQuery.data ?? []).filter((u: any) =>
+        u.role?.name.toLowerCase() === 'student'
+    );
+
+    // Toutes les notes en CSV, produites en flux par le serveur
+    const exportGrades = async () => {
+        setIsExporting(true);
+        try {
+            await downloadExport('/notes/export', {}, `notes-${new Date().toISOString().slice(0, 10)}.csv`);
+        } catch (error) {
+            console.error('Failed to export grades', error);
+            toast.error("Erreur lors de l'export");
+        } finally {
+            setIsExporting(false);
+        }
+    };
 
     const filtered = students.filter(s =>
         s.name.toLowerCase().includes(search.toLowerCase()) ||
@@ -60,8 +62,14 @@ export default function GradesPage() {
                                 className="pl-10 bg-background"
                             />
                         </div>
-                        <div className="text-sm text-muted-foreground">
-                            {filtered.length} étudiant(s) trouvé(s)
+                        <div className="flex items-center gap-4">
+                            <div className="text-sm text-muted-foreground">
+                                {filtered.length} étudiant(s) trouvé(s)
+                            </div>
+                            <Button variant="outline" size="sm" onClick={exportGrades} disabled={isExporting} className="gap-2">
+                                {isExporting ? <Loader2 className="w-4 h-4 animate-spin" /> : <Download className="w-4 h-4" />}
+                                Exporter les notes (CSV)
+                            </Button>
                         </div>
                     </div>
 
@@ -8,6 +8,7 @@ import { Label } from '@/components/ui/label';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { GraduationCap, ArrowRight, Mail, Lock, UserCircle, Shield, BookOpen, ClipboardCheck, User } from 'lucide-react';
 import { cn } from '@/lib/utils';
+import { prechargerDashboard } from './dashboards/chargement';
 import { toast } from 'sonner';
 
 const ROLE_ICONS: Record<UserRole, any> = {
@@ -43,6 +44,8 @@ export default function LoginPage() {
   const handleLogin = async (e: React.FormEvent) => {
     e.preventDefault();
     setIsLoading(true);
+    // Tableau de bord téléchargé pendant la requête de connexion
+    prechargerDashboard(selectedRole);
     try {
       // Tentative de connexion avec le rôle sélectionné
       await login(email, password, selectedRole);
@@ -50,7 +53,8 @@ export default function LoginPage() {
       navigate('/dashboard');
     } catch (error: any) {
       console.error('Login failed:', error);
-      toast.error("Identifiants incorrects ou rôle invalide");
+      // Message du backend : identifiants refusés ou compte bloqué (429)
+      toast.error(error.response?.data?.errors?.email?.[0] || "Identifiants incorrects ou rôle invalide");
     } finally {
       setIsLoading(false);
     }
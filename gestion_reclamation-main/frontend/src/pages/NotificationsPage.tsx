@@ -6,6 +6,7 @@ import { cn } from '@/lib/utils';
 import { formatDistanceToNow } from 'date-fns';
 import { fr } from 'date-fns/locale';
 import api from '@/lib/axios';
+import { subscribeNotifications } from '@/lib/notificationStream';
 import { toast } from 'sonner';
 import { Link } from 'react-router-dom';
 
@@ -52,47 +53,90 @@ const typeConfig: Record<string, any> = {
 export default function NotificationsPage() {
   const [notifications, setNotifications] = useState<Notification[]>([]);
   const [loading, setLoading] = useState(true);
-
-  const fetchNotifications = async () => {
-    try {
-      const response = await api.get('/notifications');
-      setNotifications(response.data);
-    } catch (error) {
-      console.error('Failed to fetch notifications', error);
-      toast.error('Erreur lors du chargement des notifications');
-    } finally {
-      setLoading(false);
-    }
-  };
+  // Compteur tenu par le serveur (users.notifications_non_lues), connu au premier événement du flux
+  const [serverUnread, setServerUnread] = useState<number | null>(null);
 
   useEffect(() => {
-    fetchNotifications();
+    // Abonné au flux seulement tant que la page est ouverte et l'onglet visible
+    const page = new AbortController();
+    let stream: AbortController | null = null;
+    let cursor = 0;
+    // Pas d'abonnement avant le chargement initial, qui fixe le curseur
+    let loaded = false;
+
+    const subscribe = () => {
+      stream?.abort();
+      stream = new AbortController();
+      subscribeNotifications<Notification>(cursor, event => {
+        cursor = event.curseur;
+        setServerUnread(event.non_lues);
+        if (event.notifications.length > 0) {
+          setNotifications(prev => [...[...event.notifications].reverse(), ...prev]);
+        }
+      }, stream.signal);
+    };
+
+    const onVisibilityChange = () => {
+      if (document.hidden) {
+        stream?.abort();
+        stream = null;
+      } else if (!page.signal.aborted && !stream && loaded) {
+        // Retour sur l'onglet : le premier événement rattrape ce qui a été manqué
+        subscribe();
+      }
+    };
+
+    const load = async () => {
+      try {
+        const response = await api.get('/notifications', { signal: page.signal });
+        setNotifications(response.data);
+        cursor = Math.max(0, ...response.data.map((n: Notification) => Number(n.id)));
+      } catch (error) {
+        if (page.signal.aborted) return;
+        console.error('Failed to fetch notifications', error);
+        toast.error('Erreur lors du chargement des notifications');
+      } finally {
+        setLoading(false);
+      }
+      loaded = true;
+      if (!page.signal.aborted && !document.hidden) {
+        subscribe();
+      }
+    };
+
+    document.addEventListener('visibilitychange', onVisibilityChange);
+    load();
+    return () => {
+      page.abort();
+      stream?.abort();
+      document.removeEventListener('visibilitychange', onVisibilityChange);
+    };
   }, []);
 
   const markAsRead = async (id: string) => {
     try {
       await api.post(`/notifications/${id}/read`);
       setNotifications(prev => prev.map(n => n.id === id ? { ...n, read_at: new Date().toISOString() } : n));
+      setServerUnread(prev => prev === null ? prev : Math.max(0, prev - 1));
     } catch (error) {
       console.error('Failed to mark as read', error);
     }
   };
 
   const markAllAsRead = async () => {
-    const unread = notifications.filter(n => !n.read_at);
-    if (unread.length === 0) return;
+    if (unreadCount === 0) return;
 
     try {
-      await Promise.all(unread.map(n => api.post(`/notifications/${n.id}/read`)));
-      setNotifications(prev => prev.map(n => ({ ...n, read_at: new Date().toISOString() })));
+      await api.post('/notifications/read-all');
+      setNotifications(prev => prev.map(n => ({ ...n, read_at: n.read_at ?? new Date().toISOString() })));
+      setServerUnread(0);
       toast.success('Toutes les notifications ont été marquées comme lues');
     } catch (error) {
       console.error('Failed to mark all as read', error);
     }
   };
 
-  const getUnreadCount = () => notifications.filter(n => !n.read_at).length;
-  const unreadCount = getUnreadCount();
+  const unreadCount = serverUnread ?? notifications.filter(n => !n.read_at).length;
 
   return (
     <DashboardLayout>
@@ -4,7 +4,7 @@ import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { ArrowLeft, Save, User, GraduationCap, FileText } from 'lucide-react';
-import api from '@/lib/axios';
+import { useSaveGrade, useStudentGrades } from '@/lib/queries';
 import { toast } from 'sonner';
 import { Badge } from '@/components/ui/badge';
 
@@ -22,26 +22,22 @@ interface GradeItem {
 export default function StudentGradesPage() {
     const { id } = useParams<{ id: string }>();
     const [grades, setGrades] = useState<GradeItem[]>([]);
-    const [student, setStudent] = useState<any>(null);
-    const [isLoading, setIsLoading] = useState(true);
-    const [isSaving, setIsSaving] = useState(false);
+    const gradesQuery = useStudentGrades(id);
+    const student: any = gradesQuery.data?.student ?? null;
+    const isLoading = gradesQuery.isPending;
+    const saveOne = useSaveGrade();
 
+    // Relevé en cache (affiché aussitôt) puis revalidé : copie locale modifiable
     useEffect(() => {
-        const fetchData = async () => {
-            if (!id) return;
-            try {
-                const response = await api.get(`/users/${id}/grades`);
-                setStudent(response.data.student);
-                setGrades(response.data.grades);
-            } catch (error) {
-                console.error('Failed to fetch student grades', error);
-                toast.error("Erreur lors du chargement du dossier étudiant");
-            } finally {
-                setIsLoading(false);
-            }
-        };
-        fetchData();
-    }, [id]);
+        if (gradesQuery.data) setGrades(gradesQuery.data.grades);
+    }, [gradesQuery.data]);
+
+    useEffect(() => {
+        if (gradesQuery.isError) {
+            console.error('Failed to fetch student grades', gradesQuery.error);
+            toast.error("Erreur lors du chargement du dossier étudiant");
+        }
+    }, [gradesQuery.isError]);
 
     const handleGradeChange = (matiereId: number, value: string) => {
         setGrades(prev => prev.map(g => {
@@ -69,7 +65,7 @@ export default function StudentGradesPage() {
                 return;
             }
 
-            await api.post('/notes', {
+            await saveOne.mutateAsync({
                 user_id: student.id,
                 matiere_id: item.matiere.id,
                 note: item.note,
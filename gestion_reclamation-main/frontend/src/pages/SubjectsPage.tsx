@@ -1,7 +1,7 @@
 import { useState, useEffect, useMemo } from 'react';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { BookOpen, Users, Clock, Plus, Loader2, Trash2 } from 'lucide-react';
-import api from '@/lib/axios';
+import { useCreateMatiere, useDeleteMatiere, useFilieres, useMatieres } from '@/lib/queries';
 import { toast } from 'sonner';
 import { Button } from '@/components/ui/button';
 import {
@@ -42,10 +42,6 @@ interface Filiere {
 
 export default function SubjectsPage() {
     const { user } = useAuth();
-    const [subjects, setSubjects] = useState<Subject[]>([]);
-    const [filieres, setFilieres] = useState<Filiere[]>([]);
-    const [isLoading, setIsLoading] = useState(true);
-    const [isSaving, setIsSaving] = useState(false);
     const [isDialogOpen, setIsDialogOpen] = useState(false);
 
     // Form state
@@ -54,27 +50,21 @@ export default function SubjectsPage() {
     const [selectedNiveau, setSelectedNiveau] = useState('');
     const [selectedFiliereId, setSelectedFiliereId] = useState('');
 
-    const fetchData = async () => {
-        setIsLoading(true);
-        try {
-            // Admin sees everything, teacher sees their subjects by default
-            const subjectsUrl = user?.role === 'admin' ? '/matieres' : '/matieres?my';
-            const [subjectsRes, filieresRes] = await Promise.all([
-                api.get(subjectsUrl),
-                api.get('/filieres')
-            ]);
-            setSubjects(subjectsRes.data);
-            setFilieres(filieresRes.data);
-        } catch (error) {
-            toast.error("Erreur lors de la récupération des données");
-        } finally {
-            setIsLoading(false);
-        }
-    };
+    // Admin sees everything, teacher sees their subjects by default
+    const subjectsQuery = useMatieres(user?.role !== 'admin', !!user);
+    const filieresQuery = useFilieres(!!user);
+    const subjects: Subject[] = subjectsQuery.data ?? [];
+    const filieres: Filiere[] = filieresQuery.data ?? [];
+    const isLoading = subjectsQuery.isPending;
+    const createMatiere = useCreateMatiere();
+    const deleteMatiere = useDeleteMatiere();
+    const isSaving = createMatiere.isPending;
 
     useEffect(() => {
-        if (user) fetchData();
-    }, [user]);
+        if (subjectsQuery.isError || filieresQuery.isError) {
+            toast.error("Erreur lors de la récupération des données");
+        }
+    }, [subjectsQuery.isError, filieresQuery.isError]);
 
     // Derived data for form
     const getFiliereName = (f: any) => f.name || f.nom || '';
@@ -113,31 +103,26 @@ export default function SubjectsPage() {
             return;
         }
 
-        setIsSaving(true);
         try {
-            const response = await api.post('/matieres', {
+            await createMatiere.mutateAsync({
                 name: newName,
                 filiere_id: finalFiliere.id,
             });
 
             toast.success("Matière ajoutée avec succès !");
-            setSubjects([response.data, ...subjects]);
             setIsDialogOpen(false);
             setNewName('');
             setSelectedFiliereName('');
             setSelectedNiveau('');
         } catch (error) {
             toast.error("Erreur lors de l'ajout de la matière");
-        } finally {
-            setIsSaving(false);
         }
     };
 
     const handleDeleteSubject = async (id: number) => {
         if (!confirm("Supprimer cette matière ?")) return;
         try {
-            await api.delete(`/matieres/${id}`);
-            setSubjects(subjects.filter(s => s.id !== id));
+            await deleteMatiere.mutateAsync(id);
             toast.success("Matière supprimée");
         } catch (error) {
             toast.error("Impossible de supprimer cette matière");
@@ -21,7 +21,7 @@ import {
     SelectValue,
 } from "@/components/ui/select";
 import { Badge } from '@/components/ui/badge';
-import api from '@/lib/axios';
+import { useCreateTeacher, useFilieres, useMatieres, useTeacherMatiere, useTeachers } from '@/lib/queries';
 import { toast } from 'sonner';
 
 interface Filiere {
@@ -54,10 +54,22 @@ interface Matiere {
 }
 
 export default function TeachersPage() {
-    const [teachers, setTeachers] = useState<Teacher[]>([]);
-    const [matieres, setMatieres] = useState<Matiere[]>([]);
-    const [filieres, setFilieres] = useState<Filiere[]>([]);
-    const [isLoading, setIsLoading] = useState(true);
+    const teachersQuery = useTeachers();
+    const matieresQuery = useMatieres();
+    const filieresQuery = useFilieres();
+    const teachers: Teacher[] = teachersQuery.data ?? [];
+    const matieres: Matiere[] = matieresQuery.data ?? [];
+    const filieres: Filiere[] = filieresQuery.data ?? [];
+    const isLoading = teachersQuery.isPending;
+    const createTeacher = useCreateTeacher();
+    const teacherMatiere = useTeacherMatiere();
+
+    useEffect(() => {
+        if (teachersQuery.isError || matieresQuery.isError || filieresQuery.isError) {
+            toast.error("Erreur de chargement des données");
+        }
+    }, [teachersQuery.isError, matieresQuery.isError, filieresQuery.isError]);
+
     const [isAddingTeacher, setIsAddingTeacher] = useState(false);
     const [isAssigningMatiere, setIsAssigningMatiere] = useState(false);
     const [selectedTeacher, setSelectedTeacher] = useState<Teacher | null>(null);
@@ -90,33 +102,10 @@ export default function TeachersPage() {
         (!selectedTeacher?.matieres.some(tm => tm.id === m.id))
     );
 
-    useEffect(() => {
-        fetchData();
-    }, []);
-
-    const fetchData = async () => {
-        try {
-            const [teachersRes, matieresRes, filieresRes] = await Promise.all([
-                api.get('/teachers'),
-                api.get('/matieres'),
-                api.get('/filieres')
-            ]);
-            setTeachers(teachersRes.data);
-            setMatieres(matieresRes.data);
-            setFilieres(filieresRes.data);
-        } catch (error) {
-            console.error('Error fetching data:', error);
-            toast.error("Erreur de chargement des données");
-        } finally {
-            setIsLoading(false);
-        }
-    };
-
     const handleAddTeacher = async (e: React.FormEvent) => {
         e.preventDefault();
         try {
-            const res = await api.post('/teachers', newTeacher);
-            setTeachers([...teachers, res.data]);
+            await createTeacher.mutateAsync(newTeacher);
             setIsAddingTeacher(false);
             setNewTeacher({ name: '', email: '', password: 'password' });
             toast.success("Enseignant ajouté avec succès");
@@ -128,13 +117,14 @@ export default function TeachersPage() {
     const handleAssignMatiere = async () => {
         if (!selectedTeacher || !selectedMatiereId) return;
         try {
-            const res = await api.post(`/teachers/${selectedTeacher.id}/assign-matiere`, {
-                matiere_id: selectedMatiereId
+            const res = await teacherMatiere.mutateAsync({
+                teacherId: selectedTeacher.id,
+                matiereId: selectedMatiereId,
+                assign: true,
             });
-            setTeachers(teachers.map(t => t.id === selectedTeacher.id ? res.data.teacher : t));
             setIsAssigningMatiere(false);
             setSelectedMatiereId('');
-            toast.success(res.data.message);
+            toast.success(res.message);
         } catch (error) {
             toast.error("Erreur d'affectation");
         }
@@ -142,11 +132,8 @@ export default function TeachersPage() {
 
     const handleUnassignMatiere = async (teacherId: number, matiereId: number) => {
         try {
-            const res = await api.post(`/teachers/${teacherId}/unassign-matiere`, {
-                matiere_id: matiereId
-            });
-            setTeachers(teachers.map(t => t.id === teacherId ? res.data.teacher : t));
-            toast.success(res.data.message);
+            const res = await teacherMatiere.mutateAsync({ teacherId, matiereId, assign: false });
+            toast.success(res.message);
         } catch (error) {
             toast.error("Erreur de désaffectation");
         }
@@ -9,14 +9,17 @@ import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger, Dialog
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { Badge } from '@/components/ui/badge';
 import { toast } from 'sonner';
-import api from '@/lib/axios';
+import { useCreateUser, useDeleteUser, useFilieres, useRoles, useUsers } from '@/lib/queries';
 
 export default function UsersPage() {
-    const [usersList, setUsersList] = useState<any[]>([]);
-    const [roles, setRoles] = useState<any[]>([]);
-    const [filieres, setFilieres] = useState<any[]>([]);
-    const [loading, setLoading] = useState(true);
-    const [isSubmitting, setIsSubmitting] = useState(false);
+    const usersQuery = useUsers();
+    const usersList: any[] = usersQuery.data ?? [];
+    const roles: any[] = useRoles().data ?? [];
+    const filieres: any[] = useFilieres().data ?? [];
+    const loading = usersQuery.isPending;
+    const createUser = useCreateUser();
+    const deleteUser = useDeleteUser();
+    const isSubmitting = createUser.isPending;
     const [isOpen, setIsOpen] = useState(false);
 
     const [formData, setFormData] = useState({
@@ -30,41 +33,12 @@ export default function UsersPage() {
     // État temporaire pour la sélection UX (Filière Name -> Niveau)
     const [selectedFiliereName, setSelectedFiliereName] = useState<string>('');
 
-    const fetchUsers = async () => {
-        try {
-            const response = await api.get('/users');
-            setUsersList(response.data);
-        } catch (error) {
-            console.error('Failed to fetch users', error);
+    useEffect(() => {
+        if (usersQuery.isError) {
+            console.error('Failed to fetch users', usersQuery.error);
             toast.error('Erreur lors du chargement des utilisateurs');
-        } finally {
-            setLoading(false);
-        }
-    };
-
-    const fetchRoles = async () => {
-        try {
-            const response = await api.get('/roles');
-            setRoles(response.data);
-        } catch (error) {
-            console.error('Failed to fetch roles', error);
         }
-    };
-
-    const fetchFilieres = async () => {
-        try {
-            const response = await api.get('/filieres');
-            setFilieres(response.data);
-        } catch (error) {
-            console.error('Failed to fetch filieres', error);
-        }
-    };
-
-    useEffect(() => {
-        fetchUsers();
-        fetchRoles();
-        fetchFilieres();
-    }, []);
+    }, [usersQuery.isError]);
 
     // Dériver les noms uniques de filières pour le premier dropdown
     const uniqueFiliereNames = Array.from(new Set(filieres.map(f => f.name)));
@@ -85,19 +59,15 @@ export default function UsersPage() {
             return;
         }
 
-        setIsSubmitting(true);
         try {
-            await api.post('/users', formData);
+            await createUser.mutateAsync(formData);
             toast.success('Utilisateur créé avec succès');
             setIsOpen(false);
             setFormData({ name: '', email: '', password: 'password', role_id: '', filiere_id: '' });
             setSelectedFiliereName('');
-            fetchUsers();
         } catch (error: any) {
             console.error('Failed to create user', error);
             toast.error(error.response?.data?.message || 'Erreur lors de la création');
-        } finally {
-            setIsSubmitting(false);
         }
     };
 
@@ -105,9 +75,8 @@ export default function UsersPage() {
         if (!confirm('Êtes-vous sûr de vouloir supprimer cet utilisateur ?')) return;
 
         try {
-            await api.delete(`/users/${id}`);
+            await deleteUser.mutateAsync(id);
             toast.success('Utilisateur supprimé');
-            fetchUsers();
         } catch (error) {
             console.error('Failed to delete user', error);
             toast.error('Erreur lors de la suppression');
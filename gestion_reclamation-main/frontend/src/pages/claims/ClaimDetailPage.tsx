@@ -25,7 +25,7 @@ import { format } from 'date-fns';
 import { fr } from 'date-fns/locale';
 import { toast } from 'sonner';
 import { ClaimStatus } from '@/types';
-import api from '@/lib/axios';
+import { useClaim, useClaimTransition, useEnseignants } from '@/lib/queries';
 
 // Page de détail d'une réclamation avec gestion du workflow
 export default function ClaimDetailPage() {
@@ -33,38 +33,30 @@ export default function ClaimDetailPage() {
   const { user } = useAuth();
   const navigate = useNavigate();
 
-  const [claim, setClaim] = useState<any>(null);
-  const [teachers, setTeachers] = useState<any[]>([]);
+  const claimQuery = useClaim(id);
+  const claim: any = claimQuery.data ?? null;
+  const isLoading = claimQuery.isPending;
+  // Liste des enseignants : seulement pour l'imputation (DA)
+  const teachers: any[] = useEnseignants(user?.role === 'admin').data ?? [];
+  const transition = useClaimTransition(id);
+  const isProcessing = transition.isPending;
   const [comment, setComment] = useState('');
   const [newNote, setNewNote] = useState('');
   const [selectedTeacher, setSelectedTeacher] = useState('');
-  const [isProcessing, setIsProcessing] = useState(false);
-  const [isLoading, setIsLoading] = useState(true);
 
+  // Pré-sélectionner l'enseignant assigné à la réclamation
   useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const [claimRes, teachersRes] = await Promise.all([
-          api.get(`/demandes/${id}`),
-          api.get('/users/enseignants'),
-        ]);
-        const claimData = claimRes.data;
-        setClaim(claimData);
-        setTeachers(teachersRes.data);
-
-        // Pré-sélectionner l'enseignant assigné à la réclamation
-        if (claimData.enseignant_id) {
-          setSelectedTeacher(claimData.enseignant_id.toString());
-        }
-      } catch (error) {
-        console.error('Failed to fetch data', error);
-        toast.error('Impossible de charger les détails de la réclamation');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchData();
-  }, [id]);
+    if (claim?.enseignant_id) {
+      setSelectedTeacher(claim.enseignant_id.toString());
+    }
+  }, [claim?.enseignant_id]);
+
+  useEffect(() => {
+    if (claimQuery.isError) {
+      console.error('Failed to fetch data', claimQuery.error);
+      toast.error('Impossible de charger les détails de la réclamation');
+    }
+  }, [claimQuery.isError]);
 
   if (isLoading) {
     return (
@@ -92,33 +84,32 @@ export default function ClaimDetailPage() {
 
   // Gestion des actions (Validation, Rejet, Imputation...)
   const handleAction = async (action: 'validate' | 'reject' | 'send_da' | 'assign' | 'validate_note') => {
-    setIsProcessing(true);
     try {
       let endpoint = '';
       let data = {};
 
       switch (action) {
         case 'send_da':
-          endpoint = `/demandes/${id}/envoyer-au-da`;
+          endpoint = 'envoyer-au-da';
           break;
         case 'reject':
-          endpoint = `/demandes/${id}/rejeter`;
+          endpoint = 'rejeter';
           data = { commentaire: comment };
           break;
         case 'assign':
-          endpoint = `/demandes/${id}/imputer`;
+          endpoint = 'imputer';
           data = { enseignant_id: selectedTeacher, commentaire: comment };
           break;
         case 'validate_note':
-          endpoint = `/demandes/${id}/corriger`;
+          endpoint = 'corriger';
           data = { nouvelle_note: newNote, commentaire: comment };
           break;
         case 'validate':
-          endpoint = `/demandes/${id}/valider`;
+          endpoint = 'valider';
           break;
       }
 
-      await api.post(endpoint, data);
+      await transition.mutateAsync({ action: endpoint, data });
 
       const messages = {
         validate: 'Réclamation validée avec succès',
@@ -133,8 +124,6 @@ export default function ClaimDetailPage() {
     } catch (error: any) {
       console.error('Action failed', error);
       toast.error('Une erreur est survenue lors de l\'action.');
-    } finally {
-      setIsProcessing(false);
     }
   };
 
@@ -205,17 +194,32 @@ export default function ClaimDetailPage() {
                 {claim.justification_url && (
                   <div>
                     <p className="text-sm text-muted-foreground mb-2">Justificatif</p>
-                    <a
-                      href={claim.justification_url}
-                      target="_blank"
-                      rel="noopener noreferrer"
-                      className="inline-block"
-                    >
-                      <Button variant="outline" size="sm" className="gap-2">
-                        <Download className="w-4 h-4" />
-                        Télécharger le justificatif
-                      </Button>
-                    </a>
+                    {/* Fichier analysé par la file après la soumission (type réel, antivirus, aperçu) */}
+                    {claim.fichier?.statut === 'en_attente' && (
+                      <p className="text-sm text-muted-foreground mb-2">Analyse du fichier en cours…</p>
+                    )}
+                    {claim.fichier?.statut === 'rejete' ? (
+                      <p className="text-sm text-destructive">Justificatif refusé : {claim.fichier.motif_rejet}</p>
+                    ) : (
+                      <>
+                        {claim.fichier?.apercu_url && (
+                          <a href={claim.justification_url} target="_blank" rel="noopener noreferrer" className="block mb-2">
+                            <img src={claim.fichier.apercu_url} alt="Aperçu du justificatif" loading="lazy" className="max-w-xs rounded-lg border border-border" />
+                          </a>
+                        )}
+                        <a
+                          href={claim.justification_url}
+                          target="_blank"
+                          rel="noopener noreferrer"
+                          className="inline-block"
+                        >
+                          <Button variant="outline" size="sm" className="gap-2">
+                            <Download className="w-4 h-4" />
+                            Télécharger le justificatif
+                          </Button>
+                        </a>
+                      </>
+                    )}
                   </div>
                 )}
               </div>
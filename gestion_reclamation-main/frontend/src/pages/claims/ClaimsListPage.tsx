@@ -1,4 +1,4 @@
-import { useState, useEffect, useMemo } from 'react';
+import { useState, useEffect } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { useSearchParams } from 'react-router-dom';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
@@ -7,9 +7,20 @@ import { STATUS_CONFIG, ClaimStatus } from '@/types';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
-import { Search, Filter, PlusCircle, FileText } from 'lucide-react';
+import { Search, Filter, PlusCircle, FileText, Loader2, Download } from 'lucide-react';
 import { Link } from 'react-router-dom';
-import api from '@/lib/axios';
+import { useInfiniteClaims } from '@/lib/queries';
+import { downloadExport } from '@/lib/download';
+import { toast } from 'sonner';
+
+// Nombre de réclamations chargées par page (pagination par curseur côté API)
+const PAGE_SIZE = 20;
+
+// Colonnes affichées par ClaimCard : l'API ne renvoie que celles-ci (?fields=)
+const LIST_FIELDS = 'id,objet,nom_prenom,statut,motif,matiere_id,created_at';
+
+const PENDING_STATUSES = ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT'];
+const PROCESSED_STATUSES = ['VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE'];
 
 // Page de liste des réclamations avec filtrage
 export default function ClaimsListPage() {
@@ -18,57 +29,59 @@ export default function ClaimsListPage() {
   const filterParam = searchParams.get('filter'); // 'pending' | 'processed'
 
   const [searchQuery, setSearchQuery] = useState('');
+  const [debouncedQuery, setDebouncedQuery] = useState('');
   const [statusFilter, setStatusFilter] = useState<ClaimStatus | 'all'>('all');
-  const [claims, setClaims] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
+  const [isExporting, setIsExporting] = useState(false);
 
+  // Attendre une pause de frappe avant d'interroger l'API
   useEffect(() => {
-    const fetchClaims = async () => {
-      try {
-        const response = await api.get('/demandes');
-        setClaims(response.data);
-      } catch (error) {
-        console.error('Failed to fetch claims', error);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchClaims();
-  }, []);
-
-  // Filtrage des réclamations
-  const getFilteredClaims = () => {
-    let filtered = [...claims];
-
-    // Appliquer le filtre de l'URL (pending vs processed)
-    if (filterParam === 'pending') {
-      const pendingStatuses = ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT'];
-      filtered = filtered.filter(c => pendingStatuses.includes(c.statut));
-    } else if (filterParam === 'processed') {
-      const processedStatuses = ['VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE'];
-      filtered = filtered.filter(c => processedStatuses.includes(c.statut));
-    }
+    const timer = setTimeout(() => setDebouncedQuery(searchQuery.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
 
+  // Filtres appliqués côté serveur : filtre de l'URL (pending vs processed), statut et recherche
+  const buildParams = () => {
+    let statuts: string[] | null = null;
+    if (filterParam === 'pending') statuts = PENDING_STATUSES;
+    else if (filterParam === 'processed') statuts = PROCESSED_STATUSES;
     if (statusFilter !== 'all') {
-      filtered = filtered.filter(c => c.statut === statusFilter);
+      statuts = statuts ? statuts.filter(s => s === statusFilter) : [statusFilter];
     }
 
-    if (searchQuery) {
-      const query = searchQuery.toLowerCase();
-      filtered = filtered.filter(c =>
-        (c.nom_prenom || '').toLowerCase().includes(query) ||
-        (c.objet || '').toLowerCase().includes(query) ||
-        (c.matiere?.name || '').toLowerCase().includes(query) ||
-        (c.matiere?.nom || '').toLowerCase().includes(query)
-      );
-    }
+    return {
+      per_page: PAGE_SIZE,
+      fields: LIST_FIELDS,
+      // Liste vide après intersection : statut impossible, aucun résultat
+      ...(statuts ? { statut: statuts.length ? statuts.join(',') : 'AUCUN' } : {}),
+      ...(debouncedQuery ? { q: debouncedQuery } : {}),
+    };
+  };
 
-    return filtered;
+  // Pages en cache par combinaison de filtres : revenir sur un filtre déjà vu est immédiat
+  const claimsQuery = useInfiniteClaims(buildParams());
+  const claims: any[] = claimsQuery.data?.pages.flatMap((page) => page.data) ?? [];
+  const hasMore = claimsQuery.hasNextPage;
+  const isLoading = claimsQuery.isPending;
+  const isLoadingMore = claimsQuery.isFetchingNextPage;
+  const loadMore = () => claimsQuery.fetchNextPage();
+
+  // Export CSV côté serveur, avec les filtres de la liste (sans pagination ni colonnes réduites)
+  const exportClaims = async () => {
+    setIsExporting(true);
+    try {
+      const { per_page, fields, ...filters } = buildParams();
+      await downloadExport('/demandes/export', filters, `reclamations-${new Date().toISOString().slice(0, 10)}.csv`);
+    } catch (error) {
+      console.error('Failed to export claims', error);
+      toast.error("Erreur lors de l'export");
+    } finally {
+      setIsExporting(false);
+    }
   };
 
-  const filteredClaims = getFilteredClaims();
   // Logique d'affichage selon le rôle
   const showAddButton = user?.role === 'student';
+  const showExportButton = user?.role === 'registrar' || user?.role === 'admin';
   const showStudentColumn = user?.role !== 'student';
 
   return (
@@ -83,7 +96,7 @@ export default function ClaimsListPage() {
                   'Toutes les réclamations'}
             </h1>
             <p className="text-muted-foreground">
-              {filteredClaims.length} réclamation{filteredClaims.length > 1 ? 's' : ''} trouvée{filteredClaims.length > 1 ? 's' : ''}
+              {claims.length}{hasMore ? '+' : ''} réclamation{claims.length > 1 ? 's' : ''} trouvée{claims.length > 1 ? 's' : ''}
             </p>
           </div>
           {showAddButton && (
@@ -94,6 +107,12 @@ export default function ClaimsListPage() {
               </Button>
             </Link>
           )}
+          {showExportButton && (
+            <Button variant="outline" onClick={exportClaims} disabled={isExporting} className="gap-2">
+              {isExporting ? <Loader2 className="w-4 h-4 animate-spin" /> : <Download className="w-4 h-4" />}
+              Exporter (CSV)
+            </Button>
+          )}
         </div>
 
         {/* Filters */}
@@ -127,7 +146,11 @@ export default function ClaimsListPage() {
         </div>
 
         {/* Claims List */}
-        {filteredClaims.length === 0 ? (
+        {isLoading ? (
+          <div className="flex justify-center py-12">
+            <Loader2 className="w-8 h-8 animate-spin text-muted-foreground" />
+          </div>
+        ) : claims.length === 0 ? (
           <div className="bg-card border border-border rounded-xl p-12 text-center">
             <div className="w-16 h-16 rounded-2xl bg-muted flex items-center justify-center mx-auto mb-4">
               <FileText className="w-8 h-8 text-muted-foreground" />
@@ -150,16 +173,24 @@ export default function ClaimsListPage() {
           <>
             {/* Cards View */}
             <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
-              {filteredClaims.map((claim, index) => (
+              {claims.map((claim, index) => (
                 <div
                   key={claim.id}
                   className="animate-slide-up"
-                  style={{ animationDelay: `${index * 0.05}s` }}
+                  style={{ animationDelay: `${(index % PAGE_SIZE) * 0.05}s` }}
                 >
                   <ClaimCard claim={claim} showStudent={showStudentColumn} />
                 </div>
               ))}
             </div>
+            {hasMore && (
+              <div className="flex justify-center mt-6">
+                <Button variant="outline" onClick={loadMore} disabled={isLoadingMore} className="gap-2">
+                  {isLoadingMore && <Loader2 className="w-4 h-4 animate-spin" />}
+                  Charger plus
+                </Button>
+              </div>
+            )}
           </>
         )}
       </div>
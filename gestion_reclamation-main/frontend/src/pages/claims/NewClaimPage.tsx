@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '@/context/AuthContext';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
@@ -10,7 +10,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { ArrowLeft, Upload, Send, AlertCircle, Info } from 'lucide-react';
 import { toast } from 'sonner';
 import { Link } from 'react-router-dom';
-import api from '@/lib/axios';
+import { useCreateClaim, useMatieres } from '@/lib/queries';
 
 // Page de création d'une nouvelle réclamation
 export default function NewClaimPage() {
@@ -30,8 +30,9 @@ export default function NewClaimPage() {
     note_demandee: '',
   });
   const [file, setFile] = useState<File | null>(null);
-  const [isSubmitting, setIsSubmitting] = useState(false);
-  const [matieres, setMatieres] = useState<any[]>([]);
+  const matieres: any[] = useMatieres().data ?? [];
+  const createClaim = useCreateClaim();
+  const isSubmitting = createClaim.isPending;
 
   // Filtrer les matières visibles selon la filière de l'étudiant
   const visibleMatieres = user?.filiere
@@ -50,18 +51,6 @@ export default function NewClaimPage() {
     })
     : matieres;
 
-  useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const response = await api.get('/matieres');
-        setMatieres(response.data);
-      } catch (error) {
-        console.error('Failed to fetch matieres', error);
-      }
-    };
-    fetchData();
-  }, []);
-
   const handleMatiereChange = (value: string) => {
     const selected = visibleMatieres.find((m) => m.id?.toString() === value);
     const enseignant = selected?.enseignant;
@@ -100,8 +89,6 @@ export default function NewClaimPage() {
       return;
     }
 
-    setIsSubmitting(true);
-
     try {
       const data = new FormData();
       Object.entries(formData).forEach(([key, value]) => {
@@ -111,11 +98,7 @@ export default function NewClaimPage() {
         data.append('justification', file);
       }
 
-      await api.post('/demandes', data, {
-        headers: {
-          'Content-Type': 'multipart/form-data',
-        },
-      });
+      await createClaim.mutateAsync(data);
 
       toast.success('Réclamation soumise avec succès !', {
         description: 'Votre demande est maintenant en attente de traitement par la scolarité.',
@@ -124,8 +107,6 @@ export default function NewClaimPage() {
     } catch (error: any) {
       console.error('Submission failed', error);
       toast.error('Une erreur est survenue lors de la soumission.');
-    } finally {
-      setIsSubmitting(false);
     }
   };
 
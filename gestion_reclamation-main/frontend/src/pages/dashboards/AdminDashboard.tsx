@@ -1,49 +1,38 @@
-import { useState, useEffect } from 'react';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { StatCard } from '@/components/dashboard/StatCard';
 import { StatusBadge } from '@/components/ui/status-badge';
 import { FileText, CheckCircle, Clock, AlertTriangle } from 'lucide-react';
 import { Link } from 'react-router-dom';
 import { Button } from '@/components/ui/button';
-import api from '@/lib/axios';
+import { useClaimsPage, useStats } from '@/lib/queries';
+import { countByStatus } from '@/lib/stats';
+
+// Réclamations à imputer affichées sur le tableau de bord (le reste via « Voir tout »)
+const PENDING_LIMIT = 5;
 
 // Dashboard Admin : Vue d'ensemble et statistiques
 export default function AdminDashboard() {
-  const [claims, setClaims] = useState<any[]>([]);
-  const [teachers, setTeachers] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-
-  useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const [claimsRes, teachersRes] = await Promise.all([
-          api.get('/demandes'),
-          api.get('/users/enseignants'),
-        ]);
-        setClaims(claimsRes.data);
-        setTeachers(teachersRes.data);
-      } catch (error) {
-        console.error('Failed to fetch data', error);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchData();
-  }, []);
+  // Compteurs calculés par le serveur + seulement les premières réclamations à imputer
+  const stats = useStats(['enseignant']).data;
+  const pendingAssignment: any[] = useClaimsPage({
+    per_page: PENDING_LIMIT, statut: 'ENVOYEE_DA', fields: 'id,nom_prenom,objet,statut,matiere_id',
+  }).data?.data ?? [];
 
-  // Filtrage et Statistiques
-  const allClaims = claims;
-  const pendingAssignment = allClaims.filter(c => c.statut === 'ENVOYEE_DA');
-  const inProgress = allClaims.filter(c => ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT'].includes(c.statut));
-  const resolved = allClaims.filter(c => ['VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE'].includes(c.statut));
+  // Statistiques
+  const counts = stats?.par_statut;
+  const total = stats?.total ?? 0;
+  const teachers = stats?.par_enseignant ?? [];
+  const pendingCount = countByStatus(counts, ['ENVOYEE_DA']);
+  const inProgressCount = countByStatus(counts, ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT']);
+  const resolvedCount = countByStatus(counts, ['VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE']);
 
   const statusDistribution = [
-    { status: 'SOUMISE' as const, count: allClaims.filter(c => c.statut === 'SOUMISE').length },
-    { status: 'RECUE_SCOLARITE' as const, count: allClaims.filter(c => c.statut === 'RECUE_SCOLARITE').length },
-    { status: 'ENVOYEE_DA' as const, count: allClaims.filter(c => c.statut === 'ENVOYEE_DA').length },
-    { status: 'IMPUTEE_ENSEIGNANT' as const, count: allClaims.filter(c => c.statut === 'IMPUTEE_ENSEIGNANT').length },
-    { status: 'VALIDEE' as const, count: allClaims.filter(c => c.statut === 'VALIDEE').length },
-    { status: 'REJETEE_SCOLARITE' as const, count: allClaims.filter(c => ['REJETEE_SCOLARITE', 'NON_VALIDEE'].includes(c.statut)).length },
+    { status: 'SOUMISE' as const, count: countByStatus(counts, ['SOUMISE']) },
+    { status: 'RECUE_SCOLARITE' as const, count: countByStatus(counts, ['RECUE_SCOLARITE']) },
+    { status: 'ENVOYEE_DA' as const, count: countByStatus(counts, ['ENVOYEE_DA']) },
+    { status: 'IMPUTEE_ENSEIGNANT' as const, count: countByStatus(counts, ['IMPUTEE_ENSEIGNANT']) },
+    { status: 'VALIDEE' as const, count: countByStatus(counts, ['VALIDEE']) },
+    { status: 'REJETEE_SCOLARITE' as const, count: countByStatus(counts, ['REJETEE_SCOLARITE', 'NON_VALIDEE']) },
   ];
 
   return (
@@ -59,26 +48,26 @@ export default function AdminDashboard() {
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-5 mb-8">
           <StatCard
             title="Total réclamations"
-            value={allClaims.length}
+            value={total}
             icon={FileText}
             variant="default"
             trend={{ value: 12, isPositive: true }}
           />
           <StatCard
             title="À imputer"
-            value={pendingAssignment.length}
+            value={pendingCount}
             icon={AlertTriangle}
             variant="warning"
           />
           <StatCard
             title="En cours"
-            value={inProgress.length}
+            value={inProgressCount}
             icon={Clock}
             variant="accent"
           />
           <StatCard
             title="Résolues"
-            value={resolved.length}
+            value={resolvedCount}
             icon={CheckCircle}
             variant="success"
           />
@@ -149,7 +138,7 @@ export default function AdminDashboard() {
                   <div className="h-2 bg-muted rounded-full overflow-hidden">
                     <div
                       className="h-full bg-accent rounded-full transition-all duration-500"
-                      style={{ width: `${(count / allClaims.length) * 100}%` }}
+                      style={{ width: `${total ? (count / total) * 100 : 0}%` }}
                     />
                   </div>
                 </div>
@@ -169,8 +158,8 @@ export default function AdminDashboard() {
 
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-4">
             {teachers.map((teacher, index) => {
-              const teacherClaims = allClaims.filter(c => c.enseignant_id === teacher.id);
-              const pendingCount = teacherClaims.filter(c => c.statut === 'IMPUTEE_ENSEIGNANT').length;
+              const teacherPending = countByStatus(teacher.par_statut, ['IMPUTEE_ENSEIGNANT']);
+              const teacherName = teacher.nom ?? 'Enseignant';
 
               return (
                 <div
@@ -181,21 +170,20 @@ export default function AdminDashboard() {
                   <div className="flex items-center gap-3 mb-3">
                     <div className="w-10 h-10 rounded-full bg-primary/10 flex items-center justify-center">
                       <span className="font-semibold text-primary">
-                        {teacher.name.split(' ').slice(-1)[0][0]}
+                        {teacherName.split(' ').slice(-1)[0][0]}
                       </span>
                     </div>
                     <div className="flex-1 min-w-0">
-                      <p className="font-medium text-foreground truncate">{teacher.name}</p>
-                      <p className="text-xs text-muted-foreground truncate">{teacher.email}</p>
+                      <p className="font-medium text-foreground truncate">{teacherName}</p>
                     </div>
                   </div>
                   <div className="flex items-center justify-between text-sm">
                     <span className="text-muted-foreground">
-                      {teacherClaims.length} réclamation{teacherClaims.length > 1 ? 's' : ''}
+                      {teacher.total} réclamation{teacher.total > 1 ? 's' : ''}
                     </span>
-                    {pendingCount > 0 && (
+                    {teacherPending > 0 && (
                       <span className="px-2 py-0.5 rounded bg-status-pending-bg text-status-pending-text text-xs font-medium">
-                        {pendingCount} en attente
+                        {teacherPending} en attente
                       </span>
                     )}
                   </div>
@@ -1,4 +1,3 @@
-import { useState, useEffect } from 'react';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { StatCard } from '@/components/dashboard/StatCard';
 import { StatusBadge } from '@/components/ui/status-badge';
@@ -6,34 +5,22 @@ import { FileText, Clock, CheckCircle, AlertCircle, Send } from 'lucide-react';
 import { Link } from 'react-router-dom';
 import { Button } from '@/components/ui/button';
 import { cn } from '@/lib/utils';
-import api from '@/lib/axios';
+import { useClaimsPage, useStats } from '@/lib/queries';
+import { countByStatus } from '@/lib/stats';
 
 // Dashboard Scolarité : Supervision globale et dispatching
 export default function RegistrarDashboard() {
-  const [claims, setClaims] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-
-  useEffect(() => {
-    const fetchClaims = async () => {
-      try {
-        const response = await api.get('/demandes');
-        setClaims(response.data);
-      } catch (error) {
-        console.error('Failed to fetch claims', error);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchClaims();
-  }, []);
+  // Compteurs calculés par le serveur + les 5 réclamations à traiter affichées
+  const stats = useStats().data;
+  const toProcess: any[] = useClaimsPage({
+    per_page: 5, statut: 'SOUMISE,RECUE_SCOLARITE', fields: 'id,nom_prenom,objet,statut,matiere_id',
+  }).data?.data ?? [];
 
   // Catégorisation des réclamations
-  const allClaims = claims;
-  const newClaims = allClaims.filter(c => c.statut === 'SOUMISE');
-  const inReviewClaims = allClaims.filter(c => c.statut === 'RECUE_SCOLARITE');
-  const processedClaims = allClaims.filter(c =>
-    ['ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT', 'VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE'].includes(c.statut)
-  );
+  const counts = stats?.par_statut;
+  const newCount = countByStatus(counts, ['SOUMISE']);
+  const inReviewCount = countByStatus(counts, ['RECUE_SCOLARITE']);
+  const processedCount = countByStatus(counts, ['ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT', 'VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE']);
 
   return (
     <DashboardLayout>
@@ -48,26 +35,26 @@ export default function RegistrarDashboard() {
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-5 mb-8">
           <StatCard
             title="Nouvelles demandes"
-            value={newClaims.length}
+            value={newCount}
             icon={AlertCircle}
             variant="warning"
             subtitle="En attente de traitement"
           />
           <StatCard
             title="En cours d'examen"
-            value={inReviewClaims.length}
+            value={inReviewCount}
             icon={Clock}
             variant="accent"
           />
           <StatCard
             title="Envoyées au DA"
-            value={allClaims.filter(c => c.statut === 'ENVOYEE_DA').length}
+            value={countByStatus(counts, ['ENVOYEE_DA'])}
             icon={Send}
             variant="default"
           />
           <StatCard
             title="Traitées ce mois"
-            value={processedClaims.length}
+            value={processedCount}
             icon={CheckCircle}
             variant="success"
             trend={{ value: 15, isPositive: true }}
@@ -86,7 +73,7 @@ export default function RegistrarDashboard() {
             </div>
 
             <div className="space-y-4">
-              {[...newClaims, ...inReviewClaims].slice(0, 5).map((claim, index) => (
+              {toProcess.map((claim, index) => (
                 <Link
                   key={claim.id}
                   to={`/claims/${claim.id}`}
@@ -122,7 +109,7 @@ export default function RegistrarDashboard() {
                     <div className="w-8 h-8 rounded-lg bg-status-pending-bg flex items-center justify-center">
                       <AlertCircle className="w-4 h-4 text-status-pending" />
                     </div>
-                    <span>Nouvelles ({newClaims.length})</span>
+                    <span>Nouvelles ({newCount})</span>
                   </Button>
                 </Link>
                 <Link to="/claims?status=RECUE_SCOLARITE" className="block">
@@ -130,7 +117,7 @@ export default function RegistrarDashboard() {
                     <div className="w-8 h-8 rounded-lg bg-status-info-bg flex items-center justify-center">
                       <Clock className="w-4 h-4 text-status-info" />
                     </div>
-                    <span>En examen ({inReviewClaims.length})</span>
+                    <span>En examen ({inReviewCount})</span>
                   </Button>
                 </Link>
                 <Link to="/grades" className="block">
@@ -149,9 +136,9 @@ export default function RegistrarDashboard() {
               <h3 className="font-semibold text-foreground mb-4">Répartition</h3>
               <div className="space-y-3">
                 {[
-                  { label: 'Validées', count: allClaims.filter(c => c.statut === 'VALIDEE').length, color: 'bg-status-success' },
-                  { label: 'Rejetées', count: allClaims.filter(c => ['REJETEE_SCOLARITE', 'NON_VALIDEE'].includes(c.statut)).length, color: 'bg-status-error' },
-                  { label: 'En cours', count: allClaims.filter(c => ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT'].includes(c.statut)).length, color: 'bg-status-processing' },
+                  { label: 'Validées', count: countByStatus(counts, ['VALIDEE']), color: 'bg-status-success' },
+                  { label: 'Rejetées', count: countByStatus(counts, ['REJETEE_SCOLARITE', 'NON_VALIDEE']), color: 'bg-status-error' },
+                  { label: 'En cours', count: countByStatus(counts, ['SOUMISE', 'RECUE_SCOLARITE', 'ENVOYEE_DA', 'IMPUTEE_ENSEIGNANT']), color: 'bg-status-processing' },
                 ].map((item) => (
                   <div key={item.label} className="flex items-center justify-between">
                     <div className="flex items-center gap-2">
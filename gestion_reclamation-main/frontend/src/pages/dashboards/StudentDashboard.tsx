@@ -1,4 +1,3 @@
-import { useState, useEffect } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { StatCard } from '@/components/dashboard/StatCard';
@@ -6,33 +5,24 @@ import { ClaimCard } from '@/components/claims/ClaimCard';
 import { FileText, Clock, CheckCircle, XCircle, PlusCircle } from 'lucide-react';
 import { Link } from 'react-router-dom';
 import { Button } from '@/components/ui/button';
-import api from '@/lib/axios';
+import { useClaimsPage, useStats } from '@/lib/queries';
+import { countByStatus } from '@/lib/stats';
 
 // Dashboard Étudiant : Vue d'ensemble des réclamations
 export default function StudentDashboard() {
   const { user } = useAuth();
-  const [claims, setClaims] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
+  // Compteurs calculés par le serveur + les 4 réclamations les plus récentes
+  const stats = useStats().data;
+  const recentClaims: any[] = useClaimsPage({
+    per_page: 4, fields: 'id,objet,nom_prenom,statut,motif,matiere_id,created_at',
+  }).data?.data ?? [];
 
-  useEffect(() => {
-    const fetchClaims = async () => {
-      try {
-        const response = await api.get('/demandes');
-        setClaims(response.data);
-      } catch (error) {
-        console.error('Failed to fetch claims', error);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchClaims();
-  }, []);
-
-  // Filtrage des réclamations par statut
-  const myClaims = claims;
-  const pendingClaims = myClaims.filter(c => !['VALIDEE', 'NON_VALIDEE', 'REJETEE_SCOLARITE'].includes(c.statut));
-  const resolvedClaims = myClaims.filter(c => c.statut === 'VALIDEE');
-  const rejectedClaims = myClaims.filter(c => ['NON_VALIDEE', 'REJETEE_SCOLARITE'].includes(c.statut));
+  // Compteurs par statut
+  const counts = stats?.par_statut;
+  const total = stats?.total ?? 0;
+  const rejectedCount = countByStatus(counts, ['NON_VALIDEE', 'REJETEE_SCOLARITE']);
+  const resolvedCount = countByStatus(counts, ['VALIDEE']);
+  const pendingCount = total - resolvedCount - rejectedCount;
 
   return (
     <DashboardLayout>
@@ -59,25 +49,25 @@ export default function StudentDashboard() {
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-5 mb-8">
           <StatCard
             title="Total réclamations"
-            value={myClaims.length}
+            value={total}
             icon={FileText}
             variant="default"
           />
           <StatCard
             title="En cours"
-            value={pendingClaims.length}
+            value={pendingCount}
             icon={Clock}
             variant="warning"
           />
           <StatCard
             title="Validées"
-            value={resolvedClaims.length}
+            value={resolvedCount}
             icon={CheckCircle}
             variant="success"
           />
           <StatCard
             title="Rejetées"
-            value={rejectedClaims.length}
+            value={rejectedCount}
             icon={XCircle}
             variant="error"
           />
@@ -92,7 +82,7 @@ export default function StudentDashboard() {
             </Link>
           </div>
 
-          {myClaims.length === 0 ? (
+          {recentClaims.length === 0 ? (
             <div className="text-center py-12">
               <div className="w-16 h-16 rounded-2xl bg-muted flex items-center justify-center mx-auto mb-4">
                 <FileText className="w-8 h-8 text-muted-foreground" />
@@ -109,7 +99,7 @@ export default function StudentDashboard() {
             </div>
           ) : (
             <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
-              {myClaims.slice(0, 4).map((claim, index) => (
+              {recentClaims.map((claim, index) => (
                 <div
                   key={claim.id}
                   className="animate-slide-up"
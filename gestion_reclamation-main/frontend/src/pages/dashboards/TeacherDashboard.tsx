@@ -1,4 +1,3 @@
-import { useState, useEffect } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { StatCard } from '@/components/dashboard/StatCard';
@@ -6,27 +5,13 @@ import { StatusBadge } from '@/components/ui/status-badge';
 import { FileText, Clock, CheckCircle, BookOpen, User } from 'lucide-react';
 import { Link } from 'react-router-dom';
 import { Button } from '@/components/ui/button';
-import api from '@/lib/axios';
+import { useClaimsPage } from '@/lib/queries';
 
 // Dashboard Enseignant : Gestion des réclamations assignées
 export default function TeacherDashboard() {
   const { user } = useAuth();
-  const [claims, setClaims] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-
-  useEffect(() => {
-    const fetchClaims = async () => {
-      try {
-        const response = await api.get('/demandes');
-        setClaims(response.data);
-      } catch (error) {
-        console.error('Failed to fetch claims', error);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchClaims();
-  }, []);
+  // Réclamations imputées (liste complète), partagées avec la liste si déjà chargées
+  const claims: any[] = useClaimsPage({}).data ?? [];
 
   const assignedClaims = claims;
   // Extraction des matières uniques enseignées
@@ -0,0 +1,22 @@
+import { lazy } from 'react';
+import type { UserRole } from '@/types';
+
+// Un chunk par tableau de bord : chaque rôle ne télécharge que le sien
+const CHARGEURS: Record<UserRole, () => Promise<{ default: React.ComponentType }>> = {
+  student: () => import('./StudentDashboard'),
+  registrar: () => import('./RegistrarDashboard'),
+  teacher: () => import('./TeacherDashboard'),
+  admin: () => import('./AdminDashboard'),
+};
+
+export const DASHBOARDS = Object.fromEntries(
+  Object.entries(CHARGEURS).map(([role, charger]) => [role, lazy(charger)])
+) as Record<UserRole, React.LazyExoticComponent<React.ComponentType>>;
+
+/**
+ * Lance le téléchargement du tableau de bord d'un rôle (ex: pendant la requête
+ * de connexion) pour qu'il soit prêt à l'arrivée sur /dashboard.
+ */
+export function prechargerDashboard(role: UserRole) {
+  CHARGEURS[role]?.().catch(() => undefined);
+}
@@ -1,10 +1,9 @@
-import { useState, useEffect } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { Link } from 'react-router-dom';
 import { ArrowLeft, BookOpen, Users } from 'lucide-react';
-import api from '@/lib/axios';
+import { useMatieres } from '@/lib/queries';
 
 // Interface pour les matières
 interface Matiere {
@@ -19,48 +18,10 @@ interface Matiere {
 
 export default function TeacherNotes() {
     const { user } = useAuth();
-    const [matieres, setMatieres] = useState<Matiere[]>([]);
-    const [isLoading, setIsLoading] = useState(true);
-
-    // Pour l'instant on va essayer de récupérer via l'API. 
-    // Comme on n'a pas fait d'endpoint "mes-matieres" dédié pur, on peut filtrer /matieres 
-    // ou utiliser l'astuce du dashboard (filtrer les claims) -> mais ce n'est pas fiable si pas de claim.
-    // Mieux: on a créé 'teachers' endpoint dans api.php ? Non, c'était 'TeacherController'.
-    // Regardons NoteController::index pour enseignant : "retourne les notes de ses matières".
-    // Idéalement on devrait avoir un endpoint GET /matieres/mine.
-    // MAIS: dans l'app actuelle, comment l'enseignant voit ses matières ?
-    // Dans le dashboard, on a fait "assignedClaims.map ...". Ce n'est pas bon.
-    // On va utiliser l'api /matieres et filtrer coté front temporairement ou créer un endpoint.
-    // Pour faire vite et bien: ajoutons `iframe` ou `filter` si l'API le permet.
-    // ACTUALLY: api.php a `Route::apiResource('matieres', MatiereController::class);`
-    // Allons voir MatiereController.
-
-    useEffect(() => {
-        const fetchMatieres = async () => {
-            try {
-                // Option 1: On fetch toutes les matieres et on filtre par user.id (enseignant_id)
-                // Ce n'est pas sécurisé ni performant mais suffisant pour le prototype si peu de données.
-                const response = await api.get('/matieres');
-                const allMatieres = response.data; // Supposons que c'est un tableau
-
-                // Filtrer - IMPORTANT: convertir user.id en number car enseignant_id est un number
-                const userId = Number(user?.id);
-                const myMatieres = allMatieres.filter((m: any) => {
-                    return m.enseignant_id === userId;
-                });
-
-                setMatieres(myMatieres);
-            } catch (error) {
-                console.error('Failed to fetch subjects', error);
-            } finally {
-                setIsLoading(false);
-            }
-        };
-
-        if (user) {
-            fetchMatieres();
-        }
-    }, [user]);
+    // Matières de l'enseignant (GET /matieres?my), partagées avec la page Matières
+    const matieresQuery = useMatieres(true, !!user);
+    const matieres: Matiere[] = matieresQuery.data ?? [];
+    const isLoading = matieresQuery.isPending;
 
     return (
         <DashboardLayout>
@@ -4,7 +4,7 @@ import { DashboardLayout } from '@/components/layout/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { ArrowLeft, Save, User, UserCheck } from 'lucide-react';
-import api from '@/lib/axios';
+import { useMatiereGrades, useSaveGrade, useSaveMatiereGrades } from '@/lib/queries';
 import { toast } from 'sonner';
 
 interface StudentGrade {
@@ -21,26 +21,24 @@ interface StudentGrade {
 export default function TeacherSubjectGrades() {
     const { id } = useParams<{ id: string }>();
     const [students, setStudents] = useState<StudentGrade[]>([]);
-    const [matiereName, setMatiereName] = useState('');
-    const [isLoading, setIsLoading] = useState(true);
-    const [isSaving, setIsSaving] = useState(false);
+    const gradesQuery = useMatiereGrades(id);
+    const matiereName: string = gradesQuery.data?.matiere.name ?? '';
+    const isLoading = gradesQuery.isPending;
+    const saveOne = useSaveGrade();
+    const saveSheet = useSaveMatiereGrades(id);
+    const isSaving = saveSheet.isPending;
 
+    // Feuille en cache (affichée aussitôt) puis revalidée : copie locale modifiable
     useEffect(() => {
-        const fetchData = async () => {
-            if (!id) return;
-            try {
-                const response = await api.get(`/matieres/${id}/grades`);
-                setStudents(response.data.grades);
-                setMatiereName(response.data.matiere.name);
-            } catch (error) {
-                console.error('Failed to fetch grades', error);
-                toast.error("Erreur lors du chargement des étudiants");
-            } finally {
-                setIsLoading(false);
-            }
-        };
-        fetchData();
-    }, [id]);
+        if (gradesQuery.data) setStudents(gradesQuery.data.grades);
+    }, [gradesQuery.data]);
+
+    useEffect(() => {
+        if (gradesQuery.isError) {
+            console.error('Failed to fetch grades', gradesQuery.error);
+            toast.error("Erreur lors du chargement des étudiants");
+        }
+    }, [gradesQuery.isError]);
 
     const handleGradeChange = (studentId: number, value: string) => {
         setStudents(prev => prev.map(s => {
@@ -69,7 +67,7 @@ export default function TeacherSubjectGrades() {
                 return;
             }
 
-            await api.post('/notes', {
+            await saveOne.mutateAsync({
                 user_id: student.student.id,
                 matiere_id: id,
                 note: student.note,
@@ -82,23 +80,37 @@ export default function TeacherSubjectGrades() {
         }
     };
 
+    // Enregistre toute la feuille en une requête (PUT /matieres/{id}/grades)
     const saveAll = async () => {
-        setIsSaving(true);
-        let successCount = 0;
-        // On pourrait faire un Promise.all, mais attention au rate limit.
-        // Pour l'instant séquentiel ou API bulk (non implémentée).
-        // Faisons un simple Promise.all
+        if (!id) return;
+        const grades = students
+            .filter(s => s.note !== null)
+            .map(s => ({ user_id: s.student.id, note: s.note, commentaire: s.commentaire }));
+        if (grades.length === 0) {
+            toast.error("Aucune note à enregistrer");
+            return;
+        }
+
         try {
-            const promises = students
-                .filter(s => s.note !== null) //  On n'envoie que ceux qui ont une note ? Ou tous ? `store` updateOrCreate.
-                .map(s => saveGrade(s));
+            const { enregistres, rejetes, resultats } = await saveSheet.mutateAsync(grades);
+
+            // Mettre à jour les identifiants des notes créées
+            const noteIds = new Map<number, number>();
+            resultats.forEach((r: { user_id: number; note_id?: number }) => {
+                if (r.note_id) noteIds.set(r.user_id, r.note_id);
+            });
+            setStudents(prev => prev.map(s => noteIds.has(s.student.id) ? { ...s, note_id: noteIds.get(s.student.id)! } : s));
 
-            await Promise.all(promises);
-            // toast.success("Toutes les notes ont été sauvegardées"); // saveGrade envoie déjà des toasts, ça ferait beaucoup.
+            if (rejetes > 0) {
+                const premiere = resultats.find((r: { statut: string }) => r.statut === 'rejete');
+                toast.error(`${rejetes} note${rejetes > 1 ? 's' : ''} refusée${rejetes > 1 ? 's' : ''} : ${premiere?.erreur}`);
+            }
+            if (enregistres > 0) {
+                toast.success(`${enregistres} note${enregistres > 1 ? 's' : ''} enregistrée${enregistres > 1 ? 's' : ''}`);
+            }
         } catch (error) {
-            // Géré individuellement
-        } finally {
-            setIsSaving(false);
+            console.error('Failed to save grades', error);
+            toast.error("Erreur lors de l'enregistrement");
         }
     };
 
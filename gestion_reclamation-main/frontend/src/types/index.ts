@@ -44,6 +44,16 @@ export interface Claim {
   objectif: string;
   motif: string;
   justification_url?: string;
+  /** Justificatif analysé par la file (détail d'une demande seulement) */
+  fichier?: {
+    sha256: string;
+    mime: string;
+    taille: number;
+    statut: 'en_attente' | 'pret' | 'rejete';
+    motif_rejet?: string | null;
+    url: string | null;
+    apercu_url: string | null;
+  } | null;
   statut: ClaimStatus;
   note_actuelle?: number;
   note_demandee?: number;
@@ -55,6 +65,25 @@ export interface Claim {
   student_id: string;
 }
 
+// Compteurs de réclamations (GET /api/stats), statuts sans réclamation omis
+export type StatusCounts = Partial<Record<ClaimStatus, number>>;
+
+export interface ClaimStatsDetail {
+  id: number;
+  nom: string | null;
+  total: number;
+  par_statut: StatusCounts;
+}
+
+export interface ClaimStats {
+  total: number;
+  par_statut: StatusCounts;
+  /** Avec ?details=matiere (scolarité, DA) */
+  par_matiere?: ClaimStatsDetail[];
+  /** Avec ?details=enseignant (scolarité, DA) */
+  par_enseignant?: ClaimStatsDetail[];
+}
+
 // Interface Matière
 export interface Subject {
   id: string;
@@ -2,6 +2,16 @@ import { defineConfig } from "vite";
 import react from "@vitejs/plugin-react-swc";
 import path from "path";
 
+// Dépendances regroupées dans des chunks stables (mis en cache d'un déploiement à
+// l'autre) ; les widgets lourds (graphiques, calendrier) restent dans leur propre
+// chunk, téléchargé seulement par les pages qui les affichent
+const VENDOR_CHUNKS: Record<string, RegExp> = {
+  react: /node_modules\/(react|react-dom|react-router|react-router-dom|scheduler|@remix-run)\//,
+  query: /node_modules\/@tanstack\//,
+  charts: /node_modules\/(recharts|recharts-scale|victory-vendor|d3-[^/]+)\//,
+  calendar: /node_modules\/react-day-picker\//,
+};
+
 // https://vitejs.dev/config/
 export default defineConfig(({ mode }) => ({
   server: {
@@ -14,4 +24,16 @@ export default defineConfig(({ mode }) => ({
       "@": path.resolve(__dirname, "./src"),
     },
   },
+  build: {
+    // dist/.vite/manifest.json : graphe des chunks lu par scripts/bundle-budget.mjs
+    manifest: true,
+    rollupOptions: {
+      output: {
+        manualChunks(id) {
+          const normalise = id.replace(/\\/g, "/");
+          return Object.keys(VENDOR_CHUNKS).find((nom) => VENDOR_CHUNKS[nom].test(normalise));
+        },
+      },
+    },
+  },
 }));
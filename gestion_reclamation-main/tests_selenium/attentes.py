@@ -0,0 +1,294 @@
+"""
+Moteur d'attente événementiel pour les tests Selenium
+Remplace les pauses fixes (time.sleep) par des attentes sur de vrais signaux :
+DOM prêt, formulaire React hydraté, appel réseau terminé, changement d'URL
+"""
+
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import config
+
+
+# Sélecteurs du formulaire de connexion (LoginPage.tsx)
+CHAMP_EMAIL = (By.CSS_SELECTOR, "input[type='email']")
+CHAMP_MOT_DE_PASSE = (By.CSS_SELECTOR, "input[type='password']")
+BOUTON_CONNEXION = (By.XPATH, "//button[@type='submit']")
+
+# Messages d'erreur : toasts sonner (LoginPage.tsx) pas encore vus avant l'action
+# (voir marquer_messages_affiches), ou blocs d'alerte classiques
+TOAST_ERREUR_NOUVEAU = (
+    By.XPATH,
+    "//*[@data-sonner-toast and @data-type='error' and not(@data-sonde-vu)]",
+)
+MESSAGE_ERREUR = (
+    By.XPATH,
+    "//*[(contains(@class, 'error') or contains(@class, 'alert')) and not(@data-sonner-toast)]",
+)
+
+# Sonde réseau : enveloppe XMLHttpRequest (utilisé par axios) et fetch
+# pour compter les appels en cours et garder la trace des appels terminés
+SCRIPT_SONDE_RESEAU = """
+(function () {
+    if (window.__sondeReseau) { return; }
+    var sonde = window.__sondeReseau = { enCours: 0, termines: [] };
+    var terminer = function (url, methode, statut, debut, taille) {
+        sonde.enCours = Math.max(0, sonde.enCours - 1);
+        sonde.termines.push({
+            url: url, methode: methode, statut: statut,
+            debut: debut, duree: performance.now() - debut, taille: taille
+        });
+    };
+
+    var ouvrir = XMLHttpRequest.prototype.open;
+    var envoyer = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (methode, url) {
+        this.__sonde = { methode: String(methode).toUpperCase(), url: String(url) };
+        return ouvrir.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this, info = xhr.__sonde || { methode: 'GET', url: '' };
+        var debut = performance.now();
+        sonde.enCours += 1;
+        xhr.addEventListener('loadend', function () {
+            var taille = xhr.responseText ? xhr.responseText.length : 0;
+            terminer(xhr.responseURL || info.url, info.methode, xhr.status, debut, taille);
+        });
+        return envoyer.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var fetchOriginal = window.fetch;
+        window.fetch = function (ressource, options) {
+            var url = typeof ressource === 'string' ? ressource : ressource.url;
+            var methode = ((options && options.method) || 'GET').toUpperCase();
+            var debut = performance.now();
+            sonde.enCours += 1;
+            return fetchOriginal.apply(this, arguments).then(function (reponse) {
+                terminer(reponse.url || url, methode, reponse.status, debut, 0);
+                return reponse;
+            }, function (erreur) {
+                terminer(url, methode, 0, debut, 0);
+                throw erreur;
+            });
+        };
+    }
+})();
+"""
+
+
+def _attente(driver, timeout=None):
+    """Crée un WebDriverWait avec le délai par défaut de config.py"""
+    return WebDriverWait(driver, timeout or config.EXPLICIT_WAIT)
+
+
+def installer_sonde_reseau(driver):
+    """
+    Installe la sonde réseau dans la page
+
+    Sous Chrome, la sonde est aussi enregistrée via DevTools pour être
+    injectée avant tout script de la page lors des prochaines navigations.
+    """
+    if hasattr(driver, "execute_cdp_cmd") and not getattr(driver, "_sonde_cdp", False):
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_SONDE_RESEAU}
+        )
+        driver._sonde_cdp = True
+    driver.execute_script(SCRIPT_SONDE_RESEAU)
+
+
+def nombre_appels_termines(driver, chemin):
+    """
+    Retourne le nombre d'appels terminés dont l'URL contient `chemin`
+
+    Sert de repère avant une action : on attend ensuite qu'un nouvel appel
+    se termine avec attendre_appel_api(driver, chemin, deja_termines=n).
+    """
+    return driver.execute_script(
+        "var s = window.__sondeReseau;"
+        "return s ? s.termines.filter(function (a) {"
+        "  return a.url.indexOf(arguments[0]) !== -1; }).length : 0;",
+        chemin,
+    )
+
+
+def attendre_dom_pret(driver, timeout=None):
+    """
+    Attend que le DOM soit analysé (document.readyState 'interactive' ou 'complete')
+
+    Les images et autres ressources ne sont pas attendues : c'est ce qui permet
+    au profil "ci" (chargement "eager") de rendre la main plus tôt.
+    """
+    _attente(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") != "loading"
+    )
+
+
+def attendre_hydratation_react(driver, locator=BOUTON_CONNEXION, timeout=None):
+    """
+    Attend que React ait monté l'élément et branché ses gestionnaires d'événements
+
+    React 18 pose des propriétés `__reactProps$...` sur les nœuds qu'il gère :
+    tant qu'elles sont absentes, un clic n'est pas encore pris en compte.
+    """
+    def element_hydrate(d):
+        elements = d.find_elements(*locator)
+        if not elements:
+            return False
+        pret = d.execute_script(
+            "return Object.keys(arguments[0]).some(function (k) {"
+            "  return k.indexOf('__reactProps') === 0; });",
+            elements[0],
+        )
+        return elements[0] if pret and elements[0].is_enabled() else False
+
+    return _attente(driver, timeout).until(element_hydrate)
+
+
+def attendre_formulaire_connexion(driver, timeout=None):
+    """
+    Attend que le formulaire /login soit chargé, hydraté et utilisable
+
+    Returns:
+        Tuple (champ email, champ mot de passe, bouton de connexion)
+    """
+    attendre_dom_pret(driver, timeout)
+    bouton = attendre_hydratation_react(driver, BOUTON_CONNEXION, timeout)
+    email = _attente(driver, timeout).until(EC.element_to_be_clickable(CHAMP_EMAIL))
+    mot_de_passe = driver.find_element(*CHAMP_MOT_DE_PASSE)
+    installer_sonde_reseau(driver)
+    return email, mot_de_passe, bouton
+
+
+def ouvrir_page_connexion(driver, timeout=None):
+    """
+    Navigue vers /login et attend que le formulaire soit prêt
+
+    Returns:
+        Tuple (champ email, champ mot de passe, bouton de connexion)
+    """
+    installer_sonde_reseau(driver)
+    driver.get(f"{config.BASE_URL}/login")
+    return attendre_formulaire_connexion(driver, timeout)
+
+
+def attendre_appel_api(driver, chemin, deja_termines=0, timeout=None):
+    """
+    Attend qu'un appel réseau vers `chemin` se termine
+
+    Args:
+        chemin: Fragment d'URL de l'appel attendu (ex: "/api/login")
+        deja_termines: Nombre d'appels déjà terminés avant l'action
+
+    Returns:
+        Dictionnaire décrivant l'appel (url, methode, statut, duree, taille)
+    """
+    return _attente(driver, timeout).until(
+        lambda d: d.execute_script(
+            "var s = window.__sondeReseau; if (!s) { return false; }"
+            "var appels = s.termines.filter(function (a) {"
+            "  return a.url.indexOf(arguments[0]) !== -1; });"
+            "return appels.length > arguments[1] ? appels[appels.length - 1] : false;",
+            chemin,
+            deja_termines,
+        )
+    )
+
+
+def attendre_reseau_inactif(driver, timeout=None):
+    """Attend qu'aucun appel XHR/fetch ne soit en cours"""
+    _attente(driver, timeout).until(
+        lambda d: d.execute_script(
+            "return !window.__sondeReseau || window.__sondeReseau.enCours === 0;"
+        )
+    )
+
+
+def attendre_reseau_calme(driver, calme=0.5, timeout=None):
+    """
+    Attend qu'aucun appel ne soit en cours et qu'aucun ne se termine pendant `calme` secondes
+
+    Les requêtes d'une page partent dans ses effets React, juste après le rendu :
+    le réseau peut être inactif un instant avant qu'elles ne démarrent.
+    """
+    limite = time.perf_counter() + (timeout or config.EXPLICIT_WAIT)
+    nombre, depuis = -1, time.perf_counter()
+    while time.perf_counter() < limite:
+        attendre_reseau_inactif(driver, timeout)
+        actuel = driver.execute_script(
+            "return window.__sondeReseau ? window.__sondeReseau.termines.length : 0;"
+        )
+        if actuel != nombre:
+            nombre, depuis = actuel, time.perf_counter()
+        elif time.perf_counter() - depuis >= calme:
+            return
+        time.sleep(0.05)
+
+
+def attendre_changement_url(driver, ancienne_url, timeout=None):
+    """Attend que l'URL courante soit différente de `ancienne_url`"""
+    _attente(driver, timeout).until(EC.url_changes(ancienne_url))
+    return driver.current_url
+
+
+def attendre_url_contient(driver, fragment, timeout=None):
+    """Attend que l'URL courante contienne `fragment`"""
+    _attente(driver, timeout).until(EC.url_contains(fragment))
+    return driver.current_url
+
+
+def marquer_messages_affiches(driver):
+    """
+    Marque les toasts déjà à l'écran (attribut data-sonde-vu)
+
+    À appeler juste avant une action : attendre_message_erreur ne retourne ensuite
+    qu'un toast apparu après elle, même si les précédents sont encore affichés.
+    """
+    driver.execute_script(
+        "document.querySelectorAll('[data-sonner-toast]').forEach(function (t) {"
+        "  t.setAttribute('data-sonde-vu', '1'); });"
+    )
+
+
+def attendre_message_erreur(driver, timeout=None):
+    """
+    Attend l'affichage d'un nouveau message d'erreur visible
+
+    Returns:
+        Le toast d'erreur le plus récent non marqué par marquer_messages_affiches
+        (sonner insère les nouveaux toasts en tête), à défaut un bloc d'alerte
+    """
+    def nouveau_message(d):
+        for locator in (TOAST_ERREUR_NOUVEAU, MESSAGE_ERREUR):
+            visibles = [e for e in d.find_elements(*locator) if e.is_displayed()]
+            if visibles:
+                return visibles[0]
+        return False
+
+    return _attente(driver, timeout).until(nouveau_message)
+
+
+def soumettre_connexion(driver, email_input, password_input, bouton, email, mot_de_passe):
+    """
+    Remplit le formulaire, le soumet et attend la réponse de /api/login
+
+    Returns:
+        Dictionnaire décrivant l'appel /api/login (voir attendre_appel_api),
+        ou None si le navigateur a refusé le formulaire (validation HTML5)
+    """
+    email_input.clear()
+    email_input.send_keys(email)
+    password_input.clear()
+    password_input.send_keys(mot_de_passe)
+
+    formulaire_valide = driver.execute_script(
+        "return arguments[0].form ? arguments[0].form.checkValidity() : true;", bouton
+    )
+    deja_termines = nombre_appels_termines(driver, "/api/login")
+    marquer_messages_affiches(driver)
+    bouton.click()
+    if not formulaire_valide:
+        return None
+    return attendre_appel_api(driver, "/api/login", deja_termines)
@@ -0,0 +1,195 @@
+"""
+Benchmark de charge du circuit des réclamations (/api/demandes)
+Rejoue en parallèle des parcours complets de réclamation (soumission par un
+étudiant puis traitement par la scolarité, le DA et l'enseignant) et mesure
+latence p50/p95/p99, débit et taux d'erreur par endpoint
+
+⚠ Chaque parcours crée une demande, des notifications et des historiques :
+à lancer contre une base de test, jamais contre la production.
+
+Utilisation:
+    python bench_demandes.py                                  # 200 parcours, 20 en parallèle
+    python bench_demandes.py -c 100 -p 1000 --etudiants 50
+    python bench_demandes.py --mix correction=1,rejet_scolarite=1
+    python bench_demandes.py -o apres --reference avant.json  # compare à une exécution précédente
+    python bench_demandes.py --mix soumission=1 -c 50         # soumissions seules
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import rapports
+from client_api import ClientAPI, creer_session
+
+# Étapes après la soumission : (action, rôle qui l'exécute, statut attendu ensuite)
+PARCOURS = {
+    # Soumission seule : mesure isolée de POST /demandes (mails et notifications compris)
+    "soumission": [],
+    "correction": [
+        ("valider", "registrar", "RECUE_SCOLARITE"),
+        ("envoyer-au-da", "registrar", "ENVOYEE_DA"),
+        ("imputer", "admin", "IMPUTEE_ENSEIGNANT"),
+        ("corriger", "teacher", "VALIDEE"),
+    ],
+    "validation_enseignant": [
+        ("envoyer-au-da", "registrar", "ENVOYEE_DA"),
+        ("imputer", "admin", "IMPUTEE_ENSEIGNANT"),
+        ("valider", "teacher", "VALIDEE"),
+    ],
+    "rejet_scolarite": [
+        ("rejeter", "registrar", "REJETEE_SCOLARITE"),
+    ],
+    "rejet_da": [
+        ("envoyer-au-da", "registrar", "ENVOYEE_DA"),
+        ("rejeter", "admin", "REJETEE_DA"),
+    ],
+    "rejet_enseignant": [
+        ("envoyer-au-da", "registrar", "ENVOYEE_DA"),
+        ("imputer", "admin", "IMPUTEE_ENSEIGNANT"),
+        ("rejeter", "teacher", "NON_VALIDEE"),
+    ],
+}
+
+# Répartition par défaut des parcours (poids relatifs)
+MIX_DEFAUT = "correction=4,validation_enseignant=2,rejet_scolarite=2,rejet_da=1,rejet_enseignant=1"
+
+
+def lire_mix(texte):
+    """Convertit "correction=4,rejet_da=1" en {"correction": 4, "rejet_da": 1}"""
+    mix = {}
+    for element in texte.split(","):
+        nom, _, poids = element.partition("=")
+        if nom not in PARCOURS:
+            raise argparse.ArgumentTypeError(f"Parcours inconnu: {nom} (attendu: {', '.join(PARCOURS)})")
+        mix[nom] = float(poids or 1)
+    return mix
+
+
+class Banc:
+    """
+    Acteurs connectés et mesures d'une exécution
+
+    Un seul compte par rôle de traitement (scolarité, DA, enseignant) et
+    `nb_etudiants` comptes étudiants qui soumettent les demandes.
+    """
+
+    def __init__(self, nb_etudiants, concurrence):
+        self.session_http = creer_session(taille_pool=concurrence)
+        self.mesures = []
+        self._verrou = threading.Lock()
+        self.etudiants = [self._connecter(f"bench{i}", "student") for i in range(nb_etudiants)]
+        self.acteurs = {role: self._connecter("bench", role) for role in ("registrar", "admin", "teacher")}
+        self.enseignant_id = self.acteurs["teacher"].user().json()["id"]
+        self.matiere_id = self._premiere_matiere()
+
+    def _connecter(self, usage, role):
+        compte = comptes.compte_test(usage, role=role)
+        client = ClientAPI(session_http=self.session_http)
+        reponse = client.login(compte["email"], compte["password"], role)
+        if reponse.status_code != 200:
+            raise RuntimeError(f"Connexion impossible pour {compte['email']}: {reponse.text}")
+        return client
+
+    def _premiere_matiere(self):
+        matieres = self.acteurs["registrar"].requete("GET", "/matieres").json()
+        if not matieres:
+            raise RuntimeError("Aucune matière en base : lancer d'abord php artisan db:seed")
+        return matieres[0]["id"]
+
+    def _mesurer(self, client, endpoint, chemin, corps, statut_attendu=None):
+        debut = time.perf_counter()
+        try:
+            reponse = client.requete("POST", chemin, json=corps)
+            statut = reponse.status_code
+            donnees = reponse.json() if reponse.content else {}
+        except Exception:  # timeout, connexion refusée...
+            statut, donnees = None, {}
+        duree_ms = (time.perf_counter() - debut) * 1000
+
+        ok = statut is not None and statut < 400
+        if ok and statut_attendu:
+            # Les actions hors circuit répondent 200 sans rien changer : on vérifie le statut
+            ok = donnees.get("statut") == statut_attendu
+        with self._verrou:
+            self.mesures.append({"endpoint": endpoint, "duree_ms": duree_ms, "statut": statut, "ok": ok})
+        return donnees if ok else None
+
+    def soumettre(self, etudiant, numero):
+        return self._mesurer(etudiant, "POST /demandes", "/demandes", {
+            "nom_prenom": "Étudiant Bench",
+            "filiere_niveau": "L3",
+            "matiere_id": self.matiere_id,
+            "objet": f"Réclamation bench n°{numero}",
+            "objectif": "Révision de la note",
+            "motif": "Erreur de report de note",
+            "note_actuelle": 8,
+            "note_demandee": 12,
+        }, statut_attendu="SOUMISE")
+
+    def executer_parcours(self, nom, numero, etudiant):
+        """Soumet une demande puis enchaîne les étapes du parcours ; s'arrête à la première erreur"""
+        demande = self.soumettre(etudiant, numero)
+        for action, role, statut_attendu in PARCOURS[nom]:
+            if demande is None:
+                return
+            corps = {"commentaire": f"bench {nom}"}
+            if action == "imputer":
+                corps["enseignant_id"] = self.enseignant_id
+            elif action == "corriger":
+                corps["nouvelle_note"] = 12
+            demande = self._mesurer(
+                self.acteurs[role],
+                f"POST /demandes/{{id}}/{action} [{role}]",
+                f"/demandes/{demande['id']}/{action}",
+                corps,
+                statut_attendu,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de charge du circuit des réclamations")
+    parser.add_argument("-c", "--concurrence", type=int, default=20,
+                        help="Parcours exécutés en parallèle")
+    parser.add_argument("-p", "--parcours", type=int, default=200,
+                        help="Nombre total de parcours à jouer")
+    parser.add_argument("--etudiants", type=int, default=10,
+                        help="Nombre de comptes étudiants qui soumettent")
+    parser.add_argument("--mix", type=lire_mix, default=lire_mix(MIX_DEFAUT),
+                        help=f"Poids des parcours (défaut: {MIX_DEFAUT})")
+    parser.add_argument("--graine", type=int, default=42,
+                        help="Graine du tirage des parcours (reproductibilité)")
+    parser.add_argument("-o", "--sortie", default="bench_demandes",
+                        help="Préfixe des rapports .json et .html")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    print("Préparation des comptes...")
+    banc = Banc(args.etudiants, args.concurrence)
+
+    tirage = random.Random(args.graine)
+    noms = tirage.choices(list(args.mix), weights=list(args.mix.values()), k=args.parcours)
+
+    print(f"Exécution de {args.parcours} parcours ({args.concurrence} en parallèle)...")
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrence) as executeur:
+        for numero, nom in enumerate(noms):
+            executeur.submit(banc.executer_parcours, nom, numero, banc.etudiants[numero % len(banc.etudiants)])
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("bench_demandes", banc.mesures, duree, {
+        "concurrence": args.concurrence,
+        "parcours": args.parcours,
+        "etudiants": args.etudiants,
+        "mix": args.mix,
+        "graine": args.graine,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Benchmark des exports CSV en flux (GET /api/demandes/export, GET /api/notes/export)
+Télécharge les exports en flux (sans garder le fichier), compte les lignes reçues
+et mesure le débit (lignes/s) ainsi que la mémoire des processus serveur pendant
+le téléchargement (pic relevé par psutil, au-dessus de la mémoire avant l'appel)
+
+Avec --paliers, la base est régénérée (php artisan db:seed-volume) à chaque
+taille : le pic mémoire doit rester le même quel que soit le nombre de lignes.
+Code de sortie 1 si le pic du plus gros palier dépasse `--tolerance` fois celui
+du plus petit.
+
+Utilisation:
+    python bench_export.py                                  # taille actuelle de la base
+    python bench_export.py --paliers 1000,100000,500000 --processus php-fpm
+    python bench_export.py -o export --reference export_avant.json
+"""
+
+import argparse
+import subprocess
+import sys
+import threading
+import time
+
+import psutil
+
+import comptes
+import config
+import rapports
+from client_api import ClientAPI
+
+EXPORTS = {
+    "demandes": ("/demandes/export", {}),
+    "demandes filtre statut": ("/demandes/export", {"statut": "SOUMISE,RECUE_SCOLARITE"}),
+    "notes": ("/notes/export", {}),
+}
+
+
+def memoire_serveur(motif):
+    """RSS cumulée (octets) des processus dont le nom ou la ligne de commande contient `motif`"""
+    total = 0
+    for processus in psutil.process_iter(["name", "cmdline", "memory_info"]):
+        try:
+            texte = f"{processus.info['name']} {' '.join(processus.info['cmdline'] or [])}"
+            if motif in texte and processus.pid != psutil.Process().pid:
+                total += processus.info["memory_info"].rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError):
+            continue
+    return total
+
+
+class Echantillonneur(threading.Thread):
+    """Relève le pic de mémoire serveur pendant un téléchargement"""
+
+    def __init__(self, motif, intervalle=0.05):
+        super().__init__(daemon=True)
+        self.motif = motif
+        self.intervalle = intervalle
+        self.avant = memoire_serveur(motif)
+        self.pic = self.avant
+        self.arret = threading.Event()
+
+    def run(self):
+        while not self.arret.wait(self.intervalle):
+            self.pic = max(self.pic, memoire_serveur(self.motif))
+
+    def terminer(self):
+        self.arret.set()
+        self.join()
+        return max(0, self.pic - self.avant)
+
+
+def telecharger(client, chemin, params, motif):
+    """Lit l'export ligne à ligne ; retourne (statut, lignes de données, octets, mémoire serveur ajoutée)"""
+    echantillonneur = Echantillonneur(motif)
+    echantillonneur.start()
+    statut, lignes, octets = None, 0, 0
+    try:
+        with client.requete("GET", chemin, params=params, stream=True, timeout=600) as reponse:
+            statut = reponse.status_code
+            for ligne in reponse.iter_lines(chunk_size=64 * 1024):
+                lignes += 1
+                octets += len(ligne) + 1
+    except Exception:  # timeout, connexion coupée...
+        statut = None
+    finally:
+        memoire = echantillonneur.terminer()
+    # Première ligne : entêtes (les champs multilignes sont rares dans ces exports)
+    return statut, max(0, lignes - 1), octets, memoire
+
+
+def regenerer(taille, artisan):
+    """Régénère le jeu de données de volume avec `taille` demandes et `taille` notes"""
+    commande = artisan.split() + [
+        "db:seed-volume", f"--demandes={taille}", f"--notes={taille}", "--etudiants=2000", "--fresh",
+    ]
+    print(f"\n$ {' '.join(commande)}")
+    subprocess.run(commande, cwd=config.BACKEND_DIR, check=True)
+
+
+def mesurer_palier(client, etiquette, args, mesures, resultats):
+    for libelle, (chemin, params) in EXPORTS.items():
+        debut = time.perf_counter()
+        statut, lignes, octets, memoire = telecharger(client, chemin, params, args.processus)
+        duree = time.perf_counter() - debut
+        mesures.append({
+            "endpoint": f"{libelle} [{etiquette}]",
+            "duree_ms": duree * 1000,
+            "statut": statut,
+            "ok": statut == 200,
+        })
+        resultats.append({
+            "export": libelle,
+            "palier": etiquette,
+            "lignes": lignes,
+            "octets": octets,
+            "lignes_par_s": round(lignes / duree, 1) if duree else None,
+            "memoire_serveur_mio": round(memoire / 2**20, 1),
+        })
+        print(f"  {libelle:<25} {lignes:>8} lignes en {duree:6.1f} s "
+              f"({lignes / duree if duree else 0:,.0f} lignes/s), mémoire serveur +{memoire / 2**20:.1f} Mio")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des exports CSV en flux")
+    parser.add_argument("--paliers", help="Tailles de table à générer, ex: 1000,100000,500000")
+    parser.add_argument("--artisan", default="php artisan", help="Commande artisan du backend")
+    parser.add_argument("--processus", default="php",
+                        help="Motif des processus serveur dont la mémoire est mesurée")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Rapport max entre le pic mémoire du plus gros et du plus petit palier")
+    parser.add_argument("-o", "--sortie", default="bench_export")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    compte = comptes.compte_test("bench", role="registrar")
+    client = ClientAPI()
+    client.login(compte["email"], compte["password"], "registrar")
+
+    mesures, resultats = [], []
+    debut = time.perf_counter()
+    paliers = [int(p) for p in args.paliers.split(",")] if args.paliers else ["base actuelle"]
+    for palier in paliers:
+        if args.paliers:
+            regenerer(palier, args.artisan)
+        print(f"\nPalier {palier} :")
+        mesurer_palier(client, palier, args, mesures, resultats)
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("bench_export", mesures, duree, {
+        "paliers": args.paliers or "base actuelle",
+        "exports": resultats,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+    if len(paliers) < 2:
+        return
+    # Mémoire constante : on compare chaque export entre le plus petit et le plus gros palier
+    # (plancher de 1 Mio : en dessous, l'écart relève du bruit de mesure)
+    echecs = []
+    for libelle in EXPORTS:
+        petit, gros = (next(r for r in resultats if r["export"] == libelle and r["palier"] == p)
+                       for p in (paliers[0], paliers[-1]))
+        rapport_memoire = max(gros["memoire_serveur_mio"], 1) / max(petit["memoire_serveur_mio"], 1)
+        print(f"{libelle:<25} mémoire x{rapport_memoire:.2f} pour x{paliers[-1] / paliers[0]:.0f} lignes")
+        if rapport_memoire > args.tolerance:
+            echecs.append(libelle)
+    if echecs:
+        print(f"✗ Mémoire serveur croissante avec le volume : {', '.join(echecs)}")
+        sys.exit(1)
+    print("✓ Mémoire serveur stable quel que soit le volume exporté")
+
+
+if __name__ == "__main__":
+    main()
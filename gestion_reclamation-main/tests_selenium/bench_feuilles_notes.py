@@ -0,0 +1,125 @@
+"""
+Benchmark de lecture des feuilles de notes (cache en lecture)
+Simule la consultation des résultats juste après leur publication : de nombreux
+lecteurs ouvrent en parallèle les feuilles des matières (GET /api/matieres/{id}/grades)
+et les relevés des étudiants (GET /api/users/{id}/grades), pendant qu'une note est
+modifiée de temps en temps (invalidation)
+
+Le rapport sépare les réponses servies par le cache (en-tête X-Cache: HIT) des
+recalculs (MISS) et reprend les compteurs du serveur (GET /api/grades/cache-stats).
+
+Utilisation:
+    python bench_feuilles_notes.py                      # 2000 lectures, 20 en parallèle
+    python bench_feuilles_notes.py -l 10000 -c 50 --ecritures 0.01
+    python bench_feuilles_notes.py -o feuilles --reference feuilles_avant.json
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import rapports
+from client_api import ClientAPI, creer_session
+
+
+class Lecteurs:
+    """Client de la scolarité (qui voit toutes les feuilles) et mesures de l'exécution"""
+
+    def __init__(self, concurrence, nb_matieres):
+        compte = comptes.compte_test("bench", role="registrar")
+        self.client = ClientAPI(session_http=creer_session(taille_pool=concurrence))
+        self.client.login(compte["email"], compte["password"], "registrar")
+        self.mesures = []
+        self._verrou = threading.Lock()
+
+        self.matieres = [m["id"] for m in self.client.requete("GET", "/matieres").json()[:nb_matieres]]
+        if not self.matieres:
+            raise RuntimeError("Aucune matière en base : lancer d'abord php artisan db:seed")
+        # Étudiants et notes existantes des feuilles lues, pour les relevés et les écritures
+        etudiants, self.notes = set(), []
+        for matiere_id in self.matieres:
+            for ligne in self.client.requete("GET", f"/matieres/{matiere_id}/grades").json()["grades"]:
+                etudiants.add(ligne["student"]["id"])
+                if ligne["note_id"]:
+                    self.notes.append((ligne["note_id"], ligne["note"]))
+        self.etudiants = sorted(etudiants)
+
+    def _mesurer(self, endpoint, methode, chemin, **kwargs):
+        debut = time.perf_counter()
+        try:
+            reponse = self.client.requete(methode, chemin, **kwargs)
+            statut = reponse.status_code
+            cache = reponse.headers.get("X-Cache")
+        except Exception:  # timeout, connexion refusée...
+            statut, cache = None, None
+        if cache:
+            endpoint = f"{endpoint} [{cache}]"
+        with self._verrou:
+            self.mesures.append({
+                "endpoint": endpoint,
+                "duree_ms": (time.perf_counter() - debut) * 1000,
+                "statut": statut,
+                "ok": statut is not None and statut < 400,
+            })
+
+    def tirer(self, tirage, part_etudiants, part_ecritures):
+        """Une lecture (feuille de matière ou relevé) ou, rarement, une note réécrite à l'identique"""
+        choix = tirage.random()
+        if choix < part_ecritures and self.notes:
+            note_id, note = tirage.choice(self.notes)
+            return "PUT /notes/{id}", "PUT", f"/notes/{note_id}", {"json": {"note": note}}
+        if choix < part_ecritures + part_etudiants and self.etudiants:
+            return "GET /users/{id}/grades", "GET", f"/users/{tirage.choice(self.etudiants)}/grades", {}
+        return "GET /matieres/{id}/grades", "GET", f"/matieres/{tirage.choice(self.matieres)}/grades", {}
+
+    def executer(self, operation):
+        endpoint, methode, chemin, kwargs = operation
+        self._mesurer(endpoint, methode, chemin, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de lecture des feuilles de notes")
+    parser.add_argument("-c", "--concurrence", type=int, default=20)
+    parser.add_argument("-l", "--lectures", type=int, default=2000, help="Nombre total d'opérations")
+    parser.add_argument("--matieres", type=int, default=20, help="Nombre de feuilles de matières lues")
+    parser.add_argument("--etudiants", type=float, default=0.3, help="Part des relevés d'étudiants")
+    parser.add_argument("--ecritures", type=float, default=0.002, help="Part des notes modifiées")
+    parser.add_argument("--graine", type=int, default=42)
+    parser.add_argument("-o", "--sortie", default="bench_feuilles_notes")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    print("Préparation des feuilles...")
+    lecteurs = Lecteurs(args.concurrence, args.matieres)
+    lecteurs.client.requete("DELETE", "/grades/cache-stats")
+
+    tirage = random.Random(args.graine)
+    operations = [lecteurs.tirer(tirage, args.etudiants, args.ecritures) for _ in range(args.lectures)]
+    print(f"Exécution de {args.lectures} opérations ({args.concurrence} en parallèle)...")
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrence) as executeur:
+        executeur.map(lecteurs.executer, operations)
+    duree = time.perf_counter() - debut
+
+    statistiques = lecteurs.client.requete("GET", "/grades/cache-stats").json()
+    rapport = rapports.construire_rapport("bench_feuilles_notes", lecteurs.mesures, duree, {
+        "concurrence": args.concurrence,
+        "operations": args.lectures,
+        "matieres": len(lecteurs.matieres),
+        "part_etudiants": args.etudiants,
+        "part_ecritures": args.ecritures,
+        "cache_serveur": statistiques,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+    echantillon = statistiques.get("echantillon", 1)
+    estimation = f" (estimés, une lecture comptée sur {echantillon})" if echantillon > 1 else ""
+    print(f"Cache serveur : {statistiques['hits']} hits, {statistiques['misses']} misses{estimation} "
+          f"(taux de succès {statistiques['taux_succes']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark de la soumission de réclamations avec justificatif (POST /api/demandes)
+Soumet en parallèle des demandes accompagnées d'un PDF de 2 Mo et mesure la
+latence de la soumission, puis vérifie le téléchargement du justificatif :
+requête partielle (Range -> 206) et revalidation (If-None-Match -> 304)
+
+Deux modes de contenu :
+  - unique : un fichier différent par demande (chaque envoi est écrit et analysé) ;
+  - identique : le même fichier pour toutes (stocké une fois, dédoublonné par SHA-256).
+
+⚠ Chaque soumission crée une demande, des notifications et des historiques :
+à lancer contre une base de test, jamais contre la production.
+
+Utilisation:
+    python bench_justificatifs.py                          # 100 soumissions, 10 en parallèle, unique
+    python bench_justificatifs.py --contenu identique -n 200 -c 20
+    python bench_justificatifs.py -o justif --reference justif_avant.json
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import rapports
+from client_api import ClientAPI, creer_session
+
+# Sous la limite de validation (max:2048 Ko)
+TAILLE_DEFAUT = 2_000_000
+
+
+def pdf(taille):
+    """Contenu reconnu comme PDF (en-tête %PDF) complété d'octets aléatoires"""
+    entete, fin = b"%PDF-1.4\n%", b"\n%%EOF\n"
+    return entete + os.urandom(taille - len(entete) - len(fin)) + fin
+
+
+class Banc:
+    """Étudiants connectés, justificatif partagé (mode identique) et mesures"""
+
+    def __init__(self, nb_etudiants, concurrence, taille, identique):
+        self.session_http = creer_session(taille_pool=concurrence)
+        self.taille = taille
+        self.commun = pdf(taille) if identique else None
+        self.mesures = []
+        self.demandes = []
+        self._verrou = threading.Lock()
+        self.etudiants = [self._connecter(f"bench{i}") for i in range(nb_etudiants)]
+        matieres = self.etudiants[0].requete("GET", "/matieres").json()
+        if not matieres:
+            raise RuntimeError("Aucune matière en base : lancer d'abord php artisan db:seed")
+        self.matiere_id = matieres[0]["id"]
+
+    def _connecter(self, usage):
+        compte = comptes.compte_test(usage, role="student")
+        client = ClientAPI(session_http=self.session_http)
+        reponse = client.login(compte["email"], compte["password"], "student")
+        if reponse.status_code != 200:
+            raise RuntimeError(f"Connexion impossible pour {compte['email']}: {reponse.text}")
+        return client
+
+    def _mesurer(self, endpoint, appel, ok):
+        debut = time.perf_counter()
+        try:
+            reponse = appel()
+            statut = reponse.status_code
+        except Exception:  # timeout, connexion refusée...
+            reponse, statut = None, None
+        with self._verrou:
+            self.mesures.append({
+                "endpoint": endpoint,
+                "duree_ms": (time.perf_counter() - debut) * 1000,
+                "statut": statut,
+                "ok": statut is not None and ok(reponse),
+            })
+        return reponse
+
+    def soumettre(self, numero):
+        etudiant = self.etudiants[numero % len(self.etudiants)]
+        # Contenu généré avant la mesure : seul l'envoi est chronométré
+        contenu = self.commun or pdf(self.taille)
+        reponse = self._mesurer("POST /demandes (2 Mo)", lambda: etudiant.requete("POST", "/demandes", data={
+            "nom_prenom": "Étudiant Bench",
+            "filiere_niveau": "L3",
+            "matiere_id": self.matiere_id,
+            "objet": f"Réclamation bench n°{numero}",
+            "objectif": "Révision de la note",
+            "motif": "Erreur de report de note",
+        }, files={"justification": (f"justificatif{numero}.pdf", contenu, "application/pdf")}, timeout=120),
+            lambda r: r.status_code == 201)
+        if reponse is not None and reponse.status_code == 201:
+            with self._verrou:
+                self.demandes.append((etudiant, reponse.json()))
+
+    def verifier_telechargement(self, attente_max):
+        """Attend l'analyse d'un justificatif puis rejoue Range et If-None-Match sur son lien"""
+        if not self.demandes:
+            return None
+        etudiant, demande = self.demandes[0]
+        limite = time.perf_counter() + attente_max
+        fichier = None
+        while time.perf_counter() < limite:
+            fichier = etudiant.requete("GET", f"/demandes/{demande['id']}").json().get("fichier")
+            if fichier and fichier["statut"] != "en_attente":
+                break
+            time.sleep(0.5)
+        if not fichier or fichier["statut"] != "pret":
+            print(f"⚠ Justificatif non analysé ({fichier and fichier['statut']}) : la file tourne-t-elle ?")
+            return fichier and fichier["statut"]
+
+        url = demande["justification_url"]
+        session = self.session_http
+        complet = self._mesurer("GET /fichiers/{sha256}", lambda: session.get(url, timeout=60),
+                                lambda r: r.status_code == 200 and len(r.content) == self.taille)
+        self._mesurer("GET /fichiers/{sha256} [Range 1 Ko]",
+                      lambda: session.get(url, headers={"Range": "bytes=0-1023"}, timeout=60),
+                      lambda r: r.status_code == 206 and len(r.content) == 1024)
+        etag = complet.headers.get("ETag") if complet is not None else None
+        self._mesurer("GET /fichiers/{sha256} [If-None-Match]",
+                      lambda: session.get(url, headers={"If-None-Match": etag or ""}, timeout=60),
+                      lambda r: r.status_code == 304 and not r.content)
+        return "pret"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la soumission avec justificatif")
+    parser.add_argument("-n", "--soumissions", type=int, default=100)
+    parser.add_argument("-c", "--concurrence", type=int, default=10)
+    parser.add_argument("--etudiants", type=int, default=10, help="Comptes étudiants qui soumettent")
+    parser.add_argument("--taille", type=int, default=TAILLE_DEFAUT, help="Taille du justificatif (octets)")
+    parser.add_argument("--contenu", choices=["unique", "identique"], default="unique")
+    parser.add_argument("--attente", type=int, default=30, help="Attente max de l'analyse par la file (s)")
+    parser.add_argument("-o", "--sortie", default="bench_justificatifs")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    print("Préparation des comptes...")
+    banc = Banc(args.etudiants, args.concurrence, args.taille, args.contenu == "identique")
+
+    print(f"Soumission de {args.soumissions} demandes avec justificatif {args.contenu} "
+          f"de {args.taille / 1e6:.1f} Mo ({args.concurrence} en parallèle)...")
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrence) as executeur:
+        executeur.map(banc.soumettre, range(args.soumissions))
+    duree = time.perf_counter() - debut
+
+    statut_fichier = banc.verifier_telechargement(args.attente)
+
+    rapport = rapports.construire_rapport("bench_justificatifs", banc.mesures, duree, {
+        "soumissions": args.soumissions,
+        "concurrence": args.concurrence,
+        "taille_octets": args.taille,
+        "contenu": args.contenu,
+        "debit_envoi_mo_s": round(len(banc.demandes) * args.taille / 1e6 / duree, 1),
+        "statut_analyse": statut_fichier,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark de la liste des réclamations (GET /api/demandes)
+Compare le tableau complet historique à la liste paginée par curseur
+(première page, page profonde, filtres, champs réduits) et, avec --paliers,
+régénère la base à plusieurs tailles pour vérifier que la latence de la liste
+paginée reste stable quand la table grossit
+
+Utilisation:
+    python bench_liste_demandes.py                           # taille actuelle de la base
+    python bench_liste_demandes.py --paliers 1000,10000,50000
+    python bench_liste_demandes.py --sans-complet -o liste --reference liste_avant.json
+"""
+
+import argparse
+import subprocess
+import time
+
+import comptes
+import config
+import rapports
+from client_api import ClientAPI
+
+# Cas mesurés : libellé -> paramètres de GET /demandes
+CAS_PAGINES = {
+    "page 1": {"per_page": 25},
+    "page 1 champs réduits": {"per_page": 25, "fields": "id,objet,nom_prenom,statut,motif,matiere_id,created_at"},
+    "filtre statut": {"per_page": 25, "statut": "SOUMISE,RECUE_SCOLARITE"},
+    "filtre dates": {"per_page": 25, "date_debut": "2025-11-01", "date_fin": "2025-12-31"},
+}
+
+
+def regenerer(demandes, artisan):
+    """Régénère le jeu de données de volume avec `demandes` demandes (db:seed-volume)"""
+    commande = artisan.split() + [
+        "db:seed-volume", f"--demandes={demandes}", "--etudiants=2000", "--notes=0", "--fresh",
+    ]
+    print(f"\n$ {' '.join(commande)}")
+    subprocess.run(commande, cwd=config.BACKEND_DIR, check=True)
+
+
+def mesurer(client, endpoint, params, mesures, repetitions):
+    """Rejoue `repetitions` fois la requête et retourne la dernière réponse JSON"""
+    donnees = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        try:
+            reponse = client.requete("GET", "/demandes", params=params, timeout=120)
+            statut = reponse.status_code
+            donnees = reponse.json() if statut == 200 else None
+        except Exception:  # timeout, connexion refusée...
+            statut, donnees = None, None
+        mesures.append({
+            "endpoint": endpoint,
+            "duree_ms": (time.perf_counter() - debut) * 1000,
+            "statut": statut,
+            "ok": statut == 200,
+        })
+    return donnees
+
+
+def mesurer_palier(client, etiquette, args, mesures):
+    """Mesure tous les cas sur la base dans son état actuel"""
+    if not args.sans_complet:
+        mesurer(client, f"tableau complet [{etiquette}]", {}, mesures, max(1, args.repetitions // 4))
+
+    for libelle, params in CAS_PAGINES.items():
+        mesurer(client, f"{libelle} [{etiquette}]", params, mesures, args.repetitions)
+
+    # Page profonde : on suit le curseur jusqu'à la page demandée, puis on la rejoue
+    params = dict(CAS_PAGINES["page 1"])
+    for _ in range(args.profondeur - 1):
+        page = client.requete("GET", "/demandes", params=params).json()
+        if not page.get("next_cursor"):
+            break
+        params["cursor"] = page["next_cursor"]
+    mesurer(client, f"page {args.profondeur} (curseur) [{etiquette}]", params, mesures, args.repetitions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la liste des réclamations")
+    parser.add_argument("--paliers", help="Tailles de table à générer, ex: 1000,10000,50000")
+    parser.add_argument("--artisan", default="php artisan", help="Commande artisan du backend")
+    parser.add_argument("-n", "--repetitions", type=int, default=20)
+    parser.add_argument("--profondeur", type=int, default=20, help="Page profonde mesurée")
+    parser.add_argument("--sans-complet", action="store_true",
+                        help="Ne pas mesurer le tableau complet (trop lent sur de gros volumes)")
+    parser.add_argument("-o", "--sortie", default="bench_liste_demandes")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    # La scolarité voit toutes les demandes : c'est la liste la plus lourde
+    compte = comptes.compte_test("bench", role="registrar")
+    client = ClientAPI()
+    client.login(compte["email"], compte["password"], "registrar")
+
+    mesures = []
+    debut = time.perf_counter()
+    if args.paliers:
+        for palier in (int(p) for p in args.paliers.split(",")):
+            regenerer(palier, args.artisan)
+            mesurer_palier(client, palier, args, mesures)
+    else:
+        mesurer_palier(client, "base actuelle", args, mesures)
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("bench_liste_demandes", mesures, duree, {
+        "paliers": args.paliers or "base actuelle",
+        "repetitions": args.repetitions,
+        "profondeur": args.profondeur,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+
+if __name__ == "__main__":
+    main()
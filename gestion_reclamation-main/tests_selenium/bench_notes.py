@@ -0,0 +1,125 @@
+"""
+Benchmark de la saisie d'une feuille de notes
+Compare l'enregistrement d'une feuille complète note par note (POST /api/notes,
+une requête par étudiant comme l'ancien bouton « Tout enregistrer ») à l'envoi
+de la feuille en une seule requête (PUT /api/matieres/{id}/grades)
+
+La feuille est celle d'une matière créée pour l'occasion par l'enseignant de
+test, dans une filière qui compte assez d'étudiants (php artisan db:seed-volume).
+
+Utilisation:
+    python bench_notes.py                        # feuille de 120 étudiants, 5 répétitions
+    python bench_notes.py --taille 300 -n 10 --filiere 4
+    python bench_notes.py -o notes --reference notes_avant.json
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import rapports
+from client_api import ClientAPI, creer_session
+
+# Requêtes simultanées vers un même hôte dans un navigateur (Promise.all du frontend)
+CONNEXIONS_NAVIGATEUR = 6
+
+
+def preparer_feuille(client, filiere_id, taille):
+    """Crée une matière de l'enseignant et retourne (matiere_id, ids des étudiants de la feuille)"""
+    if filiere_id is None:
+        filiere_id = client.requete("GET", "/filieres").json()[0]["id"]
+    matiere = client.requete("POST", "/matieres", json={
+        "name": f"Bench notes {int(time.time())}",
+        "filiere_id": filiere_id,
+    }).json()
+    etudiants = client.requete("GET", f"/matieres/{matiere['id']}/grades").json()["grades"]
+    if len(etudiants) < taille:
+        print(f"⚠ Seulement {len(etudiants)} étudiants dans la filière {filiere_id} "
+              f"(lancer php artisan db:seed-volume pour des feuilles plus grandes)")
+    return matiere["id"], [e["student"]["id"] for e in etudiants[:taille]]
+
+
+def chronometrer(mesures, endpoint, requete):
+    """Exécute `requete()` et enregistre sa durée ; retourne la réponse"""
+    debut = time.perf_counter()
+    try:
+        reponse = requete()
+        statut = reponse.status_code
+    except Exception:  # timeout, connexion refusée...
+        reponse, statut = None, None
+    mesures.append({
+        "endpoint": endpoint,
+        "duree_ms": (time.perf_counter() - debut) * 1000,
+        "statut": statut,
+        "ok": statut is not None and statut < 400,
+    })
+    return reponse
+
+
+def feuille_par_note(client, matiere_id, notes, mesures):
+    """Une requête POST /notes par étudiant, CONNEXIONS_NAVIGATEUR à la fois"""
+    def enregistrer(user_id):
+        reponse = chronometrer(mesures, "POST /notes", lambda: client.requete("POST", "/notes", json={
+            "user_id": user_id, "matiere_id": matiere_id, "note": notes[user_id],
+        }))
+        return reponse is not None and reponse.status_code < 400
+
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONNEXIONS_NAVIGATEUR) as executeur:
+        reussites = list(executeur.map(enregistrer, notes))
+    mesures.append({
+        "endpoint": f"feuille note par note ({len(notes)} requêtes)",
+        "duree_ms": (time.perf_counter() - debut) * 1000,
+        "statut": None,
+        "ok": all(reussites),
+    })
+
+
+def feuille_en_bloc(client, matiere_id, notes, mesures):
+    """Toute la feuille en un seul PUT /matieres/{id}/grades"""
+    grades = [{"user_id": user_id, "note": note} for user_id, note in notes.items()]
+    chronometrer(mesures, f"feuille en un PUT ({len(notes)} lignes)", lambda: client.requete(
+        "PUT", f"/matieres/{matiere_id}/grades", json={"grades": grades},
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la saisie d'une feuille de notes")
+    parser.add_argument("--taille", type=int, default=120, help="Nombre d'étudiants de la feuille")
+    parser.add_argument("--filiere", type=int, help="Filière de la matière (défaut: la première)")
+    parser.add_argument("-n", "--repetitions", type=int, default=5)
+    parser.add_argument("-o", "--sortie", default="bench_notes")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    compte = comptes.compte_test("bench", role="teacher")
+    client = ClientAPI(session_http=creer_session(taille_pool=CONNEXIONS_NAVIGATEUR))
+    client.login(compte["email"], compte["password"], "teacher")
+    matiere_id, etudiants = preparer_feuille(client, args.filiere, args.taille)
+
+    tirage = random.Random(42)
+    mesures = []
+    debut = time.perf_counter()
+    for repetition in range(args.repetitions):
+        notes = {user_id: tirage.randint(0, 40) / 2 for user_id in etudiants}
+        # Alterner l'ordre pour ne pas toujours favoriser le même chemin (caches chauds)
+        chemins = [feuille_par_note, feuille_en_bloc]
+        if repetition % 2:
+            chemins.reverse()
+        for chemin in chemins:
+            chemin(client, matiere_id, notes, mesures)
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("bench_notes", mesures, duree, {
+        "taille": len(etudiants),
+        "repetitions": args.repetitions,
+        "matiere_id": matiere_id,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark des profils navigateur
+Compare, pour chaque couple navigateur/profil, le temps de démarrage, le temps
+d'affichage du formulaire /login et la mémoire consommée par le navigateur
+
+Utilisation:
+    python bench_profils.py                              # chrome:dev et chrome:ci
+    python bench_profils.py chrome:ci firefox:ci -n 5    # 5 mesures par profil
+    python bench_profils.py -o resultats_profils.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+import attentes
+from navigateur import creer_driver
+
+try:
+    import psutil
+except ImportError:  # psutil est optionnel : sans lui, pas de mesure RSS
+    psutil = None
+
+
+def memoire_processus_mo(driver):
+    """
+    Mémoire résidente (Mo) du driver et de tous les processus navigateur lancés
+
+    Returns:
+        None si psutil n'est pas installé
+    """
+    if psutil is None:
+        return None
+    racine = psutil.Process(driver.service.process.pid)
+    processus = [racine] + racine.children(recursive=True)
+    total = 0
+    for p in processus:
+        try:
+            total += p.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return total / (1024 * 1024)
+
+
+def mesurer(navigateur, profil):
+    """Démarre un navigateur, ouvre /login et relève les mesures"""
+    debut = time.perf_counter()
+    driver = creer_driver(navigateur, profil)
+    demarrage = time.perf_counter() - debut
+    try:
+        debut = time.perf_counter()
+        attentes.ouvrir_page_connexion(driver)
+        formulaire = time.perf_counter() - debut
+        tas_js = driver.execute_script(
+            "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+        )
+        return {
+            "demarrage_ms": demarrage * 1000,
+            "formulaire_ms": formulaire * 1000,
+            "tas_js_mo": tas_js / (1024 * 1024) if tas_js else None,
+            "rss_mo": memoire_processus_mo(driver),
+        }
+    finally:
+        driver.quit()
+
+
+def resumer(mesures):
+    """Médiane de chaque métrique sur l'ensemble des mesures"""
+    resume = {}
+    for cle in mesures[0]:
+        valeurs = [m[cle] for m in mesures if m[cle] is not None]
+        resume[cle] = round(statistics.median(valeurs), 1) if valeurs else None
+    return resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare les profils navigateur")
+    parser.add_argument("profils", nargs="*", default=["chrome:dev", "chrome:ci"],
+                        help="Couples navigateur:profil à comparer")
+    parser.add_argument("-n", "--repetitions", type=int, default=3)
+    parser.add_argument("-o", "--sortie", help="Fichier JSON de résultats")
+    args = parser.parse_args()
+
+    resultats = {}
+    for couple in args.profils:
+        navigateur, _, profil = couple.partition(":")
+        print(f"\n--- {couple} ({args.repetitions} mesures) ---")
+        mesures = [mesurer(navigateur, profil or "dev") for _ in range(args.repetitions)]
+        resultats[couple] = resumer(mesures)
+        for cle, valeur in resultats[couple].items():
+            print(f"  {cle}: {valeur if valeur is not None else 'n/d'}")
+
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2)
+        print(f"\n✓ Résultats enregistrés dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
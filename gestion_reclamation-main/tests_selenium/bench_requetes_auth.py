@@ -0,0 +1,108 @@
+"""
+Benchmark du coût de l'authentification par requête (auth:sanctum)
+Rejoue des appels authentifiés courts et relève, en plus de la latence, le nombre
+de requêtes SQL de chaque appel (en-tête X-Query-Count) et, à part, celles des
+tables du cache, de la file et des sessions (X-Query-Count-Infra : le jeton lu
+dans le cache est une requête SQL avec CACHE_STORE=database)
+
+Le backend doit être lancé avec PERFORMANCE_PROFILER=true dans son .env. Pour
+mesurer l'état « avant », désactiver le cache des jetons avec
+SANCTUM_TOKEN_CACHE_TTL=0 et SANCTUM_LAST_USED_INTERVAL=0 :
+
+Utilisation:
+    python bench_requetes_auth.py -o auth_avant             # backend avec TTL=0, INTERVAL=0
+    python bench_requetes_auth.py -o auth_apres --reference auth_avant.json
+    python bench_requetes_auth.py -n 500 -c 20
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import rapports
+from client_api import ClientAPI, creer_session
+
+# Appels mesurés : le moins de travail possible après l'authentification
+APPELS = {
+    "GET /user": "/user",
+    "GET /notifications": "/notifications",
+    "GET /roles (public)": "/roles",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût de l'authentification par requête")
+    parser.add_argument("-n", "--repetitions", type=int, default=200, help="Appels par endpoint")
+    parser.add_argument("-c", "--concurrence", type=int, default=10)
+    parser.add_argument("-o", "--sortie", default="bench_requetes_auth")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    compte = comptes.compte_test("bench")
+    client = ClientAPI(session_http=creer_session(taille_pool=args.concurrence))
+    client.login(compte["email"], compte["password"], compte["role"])
+
+    mesures, requetes_sql = [], {endpoint: [] for endpoint in APPELS}
+    requetes_infra = {endpoint: [] for endpoint in APPELS}
+    verrou = threading.Lock()
+
+    def appeler(endpoint):
+        debut = time.perf_counter()
+        try:
+            reponse = client.requete("GET", APPELS[endpoint])
+            statut = reponse.status_code
+            nombre = reponse.headers.get("X-Query-Count")
+            infra = reponse.headers.get("X-Query-Count-Infra")
+        except Exception:  # timeout, connexion refusée...
+            statut, nombre, infra = None, None, None
+        with verrou:
+            mesures.append({
+                "endpoint": endpoint,
+                "duree_ms": (time.perf_counter() - debut) * 1000,
+                "statut": statut,
+                "ok": statut == 200,
+            })
+            if nombre is not None:
+                requetes_sql[endpoint].append(int(nombre))
+            if infra is not None:
+                requetes_infra[endpoint].append(int(infra))
+
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrence) as executeur:
+        executeur.map(appeler, [endpoint for endpoint in APPELS for _ in range(args.repetitions)])
+    duree = time.perf_counter() - debut
+
+    if not any(requetes_sql.values()):
+        print("⚠ Pas d'en-tête X-Query-Count : lancer le backend avec PERFORMANCE_PROFILER=true")
+
+    def moyennes_par_appel(releves):
+        return {
+            endpoint: round(statistics.mean(nombres), 2) if nombres else None
+            for endpoint, nombres in releves.items()
+        }
+
+    moyennes, moyennes_infra = moyennes_par_appel(requetes_sql), moyennes_par_appel(requetes_infra)
+    rapport = rapports.construire_rapport("bench_requetes_auth", mesures, duree, {
+        "repetitions": args.repetitions,
+        "concurrence": args.concurrence,
+        "requetes_sql_par_appel": moyennes,
+        "requetes_infra_par_appel": moyennes_infra,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+    parametres_avant = rapports.charger(args.reference)["parametres"] if args.reference else {}
+    avant = parametres_avant.get("requetes_sql_par_appel", {})
+    avant_infra = parametres_avant.get("requetes_infra_par_appel", {})
+    print(f"\n{'Requêtes SQL par appel (application / infra)':<45} {'avant':>11} {'après':>11}")
+    for endpoint, moyenne in moyennes.items():
+        colonne_avant = f"{avant.get(endpoint, '-')} / {avant_infra.get(endpoint, '-')}"
+        colonne_apres = f"{moyenne} / {moyennes_infra[endpoint]}"
+        print(f"{endpoint:<45} {colonne_avant:>11} {colonne_apres:>11}")
+
+
+if __name__ == "__main__":
+    main()
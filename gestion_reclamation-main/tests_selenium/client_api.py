@@ -0,0 +1,86 @@
+"""
+Client HTTP de l'API d'authentification
+Permet de tester le comportement du backend (AuthController) sans navigateur,
+avec une session HTTP keep-alive partagée par tous les clients du processus
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+import config
+
+
+def creer_session(taille_pool=None):
+    """
+    Crée une session HTTP keep-alive vers l'API
+
+    Args:
+        taille_pool: Connexions gardées ouvertes par hôte (config.API_POOL_CONNEXIONS
+                     par défaut) ; à augmenter pour les benchmarks concurrents
+    """
+    session = requests.Session()
+    adaptateur = HTTPAdapter(pool_connections=4, pool_maxsize=taille_pool or config.API_POOL_CONNEXIONS)
+    session.mount("http://", adaptateur)
+    session.mount("https://", adaptateur)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+# Session partagée : les connexions TCP sont réutilisées d'une requête à l'autre
+session = creer_session()
+
+
+class ClientAPI:
+    """
+    Client de l'API d'authentification (/api/login, /api/user, /api/logout)
+
+    Envoie les mêmes champs que le frontend (voir AuthContext.tsx), y compris
+    `role_name`, et garde le jeton Bearer obtenu à la connexion.
+    """
+
+    def __init__(self, base_url=None, jeton=None, session_http=None):
+        self.base_url = base_url or config.API_URL
+        self.jeton = jeton
+        self.session = session_http or session
+
+    def _entetes(self):
+        return {"Authorization": f"Bearer {self.jeton}"} if self.jeton else {}
+
+    def requete(self, methode, chemin, **kwargs):
+        """Envoie une requête authentifiée (si un jeton est présent) vers l'API"""
+        kwargs.setdefault("timeout", 30)
+        entetes = {**self._entetes(), **kwargs.pop("headers", {})}
+        return self.session.request(methode, f"{self.base_url}{chemin}", headers=entetes, **kwargs)
+
+    def login(self, email, password, role_name="student"):
+        """
+        POST /api/login
+
+        En cas de succès, le jeton retourné est conservé pour les appels suivants.
+        """
+        reponse = self.requete("POST", "/login", json={
+            "email": email,
+            "password": password,
+            "role_name": role_name,
+        })
+        if reponse.status_code == 200:
+            self.jeton = reponse.json()["token"]
+        return reponse
+
+    def user(self):
+        """GET /api/user"""
+        return self.requete("GET", "/user")
+
+    def logout(self):
+        """POST /api/logout (le jeton est oublié côté client)"""
+        reponse = self.requete("POST", "/logout")
+        self.jeton = None
+        return reponse
+
+
+def message_erreur(reponse):
+    """Extrait le message d'erreur d'une réponse de validation Laravel"""
+    donnees = reponse.json()
+    erreurs = donnees.get("errors", {})
+    if "email" in erreurs:
+        return erreurs["email"][0]
+    return donnees.get("message", "")
@@ -0,0 +1,87 @@
+"""
+Comptes de test isolés par worker
+Chaque processus de test (worker pytest-xdist) reçoit ses propres comptes,
+créés à la volée via l'API, pour que les scénarios puissent tourner en parallèle
+sans se bloquer mutuellement (ex: le scénario de blocage après 3 tentatives)
+"""
+
+import os
+import time
+import config
+from client_api import session
+
+
+# Comptes déjà provisionnés dans ce processus : (usage, rôle, unique) -> compte
+_comptes = {}
+_roles = {}
+
+
+def identifiant_worker():
+    """
+    Identifiant du worker courant
+
+    pytest-xdist expose PYTEST_XDIST_WORKER (gw0, gw1, ...) ; en exécution
+    directe ou sans -n, on est sur le processus principal ("master").
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def _id_role(nom_role):
+    """Retourne l'id d'un rôle à partir de son nom (via GET /api/roles)"""
+    if not _roles:
+        reponse = session.get(f"{config.API_URL}/roles", timeout=10)
+        reponse.raise_for_status()
+        _roles.update({role["name"]: role["id"] for role in reponse.json()})
+    return _roles[nom_role]
+
+
+def _provisionner(email, mot_de_passe, role, nom):
+    """
+    Crée le compte via POST /api/register
+
+    Un compte déjà existant (email déjà pris) est réutilisé tel quel.
+    """
+    reponse = session.post(
+        f"{config.API_URL}/register",
+        json={
+            "name": nom,
+            "email": email,
+            "password": mot_de_passe,
+            "password_confirmation": mot_de_passe,
+            "role_id": _id_role(role),
+        },
+        timeout=30,
+    )
+    if reponse.status_code == 422 and "email" in reponse.json().get("errors", {}):
+        return
+    reponse.raise_for_status()
+
+
+def compte_test(usage, role="student", unique=False):
+    """
+    Retourne un compte de test propre au worker courant
+
+    Args:
+        usage: Scénario qui utilise le compte (ex: "connexion", "blocage")
+        role: Nom du rôle backend (student, registrar, teacher, admin)
+        unique: Ajoute un suffixe propre à l'exécution, pour les scénarios qui
+                laissent le compte dans un état non réutilisable (blocage)
+
+    Returns:
+        Dictionnaire {"email", "password", "role"}
+    """
+    cle = (usage, role, unique)
+    if cle in _comptes:
+        return _comptes[cle]
+
+    if not config.PROVISIONNER_COMPTES:
+        compte = {"email": config.VALID_PHONE, "password": config.VALID_PASSWORD, "role": role}
+    else:
+        suffixe = f".{int(time.time() * 1000)}" if unique else ""
+        email = f"{usage}.{role}.{identifiant_worker()}{suffixe}@{config.COMPTES_TEST_DOMAINE}"
+        compte = {"email": email, "password": config.COMPTES_TEST_PASSWORD, "role": role}
+        _provisionner(email, compte["password"], role, f"E2E {usage} {identifiant_worker()}")
+        print(f"✓ Compte de test prêt: {email}")
+
+    _comptes[cle] = compte
+    return compte
@@ -2,9 +2,26 @@
 Configuration pour les tests Selenium
 """
 
+import os
+
 # URL de base de l'application
 BASE_URL = "http://localhost:3000"
 
+# URL de l'API backend (même valeur que baseURL dans frontend/src/lib/axios.ts)
+API_URL = "http://127.0.0.1:8000/api"
+
+# Flux des notifications (php artisan notifications:serve, même valeur que frontend/src/lib/notificationStream.ts)
+NOTIFICATIONS_URL = "http://127.0.0.1:8081/notifications/stream"
+
+# Clé du localStorage où le frontend lit le jeton Sanctum (frontend/src/lib/axios.ts)
+CLE_JETON_STORAGE = "token"
+
+# Dossier du backend Laravel (commandes artisan lancées par les benchmarks)
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+# Nombre maximal de connexions keep-alive gardées ouvertes vers l'API
+API_POOL_CONNEXIONS = 10
+
 # Identifiants de test valides
 VALID_PHONE = "adama@gmail.com"
 VALID_PASSWORD = "Adama123"
@@ -13,9 +30,40 @@ VALID_PASSWORD = "Adama123"
 INVALID_PHONE = "0699999999"
 INVALID_PASSWORD = "wrongpassword"
 
+# Comptes de test isolés par worker (voir comptes.py)
+# Si False, tous les scénarios utilisent VALID_PHONE / VALID_PASSWORD
+# et ne peuvent pas tourner en parallèle
+PROVISIONNER_COMPTES = True
+COMPTES_TEST_DOMAINE = "e2e.ibam.test"
+COMPTES_TEST_PASSWORD = "E2eTest123"
+
+# Nombre de workers pour l'exécution parallèle (pytest-xdist) : "auto" = un par cœur
+WORKERS = "auto"
+
 # Temps d'attente (en secondes)
-IMPLICIT_WAIT = 20
+# L'attente implicite reste à 0 : elle se cumulerait avec les attentes
+# explicites du module attentes.py (chaque find_elements vide bloquerait)
+IMPLICIT_WAIT = 0
 EXPLICIT_WAIT = 30
 
 # Navigateur à utiliser (chrome, firefox, edge)
-BROWSER = "chrome"
+BROWSER = os.environ.get("SELENIUM_BROWSER", "chrome")
+
+# Profil du navigateur (voir navigateur.py) :
+# "dev" = fenêtre visible maximisée, "ci" = headless allégé pour les conteneurs
+PROFIL_NAVIGATEUR = os.environ.get("SELENIUM_PROFIL", "dev")
+
+# Taille fixe de la fenêtre en profil "ci" (largeur, hauteur)
+TAILLE_FENETRE = (1366, 768)
+
+# Métriques de performance relevées par les scénarios (voir metriques_navigateur.py) :
+# un fichier JSON par exécution dans METRIQUES_DOSSIER, comparé à METRIQUES_REFERENCE.
+# SELENIUM_METRIQUES=0 désactive la comparaison (relevé seul, jamais d'échec)
+METRIQUES_DOSSIER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "metriques")
+METRIQUES_REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "metriques_reference.json")
+METRIQUES_VERIFIER = os.environ.get("SELENIUM_METRIQUES", "1") != "0"
+
+# Journal réseau des DevTools (Chrome/Edge) relevé par enregistreur_reseau.py, et budget
+# d'appels API en double ou en rafale (N+1) par page. SELENIUM_RESEAU=0 le désactive
+JOURNAL_RESEAU = os.environ.get("SELENIUM_RESEAU", "1") != "0"
+BUDGETS_RESEAU = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets_reseau.json")
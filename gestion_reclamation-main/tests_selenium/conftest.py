@@ -0,0 +1,83 @@
+"""
+Configuration pytest partagée par les tests Selenium
+"""
+
+import os
+import sys
+
+import pytest
+
+# Rendre config.py et les modules utilitaires importables depuis chaque worker
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pool_navigateurs  # noqa: E402
+import session_auth  # noqa: E402
+
+# Script de diagnostic exécuté à l'import : ne pas le collecter comme un test
+collect_ignore = ["test_simple.py"]
+
+
+@pytest.fixture(scope="session")
+def pool():
+    """Pool de navigateurs du worker courant, conservé pour toute la session"""
+    return pool_navigateurs.pool_global()
+
+
+@pytest.fixture
+def navigateur(pool):
+    """Prête un navigateur du pool pour la durée d'un test"""
+    driver = pool.louer()
+    yield driver
+    pool.rendre(driver)
+
+
+@pytest.fixture
+def connecte_en(navigateur):
+    """
+    Ouvre une page de l'application déjà connecté, sans passer par /login
+
+    Utilisation:
+        def test_reclamations(connecte_en):
+            driver = connecte_en("teacher", "/claims")
+    """
+    def _connecter(role="student", page="/dashboard"):
+        return session_auth.connecter_navigateur(navigateur, role, page)
+
+    return _connecter
+
+
+def pytest_configure(config):
+    config._stats_pools = []
+
+
+def pytest_sessionfinish(session):
+    """Ferme les navigateurs du worker et transmet ses statistiques au processus principal"""
+    pool = pool_navigateurs.pool_global()
+    stats = pool.statistiques()
+    pool.fermer()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["stats_pool"] = stats
+    elif stats["locations"]:
+        session.config._stats_pools.append(stats)
+
+
+def pytest_testnodedown(node, error):
+    """(pytest-xdist) Récupère les statistiques de pool d'un worker terminé"""
+    stats = getattr(node, "workeroutput", {}).get("stats_pool")
+    if stats and stats["locations"]:
+        node.config._stats_pools.append(stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Affiche les démarrages de navigateur évités et la latence de remise à zéro"""
+    stats_pools = config._stats_pools
+    if not stats_pools:
+        return
+    terminalreporter.section("Pool de navigateurs")
+    for cle in ("demarrages", "locations", "demarrages_evites", "remplacements"):
+        terminalreporter.write_line(f"{cle}: {sum(s[cle] for s in stats_pools)}")
+    locations = sum(s["locations"] for s in stats_pools)
+    reset_moyen = sum(s["reset_moyen_ms"] * s["locations"] for s in stats_pools) / locations
+    terminalreporter.write_line(
+        f"reset_moyen_ms: {reset_moyen:.1f} (max {max(s['reset_max_ms'] for s in stats_pools)})"
+    )
@@ -3,16 +3,12 @@ Script de Démonstration avec Captures d'Écran
 Ce script exécute les tests et prend des captures d'écran à chaque étape
 """
 
-import time
 import os
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import attentes
 import config
+import pool_navigateurs
 
 
 class DemonstrationTests:
@@ -38,22 +34,22 @@ class DemonstrationTests:
         print("INITIALISATION DU NAVIGATEUR")
         print("="*80)
         
-        self.driver = webdriver.Chrome()
-        self.driver.maximize_window()
+        self.driver = pool_navigateurs.pool_global().louer()
         self.driver.implicitly_wait(config.IMPLICIT_WAIT)
         self.wait = WebDriverWait(self.driver, config.EXPLICIT_WAIT)
         
-        print("✓ Navigateur Chrome initialisé")
-        print("✓ Fenêtre maximisée")
+        print(f"✓ Navigateur {config.BROWSER} initialisé (profil {config.PROFIL_NAVIGATEUR})")
     
     def teardown(self):
         """Fermeture du navigateur"""
         print("\n" + "="*80)
         print("FERMETURE DU NAVIGATEUR")
         print("="*80)
-        time.sleep(2)
-        self.driver.quit()
+        pool = pool_navigateurs.pool_global()
+        pool.rendre(self.driver)
+        pool.fermer()
         print("✓ Navigateur fermé")
+        print(f"✓ Statistiques du pool: {pool.statistiques()}")
     
     def take_screenshot(self, description):
         """
@@ -70,7 +66,6 @@ class DemonstrationTests:
         print(f"📸 Capture d'écran sauvegardée: {filename}")
         
         self.screenshot_counter += 1
-        time.sleep(1)
     
     def demo_authentification_reussie(self):
         """
@@ -82,59 +77,52 @@ class DemonstrationTests:
         
         # Étape 1: Navigation
         print("\n--- Étape 1: Navigation vers la page de connexion ---")
-        self.driver.get(f"{config.BASE_URL}/login")
-        time.sleep(2)
-        self.take_screenshot("01_page_connexion")
-        print(f"✓ URL: {self.driver.current_url}")
-        
-        # Étape 2: Formulaire visible
-        print("\n--- Étape 2: Vérification du formulaire ---")
         try:
-            phone_input = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "email"))
-            )
-            password_input = self.driver.find_element(By.NAME, "password")
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            
-            print("✓ Champ téléphone/email trouvé")
-            print("✓ Champ mot de passe trouvé")
-            print("✓ Bouton de connexion trouvé")
-            
-            self.take_screenshot("02_formulaire_vide")
-            
+            phone_input, password_input, login_button = attentes.ouvrir_page_connexion(self.driver)
         except Exception as e:
             print(f"✗ Erreur: {e}")
-            self.take_screenshot("02_erreur_formulaire")
+            self.take_screenshot("01_erreur_chargement")
             return
+        self.take_screenshot("01_page_connexion")
+        print(f"✓ URL: {self.driver.current_url}")
+        
+        # Étape 2: Formulaire visible (déjà attendu et hydraté à l'étape 1)
+        print("\n--- Étape 2: Vérification du formulaire ---")
+        print("✓ Champ téléphone/email trouvé")
+        print("✓ Champ mot de passe trouvé")
+        print("✓ Bouton de connexion trouvé")
+        
+        self.take_screenshot("02_formulaire_vide")
         
         # Étape 3: Remplissage du formulaire
         print("\n--- Étape 3: Remplissage avec identifiants valides ---")
         phone_input.clear()
         phone_input.send_keys(config.VALID_PHONE)
         print(f"✓ Téléphone saisi: {config.VALID_PHONE}")
-        time.sleep(1)
         
         password_input.clear()
         password_input.send_keys(config.VALID_PASSWORD)
         print(f"✓ Mot de passe saisi: {'*' * len(config.VALID_PASSWORD)}")
-        time.sleep(1)
         
         self.take_screenshot("03_formulaire_rempli")
         
         # Étape 4: Soumission
         print("\n--- Étape 4: Soumission du formulaire ---")
+        url_connexion = self.driver.current_url
+        deja_termines = attentes.nombre_appels_termines(self.driver, "/api/login")
         login_button.click()
         print("✓ Formulaire soumis")
-        time.sleep(3)
+        try:
+            attentes.attendre_appel_api(self.driver, "/api/login", deja_termines)
+        except Exception as e:
+            print(f"⚠ Pas de réponse de /api/login: {e}")
         
         self.take_screenshot("04_apres_soumission")
         
         # Étape 5: Vérification connexion
         print("\n--- Étape 5: Vérification de la connexion ---")
         try:
-            self.wait.until(
-                lambda driver: "login" not in driver.current_url.lower()
-            )
+            attentes.attendre_changement_url(self.driver, url_connexion)
             print(f"✓ Connexion réussie!")
             print(f"✓ URL actuelle: {self.driver.current_url}")
             
@@ -159,8 +147,7 @@ class DemonstrationTests:
         
         # Navigation
         print("\n--- Navigation vers la page de connexion ---")
-        self.driver.get(f"{config.BASE_URL}/login")
-        time.sleep(2)
+        attentes.ouvrir_page_connexion(self.driver)
         self.take_screenshot("01_page_connexion")
         
         # Tentatives échouées
@@ -171,34 +158,33 @@ class DemonstrationTests:
             
             try:
                 # Trouver les éléments
-                phone_input = self.driver.find_element(By.NAME, "email")
-                password_input = self.driver.find_element(By.NAME, "password")
-                login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+                phone_input, password_input, login_button = attentes.attendre_formulaire_connexion(self.driver)
                 
                 # Remplir le formulaire
                 phone_input.clear()
                 phone_input.send_keys(config.INVALID_PHONE)
-                time.sleep(0.5)
                 
                 password_input.clear()
                 password_input.send_keys(config.INVALID_PASSWORD)
-                time.sleep(0.5)
                 
                 self.take_screenshot(f"0{tentative+1}_tentative_{tentative}_formulaire")
                 
-                # Soumettre
+                # Soumettre et attendre la réponse du backend
+                deja_termines = attentes.nombre_appels_termines(self.driver, "/api/login")
+                attentes.marquer_messages_affiches(self.driver)
                 login_button.click()
                 print(f"✓ Tentative {tentative} soumise")
-                time.sleep(2)
+                try:
+                    attentes.attendre_appel_api(self.driver, "/api/login", deja_termines, timeout=5)
+                except Exception:
+                    print("⚠ Formulaire non envoyé au backend")
                 
                 # Capture après soumission
                 self.take_screenshot(f"0{tentative+2}_tentative_{tentative}_resultat")
                 
                 # Vérifier le message d'erreur
                 try:
-                    error_element = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert')]"))
-                    )
+                    error_element = attentes.attendre_message_erreur(self.driver)
                     print(f"✓ Message d'erreur: {error_element.text}")
                 except:
                     print("⚠ Message d'erreur non trouvé")
@@ -207,8 +193,6 @@ class DemonstrationTests:
                     print("\n🔒 COMPTE BLOQUÉ APRÈS 3 TENTATIVES")
                     self.take_screenshot("07_compte_bloque")
                 
-                time.sleep(2)
-                
             except Exception as e:
                 print(f"✗ Erreur lors de la tentative {tentative}: {e}")
                 self.take_screenshot(f"erreur_tentative_{tentative}")
@@ -219,9 +203,7 @@ class DemonstrationTests:
         print("="*60)
         
         try:
-            phone_input = self.driver.find_element(By.NAME, "email")
-            password_input = self.driver.find_element(By.NAME, "password")
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            phone_input, password_input, login_button = attentes.attendre_formulaire_connexion(self.driver)
             
             phone_input.clear()
             phone_input.send_keys(config.VALID_PHONE)
@@ -230,8 +212,10 @@ class DemonstrationTests:
             
             self.take_screenshot("08_tentative_apres_blocage")
             
+            deja_termines = attentes.nombre_appels_termines(self.driver, "/api/login")
             login_button.click()
-            time.sleep(2)
+            attentes.attendre_appel_api(self.driver, "/api/login", deja_termines)
+            attentes.attendre_reseau_inactif(self.driver)
             
             self.take_screenshot("09_resultat_apres_blocage")
             
@@ -259,7 +243,6 @@ class DemonstrationTests:
         try:
             # Démo 1
             self.demo_authentification_reussie()
-            time.sleep(3)
             
             # Démo 2
             self.demo_authentification_echouee()
@@ -0,0 +1,298 @@
+"""
+Enregistreur des appels à l'API pendant les scénarios Selenium (Chrome/Edge)
+Lit le journal "performance" des DevTools (événements Network.* et Page.*, activé
+par navigateur.py) et reconstitue chaque appel XHR/fetch vers /api : page d'où il
+part, début, durée, temps jusqu'au premier octet, taille transférée et statut.
+
+Une page = une visite : chargement complet ou navigation interne de React Router.
+Dans une même visite, on relève :
+  - les doublons : même méthode et même URL appelées plusieurs fois ;
+  - les rafales (N+1) : au moins `n_plus_un_seuil` URL différentes de même forme
+    (ex: GET /demandes/{id}), signe d'une boucle d'appels côté React.
+Le budget (budgets_reseau.json) fixe les doublons, rafales et appels tolérés par page ;
+au-delà, le scénario échoue. Le rapport (JSON + cascade HTML) est écrit dans
+config.METRIQUES_DOSSIER.
+
+Utilisation:
+    python enregistreur_reseau.py                                  # student, /dashboard
+    python enregistreur_reseau.py --role admin --pages /dashboard,/subjects,/users
+"""
+
+import argparse
+import datetime
+import html
+import json
+import os
+import re
+from collections import Counter
+from urllib.parse import urlsplit
+
+import attentes
+import config
+
+
+def forme(methode, url):
+    """'GET', 'http://h/api/demandes/42?x=1' -> 'GET /demandes/{id}' (identifiants et SHA-256)"""
+    chemin = re.sub(r"/(\d+|[0-9a-f]{64})(?=/|$)", "/{id}", urlsplit(url).path.split("/api", 1)[-1])
+    return f"{methode} {chemin}"
+
+
+def chemin_complet(url):
+    """'http://h/api/demandes?per_page=25' -> '/api/demandes?per_page=25'"""
+    morceaux = urlsplit(url)
+    return morceaux.path + (f"?{morceaux.query}" if morceaux.query else "")
+
+
+def charger_budgets(chemin=None):
+    with open(chemin or config.BUDGETS_RESEAU, encoding="utf-8") as fichier:
+        return {cle: valeur for cle, valeur in json.load(fichier).items() if not cle.startswith("_")}
+
+
+class EnregistreurReseau:
+    """
+    Appels à l'API d'un scénario, visite par visite
+
+    Utilisation:
+        reseau = EnregistreurReseau(driver, "auth_reussie")
+        reseau.demarrer()          # avant la première navigation
+        ...
+        reseau.terminer()          # collecte, rapport JSON/HTML et budget
+    """
+
+    def __init__(self, driver, scenario):
+        self.driver = driver
+        self.scenario = scenario
+        self.actif = config.JOURNAL_RESEAU and hasattr(driver, "execute_cdp_cmd")
+        self.visites = []
+        self._requetes = {}
+        self._origine = None
+
+    def demarrer(self):
+        """Ignore les événements déjà présents dans le journal"""
+        if self.actif:
+            self.driver.get_log("performance")
+
+    def _visite(self, url):
+        self.visites.append({"page": urlsplit(url).path or "/", "appels": []})
+
+    def collecter(self):
+        """Lit les nouveaux événements du journal et complète les appels"""
+        if not self.actif:
+            return
+        for entree in self.driver.get_log("performance"):
+            message = json.loads(entree["message"])["message"]
+            methode, params = message.get("method"), message.get("params", {})
+
+            if methode == "Page.frameNavigated" and not params["frame"].get("parentId"):
+                if not params["frame"]["url"].startswith("about:"):
+                    self._visite(params["frame"]["url"])
+            elif methode == "Page.navigatedWithinDocument":
+                self._visite(params["url"])
+            elif methode == "Network.requestWillBeSent":
+                requete = params["request"]
+                if params.get("type") not in ("XHR", "Fetch") or "/api/" not in requete["url"]:
+                    continue
+                if requete["method"] == "OPTIONS":
+                    continue
+                if not self.visites:
+                    self._visite(self.driver.current_url)
+                self._origine = self._origine if self._origine is not None else params["timestamp"]
+                appel = {
+                    "methode": requete["method"],
+                    "url": requete["url"],
+                    "forme": forme(requete["method"], requete["url"]),
+                    "debut_ms": round((params["timestamp"] - self._origine) * 1000, 1),
+                    "duree_ms": None,
+                    "ttfb_ms": None,
+                    "taille": 0,
+                    "statut": None,
+                    "_horodatage": params["timestamp"],
+                }
+                self._requetes[params["requestId"]] = appel
+                self.visites[-1]["appels"].append(appel)
+            elif methode == "Network.responseReceived" and params["requestId"] in self._requetes:
+                reponse = params["response"]
+                appel = self._requetes[params["requestId"]]
+                appel["statut"] = reponse.get("status")
+                timing = reponse.get("timing")
+                if timing:
+                    appel["ttfb_ms"] = round(timing["receiveHeadersEnd"] - timing["sendStart"], 1)
+            elif methode in ("Network.loadingFinished", "Network.loadingFailed") \
+                    and params["requestId"] in self._requetes:
+                appel = self._requetes.pop(params["requestId"])
+                appel["duree_ms"] = round((params["timestamp"] - appel.pop("_horodatage")) * 1000, 1)
+                appel["taille"] = int(params.get("encodedDataLength", 0))
+                if methode == "Network.loadingFailed":
+                    appel["statut"] = appel["statut"] or 0
+
+    def analyser(self, budgets):
+        """Résumé par visite : appels, doublons, rafales et dépassements du budget"""
+        pages = []
+        # Visites sans appel (robots.txt de session_auth, about:blank...) : rien à analyser
+        for visite in (v for v in self.visites if v["appels"]):
+            appels = visite["appels"]
+            limites = {**budgets, **budgets.get("pages", {}).get(visite["page"], {})}
+            doublons = {f"{methode} {url}": n - 1
+                        for (methode, url), n in Counter((a["methode"], a["url"]) for a in appels).items()
+                        if n > 1}
+            urls_par_forme = {}
+            for appel in appels:
+                urls_par_forme.setdefault(appel["forme"], set()).add(appel["url"])
+            rafales = {f: len(urls) for f, urls in urls_par_forme.items()
+                       if len(urls) >= limites["n_plus_un_seuil"]}
+
+            depassements = []
+            if sum(doublons.values()) > limites["doublons_max"]:
+                depassements.append(f"{sum(doublons.values())} doublon(s) : {doublons}")
+            if rafales:
+                depassements.append(f"rafale(s) N+1 : {rafales}")
+            if len(appels) > limites["appels_max"]:
+                depassements.append(f"{len(appels)} appels pour un budget de {limites['appels_max']}")
+            pages.append({
+                "page": visite["page"],
+                "appels": len(appels),
+                "octets": sum(a["taille"] for a in appels),
+                "duree_ms": round(max((a["debut_ms"] + (a["duree_ms"] or 0) for a in appels), default=0)
+                                  - min((a["debut_ms"] for a in appels), default=0), 1),
+                "doublons": doublons,
+                "rafales": rafales,
+                "depassements": depassements,
+                "detail": [{c: v for c, v in a.items() if not c.startswith("_")} for a in appels],
+            })
+        return pages
+
+    def rapport(self, budgets):
+        return {
+            "scenario": self.scenario,
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "budgets": budgets,
+            "pages": self.analyser(budgets),
+        }
+
+    def enregistrer(self, rapport, dossier=None):
+        """Écrit reseau_<scenario>_<date>_<pid>.json et .html ; retourne le préfixe"""
+        dossier = dossier or config.METRIQUES_DOSSIER
+        os.makedirs(dossier, exist_ok=True)
+        horodatage = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        prefixe = os.path.join(dossier, f"reseau_{self.scenario}_{horodatage}_{os.getpid()}")
+        with open(f"{prefixe}.json", "w", encoding="utf-8") as fichier:
+            json.dump(rapport, fichier, indent=2, ensure_ascii=False)
+        ecrire_cascade_html(f"{prefixe}.html", rapport)
+        return prefixe
+
+    def terminer(self, verifier=True):
+        """
+        Collecte les derniers appels, écrit le rapport et vérifie le budget
+
+        Raises:
+            AssertionError: si une page dépasse son budget de doublons, rafales ou appels
+        """
+        if not self.actif:
+            print("⚠ Journal réseau des DevTools indisponible (Chrome/Edge, SELENIUM_RESEAU=1)")
+            return []
+        attentes.attendre_reseau_calme(self.driver)
+        self.collecter()
+        rapport = self.rapport(charger_budgets())
+        prefixe = self.enregistrer(rapport)
+        afficher(rapport)
+        print(f"✓ Cascade réseau enregistrée dans {prefixe}.html")
+
+        depassements = [f"{p['page']} : {d}" for p in rapport["pages"] for d in p["depassements"]]
+        if verifier:
+            assert not depassements, f"Budget d'appels API dépassé : {depassements}"
+        return depassements
+
+
+def afficher(rapport):
+    for page in rapport["pages"]:
+        print(f"\n{page['page']} — {page['appels']} appel(s), {page['octets'] / 1024:.1f} Ko, {page['duree_ms']} ms")
+        for appel in page["detail"]:
+            print(f"    {appel['debut_ms']:>8.0f} ms  {appel['duree_ms'] or 0:>7.0f} ms  "
+                  f"{appel['statut'] or '-':>4}  {appel['taille'] / 1024:>7.1f} Ko  "
+                  f"{appel['methode']} {chemin_complet(appel['url'])}")
+        for depassement in page["depassements"]:
+            print(f"  ✗ {depassement}")
+
+
+def ecrire_cascade_html(chemin, rapport):
+    """Cascade (waterfall) des appels de chaque page, en HTML autonome"""
+    sections = []
+    for page in rapport["pages"]:
+        detail = page["detail"]
+        debut = min((a["debut_ms"] for a in detail), default=0)
+        echelle = max(page["duree_ms"], 1)
+        doublees = {cle.split(" ", 1)[1] for cle in page["doublons"]}
+        lignes = []
+        for appel in detail:
+            gauche = (appel["debut_ms"] - debut) / echelle * 100
+            largeur = max((appel["duree_ms"] or 0) / echelle * 100, 0.5)
+            classe = "double" if appel["url"] in doublees else ("erreur" if (appel["statut"] or 0) >= 400 else "")
+            lignes.append(
+                f"<tr class='{classe}'><td>{appel['methode']}</td>"
+                f"<td class='url'>{html.escape(chemin_complet(appel['url']))}</td>"
+                f"<td>{appel['statut'] or '-'}</td><td>{appel['taille'] / 1024:.1f} Ko</td>"
+                f"<td>{appel['duree_ms'] or 0:.0f} ms</td>"
+                f"<td class='piste'><div class='barre' style='left:{gauche:.2f}%;width:{largeur:.2f}%'"
+                f" title='TTFB {appel['ttfb_ms']} ms'></div></td></tr>"
+            )
+        alertes = "".join(f"<li>{html.escape(d)}</li>" for d in page["depassements"])
+        sections.append(
+            f"<h2>{html.escape(page['page'])} — {page['appels']} appel(s), "
+            f"{page['octets'] / 1024:.1f} Ko, {page['duree_ms']} ms</h2>"
+            + (f"<ul class='alertes'>{alertes}</ul>" if alertes else "")
+            + "<table><tr><th>Méthode</th><th>URL</th><th>Statut</th><th>Taille</th><th>Durée</th>"
+              "<th>Cascade</th></tr>" + "".join(lignes) + "</table>"
+        )
+    contenu = f"""<!DOCTYPE html>
+<html lang="fr"><head><meta charset="utf-8"><title>Réseau — {html.escape(rapport['scenario'])}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 3px 8px; font-size: 13px; white-space: nowrap; }}
+td.url {{ max-width: 420px; overflow: hidden; text-overflow: ellipsis; }}
+td.piste {{ position: relative; width: 40%; }}
+.barre {{ position: absolute; top: 4px; bottom: 4px; background: #4a7bd0; }}
+tr.double td {{ background: #fff1d6; }}
+tr.erreur td {{ background: #fde2e2; }}
+ul.alertes {{ color: #b00020; }}
+</style></head><body>
+<h1>Appels API — {html.escape(rapport['scenario'])} — {rapport['date']}</h1>
+{"".join(sections)}
+</body></html>
+"""
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        fichier.write(contenu)
+
+
+def main():
+    import navigateur
+    import session_auth
+    from mesure_appels_navigation import SCRIPT_NAVIGUER
+
+    parser = argparse.ArgumentParser(description="Cascade des appels API d'un parcours de pages")
+    parser.add_argument("--role", default="student", choices=session_auth.ROLES)
+    parser.add_argument("--pages", default="/dashboard", help="Pages visitées (séparées par des virgules)")
+    parser.add_argument("--sans-budget", action="store_true", help="Rapport seul, sans échec sur le budget")
+    args = parser.parse_args()
+
+    pages = args.pages.split(",")
+    driver = navigateur.creer_driver()
+    try:
+        reseau = EnregistreurReseau(driver, f"parcours_{args.role}")
+        reseau.demarrer()
+        session_auth.connecter_navigateur(driver, args.role, pages[0])
+        for page in pages[1:]:
+            attentes.attendre_reseau_calme(driver)
+            # Navigation interne de React Router (pas de rechargement)
+            driver.execute_script(SCRIPT_NAVIGUER, page)
+            attentes.attendre_url_contient(driver, page)
+        attentes.attendre_reseau_calme(driver)
+        depassements = reseau.terminer(verifier=False)
+    finally:
+        driver.quit()
+    if depassements and not args.sans_budget:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Appels à l'API par parcours de navigation dans le frontend
+Connecte un navigateur pour chaque rôle, enchaîne les pages d'un parcours sans
+recharger l'application (navigation React Router, le cache des requêtes est
+conservé) et compte les appels XHR/fetch vers /api déclenchés par chaque étape,
+ainsi que les doublons (même méthode et même URL dans le parcours)
+
+Pour comparer avant/après une modification du frontend, lancer une fois sur
+l'ancienne version puis sur la nouvelle avec --reference.
+
+Utilisation:
+    python mesure_appels_navigation.py                          # tous les rôles
+    python mesure_appels_navigation.py --roles admin,student
+    python mesure_appels_navigation.py -o nav_apres --reference nav_avant.json
+"""
+
+import argparse
+import re
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import attentes
+import navigateur
+import rapports
+import session_auth
+
+# Pages visitées dans l'ordre ; les retours sur une page déjà vue mesurent le cache
+PARCOURS = {
+    "student": ["/dashboard", "/claims", "/claims/new", "/dashboard", "/claims", "/claims/new"],
+    "teacher": ["/dashboard", "/teacher/notes", "/claims", "/dashboard", "/teacher/notes"],
+    "registrar": ["/dashboard", "/claims", "/grades", "/subjects", "/dashboard", "/claims", "/grades"],
+    "admin": ["/dashboard", "/subjects", "/teachers", "/users", "/grades", "/subjects", "/users", "/dashboard"],
+}
+
+# Naviguer comme un clic sur un <Link> : BrowserRouter écoute popstate
+SCRIPT_NAVIGUER = """
+window.history.pushState({}, '', arguments[0]);
+window.dispatchEvent(new PopStateEvent('popstate', { state: {} }));
+"""
+
+
+def appels_api(driver):
+    """Appels terminés vers /api relevés par la sonde réseau"""
+    return driver.execute_script(
+        "var s = window.__sondeReseau;"
+        "return s ? s.termines.filter(function (a) { return a.url.indexOf('/api/') !== -1; }) : [];"
+    )
+
+
+def endpoint(appel):
+    """'http://127.0.0.1:8000/api/demandes/42?x=1' -> 'GET /demandes/{id}?x=1'"""
+    url = urlsplit(appel["url"])
+    chemin = re.sub(r"/\d+(?=/|$)", "/{id}", url.path.split("/api", 1)[-1])
+    return f"{appel['methode']} {chemin}" + (f"?{url.query}" if url.query else "")
+
+
+def mesurer_parcours(driver, role, pages, calme):
+    """Joue le parcours d'un rôle ; retourne (étapes, appels)"""
+    session_auth.connecter_navigateur(driver, role, pages[0])
+    # Sans DevTools (Firefox), la sonde n'est posée qu'ici : la première page n'est pas comptée
+    attentes.installer_sonde_reseau(driver)
+    attentes.attendre_reseau_calme(driver, calme)
+    etapes = [{"page": pages[0], "appels": [endpoint(a) for a in appels_api(driver)]}]
+
+    for page in pages[1:]:
+        deja = len(appels_api(driver))
+        driver.execute_script(SCRIPT_NAVIGUER, page)
+        attentes.attendre_url_contient(driver, page)
+        attentes.attendre_reseau_calme(driver, calme)
+        etapes.append({"page": page, "appels": [endpoint(a) for a in appels_api(driver)[deja:]]})
+    return etapes, appels_api(driver)
+
+
+def resumer(etapes):
+    tous = [appel for etape in etapes for appel in etape["appels"]]
+    doublons = {appel: n for appel, n in Counter(tous).items() if n > 1}
+    return {"appels": len(tous), "doublons": sum(n - 1 for n in doublons.values()),
+            "repetes": doublons, "etapes": etapes}
+
+
+def afficher_parcours(parcours, reference=None):
+    print(f"\n{'Rôle':<10} {'appels':>7} {'doublons':>9} {'avant':>7}")
+    for role, resume in parcours.items():
+        avant = (reference or {}).get(role, {}).get("appels", "-")
+        print(f"{role:<10} {resume['appels']:>7} {resume['doublons']:>9} {avant:>7}")
+        for etape in resume["etapes"]:
+            print(f"    {etape['page']:<18} {len(etape['appels']):>3}  {', '.join(etape['appels'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Appels à l'API par parcours de navigation")
+    parser.add_argument("--roles", default=",".join(PARCOURS), help="Rôles à parcourir (séparés par des virgules)")
+    parser.add_argument("--calme", type=float, default=0.5,
+                        help="Durée sans nouvel appel qui termine une étape (s)")
+    parser.add_argument("--navigateur", default=None, choices=navigateur.NAVIGATEURS)
+    parser.add_argument("-o", "--sortie", default="mesure_appels_navigation")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    parcours, mesures = {}, []
+    debut = time.perf_counter()
+    for role in args.roles.split(","):
+        driver = navigateur.creer_driver(args.navigateur)
+        try:
+            etapes, appels = mesurer_parcours(driver, role, PARCOURS[role], args.calme)
+        finally:
+            driver.quit()
+        parcours[role] = resumer(etapes)
+        mesures += [{
+            "endpoint": endpoint(a),
+            "duree_ms": a["duree"],
+            "statut": a["statut"],
+            "ok": 0 < a["statut"] < 400,
+        } for a in appels]
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("mesure_appels_navigation", mesures, duree, {
+        "roles": args.roles,
+        "appels": sum(r["appels"] for r in parcours.values()),
+        "doublons": sum(r["doublons"] for r in parcours.values()),
+    })
+    rapport["parcours"] = parcours
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    afficher_parcours(parcours, rapports.charger(args.reference).get("parcours") if args.reference else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Temps jusqu'à l'interactivité (TTI) de /login et /dashboard
+Recharge chaque page plusieurs fois (cache du navigateur vidé par défaut, comme
+à la première visite d'un étudiant) et relève dans la page :
+
+  - fcp : premier rendu de contenu (First Contentful Paint) ;
+  - pret : élément principal monté et branché par React (bouton de connexion,
+    titre du tableau de bord) ;
+  - tti : `pret`, repoussé à la fin de la dernière tâche longue (> 50 ms) du
+    fil principal - tant qu'elle dure, un clic reste sans effet ;
+  - js_ko : JavaScript téléchargé par la page.
+
+Sous Chrome/Edge seulement (sonde injectée via DevTools avant les scripts de la page).
+
+Utilisation:
+    python mesure_tti.py                             # 10 chargements par page, rôle student
+    python mesure_tti.py -n 20 --roles student,admin --cache chaud
+    python mesure_tti.py -o tti_apres --reference tti_avant.json --max-tti 2500
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+import attentes
+import config
+import navigateur
+import rapports
+import session_auth
+
+# Élément qui rend chaque page utilisable, par chemin
+ELEMENTS_PRETS = {
+    "/": "form button[type='submit']",
+    "/dashboard": "main h1",
+}
+
+# Injecté avant tout script de la page : tâches longues et instant où l'élément
+# principal porte les gestionnaires d'événements de React
+SCRIPT_SONDE_TTI = """
+(function () {
+    if (window.__sondeTti) { return; }
+    var sonde = window.__sondeTti = { pret: null, taches: [] };
+    try {
+        new PerformanceObserver(function (liste) {
+            liste.getEntries().forEach(function (t) {
+                sonde.taches.push({ debut: t.startTime, fin: t.startTime + t.duration });
+            });
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) { /* navigateur sans Long Tasks API */ }
+    var selecteurs = %s;
+    var verifier = setInterval(function () {
+        var selecteur = selecteurs[window.location.pathname];
+        var element = selecteur && document.querySelector(selecteur);
+        if (element && Object.keys(element).some(function (k) { return k.indexOf('__reactProps') === 0; })) {
+            sonde.pret = performance.now();
+            clearInterval(verifier);
+        }
+    }, 10);
+})();
+"""
+
+SCRIPT_LIRE_MESURES = """
+var sonde = window.__sondeTti;
+var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+var scripts = performance.getEntriesByType('resource').filter(function (r) {
+    return r.initiatorType === 'script' || /\\.m?js(\\?|$)/.test(r.name);
+});
+return {
+    pret: sonde.pret,
+    taches: sonde.taches,
+    fcp: fcp ? fcp.startTime : null,
+    js_octets: scripts.reduce(function (t, r) { return t + (r.transferSize || r.encodedBodySize || 0); }, 0),
+    scripts: scripts.length
+};
+"""
+
+
+def preparer(driver):
+    if not hasattr(driver, "execute_cdp_cmd"):
+        sys.exit("mesure_tti.py nécessite Chrome ou Edge (DevTools)")
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                           {"source": SCRIPT_SONDE_TTI % json.dumps(ELEMENTS_PRETS)})
+    driver.execute_cdp_cmd("Network.enable", {})
+
+
+def charger(driver, chemin, cache_froid, calme=0.5):
+    """Charge `chemin`, attend l'élément prêt puis le calme du fil principal ; retourne les mesures"""
+    if cache_froid:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get(f"{config.BASE_URL}{chemin}")
+    WebDriverWait(driver, config.EXPLICIT_WAIT, poll_frequency=0.05).until(
+        lambda d: d.execute_script("return window.__sondeTti && window.__sondeTti.pret")
+    )
+    attentes.attendre_reseau_inactif(driver)
+    # Une tâche longue en cours n'est signalée qu'à sa fin : on attend un court moment sans nouvelle
+    nombre, depuis = -1, time.perf_counter()
+    while time.perf_counter() - depuis < calme:
+        actuel = driver.execute_script("return window.__sondeTti.taches.length")
+        if actuel != nombre:
+            nombre, depuis = actuel, time.perf_counter()
+        time.sleep(0.05)
+
+    brut = driver.execute_script(SCRIPT_LIRE_MESURES)
+    fins = [t["fin"] for t in brut["taches"]]
+    return {
+        "fcp": brut["fcp"],
+        "pret": brut["pret"],
+        "tti": max([brut["pret"], *fins]),
+        "taches_longues": len(fins),
+        "js_ko": round(brut["js_octets"] / 1024, 1),
+        "scripts": brut["scripts"],
+    }
+
+
+def poser_jeton(driver, role):
+    """Jeton du rôle (ou aucun) dans le localStorage de l'origine du frontend"""
+    driver.get(f"{config.BASE_URL}/robots.txt")
+    if role:
+        driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);",
+                              config.CLE_JETON_STORAGE, session_auth.jeton_pour_role(role))
+    else:
+        driver.execute_script("window.localStorage.removeItem(arguments[0]);", config.CLE_JETON_STORAGE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps jusqu'à l'interactivité de /login et /dashboard")
+    parser.add_argument("-n", "--chargements", type=int, default=10, help="Chargements mesurés par page")
+    parser.add_argument("--roles", default="student", help="Rôles dont le tableau de bord est mesuré")
+    parser.add_argument("--cache", choices=["froid", "chaud"], default="froid",
+                        help="froid : cache HTTP vidé avant chaque chargement")
+    parser.add_argument("--navigateur", default=None, choices=("chrome", "edge"))
+    parser.add_argument("--max-tti", type=float, help="Budget : échoue si un p95 du TTI dépasse (ms)")
+    parser.add_argument("-o", "--sortie", default="mesure_tti")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    pages = [("/login", "/", None)] + [
+        (f"/dashboard ({role})", "/dashboard", role) for role in args.roles.split(",")
+    ]
+    driver = navigateur.creer_driver(args.navigateur)
+    mesures, details = [], {}
+    debut = time.perf_counter()
+    try:
+        preparer(driver)
+        for nom, chemin, role in pages:
+            poser_jeton(driver, role)
+            charger(driver, chemin, args.cache == "froid")  # chauffe (Vite, backend)
+            details[nom] = []
+            for _ in range(args.chargements):
+                resultat = charger(driver, chemin, args.cache == "froid")
+                details[nom].append(resultat)
+                for metrique in ("fcp", "pret", "tti"):
+                    if resultat[metrique] is not None:
+                        mesures.append({"endpoint": f"{nom} {metrique}", "duree_ms": resultat[metrique],
+                                        "statut": None, "ok": True})
+    finally:
+        driver.quit()
+    duree = time.perf_counter() - debut
+
+    rapport = rapports.construire_rapport("mesure_tti", mesures, duree, {
+        "chargements": args.chargements,
+        "cache": args.cache,
+        "roles": args.roles,
+        **{f"{nom} js_ko": details[nom][-1]["js_ko"] for nom in details},
+        **{f"{nom} scripts": details[nom][-1]["scripts"] for nom in details},
+    })
+    rapport["chargements"] = details
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+    if args.max_tti:
+        depasses = [nom for nom, r in rapport["endpoints"].items()
+                    if nom.endswith(" tti") and r["p95_ms"] > args.max_tti]
+        if depasses:
+            print(f"✗ TTI au-delà de {args.max_tti} ms (p95) : {', '.join(depasses)}")
+            sys.exit(1)
+        print(f"✓ TTI p95 sous {args.max_tti} ms")
+
+
+if __name__ == "__main__":
+    main()
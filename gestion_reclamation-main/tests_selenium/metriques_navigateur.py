@@ -0,0 +1,276 @@
+"""
+Métriques de performance du navigateur relevées pendant les scénarios Selenium
+Après chaque étape d'un scénario, le collecteur lit dans la page (Performance API) :
+
+  - Navigation Timing : ttfb_ms, dom_interactive_ms, dom_content_loaded_ms, load_ms ;
+  - peinture : fp_ms, fcp_ms, et lcp_ms (Largest Contentful Paint) ;
+  - tâches longues (> 50 ms) depuis l'étape précédente : taches_longues,
+    taches_longues_ms et tbt_ms (temps bloquant, part au-delà de 50 ms) ;
+  - heap_mo : tas JavaScript utilisé (Chrome/Edge) ;
+  - duree_etape_ms : temps écoulé dans la page depuis l'étape précédente
+    (navigation interne de React comprise), plus les mesures passées par le test.
+
+Chaque exécution est écrite en JSON dans config.METRIQUES_DOSSIER puis comparée à la
+référence (config.METRIQUES_REFERENCE) : une métrique au-delà de sa valeur de
+référence + tolérance fait échouer le scénario.
+
+Utilisation (référence) :
+    python metriques_navigateur.py metriques/auth_reussie_*.json   # médianes -> référence
+    python metriques_navigateur.py --afficher metriques/auth_reussie_20260101-101500_1234.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import statistics
+
+import config
+
+# Observateurs installés avant les scripts de la page : LCP et tâches longues ne
+# sont pas tous conservés dans la timeline, il faut les écouter dès le début
+SCRIPT_SONDE_PERFORMANCE = """
+(function () {
+    if (window.__sondePerf) { return; }
+    var sonde = window.__sondePerf = { lcp: null, taches: [] };
+    var observer = function (type, rappel) {
+        try {
+            new PerformanceObserver(function (liste) { liste.getEntries().forEach(rappel); })
+                .observe({ type: type, buffered: true });
+        } catch (e) { /* type non supporté par ce navigateur */ }
+    };
+    observer('largest-contentful-paint', function (e) { sonde.lcp = e.renderTime || e.startTime; });
+    observer('longtask', function (e) { sonde.taches.push({ debut: e.startTime, duree: e.duration }); });
+})();
+"""
+
+SCRIPT_LIRE_METRIQUES = """
+var sonde = window.__sondePerf || { lcp: null, taches: [] };
+var nav = performance.getEntriesByType('navigation')[0];
+var peinture = function (nom) {
+    var e = performance.getEntriesByName(nom)[0];
+    return e ? e.startTime : null;
+};
+return {
+    maintenant: performance.now(),
+    url: window.location.pathname,
+    ttfb: nav ? nav.responseStart : null,
+    dom_interactive: nav ? nav.domInteractive : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+    fp: peinture('first-paint'),
+    fcp: peinture('first-contentful-paint'),
+    lcp: sonde.lcp,
+    taches: sonde.taches,
+    heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+    ressources: performance.getEntriesByType('resource').length
+};
+"""
+
+# Seuils par défaut si la référence n'en précise pas pour une métrique
+SEUIL_DEFAUT = {"tolerance_pct": 25, "marge": 50}
+
+
+def _arrondi(valeur, chiffres=1):
+    return None if valeur is None else round(valeur, chiffres)
+
+
+class CollecteurMetriques:
+    """
+    Relève les métriques d'un scénario étape par étape
+
+    Utilisation:
+        collecteur = CollecteurMetriques(driver, "auth_reussie")
+        collecteur.installer()              # avant d'ouvrir la première page
+        ...
+        collecteur.relever("formulaire_connexion")
+        collecteur.terminer()               # écrit le JSON et vérifie la référence
+    """
+
+    def __init__(self, driver, scenario):
+        self.driver = driver
+        self.scenario = scenario
+        self.etapes = {}
+        self._instant_precedent = None
+        self._taches_vues = 0
+
+    def installer(self):
+        """Installe la sonde (via DevTools sous Chrome/Edge, pour les prochains chargements)"""
+        if hasattr(self.driver, "execute_cdp_cmd") and not getattr(self.driver, "_sonde_perf_cdp", False):
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_SONDE_PERFORMANCE}
+            )
+            self.driver._sonde_perf_cdp = True
+        self.driver.execute_script(SCRIPT_SONDE_PERFORMANCE)
+
+    def relever(self, etape, **mesures):
+        """
+        Relève les métriques de la page après `etape`
+
+        Args:
+            etape: Nom de l'étape (clé du JSON et de la référence)
+            **mesures: Mesures propres au test, en ms (ex: api_login_ms=appel["duree"])
+        """
+        self.driver.execute_script(SCRIPT_SONDE_PERFORMANCE)
+        brut = self.driver.execute_script(SCRIPT_LIRE_METRIQUES)
+
+        # Nouveau document (rechargement) : l'horloge de la page et les tâches repartent de zéro
+        if self._instant_precedent is not None and brut["maintenant"] < self._instant_precedent:
+            self._instant_precedent, self._taches_vues = None, 0
+        nouvelles = brut["taches"][self._taches_vues:]
+        self._taches_vues = len(brut["taches"])
+
+        metriques = {
+            "url": brut["url"],
+            "ttfb_ms": _arrondi(brut["ttfb"]),
+            "dom_interactive_ms": _arrondi(brut["dom_interactive"]),
+            "dom_content_loaded_ms": _arrondi(brut["dom_content_loaded"]),
+            "load_ms": _arrondi(brut["load"]),
+            "fp_ms": _arrondi(brut["fp"]),
+            "fcp_ms": _arrondi(brut["fcp"]),
+            "lcp_ms": _arrondi(brut["lcp"]),
+            "duree_etape_ms": _arrondi(brut["maintenant"] - (self._instant_precedent or 0)),
+            "taches_longues": len(nouvelles),
+            "taches_longues_ms": _arrondi(sum(t["duree"] for t in nouvelles)),
+            "tbt_ms": _arrondi(sum(max(0, t["duree"] - 50) for t in nouvelles)),
+            "heap_mo": _arrondi(brut["heap"] / 1048576, 2) if brut["heap"] else None,
+            "ressources": brut["ressources"],
+        }
+        metriques.update({cle: _arrondi(valeur) for cle, valeur in mesures.items()})
+        self._instant_precedent = brut["maintenant"]
+        self.etapes[etape] = metriques
+        return metriques
+
+    def rapport(self):
+        capacites = getattr(self.driver, "capabilities", {}) or {}
+        return {
+            "scenario": self.scenario,
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "navigateur": f"{capacites.get('browserName', '?')} {capacites.get('browserVersion', '')}".strip(),
+            "profil": config.PROFIL_NAVIGATEUR,
+            "etapes": self.etapes,
+        }
+
+    def enregistrer(self, dossier=None):
+        """Écrit le rapport de l'exécution ; retourne son chemin"""
+        dossier = dossier or config.METRIQUES_DOSSIER
+        os.makedirs(dossier, exist_ok=True)
+        horodatage = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        # pid : plusieurs workers xdist peuvent écrire le même scénario à la même seconde
+        chemin = os.path.join(dossier, f"{self.scenario}_{horodatage}_{os.getpid()}.json")
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump(self.rapport(), fichier, indent=2, ensure_ascii=False)
+        return chemin
+
+    def terminer(self, verifier=None):
+        """
+        Enregistre l'exécution puis la compare à la référence
+
+        Raises:
+            AssertionError: si une métrique dépasse sa référence + tolérance
+        """
+        chemin = self.enregistrer()
+        print(f"✓ Métriques de performance enregistrées dans {chemin}")
+        if not (config.METRIQUES_VERIFIER if verifier is None else verifier):
+            return []
+        reference = charger_reference()
+        if self.scenario not in reference.get("scenarios", {}):
+            print(f"⚠ Pas de référence pour {self.scenario} (voir metriques_navigateur.py)")
+            return []
+        regressions = comparer(self.rapport(), reference)
+        for regression in regressions:
+            print(f"✗ {regression}")
+        assert not regressions, f"{len(regressions)} régression(s) de performance : {regressions}"
+        print("✓ Métriques dans les seuils de la référence")
+        return regressions
+
+
+def charger_reference(chemin=None):
+    chemin = chemin or config.METRIQUES_REFERENCE
+    if not os.path.exists(chemin):
+        return {}
+    with open(chemin, encoding="utf-8") as fichier:
+        return json.load(fichier)
+
+
+def comparer(rapport, reference):
+    """
+    Compare une exécution à la référence de son scénario
+
+    Une métrique régresse si valeur > référence * (1 + tolerance_pct / 100) + marge.
+    Seules les métriques présentes dans la référence sont vérifiées.
+
+    Returns:
+        Liste de messages, un par métrique en régression
+    """
+    seuils = reference.get("seuils", {})
+    attendu = reference.get("scenarios", {}).get(rapport["scenario"], {})
+    regressions = []
+    for etape, valeurs_reference in attendu.items():
+        mesurees = rapport["etapes"].get(etape)
+        if mesurees is None:
+            continue
+        for metrique, valeur_reference in valeurs_reference.items():
+            valeur = mesurees.get(metrique)
+            if valeur is None or valeur_reference is None:
+                continue
+            seuil = {**SEUIL_DEFAUT, **seuils.get(metrique, {})}
+            limite = valeur_reference * (1 + seuil["tolerance_pct"] / 100) + seuil["marge"]
+            if valeur > limite:
+                regressions.append(
+                    f"{rapport['scenario']} / {etape} / {metrique} : {valeur} "
+                    f"(référence {valeur_reference}, limite {round(limite, 1)})"
+                )
+    return regressions
+
+
+def construire_reference(rapports_executions, metriques):
+    """Médiane de chaque métrique par scénario et par étape sur plusieurs exécutions"""
+    valeurs = {}
+    for rapport in rapports_executions:
+        for etape, mesurees in rapport["etapes"].items():
+            for metrique in metriques:
+                if mesurees.get(metrique) is not None:
+                    valeurs.setdefault(rapport["scenario"], {}).setdefault(etape, {}) \
+                        .setdefault(metrique, []).append(mesurees[metrique])
+    return {
+        scenario: {
+            etape: {metrique: round(statistics.median(liste), 1) for metrique, liste in par_metrique.items()}
+            for etape, par_metrique in etapes.items()
+        }
+        for scenario, etapes in valeurs.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Référence des métriques de performance des scénarios")
+    parser.add_argument("executions", nargs="+", help="Rapports JSON d'exécutions (metriques/*.json)")
+    parser.add_argument("--afficher", action="store_true", help="Affiche les exécutions sans toucher à la référence")
+    args = parser.parse_args()
+
+    executions = []
+    for chemin in args.executions:
+        with open(chemin, encoding="utf-8") as fichier:
+            executions.append(json.load(fichier))
+
+    reference = charger_reference()
+    if args.afficher:
+        for execution in executions:
+            print(f"\n{execution['scenario']} — {execution['date']} ({execution['navigateur']})")
+            for etape, mesurees in execution["etapes"].items():
+                print(f"  {etape}: " + ", ".join(f"{c}={v}" for c, v in mesurees.items() if v is not None))
+            for regression in comparer(execution, reference):
+                print(f"  ✗ {regression}")
+        return
+
+    # Seules les métriques qui ont un seuil sont gardées dans la référence
+    nouvelles = construire_reference(executions, list(reference.get("seuils", {})))
+    reference.setdefault("scenarios", {}).update(nouvelles)
+    with open(config.METRIQUES_REFERENCE, "w", encoding="utf-8") as fichier:
+        json.dump(reference, fichier, indent=2, ensure_ascii=False)
+        fichier.write("\n")
+    print(f"✓ Référence mise à jour pour {', '.join(nouvelles)} ({len(executions)} exécution(s), médianes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Fabrique centrale des navigateurs de test
+Construit Chrome, Edge ou Firefox selon config.BROWSER et config.PROFIL_NAVIGATEUR
+
+Profils :
+- "dev" : fenêtre visible et maximisée, pour suivre les tests à l'écran
+- "ci"  : headless et allégé (pas d'images, d'extensions, de GPU ni de trafic
+          réseau en arrière-plan), viewport fixe et chargement "eager",
+          pour les conteneurs sans affichage
+"""
+
+from selenium import webdriver
+import config
+
+PROFILS = ("dev", "ci")
+NAVIGATEURS = ("chrome", "edge", "firefox")
+
+# Options communes à tous les navigateurs Chromium (stabilité)
+OPTIONS_STABILITE_CHROMIUM = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+]
+
+# Options du profil CI pour les navigateurs Chromium
+OPTIONS_CI_CHROMIUM = [
+    '--headless=new',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--mute-audio',
+    '--blink-settings=imagesEnabled=false',
+]
+
+
+def _options_chromium(options, profil):
+    for argument in OPTIONS_STABILITE_CHROMIUM:
+        options.add_argument(argument)
+    if profil == "ci":
+        largeur, hauteur = config.TAILLE_FENETRE
+        for argument in OPTIONS_CI_CHROMIUM:
+            options.add_argument(argument)
+        options.add_argument(f'--window-size={largeur},{hauteur}')
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.page_load_strategy = "eager"
+    if config.JOURNAL_RESEAU:
+        # Journal "performance" : événements Network.* des DevTools (enregistreur_reseau.py)
+        cle = "ms:loggingPrefs" if isinstance(options, webdriver.EdgeOptions) else "goog:loggingPrefs"
+        options.set_capability(cle, {"performance": "ALL"})
+    return options
+
+
+def _options_firefox(profil):
+    options = webdriver.FirefoxOptions()
+    if profil == "ci":
+        largeur, hauteur = config.TAILLE_FENETRE
+        options.add_argument('-headless')
+        options.add_argument(f'--width={largeur}')
+        options.add_argument(f'--height={hauteur}')
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("extensions.enabled", False)
+        options.set_preference("layers.acceleration.disabled", True)
+        options.set_preference("network.prefetch-next", False)
+        options.set_preference("network.dns.disablePrefetch", True)
+        options.set_preference("app.update.enabled", False)
+        options.set_preference("browser.safebrowsing.malware.enabled", False)
+        options.set_preference("browser.safebrowsing.phishing.enabled", False)
+        options.set_preference("media.autoplay.default", 5)
+        options.page_load_strategy = "eager"
+    return options
+
+
+def creer_driver(navigateur=None, profil=None):
+    """
+    Démarre un navigateur configuré
+
+    Args:
+        navigateur: "chrome", "edge" ou "firefox" (défaut: config.BROWSER)
+        profil: "dev" ou "ci" (défaut: config.PROFIL_NAVIGATEUR)
+
+    Returns:
+        Instance WebDriver prête à l'emploi
+    """
+    navigateur = (navigateur or config.BROWSER).lower()
+    profil = (profil or config.PROFIL_NAVIGATEUR).lower()
+    if navigateur not in NAVIGATEURS:
+        raise ValueError(f"Navigateur non supporté: {navigateur} (attendu: {', '.join(NAVIGATEURS)})")
+    if profil not in PROFILS:
+        raise ValueError(f"Profil inconnu: {profil} (attendu: {', '.join(PROFILS)})")
+
+    if navigateur == "chrome":
+        driver = webdriver.Chrome(options=_options_chromium(webdriver.ChromeOptions(), profil))
+    elif navigateur == "edge":
+        driver = webdriver.Edge(options=_options_chromium(webdriver.EdgeOptions(), profil))
+    else:
+        driver = webdriver.Firefox(options=_options_firefox(profil))
+
+    if profil == "dev":
+        driver.maximize_window()
+    return driver
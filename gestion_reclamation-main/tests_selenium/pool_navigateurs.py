@@ -0,0 +1,133 @@
+"""
+Pool de navigateurs réutilisables
+Garde des instances WebDriver "chaudes" et en prête une par test, au lieu de
+démarrer un nouveau navigateur (1 à 3 s) dans chaque setup_method
+"""
+
+import atexit
+import time
+from selenium.common.exceptions import WebDriverException
+import config
+import navigateur
+
+
+class PoolNavigateurs:
+    """
+    Pool de WebDriver partagé par les tests d'un même processus
+
+    Entre deux prêts, le navigateur est remis à zéro : cookies, localStorage
+    (où le frontend garde son jeton Bearer, voir frontend/src/lib/axios.ts)
+    et sessionStorage sont vidés, puis la page est quittée pour perdre l'état React.
+    """
+
+    def __init__(self, fabrique=navigateur.creer_driver):
+        self.fabrique = fabrique
+        self.disponibles = []
+        self.demarrages = 0
+        self.locations = 0
+        self.remplacements = 0
+        self.latences_reset = []
+
+    def _demarrer(self):
+        self.demarrages += 1
+        return self.fabrique()
+
+    @staticmethod
+    def _est_vivant(driver):
+        """Vérifie que la session WebDriver répond encore"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _fermer_sans_erreur(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def louer(self):
+        """
+        Prête un navigateur prêt à l'emploi
+
+        Un navigateur du pool qui ne répond plus (crash, session perdue)
+        est remplacé automatiquement par une nouvelle instance.
+        """
+        self.locations += 1
+        while self.disponibles:
+            driver = self.disponibles.pop()
+            if self._est_vivant(driver):
+                return driver
+            self.remplacements += 1
+            self._fermer_sans_erreur(driver)
+        return self._demarrer()
+
+    def _reinitialiser(self, driver):
+        """Efface l'état laissé par le test précédent"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Vide le stockage de l'origine de l'application sans devoir y naviguer
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": config.BASE_URL,
+                "storageTypes": "cookies,local_storage,session_storage",
+            })
+        elif driver.current_url.startswith(config.BASE_URL):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        if config.JOURNAL_RESEAU and hasattr(driver, "execute_cdp_cmd"):
+            # Journal réseau des DevTools vidé : le test suivant ne lit que ses propres appels
+            driver.get_log("performance")
+
+    def rendre(self, driver):
+        """
+        Rend un navigateur au pool après l'avoir remis à zéro
+
+        Si la remise à zéro échoue, le navigateur est fermé : le prochain
+        prêt en démarrera un nouveau.
+        """
+        debut = time.perf_counter()
+        try:
+            self._reinitialiser(driver)
+        except WebDriverException:
+            self.remplacements += 1
+            self._fermer_sans_erreur(driver)
+            return
+        self.latences_reset.append(time.perf_counter() - debut)
+        self.disponibles.append(driver)
+
+    def fermer(self):
+        """Ferme tous les navigateurs du pool"""
+        while self.disponibles:
+            self._fermer_sans_erreur(self.disponibles.pop())
+
+    def statistiques(self):
+        """
+        Retourne les statistiques d'utilisation du pool
+
+        Returns:
+            Dictionnaire avec le nombre de démarrages, de prêts, de démarrages
+            évités, de remplacements et la latence de remise à zéro (ms)
+        """
+        latences = self.latences_reset
+        return {
+            "demarrages": self.demarrages,
+            "locations": self.locations,
+            "demarrages_evites": self.locations - self.demarrages,
+            "remplacements": self.remplacements,
+            "reset_moyen_ms": round(sum(latences) / len(latences) * 1000, 1) if latences else 0.0,
+            "reset_max_ms": round(max(latences) * 1000, 1) if latences else 0.0,
+        }
+
+
+_pool = None
+
+
+def pool_global():
+    """Retourne le pool du processus courant (un par worker pytest-xdist)"""
+    global _pool
+    if _pool is None:
+        _pool = PoolNavigateurs()
+        atexit.register(_pool.fermer)
+    return _pool
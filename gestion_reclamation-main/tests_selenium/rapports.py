@@ -0,0 +1,191 @@
+"""
+Rapports des benchmarks de l'API
+Agrège les mesures brutes (une par requête) en latences p50/p95/p99, débit et
+taux d'erreur par endpoint, les enregistre en JSON et HTML et les compare à
+un rapport de référence (exécution précédente)
+"""
+
+import datetime
+import html
+import json
+import math
+import statistics
+
+# Métriques comparées entre deux exécutions : (clé, plus haut = meilleur)
+METRIQUES_COMPAREES = (
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("p99_ms", False),
+    ("debit_rps", True),
+    ("taux_erreur", False),
+)
+
+
+def percentile(valeurs, p):
+    """Percentile `p` (0-100) par interpolation linéaire entre rangs"""
+    if not valeurs:
+        return None
+    valeurs = sorted(valeurs)
+    rang = (len(valeurs) - 1) * p / 100
+    bas, haut = math.floor(rang), math.ceil(rang)
+    return valeurs[bas] + (valeurs[haut] - valeurs[bas]) * (rang - bas)
+
+
+def _resumer_groupe(mesures, duree_s):
+    durees = [m["duree_ms"] for m in mesures]
+    erreurs = sum(1 for m in mesures if not m["ok"])
+    return {
+        "requetes": len(mesures),
+        "erreurs": erreurs,
+        "taux_erreur": round(erreurs / len(mesures), 4),
+        "moyenne_ms": round(statistics.fmean(durees), 1),
+        "p50_ms": round(percentile(durees, 50), 1),
+        "p95_ms": round(percentile(durees, 95), 1),
+        "p99_ms": round(percentile(durees, 99), 1),
+        "max_ms": round(max(durees), 1),
+        "debit_rps": round(len(mesures) / duree_s, 2) if duree_s else None,
+    }
+
+
+def construire_rapport(outil, mesures, duree_s, parametres=None):
+    """
+    Construit le rapport d'une exécution
+
+    Args:
+        outil: Nom du benchmark (ex: "bench_demandes")
+        mesures: Liste de {"endpoint", "duree_ms", "statut", "ok"}
+        duree_s: Durée totale de l'exécution (pour le débit)
+        parametres: Paramètres de l'exécution, recopiés dans le rapport
+    """
+    par_endpoint = {}
+    for mesure in mesures:
+        par_endpoint.setdefault(mesure["endpoint"], []).append(mesure)
+    return {
+        "outil": outil,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "parametres": parametres or {},
+        "duree_s": round(duree_s, 2),
+        "global": _resumer_groupe(mesures, duree_s) if mesures else {},
+        "endpoints": {
+            endpoint: _resumer_groupe(groupe, duree_s)
+            for endpoint, groupe in sorted(par_endpoint.items())
+        },
+    }
+
+
+def comparer(rapport, reference):
+    """
+    Compare un rapport à un rapport de référence
+
+    Returns:
+        {endpoint: {métrique: {"avant", "apres", "ecart_pct", "regression"}}}
+        pour les endpoints présents dans les deux rapports
+    """
+    comparaison = {}
+    for endpoint, resume in rapport["endpoints"].items():
+        avant = reference.get("endpoints", {}).get(endpoint)
+        if not avant:
+            continue
+        comparaison[endpoint] = {}
+        for cle, plus_haut_meilleur in METRIQUES_COMPAREES:
+            a, b = avant.get(cle), resume.get(cle)
+            if a is None or b is None:
+                continue
+            ecart = round((b - a) / a * 100, 1) if a else None
+            comparaison[endpoint][cle] = {
+                "avant": a,
+                "apres": b,
+                "ecart_pct": ecart,
+                "regression": b < a if plus_haut_meilleur else b > a,
+            }
+    return comparaison
+
+
+def charger(chemin):
+    """Charge un rapport JSON enregistré par ecrire_json"""
+    with open(chemin, encoding="utf-8") as fichier:
+        return json.load(fichier)
+
+
+def ecrire_json(chemin, rapport):
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        json.dump(rapport, fichier, indent=2, ensure_ascii=False)
+
+
+def ecrire_html(chemin, rapport):
+    """Rapport HTML autonome : tableau par endpoint et, si présente, la comparaison"""
+    colonnes = ("requetes", "erreurs", "taux_erreur", "p50_ms", "p95_ms", "p99_ms", "max_ms", "debit_rps")
+    lignes = []
+    for endpoint, resume in rapport["endpoints"].items():
+        cellules = "".join(f"<td>{resume[c]}</td>" for c in colonnes)
+        lignes.append(f"<tr><th>{html.escape(endpoint)}</th>{cellules}</tr>")
+
+    section_comparaison = ""
+    if rapport.get("comparaison"):
+        lignes_comp = []
+        for endpoint, metriques in rapport["comparaison"].items():
+            for cle, valeurs in metriques.items():
+                classe = "regression" if valeurs["regression"] else "gain"
+                ecart = "n/d" if valeurs["ecart_pct"] is None else f"{valeurs['ecart_pct']:+.1f} %"
+                lignes_comp.append(
+                    f"<tr class='{classe}'><th>{html.escape(endpoint)}</th><td>{cle}</td>"
+                    f"<td>{valeurs['avant']}</td><td>{valeurs['apres']}</td><td>{ecart}</td></tr>"
+                )
+        section_comparaison = (
+            f"<h2>Comparaison avec {html.escape(rapport.get('reference', 'la référence'))}</h2>"
+            "<table><tr><th>Endpoint</th><th>Métrique</th><th>Avant</th><th>Après</th><th>Écart</th></tr>"
+            + "".join(lignes_comp) + "</table>"
+        )
+
+    parametres = "".join(
+        f"<li>{html.escape(str(cle))} : {html.escape(str(valeur))}</li>"
+        for cle, valeur in rapport["parametres"].items()
+    )
+    contenu = f"""<!DOCTYPE html>
+<html lang="fr"><head><meta charset="utf-8"><title>{rapport['outil']}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: right; }}
+th:first-child {{ text-align: left; }}
+tr.regression td {{ background: #fde2e2; }}
+tr.gain td {{ background: #e2f5e2; }}
+</style></head><body>
+<h1>{rapport['outil']} — {rapport['date']}</h1>
+<ul>{parametres}<li>durée : {rapport['duree_s']} s</li></ul>
+<table><tr><th>Endpoint</th>{"".join(f"<th>{c}</th>" for c in colonnes)}</tr>
+{"".join(lignes)}</table>
+{section_comparaison}
+</body></html>
+"""
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        fichier.write(contenu)
+
+
+def afficher(rapport):
+    """Affiche le rapport dans la console"""
+    print(f"\n{'Endpoint':<45} {'req':>6} {'err %':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8}")
+    for endpoint, r in rapport["endpoints"].items():
+        print(
+            f"{endpoint:<45} {r['requetes']:>6} {r['taux_erreur'] * 100:>6.1f} "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['debit_rps']:>8}"
+        )
+    for endpoint, metriques in rapport.get("comparaison", {}).items():
+        regressions = [cle for cle, v in metriques.items() if v["regression"] and v["ecart_pct"]]
+        if regressions:
+            print(f"⚠ {endpoint} : régression sur {', '.join(regressions)}")
+
+
+def enregistrer(rapport, prefixe, reference=None):
+    """
+    Compare éventuellement à `reference` puis écrit `prefixe`.json et `prefixe`.html
+
+    Args:
+        reference: Chemin d'un rapport JSON précédent (optionnel)
+    """
+    if reference:
+        rapport["reference"] = reference
+        rapport["comparaison"] = comparer(rapport, charger(reference))
+    ecrire_json(f"{prefixe}.json", rapport)
+    ecrire_html(f"{prefixe}.html", rapport)
+    print(f"\n✓ Rapport enregistré dans {prefixe}.json et {prefixe}.html")
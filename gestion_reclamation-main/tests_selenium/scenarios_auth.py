@@ -0,0 +1,27 @@
+"""
+Données partagées des scénarios d'authentification
+Utilisées à la fois par les tests Selenium (interface) et les tests API
+(test_api_auth.py), pour que les deux versions ne puissent pas diverger
+"""
+
+# Message renvoyé par AuthController::login (et affiché par LoginPage.tsx)
+MESSAGE_IDENTIFIANTS_INCORRECTS = "Identifiants incorrects ou rôle invalide"
+
+# Mots-clés attendus dans les messages d'erreur
+MOTS_CLES_ERREUR = ("incorrect", "erroné", "invalide")
+MOTS_CLES_BLOCAGE = ("bloqué", "désactivé", "compte")
+
+# Nombre de tentatives échouées avant le blocage du compte
+TENTATIVES_AVANT_BLOCAGE = 3
+
+
+def est_message_erreur(texte):
+    """Vrai si le texte ressemble à un message d'identifiants incorrects"""
+    texte = texte.lower()
+    return any(mot in texte for mot in MOTS_CLES_ERREUR)
+
+
+def est_message_blocage(texte):
+    """Vrai si le texte ressemble à un message de compte bloqué"""
+    texte = texte.lower()
+    return any(mot in texte for mot in MOTS_CLES_BLOCAGE)
@@ -0,0 +1,68 @@
+"""
+Connexion programmatique par injection de jeton
+Obtient un jeton Sanctum via /api/login une seule fois par rôle et l'écrit
+directement dans le localStorage du navigateur : les scénarios qui ont besoin
+d'un utilisateur connecté démarrent sur /dashboard, /claims ou /grades
+sans rejouer le formulaire /login
+"""
+
+import attentes
+import comptes
+import config
+from client_api import ClientAPI
+
+ROLES = ("student", "teacher", "registrar", "admin")
+
+# Jetons déjà obtenus dans ce processus : rôle -> jeton
+_jetons = {}
+
+
+def jeton_pour_role(role):
+    """
+    Retourne un jeton Sanctum valide pour un compte de test du rôle demandé
+
+    Le jeton est demandé une seule fois par processus puis réutilisé.
+    """
+    if role not in ROLES:
+        raise ValueError(f"Rôle inconnu: {role} (attendu: {', '.join(ROLES)})")
+    if role not in _jetons:
+        compte = comptes.compte_test("session", role=role)
+        client = ClientAPI()
+        reponse = client.login(compte["email"], compte["password"], role)
+        if reponse.status_code != 200:
+            raise RuntimeError(f"Connexion API impossible pour {compte['email']}: {reponse.text}")
+        _jetons[role] = client.jeton
+    return _jetons[role]
+
+
+def oublier_jeton(role):
+    """
+    Oublie le jeton en cache d'un rôle
+
+    À appeler par un test qui se déconnecte (le jeton est alors révoqué côté backend).
+    """
+    _jetons.pop(role, None)
+
+
+def connecter_navigateur(driver, role, page="/dashboard"):
+    """
+    Connecte le navigateur en tant que `role` et ouvre `page`
+
+    Le jeton est écrit dans le localStorage de l'origine du frontend depuis une
+    ressource statique légère (robots.txt), sans charger l'application React.
+    """
+    driver.get(f"{config.BASE_URL}/robots.txt")
+    driver.execute_script(
+        "window.localStorage.setItem(arguments[0], arguments[1]);",
+        config.CLE_JETON_STORAGE,
+        jeton_pour_role(role),
+    )
+
+    attentes.installer_sonde_reseau(driver)
+    deja_termines = attentes.nombre_appels_termines(driver, "/api/user")
+    driver.get(f"{config.BASE_URL}{page}")
+    attentes.attendre_dom_pret(driver)
+    if getattr(driver, "_sonde_cdp", False):
+        # AuthContext valide le jeton via GET /api/user avant d'afficher la page
+        attentes.attendre_appel_api(driver, "/api/user", deja_termines)
+    return driver
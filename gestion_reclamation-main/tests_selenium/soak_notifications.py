@@ -0,0 +1,208 @@
+"""
+Test d'endurance du flux des notifications (php artisan notifications:serve)
+Ouvre des milliers d'abonnés inactifs (une connexion SSE ouverte chacun, rouverte
+avec le dernier curseur si elle se ferme), les maintient pendant `--duree` secondes
+et mesure la mémoire du processus du flux et du client, rapportée au nombre de
+connexions ouvertes
+
+Les abonnés partagent le jeton d'un compte de test : aucune notification n'arrive
+pendant l'essai, chaque connexion ne reçoit que l'événement d'ouverture puis les
+battements. Le flux est servi hors php-fpm : une connexion ouverte n'occupe aucun
+processus PHP, `-n` n'est borné que par les descripteurs de fichiers des deux côtés
+(ulimits du service notifications de docker-compose).
+
+Utilisation:
+    python soak_notifications.py                          # 1000 abonnés, 120 s
+    python soak_notifications.py -n 10000 --duree 600
+    python soak_notifications.py -n 2000 --montee 200 -o soak --reference soak_avant.json
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import time
+from urllib.parse import urlsplit
+
+import psutil
+
+import comptes
+import config
+import rapports
+from client_api import ClientAPI
+
+
+def memoire_processus(motif):
+    """RSS cumulée (octets) et nombre des processus dont le nom ou la ligne de commande contient `motif`"""
+    total, nombre = 0, 0
+    for processus in psutil.process_iter(["name", "cmdline", "memory_info"]):
+        try:
+            texte = f"{processus.info['name']} {' '.join(processus.info['cmdline'] or [])}"
+            if motif in texte and processus.pid != psutil.Process().pid:
+                total += processus.info["memory_info"].rss
+                nombre += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError):
+            continue
+    return total, nombre
+
+
+def augmenter_limite_fichiers(besoin):
+    """Une socket par abonné : relève la limite de descripteurs (soft) jusqu'au maximum autorisé"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    cible = besoin + 100 if hard == resource.RLIM_INFINITY else min(hard, besoin + 100)
+    if soft < cible:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (cible, hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+class Soak:
+    """Abonnés asyncio (HTTP/1.0 brut, une connexion SSE chacun) et compteurs de l'essai"""
+
+    def __init__(self, jeton):
+        url = urlsplit(config.NOTIFICATIONS_URL)
+        self.hote = url.hostname
+        self.port = url.port or 80
+        self.chemin = url.path
+        self.jeton = jeton
+        self.mesures = []
+        self.ouvertes = 0
+        self.evenements = 0
+        self.arret = asyncio.Event()
+
+    async def _connexion(self, curseur):
+        """Une connexion jusqu'à sa fermeture ; retourne le dernier curseur reçu"""
+        debut = time.perf_counter()
+        statut, ouverte = None, False
+        try:
+            lecteur, ecrivain = await asyncio.open_connection(self.hote, self.port)
+        except OSError:
+            lecteur = None
+        if lecteur is not None:
+            try:
+                ecrivain.write((
+                    f"GET {self.chemin}?since={curseur} HTTP/1.0\r\n"
+                    f"Host: {self.hote}\r\n"
+                    f"Authorization: Bearer {self.jeton}\r\n"
+                    "Accept: text/event-stream\r\n\r\n"
+                ).encode())
+                await ecrivain.drain()
+                entetes = await lecteur.readuntil(b"\r\n\r\n")
+                statut = int(entetes.split(b" ", 2)[1])
+                # Le battement arrive toutes les 20 s : sans rien pendant 60 s, la connexion est perdue
+                while statut == 200:
+                    ligne = await asyncio.wait_for(lecteur.readline(), timeout=60)
+                    if not ligne:
+                        break
+                    if not ligne.startswith(b"data: "):
+                        continue
+                    curseur = json.loads(ligne[6:]).get("curseur", curseur)
+                    self.evenements += 1
+                    if not ouverte:
+                        # Latence mesurée : connexion jusqu'à l'événement d'ouverture
+                        ouverte = True
+                        self.ouvertes += 1
+                        self.mesures.append({
+                            "endpoint": "SSE /notifications/stream",
+                            "duree_ms": (time.perf_counter() - debut) * 1000,
+                            "statut": statut,
+                            "ok": True,
+                        })
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                pass
+            finally:
+                if ouverte:
+                    self.ouvertes -= 1
+                ecrivain.close()
+
+        if not ouverte:
+            self.mesures.append({
+                "endpoint": "SSE /notifications/stream",
+                "duree_ms": (time.perf_counter() - debut) * 1000,
+                "statut": statut,
+                "ok": False,
+            })
+        return curseur
+
+    async def abonne(self):
+        """Garde une connexion ouverte, rouverte au dernier curseur, jusqu'à la fin de l'essai"""
+        curseur = 0
+        while not self.arret.is_set():
+            curseur = await self._connexion(curseur)
+            await asyncio.sleep(1)
+
+
+async def executer(args, jeton):
+    soak = Soak(jeton)
+    memoire_avant, _ = memoire_processus(args.processus)
+    client_avant = psutil.Process().memory_info().rss
+
+    # Montée progressive, pour ne pas mesurer une rafale de connexions
+    taches = []
+    debut = time.perf_counter()
+    for i in range(args.abonnes):
+        taches.append(asyncio.create_task(soak.abonne()))
+        if (i + 1) % args.montee == 0:
+            await asyncio.sleep(1)
+            print(f"  {i + 1} abonnés lancés, {soak.ouvertes} connexions ouvertes")
+
+    # Palier : on garde le pic de mémoire observé
+    pic_serveur, pic_client, pic_ouvertes, processus = memoire_avant, client_avant, 0, 0
+    fin = time.perf_counter() + args.duree
+    while time.perf_counter() < fin:
+        await asyncio.sleep(2)
+        memoire, processus = memoire_processus(args.processus)
+        pic_serveur = max(pic_serveur, memoire)
+        pic_client = max(pic_client, psutil.Process().memory_info().rss)
+        pic_ouvertes = max(pic_ouvertes, soak.ouvertes)
+        print(f"  {soak.ouvertes} connexions ouvertes, serveur {memoire / 2**20:.0f} Mio ({processus} processus)")
+
+    soak.arret.set()
+    for tache in taches:
+        tache.cancel()
+    await asyncio.gather(*taches, return_exceptions=True)
+    duree = time.perf_counter() - debut
+
+    connexions = max(pic_ouvertes, 1)
+    return soak.mesures, duree, {
+        "abonnes": args.abonnes,
+        "connexions_ouvertes_max": pic_ouvertes,
+        "evenements_recus": soak.evenements,
+        "processus_serveur": processus,
+        "memoire_serveur_avant_mio": round(memoire_avant / 2**20, 1),
+        "memoire_serveur_pic_mio": round(pic_serveur / 2**20, 1),
+        "memoire_serveur_par_connexion_kio": round((pic_serveur - memoire_avant) / connexions / 1024, 1),
+        "memoire_client_par_connexion_kio": round((pic_client - client_avant) / connexions / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test d'endurance du flux des notifications")
+    parser.add_argument("-n", "--abonnes", type=int, default=1000)
+    parser.add_argument("--duree", type=int, default=120, help="Durée du palier (secondes)")
+    parser.add_argument("--montee", type=int, default=100, help="Abonnés lancés par seconde")
+    parser.add_argument("--processus", default="notifications:serve",
+                        help="Motif des processus serveur dont la mémoire est mesurée")
+    parser.add_argument("-o", "--sortie", default="soak_notifications")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    limite = augmenter_limite_fichiers(args.abonnes)
+    if limite < args.abonnes + 100:
+        print(f"⚠ Limite de descripteurs à {limite} : moins d'abonnés possibles que demandé")
+
+    compte = comptes.compte_test("soak")
+    client = ClientAPI()
+    client.login(compte["email"], compte["password"], compte["role"])
+
+    print(f"Montée à {args.abonnes} abonnés ({args.montee}/s), palier de {args.duree} s...")
+    mesures, duree, parametres = asyncio.run(executer(args, client.jeton))
+
+    rapport = rapports.construire_rapport("soak_notifications", mesures, duree, parametres)
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+    print(f"Mémoire serveur par connexion : {parametres['memoire_serveur_par_connexion_kio']} Kio "
+          f"({parametres['connexions_ouvertes_max']} connexions ouvertes au plus)")
+
+
+if __name__ == "__main__":
+    main()
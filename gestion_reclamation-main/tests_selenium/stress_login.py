@@ -0,0 +1,170 @@
+"""
+Test de charge du blocage des connexions (POST /api/login)
+Inonde /api/login de mots de passe erronés (comptes visés et adresses d'attaque
+tirés au hasard) pendant qu'un utilisateur légitime se connecte à intervalle
+régulier, et vérifie :
+  - que le débit de l'attaque tient (les tentatives bloquées sont refusées en 429
+    sans vérification bcrypt ni écriture en base) ;
+  - que l'utilisateur légitime se connecte toujours, sans latence dégradée au-delà
+    de `--degradation-max` fois sa latence mesurée à vide.
+
+Les adresses sont simulées par l'en-tête X-Forwarded-For : lancer le backend avec
+TRUSTED_PROXIES=127.0.0.1 (ou "*"), sinon toutes les requêtes partagent l'adresse
+du script et l'attaque bloque aussi l'utilisateur légitime (seuil par IP).
+
+Code de sortie 1 si l'utilisateur légitime a été refusé ou trop ralenti.
+
+Utilisation:
+    python stress_login.py                              # 30 s, 20 attaquants
+    python stress_login.py --duree 120 -c 50 --ips 5 --victimes 200
+    python stress_login.py -o stress --reference stress_avant.json
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import comptes
+import config
+import rapports
+from client_api import ClientAPI, creer_session
+
+IP_LEGITIME = "198.51.100.10"
+
+
+class Stress:
+    """Attaquants, utilisateur légitime et mesures de l'essai"""
+
+    def __init__(self, concurrence, victimes, ips, graine):
+        self.session = creer_session(taille_pool=concurrence + 1)
+        self.victimes = [f"victime{i}@{config.COMPTES_TEST_DOMAINE}" for i in range(victimes)]
+        self.ips = [f"203.0.113.{i % 250 + 1}" for i in range(ips)]
+        self.legitime = comptes.compte_test("stress")
+        self.mesures = []
+        self.arret = threading.Event()
+        self._graine = graine
+        self._verrou = threading.Lock()
+
+    def _login(self, endpoint, email, password, role, ip):
+        client = ClientAPI(session_http=self.session)
+        debut = time.perf_counter()
+        try:
+            reponse = client.requete("POST", "/login", headers={"X-Forwarded-For": ip}, json={
+                "email": email,
+                "password": password,
+                "role_name": role,
+            })
+            statut = reponse.status_code
+        except Exception:  # timeout, connexion refusée...
+            statut = None
+        mesure = {
+            "endpoint": f"{endpoint} [{statut}]",
+            "duree_ms": (time.perf_counter() - debut) * 1000,
+            "statut": statut,
+            # Côté attaque, un refus (422 ou 429) est le résultat attendu
+            "ok": statut == 200 if endpoint.endswith("(légitime)") else statut in (422, 429),
+        }
+        with self._verrou:
+            self.mesures.append(mesure)
+        return mesure
+
+    def connexion_legitime(self):
+        compte = self.legitime
+        return self._login("POST /login (légitime)", compte["email"], compte["password"], compte["role"], IP_LEGITIME)
+
+    def attaquant(self, numero):
+        tirage = random.Random(self._graine + numero)
+        while not self.arret.is_set():
+            self._login("POST /login (attaque)", tirage.choice(self.victimes), config.INVALID_PASSWORD,
+                        "student", tirage.choice(self.ips))
+
+    def sonde(self, intervalle):
+        """Connexions légitimes régulières pendant l'attaque"""
+        while not self.arret.wait(intervalle):
+            self.connexion_legitime()
+
+
+def resume_legitime(mesures):
+    durees = [m["duree_ms"] for m in mesures]
+    return {
+        "connexions": len(mesures),
+        "refusees": sum(1 for m in mesures if not m["ok"]),
+        "p50_ms": round(rapports.percentile(durees, 50), 1) if durees else None,
+        "p95_ms": round(rapports.percentile(durees, 95), 1) if durees else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge du blocage des connexions")
+    parser.add_argument("--duree", type=int, default=30, help="Durée de l'attaque (secondes)")
+    parser.add_argument("-c", "--concurrence", type=int, default=20, help="Attaquants en parallèle")
+    parser.add_argument("--victimes", type=int, default=50, help="Comptes visés par l'attaque")
+    parser.add_argument("--ips", type=int, default=20, help="Adresses d'attaque simulées")
+    parser.add_argument("--intervalle", type=float, default=0.5, help="Secondes entre deux connexions légitimes")
+    parser.add_argument("--temoin", type=int, default=20, help="Connexions légitimes mesurées à vide")
+    parser.add_argument("--degradation-max", type=float, default=3.0,
+                        help="p95 légitime sous attaque / p95 à vide toléré")
+    parser.add_argument("--graine", type=int, default=42)
+    parser.add_argument("-o", "--sortie", default="stress_login")
+    parser.add_argument("--reference", help="Rapport JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    stress = Stress(args.concurrence, args.victimes, args.ips, args.graine)
+
+    print(f"Témoin : {args.temoin} connexions légitimes sans attaque...")
+    temoin = resume_legitime([stress.connexion_legitime() for _ in range(args.temoin)])
+    stress.mesures.clear()
+
+    print(f"Attaque : {args.concurrence} attaquants, {args.victimes} comptes visés, "
+          f"{args.ips} adresses, {args.duree} s...")
+    debut = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrence + 1) as executeur:
+        executeur.submit(stress.sonde, args.intervalle)
+        for numero in range(args.concurrence):
+            executeur.submit(stress.attaquant, numero)
+        time.sleep(args.duree)
+        stress.arret.set()
+    duree = time.perf_counter() - debut
+
+    attaque = [m for m in stress.mesures if "(attaque)" in m["endpoint"]]
+    sous_attaque = resume_legitime([m for m in stress.mesures if "(légitime)" in m["endpoint"]])
+    bloquees = sum(1 for m in attaque if m["statut"] == 429)
+    degradation = (round(sous_attaque["p95_ms"] / temoin["p95_ms"], 2)
+                   if sous_attaque["p95_ms"] and temoin["p95_ms"] else None)
+
+    rapport = rapports.construire_rapport("stress_login", stress.mesures, duree, {
+        "concurrence": args.concurrence,
+        "victimes": args.victimes,
+        "ips": args.ips,
+        "tentatives_attaque": len(attaque),
+        "debit_attaque_rps": round(len(attaque) / duree, 1),
+        "part_bloquees_429": round(bloquees / len(attaque), 4) if attaque else None,
+        "legitime_a_vide": temoin,
+        "legitime_sous_attaque": sous_attaque,
+        "degradation_p95": degradation,
+    })
+    rapports.enregistrer(rapport, args.sortie, args.reference)
+    rapports.afficher(rapport)
+
+    print(f"\nAttaque : {len(attaque)} tentatives ({len(attaque) / duree:.0f}/s), "
+          f"{bloquees} refusées par le blocage (429)")
+    print(f"Légitime : p95 {temoin['p95_ms']} ms à vide, {sous_attaque['p95_ms']} ms sous attaque, "
+          f"{sous_attaque['refusees']}/{sous_attaque['connexions']} refusées")
+
+    echecs = []
+    if sous_attaque["refusees"] or not sous_attaque["connexions"]:
+        echecs.append("l'utilisateur légitime n'a pas pu se connecter")
+    if degradation is not None and degradation > args.degradation_max:
+        echecs.append(f"latence légitime dégradée x{degradation} (max x{args.degradation_max})")
+    for echec in echecs:
+        print(f"✗ {echec}")
+    if echecs:
+        sys.exit(1)
+    print("✓ L'utilisateur légitime n'est pas affecté par l'attaque")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Tests API de l'authentification
+Mêmes scénarios que test_auth_reussie.py et test_auth_echouee.py, joués
+directement contre /api/login, /api/user et /api/logout (sans navigateur)
+pour vérifier le comportement du backend en quelques millisecondes
+"""
+
+import comptes
+import config
+import scenarios_auth
+from client_api import ClientAPI, message_erreur
+
+
+class TestAuthentificationAPI:
+    """
+    Classe de test de l'authentification au niveau de l'API
+    """
+
+    def setup_method(self):
+        """Crée un client sans jeton avant chaque test"""
+        self.client = ClientAPI()
+
+    def test_connexion_reussie(self):
+        """Connexion, lecture du profil puis déconnexion (révocation du jeton)"""
+        compte = comptes.compte_test("connexion")
+
+        reponse = self.client.login(compte["email"], compte["password"], compte["role"])
+        assert reponse.status_code == 200, reponse.text
+        assert reponse.json()["token"]
+        assert reponse.json()["user"]["role"]["name"] == compte["role"]
+
+        reponse = self.client.user()
+        assert reponse.status_code == 200
+        assert reponse.json()["email"] == compte["email"]
+
+        jeton = self.client.jeton
+        assert self.client.logout().status_code == 200
+
+        # Le jeton révoqué ne doit plus donner accès au profil
+        assert ClientAPI(jeton=jeton).user().status_code == 401
+
+    def test_role_invalide(self):
+        """Bons identifiants mais mauvais rôle : refus avec le message générique"""
+        # Le mauvais rôle compte comme un échec de connexion : compte propre, pour ne pas
+        # entamer le quota d'échecs du compte "connexion" des tests de connexion réussie
+        compte = comptes.compte_test("role_invalide", unique=True)
+
+        reponse = self.client.login(compte["email"], compte["password"], "admin")
+        assert reponse.status_code == 422
+        assert message_erreur(reponse) == scenarios_auth.MESSAGE_IDENTIFIANTS_INCORRECTS
+
+    def test_echec_enregistre(self):
+        """Mauvais mot de passe : refus, aucun jeton délivré"""
+        # Compte propre à l'exécution : des échecs répétés d'une exécution à l'autre le bloqueraient
+        compte = comptes.compte_test("echec", unique=True)
+
+        reponse = self.client.login(compte["email"], config.INVALID_PASSWORD, compte["role"])
+        assert reponse.status_code == 422
+        assert scenarios_auth.est_message_erreur(message_erreur(reponse))
+        assert self.client.jeton is None
+
+    def test_blocage_apres_3_tentatives(self):
+        """Après 3 échecs, le compte reste bloqué même avec les bons identifiants"""
+        # Clé distincte du scénario Selenium (test_auth_echouee.py, "blocage") : dans un
+        # même processus, les deux tests partageraient sinon le même compte bloqué
+        compte = comptes.compte_test("blocage_api", unique=True)
+
+        for tentative in range(1, scenarios_auth.TENTATIVES_AVANT_BLOCAGE + 1):
+            reponse = self.client.login(compte["email"], config.INVALID_PASSWORD, compte["role"])
+            assert reponse.status_code != 200, f"tentative {tentative} acceptée"
+        # La tentative qui atteint le seuil annonce déjà le blocage
+        assert reponse.status_code == 429
+        assert scenarios_auth.est_message_blocage(message_erreur(reponse))
+
+        reponse = self.client.login(compte["email"], compte["password"], compte["role"])
+        assert reponse.status_code == 429
+        assert int(reponse.headers["Retry-After"]) > 0
+        assert scenarios_auth.est_message_blocage(message_erreur(reponse))
+        assert self.client.jeton is None
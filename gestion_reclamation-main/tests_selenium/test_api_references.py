@@ -0,0 +1,30 @@
+"""
+Tests API des données de référence
+Listes publiques des rôles et des filières (/api/roles, /api/filieres), lues
+par la page de connexion et les formulaires : servies avec un ETag et
+revalidées par une requête conditionnelle (304 sans corps si inchangées)
+"""
+
+from client_api import ClientAPI
+
+
+class TestReferencesAPI:
+    """
+    Classe de test des routes de données de référence
+    """
+
+    def setup_method(self):
+        """Crée un client sans jeton avant chaque test (routes publiques)"""
+        self.client = ClientAPI()
+
+    def test_roles_requete_conditionnelle(self):
+        """Liste des rôles de la page de connexion : ETag, puis 304 sans corps si inchangée"""
+        reponse = self.client.requete("GET", "/roles")
+        assert reponse.status_code == 200
+        assert {"student", "teacher", "registrar", "admin"} <= {r["name"] for r in reponse.json()}
+        etag = reponse.headers.get("ETag")
+        assert etag
+
+        reponse = self.client.requete("GET", "/roles", headers={"If-None-Match": etag})
+        assert reponse.status_code == 304
+        assert not reponse.content
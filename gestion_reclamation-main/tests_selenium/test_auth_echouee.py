@@ -3,14 +3,13 @@ Test Fonctionnel 2 : Authentification Non Réussie
 Ce test vérifie le scénario d'échec d'authentification avec blocage après 3 tentatives
 """
 
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import attentes
+import comptes
 import config
+import metriques_navigateur
+import pool_navigateurs
+import scenarios_auth
 
 
 class TestAuthenticationEchouee:
@@ -21,22 +20,27 @@ class TestAuthenticationEchouee:
     def setup_method(self):
         """
         Configuration initiale avant chaque test
-        Initialise le navigateur Chrome
+        Emprunte un navigateur au pool (démarré une seule fois par worker)
         """
         print("\n=== INITIALISATION DU NAVIGATEUR ===")
-        self.driver = webdriver.Chrome()
-        self.driver.maximize_window()
+        self.driver = pool_navigateurs.pool_global().louer()
         self.driver.implicitly_wait(config.IMPLICIT_WAIT)
         self.wait = WebDriverWait(self.driver, config.EXPLICIT_WAIT)
+        
+        # Compte dédié au blocage : propre au worker et à l'exécution, pour ne
+        # jamais bloquer le compte utilisé par test_auth_reussie.py
+        self.compte = comptes.compte_test("blocage", unique=True)
+
+        # Métriques de performance de chaque étape (JSON + comparaison à la référence)
+        self.metriques = metriques_navigateur.CollecteurMetriques(self.driver, "blocage")
     
     def teardown_method(self):
         """
         Nettoyage après chaque test
-        Ferme le navigateur
+        Rend le navigateur au pool (cookies et localStorage vidés)
         """
-        print("\n=== FERMETURE DU NAVIGATEUR ===")
-        time.sleep(2)  # Pause pour voir le résultat
-        self.driver.quit()
+        print("\n=== LIBÉRATION DU NAVIGATEUR ===")
+        pool_navigateurs.pool_global().rendre(self.driver)
     
     def tenter_connexion(self, phone, password, tentative_num):
         """
@@ -49,26 +53,22 @@ class TestAuthenticationEchouee:
         """
         print(f"\n--- TENTATIVE {tentative_num} ---")
         
-        # Rechercher les champs du formulaire
-        phone_input = self.driver.find_element(By.NAME, "email")
-        password_input = self.driver.find_element(By.NAME, "password")
-        login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+        # Rechercher les champs du formulaire (prêts et hydratés par React)
+        phone_input, password_input, login_button = attentes.attendre_formulaire_connexion(self.driver)
         
-        # Remplir le formulaire
-        phone_input.clear()
-        phone_input.send_keys(phone)
+        # Remplir et soumettre le formulaire, puis attendre la réponse de /api/login
+        appel = attentes.soumettre_connexion(
+            self.driver, phone_input, password_input, login_button, phone, password
+        )
         print(f"✓ Téléphone saisi: {phone}")
-        time.sleep(0.5)
-        
-        password_input.clear()
-        password_input.send_keys(password)
         print(f"✓ Mot de passe saisi: {'*' * len(password)}")
-        time.sleep(0.5)
-        
-        # Soumettre le formulaire
-        login_button.click()
         print("✓ Formulaire soumis")
-        time.sleep(2)
+        if appel:
+            print(f"✓ Réponse /api/login: {appel['statut']} en {appel['duree']:.0f} ms")
+        else:
+            print("⚠ Formulaire refusé par le navigateur (format invalide)")
+        self.metriques.relever(f"tentative_{tentative_num}", api_login_ms=appel["duree"] if appel else None)
+        return appel
     
     def verifier_message_erreur(self, tentative_num):
         """
@@ -80,20 +80,18 @@ class TestAuthenticationEchouee:
         try:
             # Rechercher le message d'erreur
             # (Adapter les sélecteurs selon votre interface)
-            error_message = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert')]"))
-            )
+            error_message = attentes.attendre_message_erreur(self.driver)
             
-            message_text = error_message.text.lower()
+            message_text = error_message.text
             print(f"✓ Message d'erreur affiché: {error_message.text}")
             
-            # Vérifier le contenu du message
-            if tentative_num < 3:
-                if "incorrect" in message_text or "erroné" in message_text or "invalide" in message_text:
+            # Vérifier le contenu du message (mêmes attentes que test_api_auth.py)
+            if tentative_num < scenarios_auth.TENTATIVES_AVANT_BLOCAGE:
+                if scenarios_auth.est_message_erreur(message_text):
                     print(f"✓ Message d'erreur approprié pour la tentative {tentative_num}")
                     return True
             else:
-                if "bloqué" in message_text or "désactivé" in message_text or "compte" in message_text:
+                if scenarios_auth.est_message_blocage(message_text):
                     print(f"✓ Message de blocage affiché pour la tentative {tentative_num}")
                     return True
             
@@ -122,19 +120,15 @@ class TestAuthenticationEchouee:
         print("="*60)
         
         print("\n--- ÉTAPE 1: Navigation vers la page de connexion ---")
-        self.driver.get(f"{config.BASE_URL}/login")
-        print(f"✓ URL chargée: {self.driver.current_url}")
-        time.sleep(2)
         
         # ===== ÉTAPE 2: Vérifier l'affichage du formulaire =====
-        print("\n--- ÉTAPE 2: Vérification du formulaire de connexion ---")
-        
         try:
-            phone_input = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "email"))
-            )
-            password_input = self.driver.find_element(By.NAME, "password")
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            self.metriques.installer()
+            attentes.ouvrir_page_connexion(self.driver)
+            print(f"✓ URL chargée: {self.driver.current_url}")
+            self.metriques.relever("formulaire_connexion")
+            
+            print("\n--- ÉTAPE 2: Vérification du formulaire de connexion ---")
             print("✓ Formulaire de connexion trouvé et prêt")
         except Exception as e:
             print(f"✗ Erreur: Formulaire non trouvé - {e}")
@@ -145,7 +139,7 @@ class TestAuthenticationEchouee:
         print("PREMIÈRE TENTATIVE DE CONNEXION")
         print("="*60)
         
-        self.tenter_connexion(config.INVALID_PHONE, config.INVALID_PASSWORD, 1)
+        self.tenter_connexion(self.compte["email"], config.INVALID_PASSWORD, 1)
         
         # Vérifier le message d'erreur
         self.verifier_message_erreur(1)
@@ -155,14 +149,12 @@ class TestAuthenticationEchouee:
         print("✓ L'utilisateur reste sur la page de connexion")
         print("✓ Le système a enregistré l'échec (tentative 1/3)")
         
-        time.sleep(2)
-        
         # ===== ÉTAPE 4: Deuxième tentative échouée =====
         print("\n" + "="*60)
         print("DEUXIÈME TENTATIVE DE CONNEXION")
         print("="*60)
         
-        self.tenter_connexion(config.INVALID_PHONE, config.INVALID_PASSWORD, 2)
+        self.tenter_connexion(self.compte["email"], config.INVALID_PASSWORD, 2)
         
         # Vérifier le message d'erreur
         self.verifier_message_erreur(2)
@@ -172,14 +164,12 @@ class TestAuthenticationEchouee:
         print("✓ L'utilisateur reste sur la page de connexion")
         print("✓ Le système a enregistré l'échec (tentative 2/3)")
         
-        time.sleep(2)
-        
         # ===== ÉTAPE 5: Troisième tentative échouée =====
         print("\n" + "="*60)
         print("TROISIÈME TENTATIVE DE CONNEXION (BLOCAGE)")
         print("="*60)
         
-        self.tenter_connexion(config.INVALID_PHONE, config.INVALID_PASSWORD, 3)
+        self.tenter_connexion(self.compte["email"], config.INVALID_PASSWORD, 3)
         
         # Vérifier le message de blocage
         self.verifier_message_erreur(3)
@@ -188,10 +178,10 @@ class TestAuthenticationEchouee:
         print("\n--- ÉTAPE 6: Vérification du blocage du compte ---")
         
         try:
-            # Vérifier la présence d'un message de blocage spécifique
-            blocking_message = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'bloqué') or contains(text(), 'désactivé') or contains(text(), 'compte')]"))
-            )
+            # Vérifier le contenu du dernier message affiché (déjà attendu à l'étape 5)
+            blocking_message = attentes.attendre_message_erreur(self.driver)
+            if not scenarios_auth.est_message_blocage(blocking_message.text):
+                raise AssertionError(f"message reçu: {blocking_message.text}")
             print(f"✓ Message de blocage confirmé: {blocking_message.text}")
             print("✓ Le compte utilisateur a été désactivé après 3 tentatives")
             
@@ -201,14 +191,16 @@ class TestAuthenticationEchouee:
         
         # Vérifier que l'utilisateur ne peut plus se connecter
         print("\n--- Vérification: Tentative de connexion après blocage ---")
-        time.sleep(2)
         
         # Essayer de se connecter même avec les bons identifiants
         try:
-            self.tenter_connexion(config.VALID_PHONE, config.VALID_PASSWORD, 4)
-            time.sleep(2)
+            url_connexion = self.driver.current_url
+            appel = self.tenter_connexion(self.compte["email"], self.compte["password"], 4)
             
-            # Le compte devrait être bloqué même avec les bons identifiants
+            # Le compte devrait être bloqué même avec les bons identifiants :
+            # une réponse en erreur de /api/login suffit, inutile d'attendre une redirection
+            if appel and appel['statut'] == 200:
+                attentes.attendre_changement_url(self.driver, url_connexion)
             if "login" in self.driver.current_url.lower():
                 print("✓ Le compte reste bloqué même avec les bons identifiants")
             else:
@@ -217,6 +209,10 @@ class TestAuthenticationEchouee:
         except Exception as e:
             print(f"⚠ Erreur lors de la vérification du blocage: {e}")
         
+        # Métriques de performance (le blocage doit rester rapide : refus avant bcrypt)
+        print("\n--- Métriques de performance ---")
+        self.metriques.terminer()
+        
         print("\n" + "="*60)
         print("=== TEST AUTHENTIFICATION ÉCHOUÉE: SUCCÈS ✓ ===")
         print("="*60)
@@ -3,14 +3,15 @@ Test Fonctionnel 1 : Authentification Réussie
 Ce test vérifie le scénario d'une authentification réussie sur la plateforme
 """
 
-import time
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import attentes
+import comptes
 import config
+import enregistreur_reseau
+import metriques_navigateur
+import pool_navigateurs
 
 
 class TestAuthenticationReussie:
@@ -21,29 +22,29 @@ class TestAuthenticationReussie:
     def setup_method(self):
         """
         Configuration initiale avant chaque test
-        Initialise le navigateur Chrome
+        Emprunte un navigateur au pool (démarré une seule fois par worker)
         """
         print("\n=== INITIALISATION DU NAVIGATEUR ===")
         
-        # Options Chrome pour plus de stabilité
-        options = webdriver.ChromeOptions()
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.maximize_window()
+        self.driver = pool_navigateurs.pool_global().louer()
         self.driver.implicitly_wait(config.IMPLICIT_WAIT)
         self.wait = WebDriverWait(self.driver, config.EXPLICIT_WAIT)
+        
+        # Compte propre à ce worker (jamais partagé avec le scénario de blocage)
+        self.compte = comptes.compte_test("connexion")
+
+        # Métriques de performance de chaque étape (JSON + comparaison à la référence)
+        self.metriques = metriques_navigateur.CollecteurMetriques(self.driver, "auth_reussie")
+        # Appels à l'API de chaque page (journal réseau des DevTools)
+        self.reseau = enregistreur_reseau.EnregistreurReseau(self.driver, "auth_reussie")
     
     def teardown_method(self):
         """
         Nettoyage après chaque test
-        Ferme le navigateur
+        Rend le navigateur au pool (cookies et localStorage vidés)
         """
-        print("\n=== FERMETURE DU NAVIGATEUR ===")
-        time.sleep(2)  # Pause pour voir le résultat
-        self.driver.quit()
+        print("\n=== LIBÉRATION DU NAVIGATEUR ===")
+        pool_navigateurs.pool_global().rendre(self.driver)
     
     def test_authentification_reussie(self):
         """
@@ -59,27 +60,19 @@ class TestAuthenticationReussie:
         
         # ===== ÉTAPE 1: Saisir l'URL dans le navigateur =====
         print("\n--- ÉTAPE 1: Navigation vers la page de connexion ---")
-        self.driver.get(f"{config.BASE_URL}/login")
-        print(f"✓ URL chargée: {self.driver.current_url}")
-        time.sleep(5)  # Attendre que la page se charge complètement
-        
+
         # ===== ÉTAPE 2: Vérifier l'affichage du formulaire =====
-        print("\n--- ÉTAPE 2: Vérification du formulaire de connexion ---")
-        
-        # Attendre que le formulaire soit visible
         try:
-            # Recherche du champ email par type
-            phone_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']"))
-            )
+            # Attendre que le formulaire soit rendu et hydraté par React
+            self.metriques.installer()
+            self.reseau.demarrer()
+            phone_input, password_input, login_button = attentes.ouvrir_page_connexion(self.driver)
+            print(f"✓ URL chargée: {self.driver.current_url}")
+            self.metriques.relever("formulaire_connexion")
+
+            print("\n--- ÉTAPE 2: Vérification du formulaire de connexion ---")
             print("✓ Champ téléphone/email trouvé")
-            
-            # Recherche du champ mot de passe par type
-            password_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
             print("✓ Champ mot de passe trouvé")
-            
-            # Recherche du bouton de connexion
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
             print("✓ Bouton de connexion trouvé")
             
         except Exception as e:
@@ -89,31 +82,24 @@ class TestAuthenticationReussie:
         # ===== ÉTAPE 3: Remplir le formulaire avec des identifiants valides =====
         print("\n--- ÉTAPE 3: Remplissage du formulaire ---")
         
-        # Saisir le numéro de téléphone/email
-        phone_input.clear()
-        phone_input.send_keys(config.VALID_PHONE)
-        print(f"✓ Téléphone saisi: {config.VALID_PHONE}")
-        time.sleep(1)
-        
-        # Saisir le mot de passe
-        password_input.clear()
-        password_input.send_keys(config.VALID_PASSWORD)
-        print(f"✓ Mot de passe saisi: {'*' * len(config.VALID_PASSWORD)}")
-        time.sleep(1)
-        
-        # Cliquer sur le bouton de connexion
-        login_button.click()
+        # Saisir les identifiants puis attendre la réponse de /api/login
+        url_connexion = self.driver.current_url
+        appel = attentes.soumettre_connexion(
+            self.driver, phone_input, password_input, login_button,
+            self.compte["email"], self.compte["password"]
+        )
+        print(f"✓ Téléphone saisi: {self.compte['email']}")
+        print(f"✓ Mot de passe saisi: {'*' * len(self.compte['password'])}")
         print("✓ Bouton de connexion cliqué")
-        time.sleep(3)
+        if appel:
+            print(f"✓ Réponse /api/login: {appel['statut']} en {appel['duree']:.0f} ms")
         
         # ===== ÉTAPE 4: Vérifier la redirection vers la page d'accueil =====
         print("\n--- ÉTAPE 4: Vérification de la connexion réussie ---")
         
         try:
             # Attendre la redirection (l'URL change ou un élément spécifique apparaît)
-            self.wait.until(
-                lambda driver: "login" not in driver.current_url.lower()
-            )
+            attentes.attendre_changement_url(self.driver, url_connexion)
             print(f"✓ Redirection réussie vers: {self.driver.current_url}")
             
             # Vérifier la présence d'un élément de la page d'accueil
@@ -125,6 +111,9 @@ class TestAuthenticationReussie:
                 print("✓ Page d'accueil chargée avec succès")
             except:
                 print("⚠ Élément 'Dashboard' non trouvé, mais connexion semble réussie")
+            self.metriques.relever("tableau_de_bord", api_login_ms=appel["duree"] if appel else None)
+            # Cascade des appels de /login et du tableau de bord, avant que la déconnexion ne quitte la page
+            depassements_reseau = self.reseau.terminer(verifier=False)
             
         except Exception as e:
             print(f"✗ Erreur lors de la vérification de la connexion: {e}")
@@ -141,17 +130,19 @@ class TestAuthenticationReussie:
             )
             logout_button.click()
             print("✓ Bouton de déconnexion cliqué")
-            time.sleep(2)
             
             # Vérifier la redirection vers la page de connexion
-            self.wait.until(
-                EC.url_contains("login")
-            )
+            attentes.attendre_url_contient(self.driver, "login")
             print(f"✓ Déconnexion réussie, redirection vers: {self.driver.current_url}")
             
         except Exception as e:
             print(f"⚠ Impossible de tester la déconnexion: {e}")
         
+        # ===== ÉTAPE 6: Métriques de performance =====
+        print("\n--- ÉTAPE 6: Métriques de performance ---")
+        self.metriques.terminer()
+        assert not depassements_reseau, f"Budget d'appels API dépassé : {depassements_reseau}"
+
         print("\n=== TEST AUTHENTIFICATION RÉUSSIE: SUCCÈS ✓ ===")
 
 
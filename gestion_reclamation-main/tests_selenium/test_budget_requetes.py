@@ -0,0 +1,193 @@
+"""
+Budget de requêtes SQL par route
+Rejoue les appels principaux de l'API (lecture et circuit d'une réclamation) et
+lit les mesures du profiler du backend (X-Query-Count, X-N-Plus-One,
+Server-Timing) : un appel qui dépasse son budget (budgets_requetes.json) ou
+qui répète une même requête en boucle (N+1) fait échouer le test
+
+Le backend doit être lancé avec PERFORMANCE_PROFILER=true dans son .env, sinon
+les tests sont ignorés. Les budgets ne comptent que les requêtes de l'application
+(X-Query-Count, hors tables du cache, de la file et des sessions) et valent pour
+le store de cache avec lequel ils ont été enregistrés (clé _cache_store) : les
+tests sont ignorés si le backend en utilise un autre.
+
+Utilisation:
+    pytest test_budget_requetes.py -v
+    python test_budget_requetes.py               # tableau des mesures
+    python test_budget_requetes.py --enregistrer # mesures actuelles -> budgets_requetes.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+
+import pytest
+
+import comptes
+from client_api import ClientAPI
+
+FICHIER_BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets_requetes.json")
+
+
+def lire_server_timing(entete):
+    """'db;dur=3.1;desc="5 queries", mem;desc="peak 8.0 MB"' -> {"db": {"dur": 3.1, "desc": ...}, ...}"""
+    metriques = {}
+    for element in filter(None, (e.strip() for e in (entete or "").split(","))):
+        nom, *parametres = element.split(";")
+        valeurs = {}
+        for parametre in parametres:
+            cle, _, valeur = parametre.partition("=")
+            valeur = valeur.strip('"')
+            valeurs[cle.strip()] = float(valeur) if cle.strip() == "dur" else valeur
+        metriques[nom.strip()] = valeurs
+    return metriques
+
+
+def mesure(reponse):
+    """Mesures du profiler d'une réponse (None si le profiler est inactif)"""
+    if "X-Query-Count" not in reponse.headers:
+        return None
+    timing = lire_server_timing(reponse.headers.get("Server-Timing"))
+    memoire = re.search(r"[\d.]+", timing.get("mem", {}).get("desc", ""))
+    return {
+        "statut": reponse.status_code,
+        "requetes": int(reponse.headers["X-Query-Count"]),
+        "requetes_infra": int(reponse.headers.get("X-Query-Count-Infra", 0)),
+        "n_plus_un": int(reponse.headers.get("X-N-Plus-One", 0)),
+        "sql_ms": timing.get("db", {}).get("dur"),
+        "total_ms": timing.get("total", {}).get("dur"),
+        "memoire_mo": float(memoire.group()) if memoire else None,
+        "cache": timing.get("cache", {}).get("desc"),
+    }
+
+
+def connecter(role):
+    compte = comptes.compte_test("budget", role=role)
+    client = ClientAPI()
+    reponse = client.login(compte["email"], compte["password"], role)
+    assert reponse.status_code == 200, reponse.text
+    return client
+
+
+def jouer_scenarios():
+    """Joue les appels dans l'ordre du circuit ; retourne {appel: mesure}"""
+    acteurs = {role: connecter(role) for role in ("student", "registrar", "admin", "teacher")}
+    etudiant, scolarite = acteurs["student"], acteurs["registrar"]
+    resultats = {}
+
+    def appeler(nom, client, methode, chemin, **kwargs):
+        reponse = client.requete(methode, chemin, **kwargs)
+        resultats[nom] = mesure(reponse)
+        return reponse
+
+    appeler("GET /roles", ClientAPI(), "GET", "/roles")
+    appeler("GET /user", etudiant, "GET", "/user")
+    appeler("GET /notifications", etudiant, "GET", "/notifications")
+    appeler("GET /stats", etudiant, "GET", "/stats")
+    appeler("GET /stats?details=matiere,enseignant", acteurs["admin"], "GET", "/stats",
+            params={"details": "matiere,enseignant"})
+
+    matieres = scolarite.requete("GET", "/matieres").json()
+    if not matieres:
+        pytest.skip("Aucune matière en base : lancer d'abord php artisan db:seed")
+    matiere_id = matieres[0]["id"]
+    appeler("GET /matieres/{id}/grades", scolarite, "GET", f"/matieres/{matiere_id}/grades")
+
+    demande = appeler("POST /demandes", etudiant, "POST", "/demandes", json={
+        "nom_prenom": "Étudiant Budget",
+        "filiere_niveau": "L3",
+        "matiere_id": matiere_id,
+        "objet": "Réclamation budget",
+        "objectif": "Révision de la note",
+        "motif": "Erreur de report de note",
+        "note_actuelle": 8,
+        "note_demandee": 12,
+    }).json()
+    identifiant = demande["id"]
+
+    appeler("GET /demandes?per_page=25", scolarite, "GET", "/demandes", params={"per_page": 25})
+    appeler("GET /demandes/{id}", scolarite, "GET", f"/demandes/{identifiant}")
+    appeler("POST /demandes/{id}/valider", scolarite, "POST", f"/demandes/{identifiant}/valider",
+            json={"commentaire": "budget"})
+    appeler("POST /demandes/{id}/envoyer-au-da", scolarite, "POST", f"/demandes/{identifiant}/envoyer-au-da",
+            json={"commentaire": "budget"})
+    enseignant_id = acteurs["teacher"].user().json()["id"]
+    appeler("POST /demandes/{id}/imputer", acteurs["admin"], "POST", f"/demandes/{identifiant}/imputer",
+            json={"enseignant_id": enseignant_id, "commentaire": "budget"})
+    appeler("POST /demandes/{id}/corriger", acteurs["teacher"], "POST", f"/demandes/{identifiant}/corriger",
+            json={"nouvelle_note": 12, "commentaire": "budget"})
+    return resultats
+
+
+def charger_budgets():
+    with open(FICHIER_BUDGETS, encoding="utf-8") as fichier:
+        return {cle: valeur for cle, valeur in json.load(fichier).items() if not cle.startswith("_")}
+
+
+def store_des_budgets():
+    with open(FICHIER_BUDGETS, encoding="utf-8") as fichier:
+        return json.load(fichier).get("_cache_store")
+
+
+def store_mesure(resultats):
+    """Store de cache annoncé par le backend (Server-Timing), None s'il ne l'annonce pas"""
+    return next((m["cache"] for m in resultats.values() if m and m.get("cache")), None)
+
+
+@pytest.fixture(scope="module")
+def mesures():
+    resultats = jouer_scenarios()
+    if all(m is None for m in resultats.values()):
+        pytest.skip("Profiler inactif : lancer le backend avec PERFORMANCE_PROFILER=true")
+    attendu, mesure_store = store_des_budgets(), store_mesure(resultats)
+    if attendu and mesure_store != attendu:
+        pytest.skip(f"Budgets enregistrés avec CACHE_STORE={attendu}, backend en CACHE_STORE={mesure_store}")
+    return resultats
+
+
+@pytest.mark.parametrize("appel", list(charger_budgets()))
+def test_budget_requetes(mesures, appel):
+    """L'appel reste dans son budget de requêtes SQL, sans requête répétée en boucle"""
+    budget = charger_budgets()[appel]
+    resultat = mesures[appel]
+    assert resultat is not None, f"{appel} : pas de mesure du profiler"
+    assert resultat["statut"] < 400, f"{appel} : statut {resultat['statut']}"
+    assert resultat["requetes"] <= budget, \
+        f"{appel} : {resultat['requetes']} requêtes SQL pour un budget de {budget}"
+    assert resultat["n_plus_un"] == 0, f"{appel} : requête répétée (N+1), voir le journal du backend"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Budget de requêtes SQL par route")
+    parser.add_argument("--enregistrer", action="store_true",
+                        help="Écrit les mesures actuelles comme nouveaux budgets")
+    args = parser.parse_args()
+
+    resultats = jouer_scenarios()
+    budgets = charger_budgets()
+    print(f"CACHE_STORE du backend : {store_mesure(resultats) or '?'} (budgets : {store_des_budgets() or '?'})")
+    print(f"{'Appel':<40} {'SQL':>5} {'budget':>7} {'infra':>6} {'N+1':>4} {'SQL ms':>7} {'total ms':>9} {'Mo':>6}")
+    for appel, resultat in resultats.items():
+        if resultat is None:
+            print(f"{appel:<40} profiler inactif (PERFORMANCE_PROFILER=true)")
+            continue
+        print(f"{appel:<40} {resultat['requetes']:>5} {budgets.get(appel, '-'):>7} "
+              f"{resultat['requetes_infra']:>6} {resultat['n_plus_un']:>4} "
+              f"{resultat['sql_ms']:>7} {resultat['total_ms']:>9} {resultat['memoire_mo']:>6}")
+
+    if args.enregistrer and all(resultats.values()):
+        with open(FICHIER_BUDGETS, encoding="utf-8") as fichier:
+            contenu = json.load(fichier)
+        contenu["_cache_store"] = store_mesure(resultats)
+        contenu["_mesure"] = datetime.date.today().isoformat()
+        contenu.update({appel: resultat["requetes"] for appel, resultat in resultats.items()})
+        with open(FICHIER_BUDGETS, "w", encoding="utf-8") as fichier:
+            json.dump(contenu, fichier, ensure_ascii=False, indent=2)
+            fichier.write("\n")
+        print(f"✓ Budgets enregistrés dans {FICHIER_BUDGETS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,18 @@
 Test Simple pour Diagnostiquer
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
+import config
+from navigateur import creer_driver
 
 print("=== TEST SIMPLE ===\n")
 
-# Configuration Chrome
-options = webdriver.ChromeOptions()
-options.add_argument('--disable-blink-features=AutomationControlled')
-options.add_argument('--no-sandbox')
-options.add_argument('--disable-dev-shm-usage')
-
-# Ouvrir Chrome
-print("1. Ouverture de Chrome...")
-driver = webdriver.Chrome(options=options)
-driver.maximize_window()
+# Ouvrir le navigateur configuré dans config.py
+print(f"1. Ouverture de {config.BROWSER} (profil {config.PROFIL_NAVIGATEUR})...")
+driver = creer_driver()
 
 try:
     # Aller sur la page
@@ -1,62 +1,52 @@
 """
 Suite de tests complète pour l'authentification
-Exécute tous les tests d'authentification
+Exécute tous les tests d'authentification en parallèle (pytest-xdist)
+
+Chaque worker lance son propre navigateur et utilise ses propres comptes
+de test (voir comptes.py) : les scénarios sont indépendants et se répartissent
+sur les cœurs disponibles.
+
+Utilisation:
+    python test_suite.py            # un worker par cœur (config.WORKERS)
+    python test_suite.py 4          # 4 workers
+    python test_suite.py 0          # exécution séquentielle, sans xdist
 """
 
-import pytest
-import sys
 import os
+import sys
 
-# Ajouter le répertoire courant au path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
-from test_auth_reussie import TestAuthenticationReussie
-from test_auth_echouee import TestAuthenticationEchouee
+import config
 
+REPERTOIRE = os.path.dirname(os.path.abspath(__file__))
+
+# Scénarios de la suite (chaque fichier peut tourner sur n'importe quel worker)
+SCENARIOS = [
+    "test_api_auth.py",
+    "test_api_references.py",
+    "test_auth_reussie.py",
+    "test_auth_echouee.py",
+]
 
-class TestSuiteAuthentication:
-    """
-    Suite de tests complète pour l'authentification
-    """
-    
-    def test_01_authentification_reussie(self):
-        """
-        Test 1: Authentification réussie
-        """
-        print("\n" + "="*80)
-        print("EXÉCUTION DU TEST 1: AUTHENTIFICATION RÉUSSIE")
-        print("="*80)
-        
-        test = TestAuthenticationReussie()
-        test.setup_method()
-        try:
-            test.test_authentification_reussie()
-        finally:
-            test.teardown_method()
-    
-    def test_02_authentification_echouee(self):
-        """
-        Test 2: Authentification échouée avec 3 tentatives
-        """
-        print("\n" + "="*80)
-        print("EXÉCUTION DU TEST 2: AUTHENTIFICATION ÉCHOUÉE")
-        print("="*80)
-        
-        test = TestAuthenticationEchouee()
-        test.setup_method()
-        try:
-            test.test_authentification_echouee_3_tentatives()
-        finally:
-            test.teardown_method()
+
+def arguments_pytest(workers):
+    """Construit la ligne de commande pytest pour `workers` processus"""
+    arguments = [os.path.join(REPERTOIRE, scenario) for scenario in SCENARIOS]
+    arguments += [
+        "-v",  # Mode verbose
+        "--html=rapport_tests.html",  # Génération d'un rapport HTML
+        "--self-contained-html",  # Rapport HTML autonome
+    ]
+    if str(workers) != "0":
+        # --dist load : chaque test part vers le premier worker libre
+        arguments += ["-n", str(workers), "--dist", "load"]
+    return arguments
 
 
 if __name__ == "__main__":
     """
     Exécution de la suite de tests avec pytest
     """
-    pytest.main([
-        __file__,
-        "-v",  # Mode verbose
-        "--html=rapport_tests.html",  # Génération d'un rapport HTML
-        "--self-contained-html"  # Rapport HTML autonome
-    ])
+    workers = sys.argv[1] if len(sys.argv) > 1 else config.WORKERS
+    sys.exit(pytest.main(arguments_pytest(workers)))